@@ -3,7 +3,7 @@ API Dependencies
 Authentication and database dependencies
 """
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from sqlalchemy.orm import Session
@@ -20,14 +20,24 @@ from app.crud import token as token_crud
 security = HTTPBearer()
 settings = get_settings()
 
+# Request state attributes set by the batch endpoint for its sub-requests:
+# the shared session and the caller resolved once for the whole batch
+SHARED_SESSION_STATE = "shared_db_session"
+RESOLVED_USER_STATE = "resolved_user"
+
 
 # Database dependency (re-export for convenience)
-def get_db() -> Generator[Session, None, None]:
-    """Get database session"""
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """Get database session (reuses the batch session for batched sub-requests)"""
+    shared_session = getattr(request.state, SHARED_SESSION_STATE, None)
+    if shared_session is not None:
+        yield shared_session
+        return
     yield from db_session()
 
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -49,6 +59,12 @@ def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    if hasattr(request.state, RESOLVED_USER_STATE):
+        resolved_user = getattr(request.state, RESOLVED_USER_STATE)
+        if resolved_user is None:
+            raise credentials_exception
+        return resolved_user
     
     try:
         token = credentials.credentials
@@ -127,6 +143,7 @@ def require_admin(
 
 # Optional authentication (for endpoints that work with or without auth)
 def get_current_user_optional(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False)),
     db: Session = Depends(get_db)
 ) -> User | None:
@@ -143,6 +160,8 @@ def get_current_user_optional(
     """
     if credentials is None:
         return None
+    if hasattr(request.state, RESOLVED_USER_STATE):
+        return getattr(request.state, RESOLVED_USER_STATE)
     
     try:
         token = credentials.credentials
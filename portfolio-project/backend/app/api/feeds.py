@@ -0,0 +1,99 @@
+"""
+Feed Endpoints
+Blog RSS/Atom feeds and the sitemap, mounted at the site root for crawlers
+
+Documents are read as stored, already gzip-compressed: clients accepting gzip
+get the stored bytes, others the decompressed body. ``If-None-Match`` and
+``If-Modified-Since`` are answered with 304 before the body is touched.
+"""
+import gzip
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.core.cache_policy import add_surrogate_keys
+from app.core.compression import available_encodings, negotiate_encoding
+from app.core.responses import etag_matches
+from app.crud import feeds as feeds_crud
+from app.models.feed import FeedDocument
+from app.utils.feed_xml import http_date, utc
+
+router = APIRouter()
+
+
+def _not_modified(request: Request, document: FeedDocument) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, document.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return utc(document.last_modified) <= utc(since)
+
+
+def _document_response(request: Request, document: Optional[FeedDocument], *keys: str) -> Response:
+    if document is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sitemap page not found")
+
+    headers = {"Last-Modified": http_date(document.last_modified), "Vary": "Accept-Encoding"}
+    gzipped = negotiate_encoding(request.headers.get("accept-encoding", ""), available_encodings()) == "gzip"
+    if gzipped:
+        headers.update({"Content-Encoding": "gzip", "ETag": f"W/{document.etag}"})
+    else:
+        # The compression middleware may still pick brotli for this body
+        headers["ETag"] = document.etag
+
+    if _not_modified(request, document):
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        body = document.body if gzipped else gzip.decompress(document.body)
+        response = Response(content=body, media_type=document.media_type, headers=headers)
+    add_surrogate_keys(response, *keys)
+    return response
+
+
+@router.get("/feeds/blog.rss")
+async def get_blog_rss(
+    request: Request,
+    language: str = Query("en", pattern="^(tr|en)$"),
+    db: Session = Depends(get_db)
+):
+    """RSS 2.0 feed of the newest published blog posts in a language"""
+    document = feeds_crud.get_feed_document(db, feeds_crud.feed_document_name("rss", language))
+    return _document_response(request, document, "feeds", "blog")
+
+
+@router.get("/feeds/blog.atom")
+async def get_blog_atom(
+    request: Request,
+    language: str = Query("en", pattern="^(tr|en)$"),
+    db: Session = Depends(get_db)
+):
+    """Atom feed of the newest published blog posts in a language"""
+    document = feeds_crud.get_feed_document(db, feeds_crud.feed_document_name("atom", language))
+    return _document_response(request, document, "feeds", "blog")
+
+
+@router.get("/sitemap.xml")
+async def get_sitemap(request: Request, db: Session = Depends(get_db)):
+    """
+    Sitemap of the site's pages and published blog posts
+
+    A sitemap index of ``/sitemaps/{page}.xml`` once the URLs outgrow one file.
+    """
+    document = feeds_crud.get_feed_document(db, feeds_crud.SITEMAP)
+    return _document_response(request, document, "sitemap", "blog", "projects")
+
+
+@router.get("/sitemaps/{page}.xml")
+async def get_sitemap_page(request: Request, page: int = Path(..., ge=1), db: Session = Depends(get_db)):
+    """One page of a sitemap index"""
+    document = feeds_crud.get_feed_document(db, feeds_crud.sitemap_page_name(page))
+    return _document_response(request, document, "sitemap", "blog", "projects")
@@ -0,0 +1,107 @@
+"""
+Sparse Fieldsets
+``fields=`` and ``include=`` query parameters for list endpoints
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+from app.serializers.encoders import adapter
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """Scalar fields a resource exposes and the relations clients may expand"""
+    fields: Tuple[str, ...]
+    relations: Tuple[str, ...] = ()
+    default_include: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    """
+    Fields and relations requested by a client
+
+    ``columns`` is None when the client did not narrow the scalar fields.
+    Both tuples keep the resource's declaration order.
+    """
+    fieldset: Fieldset
+    columns: Optional[Tuple[str, ...]]
+    include: Tuple[str, ...]
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return self.fieldset.fields if self.columns is None else self.columns
+
+    @property
+    def is_default(self) -> bool:
+        """True when the response should keep the endpoint's full legacy shape"""
+        return self.columns is None and self.include == self.fieldset.default_include
+
+    def wants(self, name: str) -> bool:
+        return name in self.fields or name in self.include
+
+    def pick(self, obj: Any, relations: Dict[str, Callable[[Any], Any]]) -> dict:
+        """
+        Build a response item from the selected attributes of ``obj``
+
+        Args:
+            obj: ORM object; only selected attributes are read, so deferred
+                columns stay unloaded
+            relations: Serializer for each expandable relation value
+        """
+        item = {name: getattr(obj, name) for name in self.fields}
+        for name in self.include:
+            item[name] = relations[name](getattr(obj, name))
+        return item
+
+
+def list_dumper(schema) -> Callable[[Any], list]:
+    """Serializer turning a loaded relation into JSON-ready dicts of ``schema``"""
+    schema_adapter = adapter(List[schema])
+    return lambda items: schema_adapter.dump_python(schema_adapter.validate_python(items), mode="json")
+
+
+def _split(value: str) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+
+
+class SparseFieldset:
+    """
+    Dependency parsing ``fields`` and ``include`` for one resource
+
+    ``id`` is always returned. Omitting ``include`` keeps the default
+    expansions; an empty ``include=`` drops them all.
+    """
+
+    def __init__(self, fieldset: Fieldset):
+        self.fieldset = fieldset
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,slug,title"),
+        include: Optional[str] = Query(None, description="Comma-separated relations to expand"),
+    ) -> FieldSelection:
+        columns = None
+        if fields is not None:
+            requested = _split(fields)
+            self._reject_unknown(requested, self.fieldset.fields, "field")
+            columns = tuple(name for name in self.fieldset.fields if name == "id" or name in requested)
+
+        expand = self.fieldset.default_include
+        if include is not None:
+            requested = _split(include)
+            self._reject_unknown(requested, self.fieldset.relations, "relation")
+            expand = tuple(name for name in self.fieldset.relations if name in requested)
+
+        return FieldSelection(fieldset=self.fieldset, columns=columns, include=expand)
+
+    @staticmethod
+    def _reject_unknown(requested: Tuple[str, ...], allowed: Tuple[str, ...], kind: str) -> None:
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown {kind}(s): {', '.join(unknown)}. Allowed: {', '.join(allowed) or 'none'}"
+            )
@@ -0,0 +1,41 @@
+"""
+NDJSON Streaming
+``Accept: application/x-ndjson`` exports of whole list endpoints
+"""
+from typing import Any, Callable, Iterable, Iterator
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client lists NDJSON among the media types it accepts"""
+    accepted = request.headers.get("accept", "")
+    return any(
+        media_range.split(";", 1)[0].strip().lower() == NDJSON_MEDIA_TYPE
+        for media_range in accepted.split(",")
+    )
+
+
+def vary_on_accept(response: Response) -> Response:
+    """Keep shared caches from serving one representation of a list for the other"""
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+def ndjson_response(rows: Iterable[Any], encode: Callable[[Any], bytes]) -> StreamingResponse:
+    """
+    Stream ``rows`` as one JSON document per line
+
+    ``rows`` should be a lazy ``yield_per`` iterator: it is consumed while the
+    body is sent, after the route has returned, so only one batch of rows and
+    one encoded line are held at a time. The database session stays open until
+    the response is complete.
+    """
+    def lines() -> Iterator[bytes]:
+        for row in rows:
+            yield encode(row) + b"\n"
+
+    return vary_on_accept(StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE))
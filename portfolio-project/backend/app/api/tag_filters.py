@@ -0,0 +1,27 @@
+"""
+Tag Filters
+``tag=`` and ``tags_all=`` query parameters for list endpoints
+"""
+from typing import Optional, Tuple
+
+from fastapi import Query
+
+from app.crud.tag import TagFilter
+
+
+def _slugs(value: Optional[str]) -> Tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(dict.fromkeys(part.strip().lower() for part in value.split(",") if part.strip()))
+
+
+def tag_filter(
+    tag: Optional[str] = Query(
+        None, max_length=512, description="Comma-separated tag slugs; items carrying any of them"
+    ),
+    tags_all: Optional[str] = Query(
+        None, max_length=512, description="Comma-separated tag slugs; items carrying all of them"
+    ),
+) -> TagFilter:
+    """Dependency parsing the tag filters of a list; both narrow the list when given together"""
+    return TagFilter(any_of=_slugs(tag), all_of=_slugs(tags_all))
@@ -4,7 +4,7 @@ Combines all v1 endpoints
 """
 from fastapi import APIRouter
 
-from app.api.v1 import auth, blog, projects, skills, experiences, contact, github, translations, admin, technologies
+from app.api.v1 import auth, blog, projects, skills, experiences, contact, github, translations, admin, technologies, tags, bundle, batch
 
 # Create main v1 router
 api_router = APIRouter()
@@ -20,3 +20,6 @@ api_router.include_router(contact.router, prefix="/contact", tags=["Contact"])
 api_router.include_router(github.router, prefix="/github", tags=["GitHub"])
 api_router.include_router(translations.router, prefix="/translations", tags=["Translations"])
 api_router.include_router(technologies.router, prefix="/technologies", tags=["Technologies"])
+api_router.include_router(tags.router, prefix="/tags", tags=["Tags"])
+api_router.include_router(bundle.router, prefix="/bundle", tags=["Bundle"])
+api_router.include_router(batch.router, prefix="/batch", tags=["Batch"])
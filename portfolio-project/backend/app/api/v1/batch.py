@@ -0,0 +1,164 @@
+"""
+Batch Endpoints
+Runs several API reads in one HTTP round trip
+"""
+import asyncio
+import json
+from typing import Any, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from loguru import logger
+from sqlalchemy.orm import Session
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp
+
+from app.api.deps import RESOLVED_USER_STATE, SHARED_SESSION_STATE, get_current_user_optional, get_db
+from app.config import settings
+from app.models.user import User
+from app.schemas.batch import BatchItemResponse, BatchRequest, BatchResponse
+
+router = APIRouter()
+
+# Parent headers that are meaningful to sub-requests
+FORWARDED_HEADERS = (b"authorization", b"accept-language", b"user-agent")
+
+# Parent scope entries copied verbatim into every sub-request
+INHERITED_SCOPE_KEYS = ("asgi", "http_version", "scheme", "server", "client", "root_path", "app")
+
+
+def _without_user_middleware(app: FastAPI) -> ASGIApp:
+    """
+    The innermost layers of the app's own middleware stack around its router
+
+    Keeps the exception handlers and the exit stack FastAPI's routes expect,
+    leaving out CORS, rate limiting and the other HTTP middleware that the
+    batch request itself already went through.
+    """
+    handlers = {key: value for key, value in app.exception_handlers.items() if key not in (500, Exception)}
+    return ExceptionMiddleware(AsyncExitStackMiddleware(app.router), handlers=handlers, debug=app.debug)
+
+
+def _validate_path(path: str) -> Tuple[str, str]:
+    """Split a batch item path into path and query string, rejecting non-API targets"""
+    target, _, query = path.partition("?")
+    batch_prefix = f"{settings.API_V1_PREFIX}/batch"
+
+    if "#" in path or ".." in target.split("/"):
+        raise ValueError(f"Invalid path: {path}")
+    if not target.startswith(f"{settings.API_V1_PREFIX}/"):
+        raise ValueError(f"Path must start with {settings.API_V1_PREFIX}/: {path}")
+    if target == batch_prefix or target.startswith(f"{batch_prefix}/"):
+        raise ValueError("Batch requests cannot be nested")
+    return target, query
+
+
+def _sub_scope(request: Request, path: str, query: str, db: Session, user: Optional[User]) -> dict:
+    parent = request.scope
+    scope = {key: parent[key] for key in INHERITED_SCOPE_KEYS if key in parent}
+    scope.update(
+        type="http",
+        method="GET",
+        path=path,
+        raw_path=path.encode(),
+        query_string=query.encode(),
+        headers=[(name, value) for name, value in parent["headers"] if name in FORWARDED_HEADERS],
+        state={**parent.get("state", {}), SHARED_SESSION_STATE: db, RESOLVED_USER_STATE: user},
+    )
+    return scope
+
+
+def _decode_body(body: bytes, content_type: Optional[str]) -> Any:
+    if not body:
+        return None
+    if content_type and content_type.startswith("application/json"):
+        return json.loads(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _dispatch(
+    app: ASGIApp, request: Request, path: str, db: Session, user: Optional[User]
+) -> BatchItemResponse:
+    """Run one GET through the application router, skipping HTTP middleware"""
+    try:
+        target, query = _validate_path(path)
+    except ValueError as exc:
+        return BatchItemResponse(path=path, status=status.HTTP_400_BAD_REQUEST, body={"detail": str(exc)})
+
+    started = {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "headers": []}
+    chunks: List[bytes] = []
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            started["status"] = message["status"]
+            started["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    scope = _sub_scope(request, target, query, db, user)
+    try:
+        await app(scope, receive, send)
+    except Exception as exc:
+        logger.error(f"Batch sub-request {path} failed: {exc}")
+        db.rollback()
+        return BatchItemResponse(
+            path=path,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            body={"detail": "Internal server error"},
+        )
+    finally:
+        disconnected.set()
+
+    if started["status"] >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+        # The item may have left the shared session mid-transaction
+        db.rollback()
+
+    content_type = next(
+        (value.decode("latin-1") for name, value in started["headers"] if name.lower() == b"content-type"),
+        None,
+    )
+    return BatchItemResponse(
+        path=path,
+        status=started["status"],
+        body=_decode_body(b"".join(chunks), content_type),
+    )
+
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Run several GET requests against the API in one round trip
+
+    Items run in-process one after another on a shared database session;
+    the routes use blocking database calls, so running them concurrently would
+    not overlap any work. A failed item rolls the session back so later items
+    still run. Results are returned in request order, each with its own status
+    code. The caller is authenticated once and reused by every item.
+
+    Items see each other's side effects: ``/blog/{slug}`` counts a view and
+    commits, which expires the objects earlier items loaded into the session.
+    """
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests"
+        )
+
+    app = _without_user_middleware(request.app)
+    responses = [await _dispatch(app, request, item.path, db, current_user) for item in batch.requests]
+    return BatchResponse(responses=responses)
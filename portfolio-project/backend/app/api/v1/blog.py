@@ -2,80 +2,304 @@
 Blog Post Endpoints
 CRUD operations for blog posts
 """
-from typing import List
+from typing import List, Optional
 import math
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 import uuid
 
 from app.api.deps import get_db, require_admin
+from app.api.fieldsets import Fieldset, FieldSelection, SparseFieldset, list_dumper
+from app.api.streaming import ndjson_response, vary_on_accept, wants_ndjson
+from app.api.tag_filters import tag_filter
+from app.core.cache_policy import add_surrogate_keys, mark_uncacheable
+from app.core.responses import EncodedJSONResponse, ORJSONResponse, content_etag, etag_matches
 from app.schemas.blog import (
+    BlogArchive,
     BlogPostCreate,
     BlogPostUpdate,
     BlogPostResponse,
     BlogPostListResponse,
-    BlogTranslationCreate
+    BlogPostSummary,
+    BlogTrendingPost,
+    BlogSearchResult,
+    BlogTranslationCreate,
+    BlogTranslationSummary,
 )
+from app.schemas.tag import TagSummary
 from app.crud import blog as blog_crud
+from app.crud import blog_archive
+from app.crud import blog_search
+from app.crud import related as related_crud
+from app.crud.pagination import decode_offset_cursor, encode_offset_cursor, next_cursor
+from app.crud.tag import TagFilter
+from app.serializers.encoders import dump_json, dumps, list_envelope, merge_fields
+from app.services.invalidation import invalidate_content
+from app.services.search_index import get_search_index, reindex_blog_posts
+from app.services.trending import WINDOWS, get_trending
+from app.services.view_counter import get_view_counter, visitor_id
 
 router = APIRouter()
 
+BLOG_FIELDSET = Fieldset(
+    fields=(
+        "id", "slug", "title", "excerpt", "cover_image", "author_id", "published",
+        "published_at", "views", "word_count", "reading_time", "created_at", "updated_at",
+    ),
+    relations=("translations", "tags"),
+)
+_blog_relations = {"translations": list_dumper(BlogTranslationSummary), "tags": list_dumper(TagSummary)}
+
+MONTH_NAMES = {
+    "en": (
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December",
+    ),
+    "tr": (
+        "Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran",
+        "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık",
+    ),
+}
+
+
+def _post_key(post_id) -> str:
+    return f"blog:{post_id}"
+
+
+def _reindex(db: Session, background_tasks: BackgroundTasks, post_id) -> None:
+    """Update the search index after a committed write and save it after the response"""
+    reindex_blog_posts(db, post_id)
+    background_tasks.add_task(get_search_index().save)
+
 
-@router.get("/", response_model=BlogPostListResponse)
+@router.get("/", response_model=None, responses={200: {"model": BlogPostListResponse}})
 async def get_blog_posts(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     language: str = Query("en", pattern="^(tr|en)$"),
     published_only: bool = True,
+    cursor: Optional[str] = Query(None, max_length=512, description="next_cursor of the previous page; replaces skip"),
+    selection: FieldSelection = Depends(SparseFieldset(BLOG_FIELDSET)),
+    tags: TagFilter = Depends(tag_filter),
+    year: Optional[int] = Query(None, ge=1970, le=2999, description="Only posts published in this year"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="Narrows year to one of its months"),
     db: Session = Depends(get_db)
 ):
     """
-    Get list of blog posts with pagination
-    """
-    total = blog_crud.get_blog_count(db, published_only=published_only)
-    pages = math.ceil(total / limit) if limit else 1
-    page = skip // limit + 1 if limit else 1
+    Get list of blog post summaries with pagination
 
-    posts = blog_crud.get_blog_posts(
-        db,
-        skip=skip,
-        limit=limit,
-        language=language,
-        published_only=published_only
-    )
+    Items leave out ``content``, which is never loaded for lists; fetch a
+    post by slug for its body. ``fields`` narrows each item further (e.g.
+    ``?fields=slug,title``); ``include=translations`` expands translations
+    and ``include=tags`` adds the tags to narrowed items. ``tag`` keeps posts
+    carrying any of the given tag slugs, ``tags_all`` those carrying all of
+    them. ``year`` and ``month`` list one bucket of ``/blog/archive``.
+    Pass the returned ``next_cursor`` as ``cursor`` to page without offsets;
+    cursor pages skip the count, so ``total``, ``page`` and ``pages`` are null.
 
-    return {
-        "items": posts,
+    With ``Accept: application/x-ndjson`` every matching post is streamed as
+    one item per line instead; ``skip``, ``limit`` and ``cursor`` are ignored.
+    """
+    period = blog_archive.month_range(year, month) if year else None
+    if wants_ndjson(request):
+        posts = blog_crud.iter_blog_posts(
+            db,
+            published_only=published_only,
+            language=language,
+            columns=selection.columns,
+            include=selection.include,
+            tags=tags,
+            period=period,
+        )
+        if selection.is_default:
+            return ndjson_response(posts, lambda post: dump_json(BlogPostSummary, post))
+        return ndjson_response(posts, lambda post: dumps(selection.pick(post, _blog_relations)))
+
+    # Full items are spliced into the body straight from the read model when
+    # every one is materialized
+    result = None
+    if selection.is_default:
+        result = blog_crud.get_blog_post_documents_page(
+            db,
+            skip=skip,
+            limit=limit,
+            language=language,
+            published_only=published_only,
+            cursor=cursor,
+            tags=tags,
+            period=period,
+        )
+    documents = None
+    if result is not None:
+        posts = [post for post, _ in result.items]
+        documents = [document for _, document in result.items]
+    else:
+        result = blog_crud.get_blog_posts_page(
+            db,
+            skip=skip,
+            limit=limit,
+            language=language,
+            published_only=published_only,
+            columns=selection.columns,
+            include=selection.include,
+            cursor=cursor,
+            tags=tags,
+            period=period,
+        )
+        posts = result.items
+        items = posts if selection.is_default else [selection.pick(post, _blog_relations) for post in posts]
+    total = result.total
+    page = pages = None
+    if total is not None:
+        pages = max(math.ceil(total / limit) if limit else 1, 1)
+        page = skip // limit + 1 if limit else 1
+    envelope = {
         "total": total,
         "page": page,
         "size": limit,
-        "pages": max(pages, 1)
+        "pages": pages,
+        "next_cursor": next_cursor(blog_crud.SORT_KEYS, posts, limit),
     }
 
+    if documents is not None:
+        response = EncodedJSONResponse(list_envelope(documents, **envelope))
+    elif selection.is_default:
+        response = EncodedJSONResponse(dump_json(BlogPostListResponse, {"items": items, **envelope}))
+    else:
+        response = ORJSONResponse({"items": items, **envelope})
+    add_surrogate_keys(response, "blog", *(_post_key(post.id) for post in posts))
+    return vary_on_accept(response)
 
-@router.get("/search", response_model=List[BlogPostResponse])
+
+@router.get("/search", response_model=List[BlogSearchResult])
 async def search_blog_posts(
+    response: Response,
     q: str = Query(..., min_length=2),
     language: str = Query("en", pattern="^(tr|en)$"),
     limit: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, max_length=512, description="next_cursor of the previous page; replaces skip"),
+    db: Session = Depends(get_db)
+):
+    """
+    Search blog posts by title and content, returning summaries
+
+    On PostgreSQL ``q`` takes web search syntax (``"exact phrase"``, ``or``,
+    ``-word``) in the stemming of the requested language; results are
+    ordered by relevance and carry a highlighted ``headline``. The cursor for
+    the next page is returned in the ``X-Next-Cursor`` header.
+
+    Elsewhere results come from the in-process BM25 index, ranked by any of
+    the words of ``q`` with case and diacritics folded; its stored results
+    are spliced into the body without querying the database.
+    """
+    index = get_search_index()
+    if index.ready:
+        offset = decode_offset_cursor(cursor) if cursor else 0
+        hits = index.search(q, language, limit, offset)
+        indexed = EncodedJSONResponse(b"[" + b",".join(document for _, document in hits) + b"]")
+        add_surrogate_keys(indexed, "blog", *(_post_key(key) for key, _ in hits))
+        if len(hits) == limit:
+            indexed.headers["X-Next-Cursor"] = encode_offset_cursor(offset + limit)
+        return indexed
+
+    posts = blog_search.search_posts(db, q, language=language, limit=limit, cursor=cursor)
+    add_surrogate_keys(response, "blog", *(_post_key(post.id) for post in posts))
+    following = blog_search.next_search_cursor(db, posts, limit, cursor)
+    if following:
+        response.headers["X-Next-Cursor"] = following
+    return posts
+
+
+@router.get("/trending", response_model=List[BlogTrendingPost])
+async def get_trending_blog_posts(
+    language: str = Query("en", pattern="^(tr|en)$"),
+    window: str = Query("7d", pattern=f"^({'|'.join(WINDOWS)})$"),
+    limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db)
 ):
     """
-    Search blog posts by title and content
+    Get the posts most read lately in a language, highest ``trending_score`` first
+
+    The score counts the views of the last ``window`` (``1d``, ``7d`` or
+    ``30d``) with older views weighing exponentially less; a view one window
+    old weighs 1/e. Read from the leaderboard kept up to date by each counted
+    view, with the summaries looked up by id.
     """
-    return blog_crud.search_blog_posts(db, search_query=q, language=language, limit=limit)
+    leaders = await get_trending().top(language, window, limit)
+    documents = blog_crud.get_blog_summary_documents(db, [post_id for post_id, _ in leaders], language)
+    ranked = [(post_id, score) for post_id, score in leaders if post_id in documents]
+
+    response = EncodedJSONResponse(b"[" + b",".join(
+        merge_fields(documents[post_id][1], views=documents[post_id][0], trending_score=round(score, 3))
+        for post_id, score in ranked
+    ) + b"]")
+    add_surrogate_keys(response, "blog", *(_post_key(post_id) for post_id, _ in ranked))
+    return response
+
+
+@router.get("/archive", response_model=None, responses={200: {"model": BlogArchive}})
+async def get_blog_archive(
+    request: Request,
+    language: str = Query("en", pattern="^(tr|en)$"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the number of published posts per year and month, newest first
+
+    Read from the month counts kept up to date by the blog writes, with the
+    month names in ``language``; list the posts of a month with
+    ``?year=&month=`` on the blog list. ``If-None-Match`` is answered with 304.
+    """
+    years = []
+    for row in blog_archive.get_archive_months(db):
+        if not years or years[-1]["year"] != row.year:
+            years.append({"year": row.year, "count": 0, "months": []})
+        years[-1]["count"] += row.post_count
+        years[-1]["months"].append(
+            {"month": row.month, "name": MONTH_NAMES[language][row.month - 1], "count": row.post_count}
+        )
+    body = dump_json(BlogArchive, {
+        "language": language, "total": sum(year["count"] for year in years), "years": years
+    })
+
+    etag = content_etag(body)
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    else:
+        response = EncodedJSONResponse(body, headers={"ETag": etag})
+    add_surrogate_keys(response, "blog")
+    return response
 
 
 @router.get("/{slug}", response_model=BlogPostResponse)
 async def get_blog_post(
     slug: str,
+    request: Request,
+    response: Response,
     language: str = Query("en", pattern="^(tr|en)$"),
     db: Session = Depends(get_db)
 ):
     """
     Get a specific blog post by slug
-    Also increments view count
+    Also counts a view, once per visitor per window
+
+    Served from the read model with the view count merged in, or assembled
+    from the blog tables when the post has no document yet. The view is
+    buffered and written back in batches, so the count includes views not yet
+    flushed to the database.
     """
+    # Every view must reach the origin to be counted
+    mark_uncacheable(response)
+
+    entry = blog_crud.get_blog_post_document(db, slug, language)
+    if entry is not None:
+        post_id, views, document = entry
+        views += await get_view_counter().record(post_id, visitor_id(request), language)
+        encoded = EncodedJSONResponse(merge_fields(document, views=views))
+        mark_uncacheable(encoded)
+        return encoded
+
     post = blog_crud.get_blog_post_by_slug(db, slug=slug, language=language)
     
     if not post:
@@ -83,36 +307,61 @@ async def get_blog_post(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Blog post not found"
         )
-    
-    # Increment view count
-    blog_crud.increment_blog_views(db, post.id)
 
-    refreshed = blog_crud.get_blog_post_by_slug(db, slug=slug, language=language)
-    if not refreshed:
+    detail = BlogPostResponse.model_validate(post)
+    detail.views += await get_view_counter().record(post.id, visitor_id(request), language)
+    return detail
+
+
+@router.get("/{slug}/related", response_model=List[BlogPostSummary])
+async def get_related_blog_posts(
+    slug: str,
+    language: str = Query("en", pattern="^(tr|en)$"),
+    limit: int = Query(5, ge=1, le=related_crud.NEIGHBORS),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the published posts most similar to a post, most similar first
+
+    Similarity is the TF-IDF cosine of titles, excerpts and content in the
+    requested language, precomputed whenever a post is written; the stored
+    neighbours are looked up and their summaries spliced into the body.
+    """
+    related = related_crud.get_related_documents(db, slug, language, limit)
+    if related is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Blog post not found",
+            detail="Blog post not found"
         )
 
-    return refreshed
+    response = EncodedJSONResponse(
+        b"[" + b",".join(merge_fields(document, views=views) for _, views, document in related) + b"]"
+    )
+    add_surrogate_keys(response, "blog", *(_post_key(post_id) for post_id, _, _ in related))
+    return response
 
 
 @router.post("/", response_model=BlogPostResponse, status_code=status.HTTP_201_CREATED)
 async def create_blog_post(
     post_data: BlogPostCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(require_admin)
 ):
     """
     Create a new blog post (admin only)
     """
-    return blog_crud.create_blog_post(db, post_data, author_id=current_user.id)
+    post = blog_crud.create_blog_post(db, post_data, author_id=current_user.id)
+    _reindex(db, background_tasks, post.id)
+    background_tasks.add_task(invalidate_content, "blog")
+    return post
 
 
 @router.put("/{post_id}", response_model=BlogPostResponse)
 async def update_blog_post(
     post_id: uuid.UUID,
     post_data: BlogPostUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -127,12 +376,17 @@ async def update_blog_post(
             detail="Blog post not found"
         )
     
+    _reindex(db, background_tasks, post_id)
+    if not updated_post.published:
+        await get_trending().remove(post_id)
+    background_tasks.add_task(invalidate_content, "blog", _post_key(post_id))
     return updated_post
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_blog_post(
     post_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -147,6 +401,9 @@ async def delete_blog_post(
             detail="Blog post not found"
         )
     
+    _reindex(db, background_tasks, post_id)
+    await get_trending().remove(post_id)
+    background_tasks.add_task(invalidate_content, "blog", _post_key(post_id))
     return None
 
 
@@ -154,6 +411,7 @@ async def delete_blog_post(
 async def add_blog_translation(
     post_id: uuid.UUID,
     translation_data: BlogTranslationCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -175,4 +433,6 @@ async def add_blog_translation(
             detail="Blog post not found",
         )
 
+    _reindex(db, background_tasks, post_id)
+    background_tasks.add_task(invalidate_content, "blog", _post_key(post_id))
     return post
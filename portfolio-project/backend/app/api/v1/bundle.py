@@ -0,0 +1,36 @@
+"""
+Bundle Endpoints
+Aggregated payloads that replace several round trips of the SPA
+"""
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.core.cache_policy import add_surrogate_keys
+from app.core.responses import content_etag
+from app.services import bundle_service
+
+router = APIRouter()
+
+
+@router.get("/home")
+async def get_home_bundle(
+    language: str = Query("en", pattern="^(tr|en)$"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the home page bundle for a language
+
+    Served from the copy precomputed in Redis whenever content changes; built
+    and stored on a miss.
+    """
+    payload = await bundle_service.get_home_bundle(language)
+    if payload is None:
+        payload = bundle_service.render_home_bundle(db, language)
+        await bundle_service.store_home_bundle(language, payload)
+
+    response = Response(content=payload, media_type="application/json")
+    # Lets the compression middleware reuse its compressed copy of this body
+    response.headers["ETag"] = content_etag(response.body)
+    add_surrogate_keys(response, "bundle", *sorted(bundle_service.HOME_BUNDLE_DEPENDENCIES))
+    return response
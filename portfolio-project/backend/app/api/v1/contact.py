@@ -3,15 +3,17 @@ Contact Form Endpoints
 Submit and manage contact messages
 """
 import uuid
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from loguru import logger
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin
+from app.api.streaming import ndjson_response, wants_ndjson
 from app.crud import contact as contact_crud
-from app.models.contact import ContactMessage as ContactMessageModel
+from app.crud.pagination import next_cursor
+from app.serializers.encoders import dump_json
 from app.schemas.contact import (
     ContactMessage,
     ContactMessageCreate,
@@ -86,31 +88,44 @@ async def submit_contact_message(
 
 @router.get('/', response_model=ContactMessageListResponse)
 async def get_contact_messages(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     unread_only: bool = False,
+    cursor: Optional[str] = Query(None, max_length=512, description="next_cursor of the previous page; replaces skip"),
     db: Session = Depends(get_db),
     _: None = Depends(require_admin),
 ):
-    """Get list of contact messages (admin only)."""
-    messages = contact_crud.get_contact_messages(
+    """
+    Get list of contact messages (admin only).
+
+    With ``Accept: application/x-ndjson`` every matching message is streamed
+    as one item per line instead; ``skip``, ``limit`` and ``cursor`` are ignored.
+    """
+    if wants_ndjson(request):
+        messages = contact_crud.iter_contact_messages(db, unread_only=unread_only)
+        return ndjson_response(messages, lambda message: dump_json(ContactMessage, message))
+
+    page = contact_crud.get_contact_messages_page(
         db,
         skip=skip,
         limit=limit,
         unread_only=unread_only,
+        cursor=cursor,
     )
+    messages = page.items
 
-    count_query = db.query(func.count(ContactMessageModel.id))
-    if unread_only:
-        count_query = count_query.filter(ContactMessageModel.is_read == False)  # noqa: E712
-    total = count_query.scalar()
+    # Offset pages count everything alongside the rows; cursor pages skip the
+    # list total but still report unread messages
+    unread_count = page.counts["unread"] if page.total is not None else contact_crud.get_unread_count(db)
 
     return {
         'messages': messages,
-        'total': total,
+        'total': page.total,
         'skip': skip,
         'limit': limit,
-        'unread_count': contact_crud.get_unread_count(db),
+        'unread_count': unread_count,
+        'next_cursor': next_cursor(contact_crud.SORT_KEYS, messages, limit),
     }
 
 
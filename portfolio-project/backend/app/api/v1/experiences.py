@@ -2,41 +2,65 @@
 Experience Endpoints
 CRUD operations for work experiences, education, and volunteering
 """
-from typing import List, Dict
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Dict, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 import uuid
 
 from app.api.deps import get_db, require_admin
+from app.api.fieldsets import Fieldset, FieldSelection, SparseFieldset, list_dumper
+from app.core.responses import EncodedJSONResponse, ORJSONResponse
 from app.models.experience import Experience
 from app.schemas.experience import (
     ExperienceCreate,
     ExperienceUpdate,
     ExperienceResponse,
-    ExperienceListResponse
+    ExperienceListResponse,
+    ExperienceTranslation
 )
 from app.crud import experience as experience_crud
+from app.crud.pagination import next_cursor
+from app.serializers.encoders import dump_json
+from app.services.invalidation import invalidate_content
 
 router = APIRouter()
 
+EXPERIENCE_FIELDSET = Fieldset(
+    fields=(
+        "id", "title", "organization", "location", "experience_type", "start_date", "end_date",
+        "is_current", "description", "display_order", "created_at", "updated_at",
+    ),
+    relations=("translations",),
+    default_include=("translations",),
+)
+_experience_relations = {"translations": list_dumper(ExperienceTranslation)}
+
 
-@router.get("/", response_model=ExperienceListResponse)
+@router.get("/", response_model=None, responses={200: {"model": ExperienceListResponse}})
 async def get_experiences(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     experience_type: str = Query(None),
     language: str = Query("en", pattern="^(tr|en)$"),
+    cursor: Optional[str] = Query(None, max_length=512, description="next_cursor of the previous page; replaces skip"),
+    selection: FieldSelection = Depends(SparseFieldset(EXPERIENCE_FIELDSET)),
     db: Session = Depends(get_db)
 ):
     """
     Get list of experiences with optional type filtering
+
+    ``fields`` and ``include`` narrow each item, e.g. ``?fields=title,organization&include=``.
+    Pass the returned ``next_cursor`` as ``cursor`` to page without offsets;
+    cursor pages skip the count, so ``total`` is null.
     """
     # Get total count
-    count_query = db.query(func.count(Experience.id))
-    if experience_type:
-        count_query = count_query.filter(Experience.experience_type == experience_type)
-    total = count_query.scalar()
+    total = None
+    if not cursor:
+        count_query = db.query(func.count(Experience.id))
+        if experience_type:
+            count_query = count_query.filter(Experience.experience_type == experience_type)
+        total = count_query.scalar()
 
     experiences = experience_crud.get_experiences(
         db,
@@ -44,14 +68,24 @@ async def get_experiences(
         limit=limit,
         experience_type=experience_type,
         language=language,
+        columns=selection.columns,
+        include=selection.include,
+        cursor=cursor,
     )
     
-    return {
-        "experiences": experiences,
+    payload = {
+        "experiences": (
+            experiences if selection.is_default
+            else [selection.pick(item, _experience_relations) for item in experiences]
+        ),
         "total": total,
         "skip": skip,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor(experience_crud.SORT_KEYS, experiences, limit),
     }
+    if selection.is_default:
+        return EncodedJSONResponse(dump_json(ExperienceListResponse, payload))
+    return ORJSONResponse(payload)
 
 
 @router.get("/by-type", response_model=Dict[str, List[ExperienceResponse]])
@@ -96,19 +130,23 @@ async def get_experience(
 @router.post("/", response_model=ExperienceResponse, status_code=status.HTTP_201_CREATED)
 async def create_experience(
     experience_data: ExperienceCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
     """
     Create a new experience entry (admin only)
     """
-    return experience_crud.create_experience(db, experience_data)
+    experience = experience_crud.create_experience(db, experience_data)
+    background_tasks.add_task(invalidate_content, "experiences")
+    return experience
 
 
 @router.put("/{experience_id}", response_model=ExperienceResponse)
 async def update_experience(
     experience_id: uuid.UUID,
     experience_data: ExperienceUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -127,12 +165,14 @@ async def update_experience(
             detail="Experience not found"
         )
     
+    background_tasks.add_task(invalidate_content, "experiences")
     return updated_experience
 
 
 @router.delete("/{experience_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_experience(
     experience_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -147,4 +187,5 @@ async def delete_experience(
             detail="Experience not found"
         )
     
+    background_tasks.add_task(invalidate_content, "experiences")
     return None
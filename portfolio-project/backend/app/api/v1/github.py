@@ -3,14 +3,17 @@ GitHub Integration Endpoints
 GitHub repository fetching and caching
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
 from loguru import logger
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin, get_current_user_optional
+from app.api.streaming import ndjson_response, vary_on_accept, wants_ndjson
 from app.schemas.github import GitHubRepo, GitHubSyncResponse
 from app.crud import github as github_crud
+from app.serializers.encoders import dump_json
 from app.services.github_service import GitHubService
+from app.services.invalidation import invalidate_content
 from app.config import get_settings
 from app.models.user import User
 
@@ -20,6 +23,9 @@ settings = get_settings()
 
 @router.get("/repos", response_model=List[GitHubRepo])
 async def get_github_repos(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     limit: int = Query(20, ge=1, le=50),
     featured_only: bool = False,
     force_refresh: bool = False,
@@ -29,6 +35,9 @@ async def get_github_repos(
     """
     Get GitHub repositories
     Returns cached data unless force_refresh is True
+
+    With ``Accept: application/x-ndjson`` every cached repository is streamed
+    as one item per line instead; ``limit`` is ignored.
     """
     # Check if cache is valid
     cache_valid = github_crud.is_cache_valid(db, cache_hours=24)
@@ -55,13 +64,20 @@ async def get_github_repos(
         # Update database cache
         if fresh_repos:
             github_crud.bulk_create_or_update_repos(db, fresh_repos)
+            background_tasks.add_task(invalidate_content, "github")
 
     # Return data from database
+    if wants_ndjson(request):
+        repos = github_crud.iter_github_repos(db, featured_only=featured_only)
+        return ndjson_response(repos, lambda repo: dump_json(GitHubRepo, repo))
+
+    vary_on_accept(response)
     return github_crud.get_github_repos(db, limit=limit, featured_only=featured_only)
 
 
 @router.post("/sync", response_model=GitHubSyncResponse)
 async def sync_github_repos(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -84,6 +100,7 @@ async def sync_github_repos(
 
         # Update database
         count = github_crud.bulk_create_or_update_repos(db, repos)
+        background_tasks.add_task(invalidate_content, "github")
 
         return {
             "success": True,
@@ -126,6 +143,7 @@ async def get_cache_status(
 
 @router.delete("/cache", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_cache(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -133,4 +151,5 @@ async def clear_cache(
     Clear GitHub repository cache (admin only)
     """
     github_crud.clear_github_cache(db)
+    background_tasks.add_task(invalidate_content, "github")
     return None
@@ -5,11 +5,16 @@ CRUD operations for projects
 import re
 import uuid
 import os
+from typing import Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin
+from app.api.fieldsets import FieldSelection, SparseFieldset
+from app.api.tag_filters import tag_filter
+from app.core.cache_policy import add_surrogate_keys
+from app.core.responses import EncodedJSONResponse, ORJSONResponse
 from app.schemas.project import (
     ProjectCreate,
     ProjectResponse,
@@ -17,6 +22,12 @@ from app.schemas.project import (
     ProjectUpdate,
 )
 from app.crud import project as project_crud
+from app.crud import read_model as read_model_crud
+from app.crud.pagination import next_cursor
+from app.crud.tag import TagFilter
+from app.serializers.encoders import list_envelope, loads
+from app.serializers.project import PROJECT_FIELDSET, serialize_project
+from app.services.invalidation import invalidate_content
 from app.services.storage_service import StorageService
 
 router = APIRouter()
@@ -24,66 +35,12 @@ router = APIRouter()
 # Maximum allowed upload size for project images (10 MB)
 MAX_PROJECT_IMAGE_UPLOAD_SIZE = 10 * 1024 * 1024
 
+def _project_key(project_id) -> str:
+    return f"project:{project_id}"
 
-def _serialize_project(project, language: str) -> dict:
-    translated = next(
-        (item for item in project.translations if item.language == language),
-        None,
-    )
-    fallback = next(
-        (item for item in project.translations if item.language == "en"),
-        None,
-    )
-    source = translated or fallback
 
-    title = source.title if source else project.title
-    short_description = source.short_description if source else project.short_description
-    description = source.description if source else project.description
-
-    return {
-        "id": str(project.id),
-        "slug": project.slug,
-        "title": title,
-        "short_description": short_description,
-        "description": description,
-        "cover_image": project.cover_image,
-        "github_url": project.github_url,
-        "demo_url": project.demo_url,
-        "featured": project.featured,
-        "display_order": project.display_order,
-        "created_at": project.created_at.isoformat() if project.created_at else None,
-        "updated_at": project.updated_at.isoformat() if project.updated_at else None,
-        "technologies": [
-            {
-                "id": str(tech.id),
-                "name": tech.name,
-                "slug": tech.slug,
-                "icon": tech.icon,
-                "color": tech.color,
-                "category": tech.category,
-            }
-            for tech in project.technologies
-        ],
-        "translations": [
-            {
-                "id": str(trans.id),
-                "language": trans.language,
-                "title": trans.title,
-                "short_description": trans.short_description,
-                "description": trans.description,
-            }
-            for trans in project.translations
-        ],
-        "images": [
-            {
-                "id": str(img.id),
-                "image_url": img.image_url,
-                "caption": img.caption,
-                "display_order": img.display_order,
-            }
-            for img in project.images
-        ],
-    }
+def _project_surrogate_keys(item: dict) -> list:
+    return [_project_key(item["id"]), *(f"technology:{tech['id']}" for tech in item.get("technologies", []))]
 
 
 @router.get("/")
@@ -93,37 +50,72 @@ async def get_projects(
     language: str = Query("en", pattern="^(tr|en)$"),
     featured_only: bool = False,
     technology_slug: str = None,
+    cursor: Optional[str] = Query(None, max_length=512, description="next_cursor of the previous page; replaces skip"),
+    selection: FieldSelection = Depends(SparseFieldset(PROJECT_FIELDSET)),
+    tags: TagFilter = Depends(tag_filter),
     db: Session = Depends(get_db)
 ):
     """
     Get list of projects with optional filtering
-    """
-    total = project_crud.get_projects_count(
-        db,
-        featured_only=featured_only,
-        technology_slug=technology_slug,
-    )
 
-    projects = project_crud.get_projects(
-        db,
-        skip=skip,
-        limit=limit,
-        language=language,
-        featured_only=featured_only,
-        technology_slug=technology_slug
-    )
-    items = [_serialize_project(project, language) for project in projects]
-    
-    return {
-        "items": items,
+    ``fields`` and ``include`` narrow each item, e.g.
+    ``?fields=slug,title,cover_image&include=technologies``. ``tag`` keeps
+    projects carrying any of the given tag slugs, ``tags_all`` those
+    carrying all of them. Pass the
+    returned ``next_cursor`` as ``cursor`` to page without offsets; cursor
+    pages skip the count, so ``total``, ``page`` and ``pages`` are null.
+    """
+    # Full items are spliced into the body straight from the read model when
+    # every one is materialized
+    page = None
+    if selection.is_default:
+        page = project_crud.get_project_documents_page(
+            db,
+            skip=skip,
+            limit=limit,
+            language=language,
+            featured_only=featured_only,
+            technology_slug=technology_slug,
+            tags=tags,
+            cursor=cursor,
+        )
+    documents = None
+    if page is not None:
+        projects = [project for project, _ in page.items]
+        documents = [document for _, document in page.items]
+    else:
+        page = project_crud.get_projects_page(
+            db,
+            skip=skip,
+            limit=limit,
+            language=language,
+            featured_only=featured_only,
+            technology_slug=technology_slug,
+            tags=tags,
+            columns=selection.columns,
+            include=selection.include,
+            cursor=cursor,
+        )
+        projects = page.items
+        items = [serialize_project(project, selection) for project in projects]
+    total = page.total
+    envelope = {
         "total": total,
-        "page": skip // limit + 1 if limit > 0 else 1,
+        "page": None if cursor else (skip // limit + 1 if limit > 0 else 1),
         "size": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 1
+        "pages": None if cursor else ((total + limit - 1) // limit if limit > 0 else 1),
+        "next_cursor": next_cursor(project_crud.SORT_KEYS, projects, limit),
     }
 
+    if documents is not None:
+        response = EncodedJSONResponse(list_envelope(documents, **envelope))
+    else:
+        response = ORJSONResponse({"items": items, **envelope})
+    add_surrogate_keys(response, "projects", *(_project_key(project.id) for project in projects))
+    return response
+
 
-@router.get("/{slug}", response_model=ProjectResponse)
+@router.get("/{slug}", response_model=None, responses={200: {"model": ProjectResponse}})
 async def get_project(
     slug: str,
     language: str = Query("en", pattern="^(tr|en)$"),
@@ -131,34 +123,48 @@ async def get_project(
 ):
     """
     Get a specific project by slug
+
+    Served from the read model, or assembled from the project tables when the
+    project has no document yet.
     """
-    project = project_crud.get_project_by_slug(db, slug=slug, language=language)
-    
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    
-    return _serialize_project(project, language)
+    document = read_model_crud.get_document(db, read_model_crud.PROJECT, slug, language)
+    if document is not None:
+        # Sent as stored; parsed only to tag the response
+        response = EncodedJSONResponse(document)
+        payload = loads(document)
+    else:
+        project = project_crud.get_project_by_slug(db, slug=slug, language=language)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        payload = serialize_project(project)
+        response = ORJSONResponse(payload)
+    add_surrogate_keys(response, *_project_surrogate_keys(payload))
+    return response
 
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
     """
     Create a new project (admin only)
     """
-    return project_crud.create_project(db, project_data)
+    project = project_crud.create_project(db, project_data)
+    background_tasks.add_task(invalidate_content, "projects")
+    return project
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: uuid.UUID,
     project_data: ProjectUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -173,12 +179,14 @@ async def update_project(
             detail="Project not found"
         )
     
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     return updated_project
 
 
 @router.post("/{project_id}/upload-image", status_code=status.HTTP_201_CREATED)
 async def upload_project_image(
     project_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     caption: str = None,
     display_order: int = 0,
@@ -272,8 +280,10 @@ async def upload_project_image(
         display_order=display_order
     )
     db.add(project_image)
+    project_crud.refresh_project_documents(db, project_id)
     db.commit()
     db.refresh(project_image)
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     
     return {
         "id": str(project_image.id),
@@ -289,6 +299,7 @@ async def upload_project_image(
 async def delete_project_image(
     project_id: uuid.UUID,
     image_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -318,7 +329,9 @@ async def delete_project_image(
         )
     
     db.delete(image)
+    project_crud.refresh_project_documents(db, project_id)
     db.commit()
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     
     return None
 
@@ -327,6 +340,7 @@ async def delete_project_image(
 async def update_project_image(
     project_id: uuid.UUID,
     image_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     caption: str = None,
     display_order: int = None,
     db: Session = Depends(get_db),
@@ -363,8 +377,10 @@ async def update_project_image(
     if display_order is not None:
         image.display_order = display_order
     
+    project_crud.refresh_project_documents(db, project_id)
     db.commit()
     db.refresh(image)
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     
     return {
         "id": str(image.id),
@@ -377,6 +393,7 @@ async def update_project_image(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -391,6 +408,7 @@ async def delete_project(
             detail="Project not found"
         )
     
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     return None
 
 
@@ -398,6 +416,7 @@ async def delete_project(
 async def add_project_translation(
     project_id: uuid.UUID,
     translation_data: ProjectTranslationCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -423,4 +442,5 @@ async def add_project_translation(
             detail="Project not found",
         )
 
+    background_tasks.add_task(invalidate_content, "projects", _project_key(project_id))
     return project
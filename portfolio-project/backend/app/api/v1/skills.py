@@ -3,33 +3,46 @@ Skills Endpoints
 CRUD operations for skills
 """
 from typing import List, Dict
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 import uuid
 
 from app.api.deps import get_db, require_admin
+from app.api.fieldsets import Fieldset, FieldSelection, SparseFieldset, list_dumper
 from app.models.skill import Skill
 from app.schemas.skill import (
     SkillCreate,
     SkillUpdate,
     SkillResponse,
-    SkillListResponse
+    SkillListResponse,
+    SkillTranslation
 )
 from app.crud import skill as skill_crud
+from app.services.invalidation import invalidate_content
 
 router = APIRouter()
 
+SKILL_FIELDSET = Fieldset(
+    fields=("id", "name", "category", "proficiency", "icon", "display_order", "created_at"),
+    relations=("translations",),
+    default_include=("translations",),
+)
+_skill_relations = {"translations": list_dumper(SkillTranslation)}
+
 
-@router.get("/", response_model=SkillListResponse)
+@router.get("/", response_model=None, responses={200: {"model": SkillListResponse}})
 async def get_skills(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     language: str = Query("en", pattern="^(tr|en)$"),
+    selection: FieldSelection = Depends(SparseFieldset(SKILL_FIELDSET)),
     db: Session = Depends(get_db)
 ):
     """
     Get list of all skills
+
+    ``fields`` and ``include`` narrow each item, e.g. ``?fields=name,icon,proficiency&include=``.
     """
     # Get total count
     total = db.query(func.count(Skill.id)).scalar()
@@ -39,14 +52,17 @@ async def get_skills(
         skip=skip,
         limit=limit,
         language=language,
+        columns=selection.columns,
+        include=selection.include,
     )
     
-    return {
-        "skills": skills,
+    payload = {
+        "skills": skills if selection.is_default else [selection.pick(skill, _skill_relations) for skill in skills],
         "total": total,
         "skip": skip,
         "limit": limit
     }
+    return SkillListResponse.model_validate(payload) if selection.is_default else payload
 
 
 @router.get("/by-category", response_model=Dict[str, List[SkillResponse]])
@@ -84,19 +100,23 @@ async def get_skill(
 @router.post("/", response_model=SkillResponse, status_code=status.HTTP_201_CREATED)
 async def create_skill(
     skill_data: SkillCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
     """
     Create a new skill (admin only)
     """
-    return skill_crud.create_skill(db, skill_data)
+    skill = skill_crud.create_skill(db, skill_data)
+    background_tasks.add_task(invalidate_content, "skills")
+    return skill
 
 
 @router.put("/{skill_id}", response_model=SkillResponse)
 async def update_skill(
     skill_id: uuid.UUID,
     skill_data: SkillUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -111,12 +131,14 @@ async def update_skill(
             detail="Skill not found"
         )
     
+    background_tasks.add_task(invalidate_content, "skills")
     return updated_skill
 
 
 @router.delete("/{skill_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_skill(
     skill_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -131,4 +153,5 @@ async def delete_skill(
             detail="Skill not found"
         )
     
+    background_tasks.add_task(invalidate_content, "skills")
     return None
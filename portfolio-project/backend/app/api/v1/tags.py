@@ -0,0 +1,34 @@
+"""
+Tag Endpoints
+Tags of blog posts and projects with their counts
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.core.cache_policy import add_surrogate_keys
+from app.crud import tag as tag_crud
+from app.schemas.tag import TagResponse
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[TagResponse])
+async def get_tags(
+    response: Response,
+    type: Optional[str] = Query(None, pattern=f"^({'|'.join(tag_crud.TAG_COUNTS)})$"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the tags in use, most used first
+
+    ``blog_post_count`` counts published posts only. ``type=blog`` or
+    ``type=projects`` lists the tags of that kind of content, ordered by its
+    count. The counts are maintained by the writes, so this reads the tag
+    rows without aggregating.
+    """
+    # Tagged writes purge the blog or projects key
+    add_surrogate_keys(response, "tags", "blog", "projects")
+    return tag_crud.get_tags(db, type)
@@ -3,19 +3,21 @@ Technologies API endpoints
 """
 from typing import List
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin
+from app.crud import project as project_crud
 from app.models.user import User
 from app.models.technology import Technology
 from app.schemas.technology import TechnologyCreate, TechnologyUpdate, TechnologyResponse
+from app.services.invalidation import invalidate_content
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[TechnologyResponse])
-def get_technologies(
+async def get_technologies(
     skip: int = 0,
     limit: int = 100,
     category: str | None = None,
@@ -34,7 +36,7 @@ def get_technologies(
 
 
 @router.get("/{technology_id}", response_model=TechnologyResponse)
-def get_technology(
+async def get_technology(
     technology_id: uuid.UUID,
     db: Session = Depends(get_db)
 ):
@@ -53,6 +55,7 @@ def get_technology(
 @router.post("/", response_model=TechnologyResponse, status_code=status.HTTP_201_CREATED)
 def create_technology(
     technology: TechnologyCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: User = Depends(require_admin)
 ):
@@ -74,6 +77,7 @@ def create_technology(
     db.add(db_technology)
     db.commit()
     db.refresh(db_technology)
+    background_tasks.add_task(invalidate_content, "technologies")
     return db_technology
 
 
@@ -81,6 +85,7 @@ def create_technology(
 def update_technology(
     technology_id: uuid.UUID,
     technology: TechnologyUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: User = Depends(require_admin)
 ):
@@ -113,14 +118,21 @@ def update_technology(
     for field, value in update_data.items():
         setattr(db_technology, field, value)
     
+    project_crud.refresh_project_documents(
+        db, *project_crud.get_technology_project_ids(db, technology_id)
+    )
     db.commit()
     db.refresh(db_technology)
+    background_tasks.add_task(
+        invalidate_content, "technologies", "projects", f"technology:{technology_id}"
+    )
     return db_technology
 
 
 @router.delete("/{technology_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_technology(
     technology_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: User = Depends(require_admin)
 ):
@@ -134,6 +146,11 @@ def delete_technology(
             detail="Technology not found"
         )
     
+    project_ids = project_crud.get_technology_project_ids(db, technology_id)
     db.delete(db_technology)
+    project_crud.refresh_project_documents(db, *project_ids)
     db.commit()
+    background_tasks.add_task(
+        invalidate_content, "technologies", "projects", f"technology:{technology_id}"
+    )
     return None
@@ -3,12 +3,13 @@ Translations & Site Configuration Endpoints
 Multi-language support and site settings
 """
 from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Path
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.api.deps import get_db, require_admin
 from app.crud import site as site_crud
+from app.services.invalidation import invalidate_content
 
 router = APIRouter()
 
@@ -68,6 +69,7 @@ async def get_available_languages(
 
 @router.put("/{language}", response_model=dict)
 async def update_translations(
+    background_tasks: BackgroundTasks,
     language: str = Path(..., pattern="^(tr|en)$"),
     data: TranslationUpdate = None,
     db: Session = Depends(get_db),
@@ -83,6 +85,7 @@ async def update_translations(
         )
     
     count = site_crud.bulk_set_translations(db, language, data.translations)
+    background_tasks.add_task(invalidate_content, "translations")
     
     return {
         "success": True,
@@ -93,6 +96,7 @@ async def update_translations(
 
 @router.post("/{language}/{key}")
 async def set_translation(
+    background_tasks: BackgroundTasks,
     language: str = Path(..., pattern="^(tr|en)$"),
     key: str = Path(...),
     value: str = Query(...),
@@ -103,6 +107,7 @@ async def set_translation(
     Set or update a single translation (admin only)
     """
     translation = site_crud.set_translation(db, language, key, value)
+    background_tasks.add_task(invalidate_content, "translations")
     
     return {
         "success": True,
@@ -117,6 +122,7 @@ async def set_translation(
 @router.delete("/config/{key}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_config(
     key: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -131,11 +137,13 @@ async def delete_config(
             detail="Configuration not found"
         )
 
+    background_tasks.add_task(invalidate_content, "site-config")
     return None
 
 
 @router.delete("/{language}/{key}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_translation(
+    background_tasks: BackgroundTasks,
     language: str = Path(..., pattern="^(tr|en)$"),
     key: str = Path(...),
     db: Session = Depends(get_db),
@@ -152,6 +160,7 @@ async def delete_translation(
             detail="Translation not found"
         )
     
+    background_tasks.add_task(invalidate_content, "translations")
     return None
 
 
@@ -192,6 +201,7 @@ async def get_config(
 @router.post("/config")
 async def set_config(
     data: ConfigUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _: None = Depends(require_admin)
 ):
@@ -199,6 +209,7 @@ async def set_config(
     Set or update site configuration (admin only)
     """
     config = site_crud.set_site_config(db, data.key, data.value, data.description)
+    background_tasks.add_task(invalidate_content, "site-config")
     
     return {
         "success": True,
@@ -48,6 +48,11 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_PASSWORD: Optional[str] = None
 
+    # CDN (surrogate-key purging)
+    CDN_PURGE_BACKEND: str = "none"  # none, varnish, memory
+    CDN_PURGE_URL: Optional[str] = None
+    CDN_PURGE_TIMEOUT_SECONDS: float = 5.0
+
     # Supabase Storage
     SUPABASE_URL: Optional[str] = None
     SUPABASE_KEY: Optional[str] = None
@@ -119,6 +124,37 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
 
+    # Batch API
+    BATCH_MAX_REQUESTS: int = 20
+
+    # Static snapshot of the public API (python -m app.tools.snapshot)
+    SNAPSHOT_DIR: str = "snapshots"
+
+    # Degraded read-only mode: public GETs fall back to the snapshot while the
+    # database is unreachable
+    SNAPSHOT_REFRESH_SECONDS: int = 300  # 0 disables the in-process refresh
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = 3
+    DB_CIRCUIT_RESET_SECONDS: int = 30
+
+    # Response compression (gzip, and brotli when installed)
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_CACHE_BYTES: int = 16 * 1024 * 1024  # compressed copies of cached bodies
+
+    # In-process blog search index, used when the database is not PostgreSQL
+    SEARCH_INDEX_DIR: str = "search-index"
+
+    # Blog view counting: one view per visitor per window, written back in batches
+    VIEW_DEDUP_SECONDS: int = 30 * 60
+    VIEW_FLUSH_SECONDS: int = 10  # 0 disables the background flush
+
+    # Trending blog posts: time-decayed view leaderboards, copied to the database
+    TRENDING_PERSIST_SECONDS: int = 300  # 0 disables persisting and restoring
+
+    # Blog feeds and the sitemap, linking to pages of FRONTEND_URL
+    FEED_TITLE: str = "Yiğit Okur Blog"
+    FEED_AUTHOR: str = "Yiğit Okur"
+    FEED_SIZE: int = 20  # newest posts per feed
+
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB in bytes
     ALLOWED_EXTENSIONS: str = "jpg,jpeg,png,gif,webp,pdf"
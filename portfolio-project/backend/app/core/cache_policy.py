@@ -0,0 +1,122 @@
+"""
+HTTP cache policy for the CDN edge.
+
+Every public GET route maps to a policy that controls ``Cache-Control`` and the
+fallback ``Surrogate-Key`` of the response. Routes that serve individual
+entities tag responses with ``add_surrogate_keys`` (collection key plus one key
+per entity on lists, entity keys only on detail pages) so admin writes can purge
+exactly the affected objects. Routes with side effects per request opt out
+with ``mark_uncacheable``.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import settings
+
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+NO_STORE = "private, no-store"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Edge caching rules for one route family."""
+
+    surrogate_key: str
+    s_maxage: int
+    stale_while_revalidate: int = 86400
+    max_age: int = 0
+
+    @property
+    def cache_control(self) -> str:
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, "
+            f"stale-while-revalidate={self.stale_while_revalidate}"
+        )
+
+
+# Ordered most specific first; paths are relative to API_V1_PREFIX.
+ROUTE_CACHE_POLICIES: Tuple[Tuple[str, CachePolicy], ...] = (
+    ("/projects", CachePolicy(surrogate_key="projects", s_maxage=300)),
+    ("/blog", CachePolicy(surrogate_key="blog", s_maxage=300)),
+    ("/skills", CachePolicy(surrogate_key="skills", s_maxage=3600)),
+    ("/experiences", CachePolicy(surrogate_key="experiences", s_maxage=3600)),
+    ("/technologies", CachePolicy(surrogate_key="technologies", s_maxage=3600)),
+    ("/tags", CachePolicy(surrogate_key="tags", s_maxage=300)),
+    ("/translations/config", CachePolicy(surrogate_key="site-config", s_maxage=3600)),
+    ("/translations", CachePolicy(surrogate_key="translations", s_maxage=3600)),
+    ("/github/repos", CachePolicy(surrogate_key="github", s_maxage=600)),
+    ("/bundle", CachePolicy(surrogate_key="bundle", s_maxage=300)),
+)
+
+# Crawler-facing documents served at the site root, outside API_V1_PREFIX.
+ROOT_CACHE_POLICIES: Tuple[Tuple[str, CachePolicy], ...] = (
+    ("/feeds", CachePolicy(surrogate_key="feeds", s_maxage=900, max_age=300)),
+    ("/sitemap.xml", CachePolicy(surrogate_key="sitemap", s_maxage=3600)),
+    ("/sitemaps", CachePolicy(surrogate_key="sitemap", s_maxage=3600)),
+)
+
+
+def resolve_cache_policy(path: str) -> Optional[CachePolicy]:
+    """Return the cache policy for a request path, or None if it must not be cached."""
+    prefix = settings.API_V1_PREFIX
+    if path.startswith(prefix):
+        path, policies = path[len(prefix):], ROUTE_CACHE_POLICIES
+    else:
+        policies = ROOT_CACHE_POLICIES
+
+    for route_prefix, policy in policies:
+        if path == route_prefix or path.startswith(f"{route_prefix}/"):
+            return policy
+    return None
+
+
+def add_surrogate_keys(response: Response, *keys: str) -> None:
+    """Append entity tags to the response's Surrogate-Key header."""
+    existing = response.headers.get(SURROGATE_KEY_HEADER, "")
+    merged = _merge_keys(existing.split(), keys)
+    if merged:
+        response.headers[SURROGATE_KEY_HEADER] = merged
+
+
+def mark_uncacheable(response: Response) -> None:
+    """Keep a response out of shared caches even if its route family is cacheable."""
+    response.headers["Cache-Control"] = NO_STORE
+
+
+def apply_cache_policy(request: Request, response: Response) -> Response:
+    """Set Cache-Control, Vary and Surrogate-Key headers on an outgoing response."""
+    policy = resolve_cache_policy(request.url.path)
+    cacheable = (
+        policy is not None
+        and request.method in ("GET", "HEAD")
+        # A 304 refreshes the cached 200, so it carries the same headers
+        and response.status_code in (200, 304)
+        and "authorization" not in request.headers
+        and response.headers.get("Cache-Control") != NO_STORE
+    )
+
+    if not cacheable:
+        response.headers["Cache-Control"] = NO_STORE
+        if SURROGATE_KEY_HEADER in response.headers:
+            del response.headers[SURROGATE_KEY_HEADER]
+        return response
+
+    response.headers["Cache-Control"] = policy.cache_control
+    response.headers["Vary"] = _merge_keys(
+        [item.strip() for item in response.headers.get("Vary", "").split(",")],
+        ["Accept-Language"],
+        separator=", ",
+    )
+    if SURROGATE_KEY_HEADER not in response.headers:
+        response.headers[SURROGATE_KEY_HEADER] = policy.surrogate_key
+    return response
+
+
+def _merge_keys(existing: Iterable[str], extra: Iterable[str], separator: str = " ") -> str:
+    seen = []
+    for key in [*existing, *extra]:
+        if key and key not in seen:
+            seen.append(key)
+    return separator.join(seen)
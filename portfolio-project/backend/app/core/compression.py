@@ -0,0 +1,236 @@
+"""
+Response Compression
+Pure-ASGI gzip/brotli negotiation that reuses the compressed copies of cached bodies
+
+Only text-like content types at least ``minimum_size`` bytes long are
+compressed, and responses that already carry a ``Content-Encoding`` (such as
+precompressed snapshot files) pass through untouched. Streamed responses are
+compressed chunk by chunk and flushed after each one, so NDJSON exports keep
+arriving incrementally.
+
+A response with an ``ETag`` is a cached body (the home bundle, snapshot
+files): its compressed variants are kept in a bounded in-process cache keyed
+by path and ETag and reused until the ETag changes, instead of compressing the
+same bytes on every request.
+"""
+import gzip
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/rss+xml",
+    "application/atom+xml",
+    "text/",
+)
+
+# Dynamic bodies favour speed; cached bodies are compressed once, so harder
+GZIP_LEVEL = 6
+CACHED_GZIP_LEVEL = 9
+BROTLI_QUALITY = 5
+CACHED_BROTLI_QUALITY = 9
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, most preferred first"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, supported: Tuple[str, ...]) -> Optional[str]:
+    """
+    Pick the encoding for an ``Accept-Encoding`` header
+
+    The client's highest q-value wins; ties go to the server's preference
+    order. Returns None when nothing acceptable is supported.
+    """
+    weights: Dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        name, _, params = token.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    candidates = [
+        (weights.get(encoding, weights.get("*", 0.0)), -rank, encoding)
+        for rank, encoding in enumerate(supported)
+    ]
+    weight, _, encoding = max(candidates)
+    return encoding if weight > 0 else None
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=CACHED_BROTLI_QUALITY if cached else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL if cached else GZIP_LEVEL, mtime=0)
+
+
+def _stream_compressor(encoding: str) -> Callable[[bytes, bool], bytes]:
+    """Incremental compressor: ``(chunk, last) -> compressed bytes`` flushed per chunk"""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+        def step(chunk: bytes, last: bool) -> bytes:
+            data = compressor.process(chunk)
+            return data + (compressor.finish() if last else compressor.flush())
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+        def step(chunk: bytes, last: bool) -> bytes:
+            data = compressor.compress(chunk)
+            return data + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+    return step
+
+
+class CompressedVariantCache:
+    """Least recently used compressed bodies, bounded by their total size"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Tuple[str, str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class CompressionMiddleware:
+    """Compress eligible responses with the best encoding the client accepts"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, cache_bytes: int = 16 * 1024 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+        self.cache = CompressedVariantCache(cache_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressingResponder(self, encoding, scope["path"], send).run(scope, receive)
+
+
+class _CompressingResponder:
+    """Per-request state: holds the response start until the first body chunk"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, path: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.path = path
+        self.send = send
+        self.start: Optional[Message] = None
+        self.compressing = False
+        self.passthrough = False
+        self.step: Optional[Callable[[bytes, bool], bytes]] = None
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.intercept)
+
+    async def intercept(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        if self.compressing:
+            await self._send_chunk(message)
+            return
+
+        body = message.get("body", b"")
+        streaming = message.get("more_body", False)
+        if not self._eligible(body, streaming):
+            self.passthrough = True
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+        self.start["headers"] = headers.raw
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes are another representation of the resource
+            headers["ETag"] = f"W/{etag}"
+
+        if streaming:
+            del headers["Content-Length"]
+            self.compressing = True
+            self.step = _stream_compressor(self.encoding)
+            await self.send(self.start)
+            await self._send_chunk(message)
+            return
+
+        compressed = self._compress_whole(body, etag)
+        headers["Content-Length"] = str(len(compressed))
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    def _eligible(self, body: bytes, streaming: bool) -> bool:
+        headers = Headers(raw=self.start["headers"])
+        if self.start["status"] < 200 or self.start["status"] in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        return streaming or len(body) >= self.middleware.minimum_size
+
+    def _compress_whole(self, body: bytes, etag: Optional[str]) -> bytes:
+        if not etag:
+            return compress(body, self.encoding)
+        key = (self.path, etag, self.encoding)
+        compressed = self.middleware.cache.get(key)
+        if compressed is None:
+            compressed = compress(body, self.encoding, cached=True)
+            self.middleware.cache.put(key, compressed)
+        return compressed
+
+    async def _send_chunk(self, message: Message) -> None:
+        last = not message.get("more_body", False)
+        data = self.step(message.get("body", b""), last)
+        await self.send({"type": "http.response.body", "body": data, "more_body": not last})
+
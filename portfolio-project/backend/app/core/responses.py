@@ -0,0 +1,48 @@
+"""
+JSON Responses
+Response classes for payloads encoded with orjson or already encoded upstream
+
+Routes that declare a ``response_model`` are already encoded in one pass by
+pydantic's core and keep FastAPI's default response class; these are for
+routes that build their own payload.
+"""
+from hashlib import blake2b
+from typing import Any
+
+from fastapi import Response
+
+from app.serializers.encoders import dumps
+
+
+class ORJSONResponse(Response):
+    """Plain data (dicts, lists, datetimes, UUIDs) encoded with orjson"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class EncodedJSONResponse(Response):
+    """A JSON document that is already encoded, sent as is"""
+    media_type = "application/json"
+
+
+def content_etag(body: bytes) -> str:
+    """
+    Strong ETag derived from a response body
+
+    Set it on responses served from a cache: the compression middleware keeps
+    their compressed variants until the ETag changes.
+    """
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an ``If-None-Match`` header matches a strong ETag
+
+    Weak comparison: compressed copies of a body carry the weak form of its
+    ETag.
+    """
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
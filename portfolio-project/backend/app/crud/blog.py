@@ -2,15 +2,63 @@
 Blog CRUD Operations
 Blog posts and translations management
 """
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func, update
-from typing import List, Optional
+from dataclasses import replace
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+from sqlalchemy import case, or_, func, update
+from typing import Collection, Iterator, List, Mapping, Optional, Set, Tuple
 from datetime import datetime, timezone
 import uuid
 from slugify import slugify
 
 from app.models.blog import BlogPost, BlogTranslation
-from app.schemas.blog import BlogPostCreate, BlogPostUpdate, BlogTranslationCreate
+from app.models.read_model import ContentReadModel
+from app.crud import blog_archive
+from app.crud import feeds as feeds_crud
+from app.crud import read_model
+from app.crud import related as related_crud
+from app.crud import tag as tag_crud
+from app.crud.tag import TagFilter
+from app.crud.loading import collection_loaders, load_columns
+from app.crud.pagination import STREAM_BATCH_SIZE, Page, SortKey, after_cursor, fetch_page, order_by_keys
+from app.crud.translation import (
+    TranslationSpec,
+    foreign_language,
+    project_translations,
+    translated_view,
+    translated_views,
+)
+from app.serializers.encoders import merge_fields
+from app.utils.markdown_renderer import render_content
+from app.schemas.blog import (
+    BlogPostCreate,
+    BlogPostResponse,
+    BlogPostSummary,
+    BlogPostUpdate,
+    BlogTranslationCreate,
+    BlogTranslationSummary,
+)
+
+# Columns overridden by blog translations
+TRANSLATED_FIELDS = (
+    "title", "content", "content_html", "content_toc", "excerpt", "word_count", "reading_time",
+)
+TRANSLATIONS = TranslationSpec(BlogTranslation, "blog_post_id", TRANSLATED_FIELDS)
+
+# Read-model documents leave out the view count, which changes on every read
+DOCUMENT_EXCLUDE = {"views"}
+
+# Columns of list and search results; post and translation bodies stay deferred
+# and the tags are loaded for the whole page at once
+SUMMARY_RELATIONS = ("tags",)
+SUMMARY_COLUMNS = tuple(name for name in BlogPostSummary.model_fields if name not in SUMMARY_RELATIONS)
+TRANSLATION_SUMMARY_COLUMNS = {"translations": tuple(BlogTranslationSummary.model_fields)}
+
+# Newest first; drafts without published_at sort ahead of published posts,
+# matching a backward scan of the published_at index
+SORT_KEYS = (
+    SortKey(BlogPost.published_at, descending=True, nullable=True, nulls_first=True),
+    SortKey(BlogPost.id, descending=True),
+)
 
 
 def _escape_ilike(value: str) -> str:
@@ -18,33 +66,49 @@ def _escape_ilike(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
-def _apply_blog_translation(post: BlogPost, language: Optional[str] = None) -> BlogPost:
-    """Apply requested translation to a blog post with English fallback."""
-    if not language or language == "en":
-        return post
-
-    translations = post.translations or []
-    translated = next((item for item in translations if item.language == language), None)
-    fallback = next((item for item in translations if item.language == "en"), None)
-    source = translated or fallback
-
-    if source:
-        post.title = source.title
-        post.content = source.content
-        post.excerpt = source.excerpt
-
-    return post
-
-
 def get_blog_posts(
     db: Session,
     skip: int = 0,
     limit: int = 10,
     published_only: bool = True,
-    language: Optional[str] = None
+    language: Optional[str] = None,
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    cursor: Optional[str] = None,
+    tags: Optional[TagFilter] = None,
+    period: Optional[Tuple[datetime, datetime]] = None,
 ) -> List[BlogPost]:
+    """Get list of blog posts; see ``get_blog_posts_page`` for the arguments"""
+    return get_blog_posts_page(
+        db,
+        skip=skip,
+        limit=limit,
+        published_only=published_only,
+        language=language,
+        tags=tags,
+        period=period,
+        columns=columns,
+        include=include,
+        cursor=cursor,
+        with_total=False,
+    ).items
+
+
+def get_blog_posts_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    published_only: bool = True,
+    language: Optional[str] = None,
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+    tags: Optional[TagFilter] = None,
+    period: Optional[Tuple[datetime, datetime]] = None,
+) -> Page:
     """
-    Get list of blog posts
+    Get a page of blog posts, with the filtered total in the same query
     
     Args:
         db: Database session
@@ -52,19 +116,145 @@ def get_blog_posts(
         limit: Maximum number of records to return
         published_only: Only return published posts
         language: Filter by language (for translations)
+        columns: Columns to load (None loads ``SUMMARY_COLUMNS``)
+        include: Relations to eager load among translations and tags (None
+            loads both)
+        cursor: Keyset cursor of the previous page; replaces ``skip``
+        with_total: Count the filtered posts (not meaningful with a cursor)
+        tags: Only return posts matching these tags
+        period: Only return posts published within ``[start, end)``
         
     Returns:
-        List of blog posts
+        Page of blog posts
+    """
+    query, translated = _blog_posts_query(db, published_only, language, columns, include, tags, period)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    page = fetch_page(query, limit, with_total=with_total and not cursor)
+    return replace(page, items=translated_views(page.items, translated))
+
+
+def iter_blog_posts(
+    db: Session,
+    published_only: bool = True,
+    language: Optional[str] = None,
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    tags: Optional[TagFilter] = None,
+    period: Optional[Tuple[datetime, datetime]] = None,
+) -> Iterator[BlogPost]:
     """
-    query = db.query(BlogPost).options(joinedload(BlogPost.translations))
+    Stream every blog post in list order, ``batch_size`` rows per round trip
+
+    Takes the filters of ``get_blog_posts_page``. Rows are fetched through a
+    server-side cursor where the driver supports one, so memory does not grow
+    with the number of posts.
+    """
+    query, translated = _blog_posts_query(db, published_only, language, columns, include, tags, period)
+    for row in query.yield_per(batch_size):
+        yield translated_view(row, translated)
+
+
+def _blog_posts_query(db: Session, published_only: bool, language, columns, include, tags=None, period=None):
+    if columns is None:
+        # Full summaries carry their tags
+        columns = SUMMARY_COLUMNS
+        include = None if include is None else {*include, *SUMMARY_RELATIONS}
+    options = load_columns(BlogPost, columns, required=[key.attribute for key in SORT_KEYS])
+    options.extend(collection_loaders(
+        {"translations": BlogPost.translations, "tags": BlogPost.tags},
+        include,
+        columns=TRANSLATION_SUMMARY_COLUMNS,
+    ))
+    query = _filter_posts(db, db.query(BlogPost).options(*options), published_only, tags, period)
     
+    query, translated = project_translations(
+        query, BlogPost, TRANSLATIONS, foreign_language(language), columns
+    )
+    return order_by_keys(query, SORT_KEYS), translated
+
+
+def _filter_posts(db: Session, query, published_only: bool, tags: Optional[TagFilter], period):
     if published_only:
         query = query.filter(BlogPost.published == True)
-    
-    query = query.order_by(BlogPost.published_at.desc())
-    posts = query.offset(skip).limit(limit).all()
+    if period:
+        start, end = period
+        query = query.filter(BlogPost.published_at >= start, BlogPost.published_at < end)
+    return tag_crud.filter_tagged(db, query, tag_crud.BLOG_TAGS, tags)
 
-    return [_apply_blog_translation(post, language) for post in posts]
+
+def get_blog_post_documents_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    published_only: bool = True,
+    language: Optional[str] = None,
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+    tags: Optional[TagFilter] = None,
+    period: Optional[Tuple[datetime, datetime]] = None,
+) -> Optional[Page]:
+    """
+    Get a page of ready-to-serve blog post summaries from the read model
+
+    Filters, order and cursors match ``get_blog_posts_page``. Items are
+    ``(post, summary document)`` pairs where only the sort keys and view count of the
+    post are loaded; the current ``views`` is spliced into each encoded
+    document.
+
+    Returns:
+        The page, or None when a post on it has no document yet and the caller
+        must fall back to ``get_blog_posts_page``
+    """
+    query = db.query(BlogPost, ContentReadModel.document).options(
+        load_only(*(key.column for key in SORT_KEYS), BlogPost.views)
+    ).outerjoin(
+        ContentReadModel, read_model.document_join(read_model.BLOG_SUMMARY, BlogPost.id, language or "en")
+    )
+    query = order_by_keys(_filter_posts(db, query, published_only, tags, period), SORT_KEYS)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    page = fetch_page(query, limit, with_total=with_total and not cursor)
+
+    if any(document is None for _, document in page.items):
+        return None
+    return replace(page, items=[
+        (post, merge_fields(document, views=post.views)) for post, document in page.items
+    ])
+
+
+def refresh_blog_documents(db: Session, *post_ids: uuid.UUID) -> None:
+    """
+    Rewrite the read-model documents of blog posts in the current transaction
+
+    Each post gets a full document for the detail route and a summary for
+    lists. Call after a write and before its commit; documents of posts that
+    no longer exist are removed.
+    """
+    db.flush()
+    for post_id in post_ids:
+        documents, summaries, slug = {}, {}, None
+        for language in read_model.READ_MODEL_LANGUAGES:
+            query = db.query(BlogPost).populate_existing().filter(BlogPost.id == post_id)
+            query, translated = project_translations(
+                query, BlogPost, TRANSLATIONS, foreign_language(language)
+            )
+            row = query.first()
+            if row is None:
+                break
+            post = translated_view(row, translated)
+            slug = post.slug
+            documents[language] = BlogPostResponse.model_validate(post).model_dump_json(
+                exclude=DOCUMENT_EXCLUDE
+            )
+            summaries[language] = BlogPostSummary.model_validate(post).model_dump_json(
+                exclude=DOCUMENT_EXCLUDE
+            )
+
+        if documents:
+            read_model.store_documents(db, read_model.BLOG, post_id, slug, documents)
+            read_model.store_documents(db, read_model.BLOG_SUMMARY, post_id, slug, summaries)
+        else:
+            read_model.delete_documents(db, read_model.BLOG, [post_id])
 
 
 def get_blog_post_by_id(db: Session, post_id: uuid.UUID) -> Optional[BlogPost]:
@@ -79,15 +269,11 @@ def get_blog_post_by_slug(
     slug: str,
     language: Optional[str] = None
 ) -> Optional[BlogPost]:
-    """Get blog post by slug with translations"""
-    post = db.query(BlogPost).options(
-        joinedload(BlogPost.translations)
-    ).filter(BlogPost.slug == slug).first()
-
-    if not post:
-        return None
-
-    return _apply_blog_translation(post, language)
+    """Get blog post by slug, translated with English fallback"""
+    query = db.query(BlogPost).filter(BlogPost.slug == slug)
+    query, translated = project_translations(query, BlogPost, TRANSLATIONS, foreign_language(language))
+    row = query.first()
+    return translated_view(row, translated) if row else None
 
 
 def create_blog_post(db: Session, post: BlogPostCreate, author_id: uuid.UUID) -> BlogPost:
@@ -112,14 +298,9 @@ def create_blog_post(db: Session, post: BlogPostCreate, author_id: uuid.UUID) ->
         slug = f"{base_slug}-{counter}"
         counter += 1
     
-    # Calculate reading time if not provided (simple: ~200 words per minute)
-    reading_time = post.reading_time
-    if not reading_time and post.content:
-        word_count = len(post.content.split())
-        reading_time = max(1, word_count // 200)
-    
     db_post = BlogPost(
         slug=slug,
+        tags=tag_crud.get_or_create_tags(db, post.tags or []),
         title=post.title,
         content=post.content,
         excerpt=post.excerpt,
@@ -127,11 +308,13 @@ def create_blog_post(db: Session, post: BlogPostCreate, author_id: uuid.UUID) ->
         author_id=author_id,
         published=post.published,
         published_at=datetime.now(timezone.utc) if post.published else None,
-        reading_time=reading_time
     )
     
+    render_content(db_post)
     db.add(db_post)
     db.flush()  # Flush to get the ID
+    tag_crud.update_tag_counts(db, tag_crud.BLOG_TAGS, (), _counted_tag_ids(db_post))
+    blog_archive.move_post(db, None, blog_archive.archive_month(db_post))
     
     # Add translations if provided
     if post.translations:
@@ -143,8 +326,12 @@ def create_blog_post(db: Session, post: BlogPostCreate, author_id: uuid.UUID) ->
                 content=translation.content,
                 excerpt=translation.excerpt
             )
+            render_content(db_translation)
             db.add(db_translation)
     
+    refresh_blog_documents(db, db_post.id)
+    related_crud.refresh_related_posts(db, db_post.id)
+    feeds_crud.refresh_blog_feeds(db, db_post.id)
     db.commit()
     db.refresh(db_post)
     
@@ -172,7 +359,9 @@ def update_blog_post(
     if not db_post:
         return None
     
-    update_data = post_update.model_dump(exclude_unset=True)
+    update_data = post_update.model_dump(exclude_unset=True, exclude={"tags"})
+    counted_before = _counted_tag_ids(db_post)
+    month_before = blog_archive.archive_month(db_post)
     
     # Handle published status change
     if "published" in update_data:
@@ -187,7 +376,15 @@ def update_blog_post(
     
     for field, value in update_data.items():
         setattr(db_post, field, value)
+    if post_update.tags is not None:
+        db_post.tags = tag_crud.get_or_create_tags(db, post_update.tags)
+    render_content(db_post)
+    tag_crud.update_tag_counts(db, tag_crud.BLOG_TAGS, counted_before, _counted_tag_ids(db_post))
+    blog_archive.move_post(db, month_before, blog_archive.archive_month(db_post))
     
+    refresh_blog_documents(db, post_id)
+    related_crud.refresh_related_posts(db, post_id)
+    feeds_crud.refresh_blog_feeds(db, post_id)
     db.commit()
     db.refresh(db_post)
     
@@ -210,33 +407,73 @@ def delete_blog_post(db: Session, post_id: uuid.UUID) -> bool:
     if not db_post:
         return False
     
+    related_crud.refresh_related_posts(db, post_id, deleting=True)
+    tag_crud.update_tag_counts(db, tag_crud.BLOG_TAGS, _counted_tag_ids(db_post), ())
+    blog_archive.move_post(db, blog_archive.archive_month(db_post), None)
     db.delete(db_post)
+    refresh_blog_documents(db, post_id)
+    feeds_crud.refresh_blog_feeds(db, post_id)
     db.commit()
     
     return True
 
 
-def increment_blog_views(db: Session, post_id: uuid.UUID) -> Optional[BlogPost]:
+def _counted_tag_ids(post: BlogPost) -> Set[uuid.UUID]:
+    """Tags whose counts include the post: its own while it is published"""
+    return {tag.id for tag in post.tags} if post.published else set()
+
+
+def add_blog_views(db: Session, counts: Mapping[uuid.UUID, int]) -> None:
     """
-    Atomically increment blog post view count
+    Add buffered view counts to their posts in one UPDATE and commit
+
+    ``updated_at`` is left alone: views are not an edit of the post.
 
     Args:
         db: Database session
-        post_id: Blog post ID
-
-    Returns:
-        Updated BlogPost or None if not found
+        counts: Views to add per blog post ID
     """
+    if not counts:
+        return
     db.execute(
         update(BlogPost)
-        .where(BlogPost.id == post_id)
-        .values(views=BlogPost.views + 1)
+        .where(BlogPost.id.in_(list(counts)))
+        .values(
+            views=BlogPost.views + case(dict(counts), value=BlogPost.id, else_=0),
+            updated_at=BlogPost.updated_at,
+        )
+        .execution_options(synchronize_session=False)
     )
     db.commit()
-    db_post = db.query(BlogPost).filter(BlogPost.id == post_id).first()
-    if db_post:
-        db.refresh(db_post)
-    return db_post
+
+
+def get_blog_post_document(
+    db: Session, slug: str, language: str
+) -> Optional[Tuple[uuid.UUID, int, str]]:
+    """Look up ``(post_id, views, document)`` by slug; None when it has not been materialized"""
+    return db.query(ContentReadModel.entity_id, BlogPost.views, ContentReadModel.document).join(
+        BlogPost, BlogPost.id == ContentReadModel.entity_id
+    ).filter(
+        ContentReadModel.entity_type == read_model.BLOG,
+        ContentReadModel.language == language,
+        ContentReadModel.slug == slug,
+    ).first()
+
+
+def get_blog_summary_documents(
+    db: Session, post_ids: Collection[uuid.UUID], language: str
+) -> Mapping[uuid.UUID, Tuple[int, str]]:
+    """Look up ``{post_id: (views, summary document)}`` of the published posts among ``post_ids``"""
+    if not post_ids:
+        return {}
+    rows = db.query(ContentReadModel.entity_id, BlogPost.views, ContentReadModel.document).join(
+        BlogPost, BlogPost.id == ContentReadModel.entity_id
+    ).filter(
+        read_model.document_join(read_model.BLOG_SUMMARY, ContentReadModel.entity_id, language),
+        ContentReadModel.entity_id.in_(list(post_ids)),
+        BlogPost.published == True,
+    )
+    return {post_id: (views, document) for post_id, views, document in rows}
 
 
 def search_blog_posts(
@@ -245,10 +482,11 @@ def search_blog_posts(
     language: Optional[str] = None,
     skip: int = 0,
     limit: int = 10,
-    published_only: bool = True
+    published_only: bool = True,
+    cursor: Optional[str] = None,
 ) -> List[BlogPost]:
     """
-    Search blog posts by title or content
+    Search blog posts by title or content, loading ``SUMMARY_COLUMNS`` only
     
     Args:
         db: Database session
@@ -256,13 +494,16 @@ def search_blog_posts(
         skip: Number of records to skip
         limit: Maximum number of records to return
         published_only: Only return published posts
+        cursor: Keyset cursor of the previous page; replaces ``skip``
         
     Returns:
         List of matching blog posts
     """
     search = f"%{_escape_ilike(search_query)}%"
 
-    db_query = db.query(BlogPost).filter(
+    db_query = db.query(BlogPost).options(
+        *load_columns(BlogPost, SUMMARY_COLUMNS), selectinload(BlogPost.tags)
+    ).filter(
         or_(
             BlogPost.title.ilike(search, escape="\\"),
             BlogPost.content.ilike(search, escape="\\"),
@@ -273,9 +514,12 @@ def search_blog_posts(
     if published_only:
         db_query = db_query.filter(BlogPost.published == True)
 
-    posts = db_query.order_by(BlogPost.published_at.desc()).offset(skip).limit(limit).all()
-
-    return [_apply_blog_translation(post, language) for post in posts]
+    db_query, translated = project_translations(
+        db_query, BlogPost, TRANSLATIONS, foreign_language(language), SUMMARY_COLUMNS
+    )
+    db_query = order_by_keys(db_query, SORT_KEYS)
+    db_query = after_cursor(db_query, SORT_KEYS, cursor) if cursor else db_query.offset(skip)
+    return translated_views(db_query.limit(limit).all(), translated)
 
 
 def get_blog_count(db: Session, published_only: bool = True) -> int:
@@ -320,6 +564,10 @@ def add_blog_translation(
         existing.title = translation.title
         existing.content = translation.content
         existing.excerpt = translation.excerpt
+        render_content(existing)
+        refresh_blog_documents(db, post_id)
+        related_crud.refresh_related_posts(db, post_id)
+        feeds_crud.refresh_blog_feeds(db, post_id)
         db.commit()
         db.refresh(existing)
         return existing
@@ -332,7 +580,11 @@ def add_blog_translation(
             content=translation.content,
             excerpt=translation.excerpt
         )
+        render_content(db_translation)
         db.add(db_translation)
+        refresh_blog_documents(db, post_id)
+        related_crud.refresh_related_posts(db, post_id)
+        feeds_crud.refresh_blog_feeds(db, post_id)
         db.commit()
         db.refresh(db_translation)
         return db_translation
@@ -0,0 +1,63 @@
+"""
+Blog Archive CRUD
+Published posts per month, kept as an aggregate moved by the blog writes
+
+The archive route reads the few month rows instead of grouping the posts by
+month on every request. Months are of the UTC ``published_at``.
+"""
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.blog import BlogArchiveMonth, BlogPost
+from app.utils.feed_xml import utc
+
+# (year, month) bucket of the archive
+Month = Tuple[int, int]
+
+
+def archive_month(post: BlogPost) -> Optional[Month]:
+    """The month whose count includes a post: that of its publication while it is published"""
+    if not post.published or post.published_at is None:
+        return None
+    published_at = utc(post.published_at)
+    return published_at.year, published_at.month
+
+
+def move_post(db: Session, before: Optional[Month], after: Optional[Month]) -> None:
+    """
+    Move a written post between archive months in the current transaction
+
+    Call with ``archive_month`` of the post before and after the write, and
+    before its commit. A month left without posts loses its row.
+    """
+    if before == after:
+        return
+    for bucket, change in ((before, -1), (after, 1)):
+        if bucket is None:
+            continue
+        row = db.get(BlogArchiveMonth, bucket)
+        if row is None:
+            if change > 0:
+                db.add(BlogArchiveMonth(year=bucket[0], month=bucket[1], post_count=change))
+        elif row.post_count + change > 0:
+            row.post_count += change
+        else:
+            db.delete(row)
+    db.flush()
+
+
+def get_archive_months(db: Session) -> List[BlogArchiveMonth]:
+    """Every archive month with published posts, newest first"""
+    return db.query(BlogArchiveMonth).order_by(
+        BlogArchiveMonth.year.desc(), BlogArchiveMonth.month.desc()
+    ).all()
+
+
+def month_range(year: int, month: Optional[int] = None) -> Tuple[datetime, datetime]:
+    """``[start, end)`` of a year, or of one of its months, in UTC"""
+    start = datetime(year, month or 1, 1, tzinfo=timezone.utc)
+    if month is None or month == 12:
+        return start, datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    return start, datetime(year, month + 1, 1, tzinfo=timezone.utc)
@@ -0,0 +1,208 @@
+"""
+Blog Search
+Ranked full-text search over blog posts and their translations
+
+On PostgreSQL, posts and translations carry a stored ``search_vector``
+(migration 004) built with the text search configuration of their language
+and indexed with GIN. A query is parsed with ``websearch_to_tsquery`` (quoted
+phrases, ``or``, ``-exclusions``), matched through those indexes, ordered by
+``ts_rank_cd`` and returned with a ``ts_headline`` snippet. Other databases
+are ranked by the in-process BM25 index of ``app.services.search_index``,
+fed by ``index_documents``, or fall back to the ``ILIKE`` scan of
+``blog.search_blog_posts`` while it is not loaded.
+"""
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, column, exists, false, func, literal, select, table, true, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.orm import Session, aliased, selectinload
+
+from app.crud import blog as blog_crud
+from app.crud.loading import load_columns
+from app.crud.pagination import decode_offset_cursor, encode_offset_cursor, next_cursor
+from app.crud.translation import TranslatedView, foreign_language, project_translations, translated_view
+from app.models.blog import BlogPost, BlogTranslation
+from app.schemas.blog import BlogSearchResult
+
+# Text search configuration per content language; the base post row is English
+SEARCH_CONFIGS = {"en": "english", "tr": "turkish", "de": "german", "fr": "french"}
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+
+# The generated vectors are not mapped: SQLite, used in development and
+# tests, cannot create them
+_post_vectors = table("blog_posts", column("id"), column("search_vector", TSVECTOR))
+_translation_vectors = table(
+    "blog_translations",
+    column("blog_post_id"),
+    column("language"),
+    column("search_vector", TSVECTOR),
+)
+
+
+def uses_fulltext(db: Session) -> bool:
+    """True when the database provides the ranked full-text search"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _config(language: str):
+    return literal(SEARCH_CONFIGS.get(language, "english"), REGCONFIG)
+
+
+def _tsquery(language: str, text: str):
+    return func.websearch_to_tsquery(_config(language), text)
+
+
+def _matches(text: str, language: str):
+    """
+    Matching post ids with their rank, found through the GIN indexes
+
+    Posts translated into ``language`` match on the translation; the others
+    on the English post, which is what the list shows for them. ``translated``
+    tells the two apart.
+    """
+    english = _tsquery("en", text)
+    posts = select(
+        _post_vectors.c.id.label("post_id"),
+        func.ts_rank_cd(_post_vectors.c.search_vector, english).label("rank"),
+        false().label("translated"),
+    ).where(_post_vectors.c.search_vector.op("@@")(english))
+    if language == "en":
+        return posts.subquery("matches")
+
+    local = _tsquery(language, text)
+    translations = select(
+        _translation_vectors.c.blog_post_id.label("post_id"),
+        func.ts_rank_cd(_translation_vectors.c.search_vector, local).label("rank"),
+        true().label("translated"),
+    ).where(
+        _translation_vectors.c.language == language,
+        _translation_vectors.c.search_vector.op("@@")(local),
+    )
+    untranslated = posts.where(~exists().where(
+        _translation_vectors.c.blog_post_id == _post_vectors.c.id,
+        _translation_vectors.c.language == language,
+    ))
+    return union_all(translations, untranslated).subquery("matches")
+
+
+def fulltext_query(db: Session, text: str, language: str, published_only: bool = True):
+    """
+    Query of ranked posts matching ``text``, and the translated columns it adds
+
+    Rows are ``(post, *translated values, headline)`` ordered by relevance.
+    ``ts_headline`` re-parses the matched body, so it sits in the select
+    list, which PostgreSQL evaluates only for the rows left after ORDER BY
+    and LIMIT.
+    """
+    matches = _matches(text, language)
+    query = db.query(BlogPost).options(
+        *load_columns(BlogPost, blog_crud.SUMMARY_COLUMNS), selectinload(BlogPost.tags)
+    ).join(matches, matches.c.post_id == BlogPost.id)
+    if published_only:
+        query = query.filter(BlogPost.published == True)
+    query, translated = project_translations(
+        query, BlogPost, blog_crud.TRANSLATIONS, foreign_language(language), blog_crud.SUMMARY_COLUMNS
+    )
+
+    if language == "en":
+        headline = func.ts_headline(_config("en"), BlogPost.content, _tsquery("en", text), HEADLINE_OPTIONS)
+    else:
+        source = aliased(BlogTranslation)
+        query = query.outerjoin(
+            source, and_(matches.c.translated, source.blog_post_id == BlogPost.id, source.language == language)
+        )
+        headline = func.ts_headline(
+            case((matches.c.translated, _config(language)), else_=_config("en")),
+            func.coalesce(source.content, BlogPost.content),
+            case((matches.c.translated, _tsquery(language, text)), else_=_tsquery("en", text)),
+            HEADLINE_OPTIONS,
+        )
+    query = query.add_columns(headline).order_by(
+        matches.c.rank.desc(), *(key.ordering() for key in blog_crud.SORT_KEYS)
+    )
+    return query, translated
+
+
+def fulltext_search(
+    db: Session,
+    text: str,
+    language: Optional[str] = None,
+    limit: int = 10,
+    published_only: bool = True,
+    cursor: Optional[str] = None,
+) -> List[TranslatedView]:
+    """
+    Rank posts matching ``text`` in ``language``; PostgreSQL only
+
+    Items are summary views (see ``blog.SUMMARY_COLUMNS``) with a
+    ``headline``.
+
+    Raises:
+        InvalidCursor: If ``cursor`` was not issued by this search
+    """
+    offset = decode_offset_cursor(cursor) if cursor else 0
+    query, translated = fulltext_query(db, text, language or "en", published_only)
+    return [
+        TranslatedView(entity, {**dict(zip(translated, values)), "headline": snippet})
+        for entity, *values, snippet in query.offset(offset).limit(limit)
+    ]
+
+
+def search_posts(
+    db: Session,
+    text: str,
+    language: Optional[str] = None,
+    limit: int = 10,
+    published_only: bool = True,
+    cursor: Optional[str] = None,
+) -> list:
+    """Search published posts with the best method the database supports"""
+    if uses_fulltext(db):
+        return fulltext_search(
+            db, text, language=language, limit=limit, published_only=published_only, cursor=cursor
+        )
+    return blog_crud.search_blog_posts(
+        db, search_query=text, language=language, limit=limit, published_only=published_only, cursor=cursor
+    )
+
+
+def next_search_cursor(db: Session, posts: list, limit: int, cursor: Optional[str] = None) -> Optional[str]:
+    """Cursor of the page after ``posts`` of ``search_posts``"""
+    if not uses_fulltext(db):
+        return next_cursor(blog_crud.SORT_KEYS, posts, limit)
+    if len(posts) < limit:
+        return None
+    return encode_offset_cursor((decode_offset_cursor(cursor) if cursor else 0) + limit)
+
+
+def index_documents(
+    db: Session, language: str, post_ids: Optional[Sequence] = None
+) -> Iterator[Tuple[str, Tuple[str, str, str], bytes]]:
+    """
+    Published posts as the search index stores them
+
+    Yields ``(id, (title, excerpt, content), result)`` in ``language``, where
+    ``result`` is the serialized ``BlogSearchResult`` the index returns for a
+    hit; its ``views`` are those at indexing time.
+    """
+    query = db.query(BlogPost).filter(BlogPost.published == True)
+    if post_ids is not None:
+        query = query.filter(BlogPost.id.in_(list(post_ids)))
+    query, translated = project_translations(
+        query, BlogPost, blog_crud.TRANSLATIONS, foreign_language(language)
+    )
+    for row in query.order_by(BlogPost.id):
+        post = translated_view(row, translated)
+        yield (
+            str(post.id),
+            (post.title, post.excerpt or "", post.content),
+            BlogSearchResult.model_validate(post).model_dump_json().encode(),
+        )
+
+
+def index_watermark(db: Session) -> str:
+    """Fingerprint of the blog tables; changes with every post or translation write"""
+    posts = db.query(func.count(BlogPost.id), func.max(BlogPost.updated_at)).one()
+    translations = db.query(func.count(BlogTranslation.id), func.max(BlogTranslation.updated_at)).one()
+    return "|".join(str(value) for value in (*posts, *translations))
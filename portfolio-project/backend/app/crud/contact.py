@@ -4,39 +4,82 @@ Contact form submissions management
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import uuid
 
 from app.models.contact import ContactMessage
+from app.crud.pagination import STREAM_BATCH_SIZE, Page, SortKey, after_cursor, fetch_page, order_by_keys
 from app.schemas.contact import ContactMessageCreate
 
+# Newest first, also used as the keyset for cursor pagination
+SORT_KEYS = (
+    SortKey(ContactMessage.created_at, descending=True),
+    SortKey(ContactMessage.id, descending=True),
+)
+
 
 def get_contact_messages(
     db: Session,
     skip: int = 0,
     limit: int = 20,
-    unread_only: bool = False
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
 ) -> List[ContactMessage]:
+    """Get list of contact messages; see ``get_contact_messages_page`` for the arguments"""
+    return get_contact_messages_page(
+        db, skip=skip, limit=limit, unread_only=unread_only, cursor=cursor, with_total=False
+    ).items
+
+
+def get_contact_messages_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 20,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+) -> Page:
     """
-    Get list of contact messages
+    Get a page of contact messages with the total and unread counts in the same query
     
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
         unread_only: Only return unread messages
+        cursor: Keyset cursor of the previous page; replaces ``skip``
+        with_total: Count the filtered and the unread messages (not
+            meaningful with a cursor)
         
     Returns:
-        List of contact messages
+        Page of contact messages; ``counts["unread"]`` holds the unread count
     """
+    query = _contact_messages_query(db, unread_only)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    return fetch_page(
+        query,
+        limit,
+        with_total=with_total and not cursor,
+        counts={"unread": ContactMessage.is_read == False},
+    )
+
+
+def iter_contact_messages(
+    db: Session,
+    unread_only: bool = False,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[ContactMessage]:
+    """Stream every contact message in list order, ``batch_size`` rows per round trip"""
+    return _contact_messages_query(db, unread_only).yield_per(batch_size)
+
+
+def _contact_messages_query(db: Session, unread_only: bool):
     query = db.query(ContactMessage)
     
     if unread_only:
         query = query.filter(ContactMessage.is_read == False)
     
-    query = query.order_by(ContactMessage.created_at.desc())
-    
-    return query.offset(skip).limit(limit).all()
+    return order_by_keys(query, SORT_KEYS)
 
 
 def get_contact_message_by_id(db: Session, message_id: uuid.UUID) -> Optional[ContactMessage]:
@@ -3,33 +3,32 @@ Experience CRUD Operations
 Education, work, and volunteer activities management
 """
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from typing import Collection, List, Optional
 import uuid
 
 from app.models.experience import Experience, ExperienceTranslation
+from app.crud.loading import collection_loaders, load_columns
+from app.crud.pagination import SortKey, after_cursor, order_by_keys
+from app.crud.translation import (
+    TranslationSpec,
+    foreign_language,
+    project_translations,
+    translated_view,
+    translated_views,
+)
 from app.schemas.experience import ExperienceCreate, ExperienceUpdate
 
+# Columns overridden by experience translations
+TRANSLATED_FIELDS = ("title", "organization", "location", "description")
+TRANSLATIONS = TranslationSpec(ExperienceTranslation, "experience_id", TRANSLATED_FIELDS)
 
-def _apply_experience_translation(
-    experience: Experience,
-    language: Optional[str] = None,
-) -> Experience:
-    """Apply requested translation to an experience object with English fallback."""
-    if not language or language == "en":
-        return experience
-
-    translations = experience.translations or []
-    translated = next((item for item in translations if item.language == language), None)
-    fallback = next((item for item in translations if item.language == "en"), None)
-    source = translated or fallback
-
-    if source:
-        experience.title = source.title
-        experience.organization = source.organization
-        experience.location = source.location
-        experience.description = source.description
-
-    return experience
+# List order, also used as the keyset for cursor pagination
+SORT_KEYS = (
+    SortKey(Experience.display_order, nullable=True),
+    SortKey(Experience.is_current, descending=True, nullable=True, nulls_first=True),
+    SortKey(Experience.start_date, descending=True),
+    SortKey(Experience.id),
+)
 
 
 def get_experiences(
@@ -39,6 +38,9 @@ def get_experiences(
     experience_type: Optional[str] = None,
     current_only: bool = False,
     language: Optional[str] = None,
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    cursor: Optional[str] = None,
 ) -> List[Experience]:
     """
     Get list of experiences
@@ -49,11 +51,16 @@ def get_experiences(
         limit: Maximum number of records to return
         experience_type: Filter by type (education, work, volunteer, activity)
         current_only: Only return current experiences
+        columns: Columns to load (None loads all)
+        include: Relations to eager load (None loads translations)
+        cursor: Keyset cursor of the previous page; replaces ``skip``
         
     Returns:
         List of experiences
     """
-    query = db.query(Experience).options(joinedload(Experience.translations))
+    options = load_columns(Experience, columns, required=[key.attribute for key in SORT_KEYS])
+    options.extend(collection_loaders({"translations": Experience.translations}, include))
+    query = db.query(Experience).options(*options)
     
     if experience_type:
         query = query.filter(Experience.experience_type == experience_type)
@@ -61,14 +68,12 @@ def get_experiences(
     if current_only:
         query = query.filter(Experience.is_current == True)
     
-    query = query.order_by(
-        Experience.display_order,
-        Experience.is_current.desc(),
-        Experience.start_date.desc()
+    query, translated = project_translations(
+        query, Experience, TRANSLATIONS, foreign_language(language), columns
     )
-    experiences = query.offset(skip).limit(limit).all()
-
-    return [_apply_experience_translation(item, language) for item in experiences]
+    query = order_by_keys(query, SORT_KEYS)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    return translated_views(query.limit(limit).all(), translated)
 
 
 def get_experiences_by_type(
@@ -85,15 +90,18 @@ def get_experience_by_id(
     experience_id: uuid.UUID,
     language: Optional[str] = None
 ) -> Optional[Experience]:
-    """Get experience by ID with translations"""
-    experience = db.query(Experience).options(
-        joinedload(Experience.translations)
-    ).filter(Experience.id == experience_id).first()
-
-    if not experience:
-        return None
+    """
+    Get experience by ID with translations
 
-    return _apply_experience_translation(experience, language)
+    With a language other than English the experience is returned as a
+    read-only translated view; pass no language to get the instance for updates.
+    """
+    query = db.query(Experience).options(
+        joinedload(Experience.translations)
+    ).filter(Experience.id == experience_id)
+    query, translated = project_translations(query, Experience, TRANSLATIONS, foreign_language(language))
+    row = query.first()
+    return translated_view(row, translated) if row else None
 
 
 def create_experience(db: Session, experience: ExperienceCreate) -> Experience:
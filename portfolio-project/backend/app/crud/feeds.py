@@ -0,0 +1,395 @@
+"""
+Feeds CRUD
+Incremental maintenance and lookup of the blog feeds and the sitemap
+
+Every published blog post has, per read-model language, a rendered RSS item
+and Atom entry in ``feed_entries``, and one sitemap URL; the sitemap also
+lists the home, blog and projects pages, whose ``lastmod`` follows the posts
+and projects written. Served documents are stored gzip-compressed in
+``feed_documents`` with their ETag.
+
+A write re-renders only the entries of the posts it changed, and only the
+documents holding an entry whose XML changed are reassembled, from the
+stored fragments: a feed from its ``FEED_SIZE`` newest entries, a sitemap
+page from its entries. Sitemap entries keep the page they were added to, so
+a write never moves other URLs between pages; past one page, ``sitemap``
+becomes an index of the pages.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.compression import compress
+from app.core.responses import content_etag
+from app.crud import read_model
+from app.models.blog import BlogPost, BlogTranslation
+from app.models.feed import FeedDocument, FeedEntry
+from app.models.project import Project, ProjectTranslation
+from app.utils import feed_xml
+
+FEED_LANGUAGES = read_model.READ_MODEL_LANGUAGES
+FEED_MEDIA_TYPES = {"rss": "application/rss+xml", "atom": "application/atom+xml"}
+SITEMAP = "sitemap"
+SITEMAP_MEDIA_TYPE = "application/xml"
+# URLs per sitemap file, the limit of the sitemap protocol
+SITEMAP_PAGE_SIZE = 50000
+
+# Section pages of the site listed in the sitemap
+HOME_PAGE, BLOG_PAGE, PROJECTS_PAGE = "/", "/blog", "/projects"
+
+# ``updated`` of a feed without entries, so that its ETag stays put
+EMPTY_FEED_UPDATED = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def feed_document_name(kind: str, language: str) -> str:
+    return f"blog.{kind}:{language}"
+
+
+def sitemap_page_name(page: int) -> str:
+    return f"{SITEMAP}-{page}"
+
+
+def _site_url(path: str) -> str:
+    return settings.FRONTEND_URL.rstrip("/") + path
+
+
+def _now() -> datetime:
+    # Last-Modified has whole seconds
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _latest(values: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    return max((feed_xml.utc(value) for value in values if value is not None), default=None)
+
+
+@dataclass
+class _Changes:
+    """Feeds and sitemap pages holding an entry whose XML changed"""
+    feeds: Set[str] = field(default_factory=set)
+    pages: Set[int] = field(default_factory=set)
+
+    def add(self, entry: FeedEntry) -> None:
+        if entry.feed == SITEMAP:
+            self.pages.add(entry.page)
+        else:
+            self.feeds.add(entry.feed)
+
+
+class _SitemapPages:
+    """Pages of new sitemap entries: the last page until it is full"""
+
+    def __init__(self, db: Session):
+        self.page = db.query(func.max(FeedEntry.page)).filter(FeedEntry.feed == SITEMAP).scalar() or 1
+        self.size = db.query(func.count()).select_from(FeedEntry).filter(
+            FeedEntry.feed == SITEMAP, FeedEntry.page == self.page
+        ).scalar()
+
+    def allocate(self) -> int:
+        if self.size >= SITEMAP_PAGE_SIZE:
+            self.page, self.size = self.page + 1, 0
+        self.size += 1
+        return self.page
+
+
+@dataclass
+class _PublishedPost:
+    slug: str
+    published: datetime
+    # (title, excerpt, lastmod) per feed language
+    texts: Dict[str, Tuple[str, Optional[str], datetime]]
+
+    @property
+    def lastmod(self) -> datetime:
+        return max(lastmod for _, _, lastmod in self.texts.values())
+
+
+def _published_posts(db: Session, post_ids: Optional[Iterable[uuid.UUID]]) -> Dict[uuid.UUID, _PublishedPost]:
+    """Published posts as read in each feed language, translations falling back to English"""
+    query = db.query(
+        BlogPost.id, BlogPost.slug, BlogPost.title, BlogPost.excerpt,
+        BlogPost.published_at, BlogPost.created_at, BlogPost.updated_at,
+    ).filter(BlogPost.published == True)
+    translations = db.query(
+        BlogTranslation.blog_post_id, BlogTranslation.language, BlogTranslation.title,
+        BlogTranslation.excerpt, BlogTranslation.updated_at,
+    ).join(BlogPost, BlogPost.id == BlogTranslation.blog_post_id).filter(
+        BlogPost.published == True, BlogTranslation.language.in_(FEED_LANGUAGES)
+    )
+    if post_ids is not None:
+        post_ids = list(post_ids)
+        query = query.filter(BlogPost.id.in_(post_ids))
+        translations = translations.filter(BlogTranslation.blog_post_id.in_(post_ids))
+
+    translated: Dict[uuid.UUID, Dict[str, tuple]] = {}
+    for post_id, language, title, excerpt, updated_at in translations:
+        translated.setdefault(post_id, {})[language] = (title, excerpt, updated_at)
+
+    posts = {}
+    for post_id, slug, title, excerpt, published_at, created_at, updated_at in query:
+        own = translated.get(post_id, {})
+        texts = {}
+        for language in FEED_LANGUAGES:
+            text_title, text_excerpt, text_updated = own.get(language) or own.get("en") or (title, excerpt, None)
+            texts[language] = (text_title, text_excerpt, _latest((updated_at, text_updated)))
+        posts[post_id] = _PublishedPost(slug, feed_xml.utc(published_at or created_at), texts)
+    return posts
+
+
+def _put_entry(
+    db: Session,
+    changes: _Changes,
+    feed: str,
+    key: str,
+    fragment: str,
+    lastmod: Optional[datetime],
+    sort_at: Optional[datetime] = None,
+    pages: Optional[_SitemapPages] = None,
+) -> bool:
+    """Store an entry; returns whether its XML changed"""
+    entry = db.get(FeedEntry, (feed, key))
+    if entry is not None and entry.fragment == fragment:
+        return False
+    if entry is None:
+        entry = FeedEntry(feed=feed, entry_key=key, page=pages.allocate() if pages else 0)
+        db.add(entry)
+    entry.fragment, entry.lastmod, entry.sort_at = fragment, lastmod, sort_at
+    # Later lookups by key in this write must find it
+    db.flush()
+    changes.add(entry)
+    return True
+
+
+def _remove_entries(db: Session, changes: _Changes, key: str) -> bool:
+    """Remove an entry from every feed; returns whether it was in any"""
+    feeds = [SITEMAP, *(f"{kind}:{language}" for kind in FEED_MEDIA_TYPES for language in FEED_LANGUAGES)]
+    entries = db.query(FeedEntry).filter(FeedEntry.feed.in_(feeds), FeedEntry.entry_key == key).all()
+    for entry in entries:
+        changes.add(entry)
+        db.delete(entry)
+    db.flush()
+    return bool(entries)
+
+
+def _touch_section(
+    db: Session, changes: _Changes, pages: _SitemapPages, path: str, lastmod: Optional[datetime]
+) -> None:
+    """Move the ``lastmod`` of a section page, and of the home page, forward to ``lastmod``"""
+    for section in dict.fromkeys((path, HOME_PAGE)):
+        entry = db.get(FeedEntry, (SITEMAP, section))
+        current = entry.lastmod if entry is not None else None
+        if entry is not None and (lastmod is None or (current and feed_xml.utc(current) >= lastmod)):
+            continue
+        fragment = feed_xml.sitemap_url(_site_url(section), lastmod)
+        _put_entry(db, changes, SITEMAP, section, fragment, lastmod, pages=pages)
+
+
+def _blog_key(post_id: uuid.UUID) -> str:
+    return f"blog:{post_id}"
+
+
+def _refresh_posts(
+    db: Session,
+    changes: _Changes,
+    pages: _SitemapPages,
+    posts: Dict[uuid.UUID, _PublishedPost],
+    post_ids: Iterable[uuid.UUID],
+) -> None:
+    for post_id in post_ids:
+        key = _blog_key(post_id)
+        post = posts.get(post_id)
+        if post is None:
+            if _remove_entries(db, changes, key):
+                _touch_section(db, changes, pages, BLOG_PAGE, _now())
+            continue
+
+        link = _site_url(f"/blog/{post.slug}")
+        changed = False
+        for language, (title, excerpt, lastmod) in post.texts.items():
+            changed |= _put_entry(
+                db, changes, f"rss:{language}", key,
+                feed_xml.rss_item(title, link, post.published, excerpt), lastmod, post.published,
+            )
+            changed |= _put_entry(
+                db, changes, f"atom:{language}", key,
+                feed_xml.atom_entry(f"urn:uuid:{post_id}", title, link, post.published, lastmod, excerpt),
+                lastmod, post.published,
+            )
+        changed |= _put_entry(
+            db, changes, SITEMAP, key, feed_xml.sitemap_url(link, post.lastmod), post.lastmod, pages=pages
+        )
+        if changed:
+            _touch_section(db, changes, pages, BLOG_PAGE, post.lastmod)
+
+
+def render_feed(db: Session, kind: str, language: str) -> str:
+    """The RSS or Atom document of a language, from its newest stored entries"""
+    rows = db.query(FeedEntry.fragment, FeedEntry.lastmod).filter(
+        FeedEntry.feed == f"{kind}:{language}"
+    ).order_by(FeedEntry.sort_at.desc(), FeedEntry.entry_key.desc()).limit(settings.FEED_SIZE).all()
+    updated = _latest(lastmod for _, lastmod in rows) or EMPTY_FEED_UPDATED
+    fragments = [fragment for fragment, _ in rows]
+    self_link = _site_url(f"/feeds/blog.{kind}?language={language}")
+    if kind == "rss":
+        return feed_xml.rss_document(settings.FEED_TITLE, _site_url(BLOG_PAGE), self_link, language, updated, fragments)
+    return feed_xml.atom_document(
+        settings.FEED_TITLE, _site_url(BLOG_PAGE), self_link, settings.FEED_AUTHOR, updated, fragments
+    )
+
+
+def _render_sitemap_page(db: Session, page: int) -> Optional[str]:
+    fragments = [fragment for (fragment,) in db.query(FeedEntry.fragment).filter(
+        FeedEntry.feed == SITEMAP, FeedEntry.page == page
+    ).order_by(FeedEntry.entry_key)]
+    return feed_xml.urlset_document(fragments) if fragments else None
+
+
+def _sitemap_pages(db: Session) -> Dict[int, datetime]:
+    """Stored sitemap pages and when each last changed"""
+    rows = db.query(FeedDocument.name, FeedDocument.last_modified).filter(
+        FeedDocument.name.like(f"{SITEMAP}-%")
+    )
+    return dict(sorted((int(name.rsplit("-", 1)[1]), last_modified) for name, last_modified in rows))
+
+
+def render_sitemap(db: Session) -> str:
+    """The sitemap: the only page as is, or an index of the pages"""
+    pages = _sitemap_pages(db)
+    if len(pages) > 1:
+        return feed_xml.sitemap_index_document(
+            (_site_url(f"/sitemaps/{page}.xml"), last_modified) for page, last_modified in pages.items()
+        )
+    if pages:
+        return _render_sitemap_page(db, next(iter(pages)))
+    return feed_xml.urlset_document(())
+
+
+def _store_document(db: Session, name: str, media_type: str, xml: Optional[str]) -> None:
+    """Replace a stored document, keeping it (and its Last-Modified) when the body is unchanged"""
+    document = db.get(FeedDocument, name)
+    if xml is None:
+        if document is not None:
+            db.delete(document)
+        return
+
+    body = xml.encode()
+    etag = content_etag(body)
+    if document is not None and document.etag == etag:
+        return
+    if document is None:
+        document = FeedDocument(name=name)
+        db.add(document)
+    document.media_type = media_type
+    document.body = compress(body, "gzip", cached=True)
+    document.etag = etag
+    document.last_modified = _now()
+
+
+def _assemble(db: Session, changes: _Changes) -> None:
+    for feed in sorted(changes.feeds):
+        kind, language = feed.split(":")
+        _store_document(
+            db, feed_document_name(kind, language), FEED_MEDIA_TYPES[kind], render_feed(db, kind, language)
+        )
+    if changes.pages:
+        for page in sorted(changes.pages):
+            _store_document(db, sitemap_page_name(page), SITEMAP_MEDIA_TYPE, _render_sitemap_page(db, page))
+        db.flush()
+        _store_document(db, SITEMAP, SITEMAP_MEDIA_TYPE, render_sitemap(db))
+
+
+def refresh_blog_feeds(db: Session, *post_ids: uuid.UUID) -> None:
+    """
+    Update the feed and sitemap entries of blog posts in the current transaction
+
+    Call after a write and before its commit, like
+    ``blog.refresh_blog_documents``; posts that are unpublished or no longer
+    exist leave the feeds and the sitemap.
+    """
+    db.flush()
+    changes, pages = _Changes(), _SitemapPages(db)
+    _refresh_posts(db, changes, pages, _published_posts(db, post_ids), post_ids)
+    _assemble(db, changes)
+
+
+def _project_lastmod(db: Session, project_ids: Optional[Iterable[uuid.UUID]]) -> Optional[datetime]:
+    projects = db.query(func.max(Project.updated_at))
+    translations = db.query(func.max(ProjectTranslation.updated_at))
+    if project_ids is not None:
+        projects = projects.filter(Project.id.in_(list(project_ids)))
+        translations = translations.filter(ProjectTranslation.project_id.in_(list(project_ids)))
+    return _latest((projects.scalar(), translations.scalar()))
+
+
+def refresh_project_feeds(db: Session, *project_ids: uuid.UUID) -> None:
+    """
+    Move the sitemap ``lastmod`` of the projects page after projects were written
+
+    Runs in the current transaction like ``refresh_blog_feeds``; a deleted
+    project changes the page now.
+    """
+    db.flush()
+    lastmod = _project_lastmod(db, project_ids)
+    if db.query(Project.id).filter(Project.id.in_(project_ids)).count() < len(set(project_ids)):
+        lastmod = _now()
+    changes, pages = _Changes(), _SitemapPages(db)
+    _touch_section(db, changes, pages, PROJECTS_PAGE, lastmod)
+    _assemble(db, changes)
+
+
+def rebuild_feeds(db: Session) -> Dict[str, int]:
+    """
+    Re-render every feed entry and document without committing
+
+    Also renumbers the sitemap pages, filling the gaps deleted URLs left.
+
+    Returns:
+        Number of published posts and of sitemap pages
+    """
+    db.execute(delete(FeedEntry))
+    db.execute(delete(FeedDocument))
+    changes, pages = _Changes(), _SitemapPages(db)
+    for section in (HOME_PAGE, BLOG_PAGE, PROJECTS_PAGE):
+        _put_entry(db, changes, SITEMAP, section, feed_xml.sitemap_url(_site_url(section), None), None, pages=pages)
+    _touch_section(db, changes, pages, PROJECTS_PAGE, _project_lastmod(db, None))
+
+    posts = _published_posts(db, None)
+    _refresh_posts(db, changes, pages, posts, sorted(posts, key=lambda post_id: (posts[post_id].published, post_id)))
+    changes.feeds.update(f"{kind}:{language}" for kind in FEED_MEDIA_TYPES for language in FEED_LANGUAGES)
+    _assemble(db, changes)
+    return {"posts": len(posts), "sitemap pages": len(changes.pages)}
+
+
+def get_feed_document(db: Session, name: str) -> Optional[FeedDocument]:
+    """
+    A stored feed or sitemap document by name
+
+    Feeds and the sitemap are assembled, but not stored, while nothing has
+    been written since their tables were created; missing sitemap pages are None.
+    """
+    document = db.get(FeedDocument, name)
+    if document is not None:
+        return document
+
+    feeds = {
+        feed_document_name(kind, language): (kind, language)
+        for kind in FEED_MEDIA_TYPES for language in FEED_LANGUAGES
+    }
+    if name in feeds:
+        media_type, xml = FEED_MEDIA_TYPES[feeds[name][0]], render_feed(db, *feeds[name])
+    elif name == SITEMAP:
+        media_type, xml = SITEMAP_MEDIA_TYPE, render_sitemap(db)
+    else:
+        return None
+    body = xml.encode()
+    return FeedDocument(
+        name=name,
+        media_type=media_type,
+        body=compress(body, "gzip", cached=True),
+        etag=content_etag(body),
+        last_modified=_now(),
+    )
@@ -4,10 +4,11 @@ GitHub repository caching management
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta, timezone
 import uuid
 
+from app.crud.pagination import STREAM_BATCH_SIZE
 from app.models.github import GitHubRepo
 
 
@@ -33,14 +34,25 @@ def get_github_repos(
     Returns:
         List of GitHub repositories
     """
+    return _github_repos_query(db, featured_only).limit(limit).all()
+
+
+def iter_github_repos(
+    db: Session,
+    featured_only: bool = False,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[GitHubRepo]:
+    """Stream every cached repository in list order, ``batch_size`` rows per round trip"""
+    return _github_repos_query(db, featured_only).yield_per(batch_size)
+
+
+def _github_repos_query(db: Session, featured_only: bool):
     query = db.query(GitHubRepo)
     
     if featured_only:
         query = query.filter(GitHubRepo.is_featured == True)
     
-    query = query.order_by(GitHubRepo.stars.desc(), GitHubRepo.last_updated.desc())
-    
-    return query.limit(limit).all()
+    return query.order_by(GitHubRepo.stars.desc(), GitHubRepo.last_updated.desc())
 
 
 def get_github_repo_by_name(db: Session, repo_name: str) -> Optional[GitHubRepo]:
@@ -0,0 +1,62 @@
+"""
+Query Loading Options
+Column deferral driven by sparse fieldsets and bulk loading of collections
+"""
+from typing import Collection, List, Mapping, Optional
+
+from sqlalchemy.orm import load_only, selectinload
+
+
+def load_columns(
+    model,
+    columns: Optional[Collection[str]],
+    required: Collection[str] = ("id",),
+) -> List:
+    """
+    Build a ``load_only`` option for the requested columns
+
+    Args:
+        model: Mapped class being queried
+        columns: Attribute names to load, or None to load every column
+        required: Attributes loaded regardless of the selection, such as
+            the primary key and the keyset sort keys
+
+    Returns:
+        Loader options to pass to ``Query.options``
+    """
+    if columns is None:
+        return []
+    names = dict.fromkeys([*required, *columns])
+    return [load_only(*(getattr(model, name) for name in names))]
+
+
+
+def collection_loaders(
+    collections: Mapping[str, object],
+    include: Optional[Collection[str]],
+    columns: Optional[Mapping[str, Collection[str]]] = None,
+) -> List:
+    """
+    Build ``selectinload`` options for the included collection relations
+
+    Each collection is fetched for the whole page in one ``IN (...)`` query
+    once the parent rows are known. Joined eager loads would instead wrap the
+    paged query in a subquery and return the product of every collection's
+    rows for each parent.
+
+    Args:
+        collections: Relationship attribute for each relation name
+        include: Relation names to load, or None to load all of them
+        columns: Attributes to load per relation name; relations left out
+            load every column
+    """
+    loaders = []
+    for name, relationship in collections.items():
+        if include is not None and name not in include:
+            continue
+        loader = selectinload(relationship)
+        if columns and name in columns:
+            target = relationship.property.mapper.class_
+            loader = loader.load_only(*(getattr(target, column) for column in columns[name]))
+        loaders.append(loader)
+    return loaders
@@ -0,0 +1,269 @@
+"""
+Keyset Pagination
+Opaque cursors over a list query's sort keys
+"""
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import and_, case, false, func, or_, select
+from sqlalchemy.orm import Query, aliased
+
+
+# Rows fetched per round trip when a whole list is streamed with yield_per;
+# bounds the memory an export holds at once
+STREAM_BATCH_SIZE = 500
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded for the requested list"""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One component of a list's ordering
+
+    Keys sort on the raw column so its index can serve both the ORDER BY and
+    the keyset predicate. Nullable keys place NULLs explicitly
+    (``nulls_first``) so every database orders them the same way. The last
+    key of a list must be its unique primary key.
+    """
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+    nulls_first: bool = False
+
+    @property
+    def attribute(self) -> str:
+        return self.column.key
+
+    @property
+    def python_type(self) -> Optional[type]:
+        try:
+            return self.column.type.python_type
+        except NotImplementedError:
+            return None
+
+    def ordering(self):
+        ordered = self.column.desc() if self.descending else self.column.asc()
+        if not self.nullable:
+            return ordered
+        return ordered.nulls_first() if self.nulls_first else ordered.nulls_last()
+
+    def accepts(self, value: Any) -> bool:
+        if value is None:
+            return self.nullable
+        expected = self.python_type
+        if expected is None:
+            return True
+        if isinstance(value, bool) and expected is not bool:
+            return False
+        if expected is date:
+            return isinstance(value, date) and not isinstance(value, datetime)
+        return isinstance(value, expected)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "u":
+            return uuid.UUID(raw)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    raise InvalidCursor("Unsupported cursor value")
+
+
+def encode_cursor(keys: Sequence[SortKey], obj: Any) -> str:
+    """Encode the sort key values of ``obj`` as an opaque cursor"""
+    payload = json.dumps(
+        [_encode_value(getattr(obj, key.attribute)) for key in keys], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor`` for the same sort keys
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or its values do not match
+            the types of the sort keys
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor("Cursor does not match this list")
+
+    try:
+        decoded = [_decode_value(value) for value in values]
+    except InvalidCursor:
+        raise
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+
+    if decoded[-1] is None or not all(key.accepts(value) for key, value in zip(keys, decoded)):
+        raise InvalidCursor("Cursor does not match this list")
+    return decoded
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """
+    Cursor of a list ordered by a computed score, such as search relevance
+
+    Such lists cannot be resumed from a row's key, so the cursor holds the
+    offset of the next page instead.
+    """
+    payload = json.dumps({"offset": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by ``encode_offset_cursor``
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or is a keyset cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor("Malformed cursor") from exc
+    offset = value.get("offset") if isinstance(value, dict) else None
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        raise InvalidCursor("Cursor does not match this list")
+    return offset
+
+
+def order_by_keys(query: Query, keys: Sequence[SortKey]) -> Query:
+    """Apply the sort keys as the query's ORDER BY"""
+    return query.order_by(*(key.ordering() for key in keys))
+
+
+def _position(key: SortKey, value: Any, stored):
+    """Return (equal, beyond) conditions of ``key`` relative to the cursor value"""
+    column = key.column
+    if value is None:
+        return column.is_(None), (column.isnot(None) if key.nulls_first else false())
+
+    beyond = column < stored if key.descending else column > stored
+    if key.nullable and not key.nulls_first:
+        beyond = or_(beyond, column.is_(None))
+    return column == stored, beyond
+
+
+def after_cursor(query: Query, keys: Sequence[SortKey], cursor: str) -> Query:
+    """
+    Restrict an ordered query to rows strictly after the cursor
+
+    Expands the row comparison into ``k1 > v1 OR (k1 = v1 AND k2 > v2) ...`` so
+    that keys with mixed sort directions work and the leading key's index can
+    be used. Non-key values are read back from the cursor row itself, so the
+    comparison uses exactly the stored representation (SQLite keeps
+    ``CURRENT_TIMESTAMP`` defaults and bound datetimes in different text
+    formats); the decoded value is the fallback when that row is gone.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    values = decode_cursor(keys, cursor)
+    primary = keys[-1]
+    # Aliased so the lookup is never correlated with the outer query's rows
+    cursor_row = aliased(primary.column.class_)
+
+    clauses, equal = [], []
+    for key, value in zip(keys, values):
+        if key is primary:
+            stored = value
+        else:
+            stored = func.coalesce(
+                select(getattr(cursor_row, key.attribute))
+                .where(getattr(cursor_row, primary.attribute) == values[-1])
+                .scalar_subquery(),
+                value,
+            )
+        same, beyond = _position(key, value, stored)
+        clauses.append(and_(*equal, beyond))
+        equal.append(same)
+    return query.filter(or_(*clauses))
+
+
+def next_cursor(keys: Sequence[SortKey], items: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after ``items``, or None when the page is not full"""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(keys, items[-1])
+
+
+@dataclass(frozen=True)
+class Page:
+    """Rows of one page, with the size of the whole filtered list when counted"""
+    items: List[Any]
+    total: Optional[int] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+def _count_matching(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def fetch_page(
+    query: Query,
+    limit: int,
+    with_total: bool = True,
+    counts: Optional[Mapping[str, Any]] = None,
+) -> Page:
+    """
+    Fetch one page and count the whole filtered list in the same round trip
+
+    ``query`` must already be ordered and offset. Window functions run before
+    LIMIT/OFFSET, so ``count(*) OVER ()`` gives every row the list size, and
+    each of ``counts`` (name to SQL condition) adds a conditional count over
+    the same rows. Only a page past the end, which has no row to carry them,
+    needs a second query. Pass ``with_total=False`` for cursor pages.
+    """
+    if not with_total:
+        return Page(items=query.limit(limit).all())
+
+    # Items keep the query's own shape: the entity, or a row of its columns
+    width = len(query.column_descriptions)
+    counts = dict(counts or {})
+    windows = [func.count().over()] + [_count_matching(condition).over() for condition in counts.values()]
+    rows = query.add_columns(*windows).limit(limit).all()
+    if rows:
+        totals = rows[0][width:]
+    else:
+        totals = (
+            query.enable_eagerloads(False)
+            .limit(None).offset(None).order_by(None)
+            .with_entities(func.count(), *(_count_matching(condition) for condition in counts.values()))
+            .one()
+        )
+    return Page(
+        items=[row[0] if width == 1 else tuple(row[:width]) for row in rows],
+        total=int(totals[0] or 0),
+        counts={name: int(value or 0) for name, value in zip(counts, totals[1:])},
+    )
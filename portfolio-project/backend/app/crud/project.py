@@ -2,33 +2,37 @@
 Project CRUD Operations
 Projects, technologies, and images management
 """
-from sqlalchemy.orm import Session, joinedload
+from dataclasses import replace
+from sqlalchemy.orm import Session, load_only, selectinload
 from sqlalchemy import func
-from typing import List, Optional
+from typing import Collection, List, Optional
 import uuid
 from slugify import slugify
 
 from app.models.project import Project, ProjectTranslation, ProjectTechnology, ProjectImage
+from app.models.read_model import ContentReadModel
 from app.models.technology import Technology
+from app.crud import feeds as feeds_crud
+from app.crud import read_model
+from app.crud import tag as tag_crud
+from app.crud.tag import TagFilter
+from app.crud.loading import collection_loaders, load_columns
+from app.crud.pagination import Page, SortKey, after_cursor, fetch_page, order_by_keys
+from app.crud.translation import TranslationSpec, project_translations, translated_view, translated_views
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectTranslationCreate
+from app.serializers.encoders import dumps
+from app.serializers.project import serialize_project
 
+# Columns overridden by project translations
+TRANSLATED_FIELDS = ("title", "short_description", "description")
+TRANSLATIONS = TranslationSpec(ProjectTranslation, "project_id", TRANSLATED_FIELDS)
 
-def _apply_project_translation(project: Project, language: Optional[str] = "en") -> Project:
-    """Apply requested translation to a project object with English fallback."""
-    if not language or language == "en":
-        return project
-
-    translations = project.translations or []
-    translated = next((item for item in translations if item.language == language), None)
-    fallback = next((item for item in translations if item.language == "en"), None)
-    source = translated or fallback
-
-    if source:
-        project.title = source.title
-        project.short_description = source.short_description
-        project.description = source.description
-
-    return project
+# List order, also used as the keyset for cursor pagination
+SORT_KEYS = (
+    SortKey(Project.display_order, nullable=True),
+    SortKey(Project.created_at, descending=True),
+    SortKey(Project.id),
+)
 
 
 def get_projects(
@@ -37,10 +41,43 @@ def get_projects(
     limit: int = 10,
     featured_only: bool = False,
     technology_slug: Optional[str] = None,
-    language: Optional[str] = "en"
+    language: Optional[str] = "en",
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    cursor: Optional[str] = None,
+    tags: Optional[TagFilter] = None,
 ) -> List[Project]:
+    """Get list of projects; see ``get_projects_page`` for the arguments"""
+    return get_projects_page(
+        db,
+        skip=skip,
+        limit=limit,
+        featured_only=featured_only,
+        technology_slug=technology_slug,
+        tags=tags,
+        language=language,
+        columns=columns,
+        include=include,
+        cursor=cursor,
+        with_total=False,
+    ).items
+
+
+def get_projects_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    featured_only: bool = False,
+    technology_slug: Optional[str] = None,
+    language: Optional[str] = "en",
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+    tags: Optional[TagFilter] = None,
+) -> Page:
     """
-    Get list of projects
+    Get a page of projects, with the filtered total in the same query
     
     Args:
         db: Database session
@@ -48,52 +85,143 @@ def get_projects(
         limit: Maximum number of records to return
         featured_only: Only return featured projects
         technology_slug: Filter by technology slug
-        language: Language code for translations (currently not used in filtering)
+        language: Language whose translation (falling back to English) fills
+            the translated fields
+        columns: Columns to load (None loads all)
+        include: Relations to eager load among technologies, translations,
+            images and tags (None loads all)
+        cursor: Keyset cursor of the previous page; replaces ``skip``
+        with_total: Count the filtered projects (not meaningful with a cursor)
+        tags: Only return projects matching these tags
         
     Returns:
-        List of projects
+        Page of projects
+    """
+    options = load_columns(Project, columns, required=[key.attribute for key in SORT_KEYS])
+    options.extend(collection_loaders(
+        {
+            "translations": Project.translations,
+            "technologies": Project.technologies,
+            "images": Project.images,
+            "tags": Project.tags,
+        },
+        include,
+    ))
+    query = _filter_projects(db, db.query(Project).options(*options), featured_only, technology_slug, tags)
+    query, translated = project_translations(query, Project, TRANSLATIONS, language or "en", columns)
+    query = order_by_keys(query, SORT_KEYS)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    page = fetch_page(query, limit, with_total=with_total and not cursor)
+    return replace(page, items=translated_views(page.items, translated))
+
+
+def get_project_documents_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    featured_only: bool = False,
+    technology_slug: Optional[str] = None,
+    language: Optional[str] = "en",
+    cursor: Optional[str] = None,
+    with_total: bool = True,
+    tags: Optional[TagFilter] = None,
+) -> Optional[Page]:
+    """
+    Get a page of ready-to-serve project documents from the read model
+
+    Filters, order and cursors match ``get_projects_page``. Items are
+    ``(project, document)`` pairs where only the sort keys of the project are
+    loaded.
+
+    Returns:
+        The page, or None when a project on it has no document yet and the
+        caller must fall back to ``get_projects_page``
     """
-    query = db.query(Project).options(
-        joinedload(Project.translations),
-        joinedload(Project.project_technologies).joinedload(ProjectTechnology.technology),
-        joinedload(Project.images)
+    query = db.query(Project, ContentReadModel.document).options(
+        load_only(*(key.column for key in SORT_KEYS))
+    ).outerjoin(
+        ContentReadModel, read_model.document_join(read_model.PROJECT, Project.id, language or "en")
     )
-    
+    query = order_by_keys(_filter_projects(db, query, featured_only, technology_slug, tags), SORT_KEYS)
+    query = after_cursor(query, SORT_KEYS, cursor) if cursor else query.offset(skip)
+    page = fetch_page(query, limit, with_total=with_total and not cursor)
+
+    if any(document is None for _, document in page.items):
+        return None
+    return page
+
+
+def _filter_projects(
+    db: Session, query, featured_only: bool, technology_slug: Optional[str], tags: Optional[TagFilter]
+):
     if featured_only:
         query = query.filter(Project.featured == True)
-    
+
     if technology_slug:
         query = query.join(ProjectTechnology).join(Technology).filter(
             Technology.slug == technology_slug
         )
-    
-    query = query.order_by(Project.display_order, Project.created_at.desc())
-    projects = query.offset(skip).limit(limit).all()
+    return tag_crud.filter_tagged(db, query, tag_crud.PROJECT_TAGS, tags)
+
 
-    return [_apply_project_translation(project, language) for project in projects]
+def _full_project_options() -> List:
+    return [
+        selectinload(Project.translations),
+        selectinload(Project.project_technologies).selectinload(ProjectTechnology.technology),
+        selectinload(Project.technologies),
+        selectinload(Project.images),
+        selectinload(Project.tags),
+    ]
 
 
 def get_project_by_id(db: Session, project_id: uuid.UUID) -> Optional[Project]:
     """Get project by ID with all relations"""
-    return db.query(Project).options(
-        joinedload(Project.translations),
-        joinedload(Project.project_technologies).joinedload(ProjectTechnology.technology),
-        joinedload(Project.images)
-    ).filter(Project.id == project_id).first()
+    return db.query(Project).options(*_full_project_options()).filter(Project.id == project_id).first()
 
 
 def get_project_by_slug(db: Session, slug: str, language: Optional[str] = "en") -> Optional[Project]:
-    """Get project by slug with all relations"""
-    project = db.query(Project).options(
-        joinedload(Project.translations),
-        joinedload(Project.project_technologies).joinedload(ProjectTechnology.technology),
-        joinedload(Project.images)
-    ).filter(Project.slug == slug).first()
-
-    if not project:
-        return None
+    """Get project by slug with all relations, translated with English fallback"""
+    query = db.query(Project).options(*_full_project_options()).filter(Project.slug == slug)
+    query, translated = project_translations(query, Project, TRANSLATIONS, language or "en")
+    row = query.first()
+    return translated_view(row, translated) if row else None
+
 
-    return _apply_project_translation(project, language)
+def refresh_project_documents(db: Session, *project_ids: uuid.UUID) -> None:
+    """
+    Rewrite the read-model documents of projects in the current transaction
+
+    Call after a write and before its commit; documents of projects that no
+    longer exist are removed.
+    """
+    db.flush()
+    for project_id in project_ids:
+        documents, slug = {}, None
+        for language in read_model.READ_MODEL_LANGUAGES:
+            query = db.query(Project).options(*_full_project_options()).populate_existing()
+            query, translated = project_translations(
+                query.filter(Project.id == project_id), Project, TRANSLATIONS, language
+            )
+            row = query.first()
+            if row is None:
+                break
+            project = translated_view(row, translated)
+            slug = project.slug
+            documents[language] = dumps(serialize_project(project)).decode()
+
+        if documents:
+            read_model.store_documents(db, read_model.PROJECT, project_id, slug, documents)
+        else:
+            read_model.delete_documents(db, read_model.PROJECT, [project_id])
+
+
+def get_technology_project_ids(db: Session, technology_id: uuid.UUID) -> List[uuid.UUID]:
+    """IDs of the projects using a technology, whose documents embed it"""
+    return [
+        project_id for (project_id,) in db.query(ProjectTechnology.project_id).filter(
+            ProjectTechnology.technology_id == technology_id
+        )
+    ]
 
 
 def create_project(db: Session, project: ProjectCreate) -> Project:
@@ -126,11 +254,13 @@ def create_project(db: Session, project: ProjectCreate) -> Project:
         github_url=str(project.github_url) if project.github_url else None,
         demo_url=str(project.demo_url) if project.demo_url else None,
         featured=project.featured,
-        display_order=project.display_order
+        display_order=project.display_order,
+        tags=tag_crud.get_or_create_tags(db, project.tags or []),
     )
     
     db.add(db_project)
     db.flush()
+    tag_crud.update_tag_counts(db, tag_crud.PROJECT_TAGS, (), {tag.id for tag in db_project.tags})
     
     # Add technologies
     if project.technology_ids:
@@ -164,6 +294,8 @@ def create_project(db: Session, project: ProjectCreate) -> Project:
             )
             db.add(db_image)
     
+    refresh_project_documents(db, db_project.id)
+    feeds_crud.refresh_project_feeds(db, db_project.id)
     db.commit()
     db.refresh(db_project)
     
@@ -191,7 +323,7 @@ def update_project(
     if not db_project:
         return None
     
-    update_data = project_update.model_dump(exclude_unset=True, exclude={"technology_ids"})
+    update_data = project_update.model_dump(exclude_unset=True, exclude={"technology_ids", "tags"})
     
     # Convert URLs to strings
     for url_field in ["cover_image", "github_url", "demo_url"]:
@@ -216,6 +348,16 @@ def update_project(
             )
             db.add(db_project_tech)
     
+    # Replace the tags if provided
+    if project_update.tags is not None:
+        tagged_before = {tag.id for tag in db_project.tags}
+        db_project.tags = tag_crud.get_or_create_tags(db, project_update.tags)
+        tag_crud.update_tag_counts(
+            db, tag_crud.PROJECT_TAGS, tagged_before, {tag.id for tag in db_project.tags}
+        )
+    
+    refresh_project_documents(db, project_id)
+    feeds_crud.refresh_project_feeds(db, project_id)
     db.commit()
     db.refresh(db_project)
     
@@ -238,7 +380,10 @@ def delete_project(db: Session, project_id: uuid.UUID) -> bool:
     if not db_project:
         return False
     
+    tag_crud.update_tag_counts(db, tag_crud.PROJECT_TAGS, {tag.id for tag in db_project.tags}, ())
     db.delete(db_project)
+    refresh_project_documents(db, project_id)
+    feeds_crud.refresh_project_feeds(db, project_id)
     db.commit()
     
     return True
@@ -292,6 +437,8 @@ def add_project_translation(
         existing.title = translation.title
         existing.short_description = translation.short_description
         existing.description = translation.description
+        refresh_project_documents(db, project_id)
+        feeds_crud.refresh_project_feeds(db, project_id)
         db.commit()
         db.refresh(existing)
         return existing
@@ -304,6 +451,8 @@ def add_project_translation(
             description=translation.description
         )
         db.add(db_translation)
+        refresh_project_documents(db, project_id)
+        feeds_crud.refresh_project_feeds(db, project_id)
         db.commit()
         db.refresh(db_translation)
         return db_translation
@@ -0,0 +1,87 @@
+"""
+Content Read Model CRUD
+Storage and lookup of the denormalized public documents
+"""
+import uuid
+from typing import Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import and_, delete, insert
+from sqlalchemy.orm import Session
+
+from app.models.read_model import ContentReadModel
+
+# Languages every document is materialized in
+READ_MODEL_LANGUAGES = ("en", "tr")
+
+PROJECT = "project"
+BLOG = "blog"
+# Blog post without its content, as served by the list route
+BLOG_SUMMARY = "blog_summary"
+
+# Document types materialized together for each entity type
+DOCUMENT_TYPES = {PROJECT: (PROJECT,), BLOG: (BLOG, BLOG_SUMMARY)}
+
+
+def store_documents(
+    db: Session,
+    entity_type: str,
+    entity_id: uuid.UUID,
+    slug: str,
+    documents: Mapping[str, str],
+) -> None:
+    """
+    Replace the documents of one entity
+
+    Runs in the caller's transaction and does not commit, so the documents
+    change atomically with the write that produced them.
+    """
+    db.execute(
+        delete(ContentReadModel).where(
+            ContentReadModel.entity_type == entity_type,
+            ContentReadModel.entity_id == entity_id,
+        )
+    )
+    db.execute(insert(ContentReadModel), [
+        {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "language": language,
+            "slug": slug,
+            "document": document,
+        }
+        for language, document in documents.items()
+    ])
+
+
+def delete_documents(db: Session, entity_type: str, entity_ids: Iterable[uuid.UUID]) -> None:
+    """Remove every document type of the given entities without committing"""
+    db.execute(
+        delete(ContentReadModel).where(
+            ContentReadModel.entity_type.in_(DOCUMENT_TYPES[entity_type]),
+            ContentReadModel.entity_id.in_(list(entity_ids)),
+        )
+    )
+
+
+def get_entry(db: Session, entity_type: str, slug: str, language: str) -> Optional[Tuple[uuid.UUID, str]]:
+    """Look up ``(entity_id, document)`` by slug; None when it has not been materialized"""
+    return db.query(ContentReadModel.entity_id, ContentReadModel.document).filter(
+        ContentReadModel.entity_type == entity_type,
+        ContentReadModel.language == language,
+        ContentReadModel.slug == slug,
+    ).first()
+
+
+def get_document(db: Session, entity_type: str, slug: str, language: str) -> Optional[str]:
+    """Look up a document by slug; None when it has not been materialized"""
+    entry = get_entry(db, entity_type, slug, language)
+    return entry[1] if entry else None
+
+
+def document_join(entity_type: str, entity_id, language: str):
+    """Join condition from an entity's id column to its document in ``language``"""
+    return and_(
+        ContentReadModel.entity_type == entity_type,
+        ContentReadModel.entity_id == entity_id,
+        ContentReadModel.language == language,
+    )
@@ -0,0 +1,302 @@
+"""
+Related Blog Posts CRUD
+Maintenance and lookup of the precomputed TF-IDF neighbours of published posts
+
+Each published post keeps, per read-model language, the weighted term counts
+of its text (the translation's, or the English post's when untranslated) in
+``blog_post_terms``, its unit TF-IDF vector in ``blog_post_vectors`` and its
+``NEIGHBORS`` most similar posts in ``blog_related_posts``; the document
+frequencies of terms live in ``blog_term_frequencies``.
+
+A write touches only the rows of the posts it changed: their terms leave and
+re-enter the document frequencies, their vectors are reweighed against them,
+and they are scored against every post sharing a vector term through the
+(language, term) index. The lists then recomputed are the changed posts'
+own, those that named a changed post, and those a changed post now scores
+high enough to enter.
+Vectors of other posts keep the frequencies of when they were weighed;
+``rebuild_related_posts`` reweighs everything.
+"""
+import uuid
+from collections import Counter
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.crud import read_model
+from app.models.blog import (
+    BlogPost, BlogPostTerms, BlogPostVector, BlogRelatedPost, BlogTermFrequency, BlogTranslation,
+)
+from app.models.read_model import ContentReadModel
+from app.utils.tfidf import TfidfModel, tfidf_vector
+from app.utils.tokenizer import term_frequencies
+
+# Neighbours stored per post and language; the most the route serves
+NEIGHBORS = 10
+# Longer tokens are URLs, hashes and the like, not topics
+MAX_TERM_LENGTH = 64
+
+Neighbors = List[Tuple[uuid.UUID, float]]
+
+
+def _insert(db: Session, model, rows: List[dict]) -> None:
+    # Straight to the table: the ORM bulk insert costs more per row than
+    # the executemany itself, and a rebuild writes a vector row per term
+    db.execute(model.__table__.insert(), rows)
+
+
+def _post_texts(
+    db: Session, language: str, post_ids: Optional[Collection[uuid.UUID]]
+) -> Dict[uuid.UUID, Tuple[str, str, str]]:
+    """``(title, excerpt, content)`` of published posts as read in ``language``"""
+    query = db.query(BlogPost.id, BlogPost.title, BlogPost.excerpt, BlogPost.content).filter(
+        BlogPost.published == True
+    )
+    if post_ids is not None:
+        query = query.filter(BlogPost.id.in_(list(post_ids)))
+    texts = {post_id: (title, excerpt or "", content) for post_id, title, excerpt, content in query}
+
+    if language != "en" and texts:
+        translations = db.query(
+            BlogTranslation.blog_post_id, BlogTranslation.title, BlogTranslation.excerpt, BlogTranslation.content
+        ).join(BlogPost, BlogPost.id == BlogTranslation.blog_post_id).filter(
+            BlogPost.published == True, BlogTranslation.language == language
+        )
+        if post_ids is not None:
+            translations = translations.filter(BlogTranslation.blog_post_id.in_(list(post_ids)))
+        for post_id, title, excerpt, content in translations:
+            texts[post_id] = (title, excerpt or "", content)
+    return texts
+
+
+def _term_counts(fields: Tuple[str, str, str], language: str) -> Dict[str, int]:
+    counts, _ = term_frequencies(fields, language)
+    return {term: count for term, count in counts.items() if len(term) <= MAX_TERM_LENGTH}
+
+
+def _update_frequencies(
+    db: Session, language: str, removed: Iterable[Mapping[str, int]], added: Iterable[Mapping[str, int]]
+) -> None:
+    delta: Counter = Counter()
+    for terms in removed:
+        delta.subtract(terms.keys())
+    for terms in added:
+        delta.update(terms.keys())
+    delta = Counter({term: change for term, change in delta.items() if change})
+    if not delta:
+        return
+
+    stored = {
+        row.term: row
+        for row in db.query(BlogTermFrequency).filter(
+            BlogTermFrequency.language == language, BlogTermFrequency.term.in_(list(delta))
+        )
+    }
+    for term, change in delta.items():
+        row = stored.get(term)
+        if row is None:
+            db.add(BlogTermFrequency(language=language, term=term, documents=change))
+        elif row.documents + change > 0:
+            row.documents += change
+        else:
+            db.delete(row)
+    db.flush()
+
+
+def _ranked(neighbors: Iterable[Tuple[uuid.UUID, float]]) -> Neighbors:
+    """Best first, ties in the order ``TfidfModel.neighbors`` breaks them"""
+    return sorted(neighbors, key=lambda item: (item[1], item[0]), reverse=True)
+
+
+def _similar(db: Session, language: str, post_id: uuid.UUID, limit: Optional[int] = None) -> Neighbors:
+    """Cosine similarity of a post to the posts sharing a vector term, best first"""
+    vector = dict(db.query(BlogPostVector.term, BlogPostVector.weight).filter(
+        BlogPostVector.blog_post_id == post_id, BlogPostVector.language == language
+    ))
+    if not vector:
+        return []
+    # Postings of the post's terms, through the (language, term) index
+    scores: Dict[uuid.UUID, float] = {}
+    postings = db.query(BlogPostVector.blog_post_id, BlogPostVector.term, BlogPostVector.weight).filter(
+        BlogPostVector.language == language, BlogPostVector.term.in_(list(vector))
+    )
+    for other, term, weight in postings:
+        if other != post_id:
+            scores[other] = scores.get(other, 0.0) + vector[term] * weight
+    ranked = _ranked(scores.items())
+    return ranked[:limit] if limit is not None else ranked
+
+
+def _neighbor_lists(db: Session, language: str, post_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Neighbors]:
+    lists: Dict[uuid.UUID, Neighbors] = {}
+    if not post_ids:
+        return lists
+    rows = db.query(BlogRelatedPost.blog_post_id, BlogRelatedPost.related_post_id, BlogRelatedPost.score).filter(
+        BlogRelatedPost.language == language, BlogRelatedPost.blog_post_id.in_(list(post_ids))
+    ).order_by(BlogRelatedPost.blog_post_id, BlogRelatedPost.rank)
+    for post_id, related_id, score in rows:
+        lists.setdefault(post_id, []).append((related_id, score))
+    return lists
+
+
+def _store_neighbors(db: Session, language: str, lists: Mapping[uuid.UUID, Neighbors]) -> None:
+    if lists:
+        db.execute(delete(BlogRelatedPost).where(
+            BlogRelatedPost.language == language, BlogRelatedPost.blog_post_id.in_(list(lists))
+        ))
+    rows = [
+        {
+            "blog_post_id": post_id,
+            "language": language,
+            "rank": rank,
+            "related_post_id": related_id,
+            "score": score,
+        }
+        for post_id, neighbors in lists.items()
+        for rank, (related_id, score) in enumerate(neighbors)
+    ]
+    if rows:
+        _insert(db, BlogRelatedPost, rows)
+
+
+def _refresh_language(db: Session, language: str, post_ids: Collection[uuid.UUID], deleting: bool) -> None:
+    changed = set(post_ids)
+    texts = {} if deleting else _post_texts(db, language, changed)
+    counts = {post_id: _term_counts(fields, language) for post_id, fields in texts.items()}
+
+    old_terms = db.query(BlogPostTerms.terms).filter(
+        BlogPostTerms.language == language, BlogPostTerms.blog_post_id.in_(changed)
+    ).all()
+    _update_frequencies(db, language, (terms for (terms,) in old_terms), counts.values())
+    for model in (BlogPostTerms, BlogPostVector):
+        db.execute(delete(model).where(model.language == language, model.blog_post_id.in_(changed)))
+    if counts:
+        _insert(db, BlogPostTerms, [
+            {"blog_post_id": post_id, "language": language, "terms": terms} for post_id, terms in counts.items()
+        ])
+
+    size = db.query(func.count()).select_from(BlogPostTerms).filter(BlogPostTerms.language == language).scalar()
+    vocabulary = {term for terms in counts.values() for term in terms}
+    frequencies = dict(db.query(BlogTermFrequency.term, BlogTermFrequency.documents).filter(
+        BlogTermFrequency.language == language, BlogTermFrequency.term.in_(vocabulary)
+    )) if vocabulary else {}
+    vectors = [
+        {"blog_post_id": post_id, "language": language, "term": term, "weight": weight}
+        for post_id, terms in counts.items()
+        for term, weight in tfidf_vector(terms, frequencies, size).items()
+    ]
+    if vectors:
+        _insert(db, BlogPostVector, vectors)
+
+    # Lists that can change: those naming a changed post, and those a changed
+    # post beats the last neighbour of (or is short enough to join)
+    stale = {
+        post_id for (post_id,) in db.query(BlogRelatedPost.blog_post_id).filter(
+            BlogRelatedPost.language == language, BlogRelatedPost.related_post_id.in_(changed)
+        ).distinct()
+    }
+    last = dict(db.query(BlogRelatedPost.blog_post_id, BlogRelatedPost.score).filter(
+        BlogRelatedPost.language == language, BlogRelatedPost.rank == NEIGHBORS - 1
+    )) if counts else {}
+    lists: Dict[uuid.UUID, Neighbors] = {}
+    scores: Dict[uuid.UUID, Dict[uuid.UUID, float]] = {}
+    for post_id in counts:
+        similar = _similar(db, language, post_id)
+        lists[post_id] = similar[:NEIGHBORS]
+        scores[post_id] = dict(similar)
+        stale.update(other for other, score in similar if other not in last or score > last[other])
+
+    # The other posts' scores are unchanged, so a list takes the changed
+    # posts' new scores in place of their old ones; only a full list left
+    # without a neighbour above its old cut-off needs its next neighbours
+    stale -= changed
+    current = _neighbor_lists(db, language, stale)
+    for post_id in stale:
+        old = current.get(post_id, [])
+        merged = [(related_id, score) for related_id, score in old if related_id not in changed]
+        merged += [(other, similar[post_id]) for other, similar in scores.items() if post_id in similar]
+        merged = _ranked(merged)[:NEIGHBORS]
+        if len(old) == NEIGHBORS and (len(merged) < NEIGHBORS or merged[-1][1] < old[-1][1]):
+            merged = _similar(db, language, post_id, NEIGHBORS)
+        lists[post_id] = merged
+
+    # Unpublished and deleted posts keep no list
+    db.execute(delete(BlogRelatedPost).where(
+        BlogRelatedPost.language == language, BlogRelatedPost.blog_post_id.in_(changed - set(counts))
+    ))
+    _store_neighbors(db, language, lists)
+
+
+def refresh_related_posts(db: Session, *post_ids: uuid.UUID, deleting: bool = False) -> None:
+    """
+    Update the related posts after posts were written, in the current transaction
+
+    Call after the write and before its commit, like
+    ``blog.refresh_blog_documents``; unpublished posts leave every list.
+    Posts about to be deleted are passed with ``deleting`` before the
+    delete, while their terms can still be taken out of the document
+    frequencies and the lists naming them found (the foreign keys cascade).
+    """
+    db.flush()
+    for language in read_model.READ_MODEL_LANGUAGES:
+        _refresh_language(db, language, post_ids, deleting)
+
+
+def rebuild_related_posts(db: Session) -> Dict[str, int]:
+    """
+    Recompute the terms, vectors and neighbours of every published post without committing
+
+    Returns:
+        Number of posts with a neighbour list per language
+    """
+    rebuilt = {}
+    for language in read_model.READ_MODEL_LANGUAGES:
+        for table in (BlogRelatedPost, BlogPostVector, BlogPostTerms, BlogTermFrequency):
+            db.execute(delete(table).where(table.language == language))
+
+        counts = {
+            post_id: _term_counts(fields, language) for post_id, fields in _post_texts(db, language, None).items()
+        }
+        model = TfidfModel(counts)
+        if counts:
+            _insert(db, BlogPostTerms, [
+                {"blog_post_id": post_id, "language": language, "terms": terms} for post_id, terms in counts.items()
+            ])
+            _insert(db, BlogTermFrequency, [
+                {"language": language, "term": term, "documents": documents}
+                for term, documents in model.frequencies.items()
+            ])
+        vectors = [
+            {"blog_post_id": post_id, "language": language, "term": term, "weight": weight}
+            for post_id, vector in model.vectors.items()
+            for term, weight in vector.items()
+        ]
+        if vectors:
+            _insert(db, BlogPostVector, vectors)
+        _store_neighbors(db, language, {post_id: model.neighbors(post_id, NEIGHBORS) for post_id in counts})
+        rebuilt[language] = len(counts)
+    return rebuilt
+
+
+def get_related_documents(
+    db: Session, slug: str, language: str, limit: int
+) -> Optional[List[Tuple[uuid.UUID, int, str]]]:
+    """
+    ``(post_id, views, summary document)`` of the posts related to ``slug``, most similar first
+
+    One lookup of the post's neighbour rows joined with their read-model
+    summaries; None when no post has the slug.
+    """
+    post_id = db.query(BlogPost.id).filter(BlogPost.slug == slug).scalar()
+    if post_id is None:
+        return None
+    return db.query(BlogRelatedPost.related_post_id, BlogPost.views, ContentReadModel.document).join(
+        BlogPost, BlogPost.id == BlogRelatedPost.related_post_id
+    ).join(
+        ContentReadModel,
+        read_model.document_join(read_model.BLOG_SUMMARY, BlogRelatedPost.related_post_id, language),
+    ).filter(
+        BlogRelatedPost.blog_post_id == post_id,
+        BlogRelatedPost.language == language,
+    ).order_by(BlogRelatedPost.rank).limit(limit).all()
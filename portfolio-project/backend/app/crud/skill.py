@@ -4,28 +4,23 @@ Skills and translations management
 """
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
-from typing import List, Optional, Dict
+from typing import Collection, List, Optional, Dict
 import uuid
 
 from app.models.skill import Skill, SkillTranslation
+from app.crud.loading import collection_loaders, load_columns
+from app.crud.translation import (
+    TranslationSpec,
+    foreign_language,
+    project_translations,
+    translated_view,
+    translated_views,
+)
 from app.schemas.skill import SkillCreate, SkillUpdate
 
-
-def _apply_skill_translation(skill: Skill, language: Optional[str] = None) -> Skill:
-    """Apply requested translation to a skill with English fallback."""
-    if not language or language == "en":
-        return skill
-
-    translations = skill.translations or []
-    translated = next((item for item in translations if item.language == language), None)
-    fallback = next((item for item in translations if item.language == "en"), None)
-    source = translated or fallback
-
-    if source:
-        skill.name = source.name
-        skill.category = source.category
-
-    return skill
+# Columns overridden by skill translations
+TRANSLATED_FIELDS = ("name", "category")
+TRANSLATIONS = TranslationSpec(SkillTranslation, "skill_id", TRANSLATED_FIELDS)
 
 
 def get_skills(
@@ -34,6 +29,8 @@ def get_skills(
     limit: int = 100,
     category: Optional[str] = None,
     language: Optional[str] = None,
+    columns: Optional[Collection[str]] = None,
+    include: Optional[Collection[str]] = None,
 ) -> List[Skill]:
     """
     Get list of skills
@@ -43,19 +40,22 @@ def get_skills(
         skip: Number of records to skip (pagination)
         limit: Maximum number of records to return
         category: Filter by category
+        columns: Columns to load (None loads all)
+        include: Relations to eager load (None loads translations)
         
     Returns:
         List of skills
     """
-    query = db.query(Skill).options(joinedload(Skill.translations))
+    options = load_columns(Skill, columns)
+    options.extend(collection_loaders({"translations": Skill.translations}, include))
+    query = db.query(Skill).options(*options)
     
     if category:
         query = query.filter(Skill.category == category)
     
+    query, translated = project_translations(query, Skill, TRANSLATIONS, foreign_language(language), columns)
     query = query.order_by(Skill.category, Skill.display_order, Skill.proficiency.desc())
-    skills = query.offset(skip).limit(limit).all()
-
-    return [_apply_skill_translation(skill, language) for skill in skills]
+    return translated_views(query.offset(skip).limit(limit).all(), translated)
 
 
 def get_skills_by_category(db: Session, language: Optional[str] = None) -> Dict[str, List[Skill]]:
@@ -81,15 +81,16 @@ def get_skill_by_id(
     skill_id: uuid.UUID,
     language: Optional[str] = None,
 ) -> Optional[Skill]:
-    """Get skill by ID with translations"""
-    skill = db.query(Skill).options(
-        joinedload(Skill.translations)
-    ).filter(Skill.id == skill_id).first()
-
-    if not skill:
-        return None
+    """
+    Get skill by ID with translations
 
-    return _apply_skill_translation(skill, language)
+    With a language other than English the skill is returned as a read-only
+    translated view; pass no language to get the instance for updates.
+    """
+    query = db.query(Skill).options(joinedload(Skill.translations)).filter(Skill.id == skill_id)
+    query, translated = project_translations(query, Skill, TRANSLATIONS, foreign_language(language))
+    row = query.first()
+    return translated_view(row, translated) if row else None
 
 
 def create_skill(db: Session, skill: SkillCreate) -> Skill:
@@ -0,0 +1,147 @@
+"""
+Tag CRUD Operations
+Tags of blog posts and projects, their maintained counts and the list filters
+"""
+from dataclasses import dataclass
+from typing import Any, Collection, List, Optional, Tuple
+import uuid
+
+from slugify import slugify
+from sqlalchemy import false, select, update
+from sqlalchemy.orm import Session
+
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.tag import BlogPostTag, ProjectTag, Tag
+
+
+@dataclass(frozen=True)
+class Taggable:
+    """Tagged model, its association table columns and the tag count it moves"""
+    model: Any
+    entity_id: Any
+    tag_id: Any
+    count: str
+
+
+BLOG_TAGS = Taggable(BlogPost, BlogPostTag.blog_post_id, BlogPostTag.tag_id, "blog_post_count")
+PROJECT_TAGS = Taggable(Project, ProjectTag.project_id, ProjectTag.tag_id, "project_count")
+
+# Facets of the tag list and the count each one orders by
+TAG_COUNTS = {"blog": "blog_post_count", "projects": "project_count"}
+
+
+@dataclass(frozen=True)
+class TagFilter:
+    """Tag slugs a list is filtered by: items carrying any of ``any_of`` and all of ``all_of``"""
+    any_of: Tuple[str, ...] = ()
+    all_of: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.any_of or self.all_of)
+
+
+def get_or_create_tags(db: Session, names: Collection[str]) -> List[Tag]:
+    """
+    Resolve tag names to tags, creating the missing ones
+
+    Names are matched by slug, so "Machine Learning" and "machine-learning"
+    are the same tag; a new tag keeps the first spelling it was given.
+    """
+    by_slug = {}
+    for name in names:
+        slug = slugify(name, max_length=100)
+        if slug:
+            by_slug.setdefault(slug, name.strip())
+    if not by_slug:
+        return []
+
+    existing = {tag.slug: tag for tag in db.query(Tag).filter(Tag.slug.in_(list(by_slug)))}
+    tags = []
+    for slug, name in by_slug.items():
+        tag = existing.get(slug)
+        if tag is None:
+            # IDs are assigned up front so counts can be moved before a flush
+            tag = Tag(id=uuid.uuid4(), slug=slug, name=name)
+            db.add(tag)
+        tags.append(tag)
+    return tags
+
+
+def update_tag_counts(
+    db: Session,
+    taggable: Taggable,
+    before: Collection[uuid.UUID],
+    after: Collection[uuid.UUID],
+) -> None:
+    """
+    Move the tag counts for one written entity in the current transaction
+
+    Tags the entity now counts towards gain one, tags it stopped counting
+    towards lose one, in an ``UPDATE`` of those tag rows only. Call before the
+    write's commit.
+
+    Args:
+        db: Database session
+        taggable: Kind of the written entity
+        before: IDs of the tags it counted towards before the write
+        after: IDs of the tags it counts towards now
+    """
+    before, after = set(before), set(after)
+    db.flush()
+    column = getattr(Tag, taggable.count)
+    for tag_ids, step in ((after - before, 1), (before - after, -1)):
+        if tag_ids:
+            db.execute(
+                update(Tag)
+                .where(Tag.id.in_(tag_ids))
+                .values({taggable.count: column + step})
+                .execution_options(synchronize_session=False)
+            )
+
+
+def filter_tagged(db: Session, query, taggable: Taggable, tags: Optional[TagFilter]):
+    """
+    Restrict a query of ``taggable.model`` to the rows matching a tag filter
+
+    The slugs are resolved to IDs first so each condition is an ``IN`` over
+    the association rows of known tags, read from their ``(tag_id, entity)``
+    index. An unknown slug in ``all_of`` matches nothing.
+    """
+    if not tags:
+        return query
+
+    slugs = {*tags.any_of, *tags.all_of}
+    tag_ids = dict(db.query(Tag.slug, Tag.id).filter(Tag.slug.in_(slugs)))
+
+    def tagged(*ids):
+        return taggable.model.id.in_(select(taggable.entity_id).where(taggable.tag_id.in_(ids)))
+
+    if any(slug not in tag_ids for slug in tags.all_of):
+        return query.filter(false())
+    for slug in tags.all_of:
+        query = query.filter(tagged(tag_ids[slug]))
+    if tags.any_of:
+        any_ids = [tag_ids[slug] for slug in tags.any_of if slug in tag_ids]
+        query = query.filter(tagged(*any_ids) if any_ids else false())
+    return query
+
+
+def get_tags(db: Session, facet: Optional[str] = None) -> List[Tag]:
+    """
+    Get the tags in use with their counts, most used first
+
+    Args:
+        db: Database session
+        facet: ``blog`` or ``projects`` to list the tags of published posts
+            or of projects only, ordered by that count; None lists tags used
+            by either, ordered by both counts together
+
+    Returns:
+        List of tags
+    """
+    if facet is None:
+        used = Tag.blog_post_count + Tag.project_count
+    else:
+        used = getattr(Tag, TAG_COUNTS[facet])
+    return db.query(Tag).filter(used > 0).order_by(used.desc(), Tag.slug).all()
@@ -0,0 +1,98 @@
+"""
+Translation Projection
+Translated columns resolved in SQL with English fallback, read through views
+"""
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Query, aliased
+
+
+@dataclass(frozen=True)
+class TranslationSpec:
+    """Translation table of a model and the columns it overrides"""
+    translation: Any
+    foreign_key: str
+    fields: Tuple[str, ...]
+
+
+class TranslatedView:
+    """
+    Read-only view of a row whose translated columns were resolved in SQL
+
+    Translated attributes come from the query; everything else, relations
+    included, is read from the underlying ORM instance, which is never
+    modified and so can never flush a translation back into the base row.
+    """
+    __slots__ = ("_entity", "_values")
+
+    def __init__(self, entity: Any, values: Dict[str, Any]):
+        object.__setattr__(self, "_entity", entity)
+        object.__setattr__(self, "_values", values)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        return getattr(self._entity, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self._entity).__name__} translation views are read-only")
+
+    def __repr__(self) -> str:
+        return f"<TranslatedView {self._entity!r}>"
+
+
+def foreign_language(language: Optional[str]) -> Optional[str]:
+    """The language to project for models whose base row holds the English text"""
+    return None if not language or language == "en" else language
+
+
+def project_translations(
+    query: Query,
+    model: Any,
+    spec: TranslationSpec,
+    language: Optional[str],
+    columns: Optional[Collection[str]] = None,
+) -> Tuple[Query, Tuple[str, ...]]:
+    """
+    Add the translated columns of ``model`` to a query
+
+    LEFT JOINs only the requested language and the English fallback (one
+    join when English is requested) and selects
+    ``COALESCE(requested, english, base)`` for each translated column that
+    ``columns`` selects.
+
+    Returns:
+        The query and the names of the added columns; no columns are added
+        without a language or when none is selected
+    """
+    fields = tuple(name for name in spec.fields if columns is None or name in columns)
+    if not language or not fields:
+        return query, ()
+
+    sources = []
+    for code in dict.fromkeys((language, "en")):
+        translation = aliased(spec.translation)
+        query = query.outerjoin(
+            translation,
+            and_(getattr(translation, spec.foreign_key) == model.id, translation.language == code),
+        )
+        sources.append(translation)
+
+    return query.add_columns(*(
+        func.coalesce(*(getattr(source, name) for source in sources), getattr(model, name)).label(name)
+        for name in fields
+    )), fields
+
+
+def translated_view(row: Any, fields: Sequence[str]) -> Any:
+    """Wrap one result row of a projected query; plain entities pass through"""
+    if not fields:
+        return row
+    entity, *values = row
+    return TranslatedView(entity, dict(zip(fields, values)))
+
+
+def translated_views(rows: Sequence[Any], fields: Sequence[str]) -> List[Any]:
+    return [translated_view(row, fields) for row in rows]
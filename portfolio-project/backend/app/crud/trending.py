@@ -0,0 +1,58 @@
+"""
+Trending Blog Posts CRUD
+The persisted copy of the trending leaderboards
+"""
+import uuid
+from datetime import datetime
+from typing import List, Mapping, Sequence, Tuple
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.models.blog import BlogPost, BlogTrendingScore
+
+# (language, period) -> [(post_id, score)]
+Leaderboards = Mapping[Tuple[str, str], Sequence[Tuple[uuid.UUID, float]]]
+
+
+def replace_trending_scores(db: Session, leaderboards: Leaderboards, scored_at: datetime) -> int:
+    """
+    Replace the stored leaderboards and commit
+
+    Posts deleted since they were scored are left out.
+
+    Returns:
+        Number of scores stored
+    """
+    post_ids = {post_id for scores in leaderboards.values() for post_id, _ in scores}
+    existing = {
+        post_id for (post_id,) in db.query(BlogPost.id).filter(BlogPost.id.in_(post_ids))
+    } if post_ids else set()
+    rows = [
+        {
+            "language": language,
+            "period": period,
+            "blog_post_id": post_id,
+            "score": score,
+            "scored_at": scored_at,
+        }
+        for (language, period), scores in leaderboards.items()
+        for post_id, score in scores
+        if post_id in existing
+    ]
+    db.execute(delete(BlogTrendingScore))
+    if rows:
+        db.execute(BlogTrendingScore.__table__.insert(), rows)
+    db.commit()
+    return len(rows)
+
+
+def get_trending_scores(db: Session) -> List[Tuple[str, str, uuid.UUID, float, datetime]]:
+    """Every stored ``(language, period, post_id, score, scored_at)``"""
+    return db.query(
+        BlogTrendingScore.language,
+        BlogTrendingScore.period,
+        BlogTrendingScore.blog_post_id,
+        BlogTrendingScore.score,
+        BlogTrendingScore.scored_at,
+    ).all()
@@ -6,19 +6,30 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
+import asyncio
 import time
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
 from app.database import check_db_connection
 from app.services.cache_service import get_cache_service
+from app.services.degraded_service import get_degraded_mode, is_database_unavailable, refresh_snapshot_forever
+from app.services.search_index import get_search_index, open_search_index
+from app.services.trending import get_trending, persist_trending_forever
+from app.services.view_counter import flush_views_forever, get_view_counter
 from app.utils.logger import setup_logging
 from app.core.rate_limit import limiter
+from app.core.cache_policy import apply_cache_policy
+from app.core.compression import CompressionMiddleware
+from app.crud.pagination import InvalidCursor
 
 # Import API routes
+from app.api import feeds
 from app.api.v1 import api_router
 
 
@@ -51,6 +62,35 @@ async def lifespan(app: FastAPI):
     # Initialize Redis cache
     cache_service = get_cache_service()
     await cache_service.connect()
+
+    # Map (or build) the blog search index; search falls back to SQL without it
+    try:
+        await run_in_threadpool(open_search_index, get_search_index())
+    except (SQLAlchemyError, OSError) as exc:
+        logger.warning("Blog search index unavailable: {}", exc)
+
+    # Keep the degraded-mode snapshot fresh
+    refresher = None
+    if settings.SNAPSHOT_REFRESH_SECONDS > 0:
+        refresher = asyncio.create_task(
+            refresh_snapshot_forever(app, get_degraded_mode(), settings.SNAPSHOT_REFRESH_SECONDS)
+        )
+
+    # Write buffered blog views back in batches
+    view_flusher = None
+    if settings.VIEW_FLUSH_SECONDS > 0:
+        view_flusher = asyncio.create_task(flush_views_forever(get_view_counter(), settings.VIEW_FLUSH_SECONDS))
+
+    # Restore lost trending leaderboards and keep their database copy current
+    trending_persister = None
+    if settings.TRENDING_PERSIST_SECONDS > 0:
+        try:
+            await get_trending().restore()
+        except SQLAlchemyError as exc:
+            logger.warning("Trending leaderboards not restored: {}", exc)
+        trending_persister = asyncio.create_task(
+            persist_trending_forever(get_trending(), settings.TRENDING_PERSIST_SECONDS)
+        )
     
     logger.info("🚀 Application startup complete")
     
@@ -58,6 +98,26 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down application...")
+    if refresher is not None:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+    if view_flusher is not None:
+        view_flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await view_flusher
+        try:
+            await get_view_counter().flush()
+        except Exception as exc:
+            logger.error("Final blog view flush failed: {}", exc)
+    if trending_persister is not None:
+        trending_persister.cancel()
+        with suppress(asyncio.CancelledError):
+            await trending_persister
+        try:
+            await get_trending().persist()
+        except Exception as exc:
+            logger.error("Final trending leaderboard persist failed: {}", exc)
     await cache_service.disconnect()
     logger.info("👋 Application shutdown complete")
 
@@ -83,6 +143,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -111,7 +172,51 @@ async def log_requests(request: Request, call_next):
     return response
 
 
+# Edge cache headers middleware
+@app.middleware("http")
+async def cache_headers(request: Request, call_next):
+    """Attach Cache-Control and Surrogate-Key headers for the CDN"""
+    response = await call_next(request)
+    return apply_cache_policy(request, response)
+
+
+# Degraded read-only mode (outermost, so it sees database errors of every route)
+@app.middleware("http")
+async def degraded_mode(request: Request, call_next):
+    """Answer from the last good snapshot while the database is unreachable"""
+    if not request.url.path.startswith(settings.API_V1_PREFIX):
+        return await call_next(request)
+
+    mode = get_degraded_mode()
+    if mode.circuit.is_open:
+        return mode.fallback_response(request)
+    try:
+        response = await call_next(request)
+    except Exception as exc:
+        if not is_database_unavailable(exc):
+            raise
+        logger.error("Database unavailable on {}: {}", request.url.path, exc)
+        mode.circuit.record_failure()
+        return mode.fallback_response(request)
+    mode.circuit.record_success()
+    return response
+
+
+# Response compression (outermost, so it sees final bodies and headers)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    cache_bytes=settings.COMPRESSION_CACHE_BYTES,
+)
+
+
 # Exception handlers
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    """Reject cursors that were not issued for the requested list"""
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
@@ -172,6 +277,7 @@ async def health_check():
         "status": "healthy" if db_status else "degraded",
         "version": settings.VERSION,
         "environment": settings.ENVIRONMENT,
+        "read_only": get_degraded_mode().circuit.is_open,
         "services": {
             "database": "connected" if db_status else "disconnected",
             "cache": "connected" if cache_status else "disconnected"
@@ -233,6 +339,7 @@ async def root():
 
 # Include API routers
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+app.include_router(feeds.router, tags=["Feeds"])
 
 
 if __name__ == "__main__":
@@ -3,14 +3,20 @@ SQLAlchemy Models Initialization
 """
 from app.models.user import User
 from app.models.auth import RefreshTokenSession, TokenBlacklist
-from app.models.blog import BlogPost, BlogTranslation
+from app.models.blog import (
+    BlogArchiveMonth, BlogPost, BlogPostTerms, BlogPostVector, BlogRelatedPost, BlogTermFrequency, BlogTranslation,
+    BlogTrendingScore,
+)
 from app.models.project import Project, ProjectTranslation, ProjectTechnology, ProjectImage
 from app.models.technology import Technology
+from app.models.tag import Tag, BlogPostTag, ProjectTag
 from app.models.skill import Skill, SkillTranslation
 from app.models.experience import Experience, ExperienceTranslation
 from app.models.contact import ContactMessage
 from app.models.github import GitHubRepo
 from app.models.site import SiteConfig, Translation, PageView
+from app.models.read_model import ContentReadModel
+from app.models.feed import FeedDocument, FeedEntry
 
 __all__ = [
     "User",
@@ -18,11 +24,20 @@ __all__ = [
     "TokenBlacklist",
     "BlogPost",
     "BlogTranslation",
+    "BlogPostTerms",
+    "BlogTermFrequency",
+    "BlogPostVector",
+    "BlogRelatedPost",
+    "BlogTrendingScore",
+    "BlogArchiveMonth",
     "Project",
     "ProjectTranslation",
     "ProjectTechnology",
     "ProjectImage",
     "Technology",
+    "Tag",
+    "BlogPostTag",
+    "ProjectTag",
     "Skill",
     "SkillTranslation",
     "Experience",
@@ -32,4 +47,7 @@ __all__ = [
     "SiteConfig",
     "Translation",
     "PageView",
+    "ContentReadModel",
+    "FeedEntry",
+    "FeedDocument",
 ]
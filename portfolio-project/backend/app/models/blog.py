@@ -2,7 +2,10 @@
 Blog Models
 Blog posts and translations
 """
-from sqlalchemy import Column, String, Text, Boolean, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    JSON, Column, Float, String, Text, Boolean, Integer, DateTime, ForeignKey, Index, PrimaryKeyConstraint,
+    SmallInteger, UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -21,7 +24,14 @@ class BlogPost(Base):
     slug = Column(String(255), unique=True, nullable=False, index=True)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
+    # Rendering of content (app.utils.markdown_renderer), redone when content_hash changes
+    content_html = Column(Text, nullable=True)
+    content_toc = Column(JSON, nullable=True)
+    content_hash = Column(String(64), nullable=True)
     excerpt = Column(Text, nullable=True)
+    # Derived from content on save with its rendering; excerpt defaults to auto_excerpt
+    auto_excerpt = Column(Text, nullable=True)
+    word_count = Column(Integer, nullable=True)
     cover_image = Column(String(500), nullable=True)
     author_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     published = Column(Boolean, default=False, index=True)
@@ -30,10 +40,13 @@ class BlogPost(Base):
     reading_time = Column(Integer, nullable=True)  # in minutes
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # PostgreSQL also has a generated search_vector (migration 004), queried
+    # by app.crud.blog_search without being mapped
     
     # Relationships
     author = relationship("User", back_populates="blog_posts")
     translations = relationship("BlogTranslation", back_populates="blog_post", cascade="all, delete-orphan")
+    tags = relationship("Tag", secondary="blog_post_tags", order_by="Tag.slug")
     
     def __repr__(self):
         return f"<BlogPost {self.slug}>"
@@ -55,7 +68,13 @@ class BlogTranslation(Base):
     language = Column(String(5), nullable=False, index=True)  # tr, en, de, fr
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
+    content_html = Column(Text, nullable=True)
+    content_toc = Column(JSON, nullable=True)
+    content_hash = Column(String(64), nullable=True)
     excerpt = Column(Text, nullable=True)
+    auto_excerpt = Column(Text, nullable=True)
+    word_count = Column(Integer, nullable=True)
+    reading_time = Column(Integer, nullable=True)  # in minutes
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -67,3 +86,112 @@ class BlogTranslation(Base):
     
     class Config:
         from_attributes = True
+
+
+class BlogPostTerms(Base):
+    """
+    Weighted term counts of a published post's text in one language
+
+    The input of the related-posts TF-IDF model (app.crud.related); kept so
+    a write re-tokenizes only the posts it changed and can take their old
+    terms out of the document frequencies.
+    """
+    __tablename__ = "blog_post_terms"
+    __table_args__ = (PrimaryKeyConstraint("blog_post_id", "language", name="pk_blog_post_terms"),)
+
+    blog_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    language = Column(String(5), nullable=False)
+    terms = Column(JSON, nullable=False)  # term -> weighted count
+
+    def __repr__(self):
+        return f"<BlogPostTerms {self.blog_post_id} - {self.language}>"
+
+
+class BlogTermFrequency(Base):
+    """Number of published posts whose text in a language contains a term"""
+    __tablename__ = "blog_term_frequencies"
+    __table_args__ = (PrimaryKeyConstraint("language", "term", name="pk_blog_term_frequencies"),)
+
+    language = Column(String(5), nullable=False)
+    term = Column(String(64), nullable=False)
+    documents = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<BlogTermFrequency {self.language}:{self.term} {self.documents}>"
+
+
+class BlogPostVector(Base):
+    """
+    Weight of a term in a published post's unit TF-IDF vector
+
+    Only the heaviest terms of each post are kept; the (language, term)
+    index lets a post be scored against every post sharing one of them.
+    """
+    __tablename__ = "blog_post_vectors"
+    __table_args__ = (
+        PrimaryKeyConstraint("blog_post_id", "language", "term", name="pk_blog_post_vectors"),
+        Index("idx_blog_post_vectors_term", "language", "term"),
+    )
+
+    blog_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    language = Column(String(5), nullable=False)
+    term = Column(String(64), nullable=False)
+    weight = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<BlogPostVector {self.blog_post_id} - {self.language}:{self.term}>"
+
+
+class BlogRelatedPost(Base):
+    """Precomputed nearest neighbour of a published post, by TF-IDF cosine similarity"""
+    __tablename__ = "blog_related_posts"
+    __table_args__ = (PrimaryKeyConstraint("blog_post_id", "language", "rank", name="pk_blog_related_posts"),)
+
+    blog_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    language = Column(String(5), nullable=False)
+    rank = Column(SmallInteger, nullable=False)  # 0 is the most similar
+    related_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<BlogRelatedPost {self.blog_post_id} -> {self.related_post_id} ({self.language})>"
+
+
+class BlogTrendingScore(Base):
+    """
+    Time-decayed view score of a post in one trending leaderboard
+
+    A periodic copy of the leaderboards kept by app.services.trending,
+    restored from when they are lost; ``score`` is as of ``scored_at``.
+    """
+    __tablename__ = "blog_trending_scores"
+    __table_args__ = (
+        PrimaryKeyConstraint("language", "period", "blog_post_id", name="pk_blog_trending_scores"),
+    )
+
+    language = Column(String(5), nullable=False)
+    period = Column(String(8), nullable=False)  # leaderboard window, e.g. "7d"
+    blog_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    scored_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<BlogTrendingScore {self.language}:{self.period} {self.blog_post_id} {self.score}>"
+
+
+class BlogArchiveMonth(Base):
+    """
+    Number of published posts in one month of the blog archive
+
+    Months are of the UTC ``published_at``; kept up to date by the blog
+    writes (app.crud.blog_archive), and only months with posts have a row.
+    """
+    __tablename__ = "blog_archive_months"
+    __table_args__ = (PrimaryKeyConstraint("year", "month", name="pk_blog_archive_months"),)
+
+    year = Column(SmallInteger, nullable=False)
+    month = Column(SmallInteger, nullable=False)
+    post_count = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<BlogArchiveMonth {self.year}-{self.month:02d} {self.post_count}>"
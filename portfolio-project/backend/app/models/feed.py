@@ -0,0 +1,51 @@
+"""
+Feed Models
+Rendered entries and compressed documents of the blog feeds and the sitemap
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, PrimaryKeyConstraint, String, Text
+
+from app.database import Base
+
+
+class FeedEntry(Base):
+    """
+    One rendered entry of a feed: an RSS item, an Atom entry or a sitemap URL
+
+    Rewritten only when its post or section changes; documents are assembled
+    from the stored fragments.
+    """
+    __tablename__ = "feed_entries"
+    __table_args__ = (
+        PrimaryKeyConstraint("feed", "entry_key", name="pk_feed_entries"),
+        Index("idx_feed_entries_sort", "feed", "sort_at"),
+        Index("idx_feed_entries_page", "feed", "page"),
+    )
+
+    feed = Column(String(16), nullable=False)  # rss:<language>, atom:<language>, sitemap
+    entry_key = Column(String(64), nullable=False)  # blog:<id>, or the path of a section page
+    fragment = Column(Text, nullable=False)
+    lastmod = Column(DateTime(timezone=True), nullable=True)
+    sort_at = Column(DateTime(timezone=True), nullable=True)  # feed order, newest first
+    page = Column(Integer, nullable=False, default=0)  # sitemap page, kept for the entry's lifetime
+
+    def __repr__(self):
+        return f"<FeedEntry {self.feed}:{self.entry_key}>"
+
+
+class FeedDocument(Base):
+    """
+    A served feed or sitemap document, gzip-compressed
+
+    Replaced when an entry it contains changes; ``last_modified`` is when its
+    body last changed.
+    """
+    __tablename__ = "feed_documents"
+
+    name = Column(String(32), primary_key=True)  # blog.rss:<language>, blog.atom:<language>, sitemap, sitemap-<n>
+    media_type = Column(String(32), nullable=False)
+    body = Column(LargeBinary, nullable=False)
+    etag = Column(String(40), nullable=False)
+    last_modified = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<FeedDocument {self.name}>"
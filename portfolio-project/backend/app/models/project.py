@@ -33,13 +33,19 @@ class Project(Base):
     # Relationships
     translations = relationship("ProjectTranslation", back_populates="project", cascade="all, delete-orphan")
     project_technologies = relationship("ProjectTechnology", back_populates="project", cascade="all, delete-orphan")
-    images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan")
+    images = relationship(
+        "ProjectImage",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        order_by="ProjectImage.display_order",
+    )
     # Direct relationship to technologies through association table
     technologies = relationship(
         "Technology",
         secondary="project_technologies",
         viewonly=True
     )
+    tags = relationship("Tag", secondary="project_tags", order_by="Tag.slug")
     
     def __repr__(self):
         return f"<Project {self.slug}>"
@@ -0,0 +1,34 @@
+"""
+Content Read Model
+Ready-to-serve JSON documents of public content, one per entity and language
+"""
+from sqlalchemy import Column, DateTime, Index, PrimaryKeyConstraint, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ContentReadModel(Base):
+    """
+    Denormalized public document of a project or blog post
+
+    Rewritten in the same transaction as every admin write to the entity, so
+    public reads fetch one row instead of reassembling the entity from its
+    translation, technology and image tables.
+    """
+    __tablename__ = "content_read_model"
+    __table_args__ = (
+        PrimaryKeyConstraint("entity_type", "entity_id", "language", name="pk_content_read_model"),
+        Index("ix_content_read_model_slug", "entity_type", "language", "slug", unique=True),
+    )
+
+    entity_type = Column(String(20), nullable=False)  # project, blog, blog_summary
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    language = Column(String(5), nullable=False)
+    slug = Column(String(255), nullable=False)
+    document = Column(Text, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ContentReadModel {self.entity_type}:{self.slug} ({self.language})>"
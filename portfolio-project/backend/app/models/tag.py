@@ -0,0 +1,62 @@
+"""
+Tag Models
+Topics shared by blog posts and projects, with their per-tag counts
+"""
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class Tag(Base):
+    """
+    Topic tag
+
+    The counts are kept up to date by the blog and project writes
+    (app.crud.tag) so the tag list never aggregates the association tables.
+    """
+    __tablename__ = "tags"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    slug = Column(String(100), unique=True, nullable=False, index=True)
+    name = Column(String(100), nullable=False)
+    # Published blog posts and projects carrying the tag
+    blog_post_count = Column(Integer, nullable=False, default=0, server_default="0")
+    project_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Tag {self.slug}>"
+
+
+class BlogPostTag(Base):
+    """
+    Many-to-many relationship between blog posts and tags
+
+    The primary key serves a post's tags; the reverse index serves the posts
+    of a tag when lists are filtered.
+    """
+    __tablename__ = "blog_post_tags"
+    __table_args__ = (Index("idx_blog_post_tags_tag", "tag_id", "blog_post_id"),)
+
+    blog_post_id = Column(UUID(as_uuid=True), ForeignKey("blog_posts.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<BlogPostTag post={self.blog_post_id} tag={self.tag_id}>"
+
+
+class ProjectTag(Base):
+    """
+    Many-to-many relationship between projects and tags, indexed both ways
+    """
+    __tablename__ = "project_tags"
+    __table_args__ = (Index("idx_project_tags_tag", "tag_id", "project_id"),)
+
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<ProjectTag project={self.project_id} tag={self.tag_id}>"
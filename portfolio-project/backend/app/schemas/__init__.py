@@ -11,12 +11,14 @@ from app.schemas.project import (
     ProjectTranslation, ProjectTranslationCreate
 )
 from app.schemas.technology import Technology, TechnologyCreate
+from app.schemas.tag import Tag, TagSummary
 from app.schemas.skill import Skill, SkillCreate, SkillTranslation
 from app.schemas.experience import Experience, ExperienceCreate, ExperienceTranslation
 from app.schemas.contact import ContactMessage, ContactMessageCreate, ContactMessageResponse
 from app.schemas.github import GitHubRepo, GitHubRepoResponse
 from app.schemas.site import SiteConfig, Translation, TranslationResponse, PageViewCreate
 from app.schemas.admin import AdminStatsResponse
+from app.schemas.batch import BatchRequest, BatchResponse
 
 __all__ = [
     "User", "UserCreate", "UserLogin", "Token", "TokenData",
@@ -25,10 +27,12 @@ __all__ = [
     "Project", "ProjectCreate", "ProjectUpdate", "ProjectDetail",
     "ProjectTranslation", "ProjectTranslationCreate",
     "Technology", "TechnologyCreate",
+    "Tag", "TagSummary",
     "Skill", "SkillCreate", "SkillTranslation",
     "Experience", "ExperienceCreate", "ExperienceTranslation",
     "ContactMessage", "ContactMessageCreate", "ContactMessageResponse",
     "GitHubRepo", "GitHubRepoResponse",
     "SiteConfig", "Translation", "TranslationResponse", "PageViewCreate",
     "AdminStatsResponse",
+    "BatchRequest", "BatchResponse",
 ]
@@ -0,0 +1,29 @@
+"""
+Batch Schemas
+Multiplexed read requests
+"""
+from pydantic import BaseModel, Field
+from typing import Any, List, Literal
+
+
+class BatchItem(BaseModel):
+    """A single relative GET request inside a batch"""
+    method: Literal["GET"] = "GET"
+    path: str = Field(..., min_length=1, max_length=2048, description="Path with optional query string, e.g. /api/v1/skills/?language=tr")
+
+
+class BatchRequest(BaseModel):
+    """Batch request body"""
+    requests: List[BatchItem] = Field(..., min_length=1)
+
+
+class BatchItemResponse(BaseModel):
+    """Result of a single request inside a batch"""
+    path: str
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Batch response, in request order"""
+    responses: List[BatchItemResponse]
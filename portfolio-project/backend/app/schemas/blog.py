@@ -2,11 +2,13 @@
 Blog Schemas
 Blog posts and translations
 """
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from app.schemas.tag import TagName, TagSummary
+
 
 class BlogTranslationBase(BaseModel):
     """Base blog translation schema"""
@@ -21,16 +23,52 @@ class BlogTranslationCreate(BlogTranslationBase):
     pass
 
 
-class BlogTranslation(BlogTranslationBase):
+class TocEntry(BaseModel):
+    """Heading in a rendered body's table of contents"""
+    id: str  # anchor of the heading
+    name: str  # heading text, HTML-escaped
+    level: int
+    children: List["TocEntry"] = []
+
+
+class RenderedContent(BaseModel):
+    """Server-side rendering of a Markdown body"""
+    content_html: Optional[str] = None  # sanitized HTML with highlighted code
+    content_toc: List[TocEntry] = []
+
+    @field_validator("content_toc", mode="before")
+    @classmethod
+    def _missing_toc(cls, value):
+        return value or []
+
+
+class BlogTranslation(BlogTranslationBase, RenderedContent):
     """Blog translation response schema"""
     id: uuid.UUID
     blog_post_id: uuid.UUID
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
     created_at: datetime
     updated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class BlogTranslationSummary(BaseModel):
+    """Blog translation in list responses, without its content"""
+    id: uuid.UUID
+    blog_post_id: uuid.UUID
+    language: str
+    title: str
+    excerpt: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class BlogPostBase(BaseModel):
     """Base blog post schema"""
     title: str = Field(..., min_length=1, max_length=255)
@@ -43,8 +81,8 @@ class BlogPostBase(BaseModel):
 class BlogPostCreate(BlogPostBase):
     """Blog post creation schema"""
     slug: Optional[str] = Field(None, max_length=255)
-    reading_time: Optional[int] = Field(None, ge=0)  # Auto-calculated if not provided
     translations: Optional[List[BlogTranslationCreate]] = None
+    tags: Optional[List[TagName]] = Field(None, max_length=20)
 
 
 class BlogPostUpdate(BaseModel):
@@ -54,16 +92,18 @@ class BlogPostUpdate(BaseModel):
     excerpt: Optional[str] = Field(None, max_length=500)
     cover_image: Optional[HttpUrl] = None
     published: Optional[bool] = None
-    reading_time: Optional[int] = Field(None, ge=0)
+    tags: Optional[List[TagName]] = Field(None, max_length=20)  # replaces the post's tags
 
 
-class BlogPost(BlogPostBase):
+class BlogPost(BlogPostBase, RenderedContent):
     """Blog post response schema"""
     id: uuid.UUID
     slug: str
     author_id: uuid.UUID
     views: int = 0
+    word_count: Optional[int] = None
     reading_time: Optional[int] = None
+    tags: List[TagSummary] = []
     published_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
@@ -71,6 +111,59 @@ class BlogPost(BlogPostBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BlogPostSummary(BaseModel):
+    """Blog post in list and search responses; the content is only served by the detail route"""
+    id: uuid.UUID
+    slug: str
+    title: str
+    excerpt: Optional[str] = None
+    cover_image: Optional[HttpUrl] = None
+    author_id: uuid.UUID
+    published: bool = False
+    published_at: Optional[datetime] = None
+    views: int = 0
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    tags: List[TagSummary] = []
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BlogSearchResult(BlogPostSummary):
+    """Blog post search hit"""
+    # Matched passages with <mark> around the hits; None without full-text search
+    headline: Optional[str] = None
+
+
+class BlogTrendingPost(BlogPostSummary):
+    """Blog post on a trending leaderboard"""
+    # Views in the window, each weighed down exponentially with its age
+    trending_score: float
+
+
+class BlogArchiveMonth(BaseModel):
+    """Month of the blog archive"""
+    month: int
+    name: str  # in the requested language
+    count: int
+
+
+class BlogArchiveYear(BaseModel):
+    """Year of the blog archive with its months, newest first"""
+    year: int
+    count: int
+    months: List[BlogArchiveMonth]
+
+
+class BlogArchive(BaseModel):
+    """Published blog posts per year and month"""
+    language: str
+    total: int
+    years: List[BlogArchiveYear]
+
+
 class BlogPostDetail(BlogPost):
     """Blog post detail with translations"""
     translations: List[BlogTranslation] = []
@@ -85,11 +178,12 @@ BlogPostResponse = BlogPost
 
 class BlogPostList(BaseModel):
     """Paginated blog post list response"""
-    items: List[BlogPost]
-    total: int
-    page: int
+    items: List[BlogPostSummary]
+    total: Optional[int] = None  # None on cursor pages
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Alias for backward compatibility
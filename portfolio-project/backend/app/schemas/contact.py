@@ -55,7 +55,8 @@ class ContactMessageListResponse(BaseModel):
     """Paginated list response for admin panel"""
 
     messages: list[ContactMessage]
-    total: int
+    total: Optional[int] = None  # None on cursor pages
     skip: int
     limit: int
     unread_count: int
+    next_cursor: Optional[str] = None
@@ -79,9 +79,10 @@ ExperienceResponse = Experience
 class ExperienceList(BaseModel):
     """Experiences list with pagination"""
     experiences: List[Experience]
-    total: int
+    total: Optional[int] = None  # None on cursor pages
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 # Alias for backward compatibility
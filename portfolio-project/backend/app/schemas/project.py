@@ -7,6 +7,8 @@ from typing import Optional, List, Any
 from datetime import datetime
 import uuid
 
+from app.schemas.tag import TagName, TagSummary
+
 
 class ProjectTranslationBase(BaseModel):
     """Base project translation schema"""
@@ -82,6 +84,7 @@ class ProjectCreate(ProjectBase):
     technology_ids: Optional[List[uuid.UUID]] = None
     translations: Optional[List[ProjectTranslationCreate]] = None
     images: Optional[List[ProjectImageCreate]] = None
+    tags: Optional[List[TagName]] = Field(None, max_length=20)
 
 
 class ProjectUpdate(BaseModel):
@@ -95,6 +98,7 @@ class ProjectUpdate(BaseModel):
     featured: Optional[bool] = None
     display_order: Optional[int] = None
     technology_ids: Optional[List[uuid.UUID]] = None
+    tags: Optional[List[TagName]] = Field(None, max_length=20)  # replaces the project's tags
 
 
 class Project(ProjectBase):
@@ -112,6 +116,7 @@ class ProjectDetail(Project):
     translations: List[ProjectTranslation] = []
     technologies: List[TechnologyRef] = []
     images: List[ProjectImage] = []
+    tags: List[TagSummary] = []
     
     model_config = ConfigDict(from_attributes=True)
 
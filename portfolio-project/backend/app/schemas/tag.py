@@ -0,0 +1,33 @@
+"""
+Tag Schemas
+Topic tags of blog posts and projects
+"""
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated
+from datetime import datetime
+import uuid
+
+# Tag as written on a post or project; its slug identifies it
+TagName = Annotated[str, Field(min_length=1, max_length=100)]
+
+
+class TagSummary(BaseModel):
+    """Tag of a blog post or project"""
+    slug: str
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class Tag(TagSummary):
+    """Tag with the number of published blog posts and projects carrying it"""
+    id: uuid.UUID
+    blog_post_count: int = 0
+    project_count: int = 0
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Alias matching the other resources
+TagResponse = Tag
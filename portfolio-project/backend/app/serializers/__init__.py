@@ -0,0 +1,4 @@
+"""
+Serializers
+Response payload builders shared across routers and services
+"""
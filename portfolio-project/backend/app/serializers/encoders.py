@@ -0,0 +1,69 @@
+"""
+JSON Encoders
+Precompiled pydantic adapters and orjson encoding of response payloads
+"""
+from functools import lru_cache
+from typing import Any, Iterable, Union
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode plain data to compact JSON
+
+    Datetimes, dates and UUIDs are encoded natively in ISO 8601 and canonical
+    form, so payload builders can pass them through unconverted.
+    """
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(document: Union[str, bytes]) -> Any:
+    return orjson.loads(document)
+
+
+@lru_cache(maxsize=None)
+def adapter(schema: Any) -> TypeAdapter:
+    """The TypeAdapter of a response schema, built once per schema"""
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, value: Any) -> bytes:
+    """
+    Validate ``value`` (plain data or ORM objects) against ``schema`` and
+    encode it in one pass through pydantic's core, without an intermediate dict
+    """
+    schema_adapter = adapter(schema)
+    return schema_adapter.dump_json(schema_adapter.validate_python(value, from_attributes=True))
+
+
+def merge_fields(document: Union[str, bytes], **fields: Any) -> bytes:
+    """
+    Add fields to an already encoded JSON object without parsing it
+
+    The document must not already contain any of ``fields``.
+    """
+    encoded = document.encode() if isinstance(document, str) else document
+    body = encoded.rstrip()[:-1].rstrip()
+    separator = b"," if body != b"{" else b""
+    return body + separator + dumps(fields)[1:]
+
+
+def list_envelope(items: Iterable[Union[str, bytes]], **fields: Any) -> bytes:
+    """
+    Encode ``{"items": [...], **fields}`` around already encoded items
+
+    Lets stored JSON documents be spliced into a list response as they are
+    instead of being parsed and encoded again.
+    """
+    encoded = b",".join(item.encode() if isinstance(item, str) else item for item in items)
+    rest = dumps(fields)
+    separator = b"," if len(rest) > 2 else b""
+    return b'{"items":[' + encoded + b"]" + separator + rest[1:]
@@ -0,0 +1,73 @@
+"""
+Project Serializer
+Public JSON payload of a project, shared by the projects and bundle endpoints
+"""
+from typing import Optional
+
+from app.api.fieldsets import Fieldset, FieldSelection
+
+PROJECT_FIELDSET = Fieldset(
+    fields=(
+        "id", "slug", "title", "short_description", "description", "cover_image",
+        "github_url", "demo_url", "featured", "display_order", "created_at", "updated_at",
+    ),
+    relations=("technologies", "translations", "images", "tags"),
+    default_include=("technologies", "translations", "images", "tags"),
+)
+FULL_PROJECT_SELECTION = FieldSelection(
+    fieldset=PROJECT_FIELDSET, columns=None, include=PROJECT_FIELDSET.default_include
+)
+
+
+def serialize_project(project, selection: Optional[FieldSelection] = None) -> dict:
+    """
+    Build the public payload of a project
+
+    Values are left as loaded (UUIDs, datetimes); encode the payload with
+    ``app.serializers.encoders.dumps``.
+
+    Args:
+        project: Project, or translated view of one, with the relations
+            required by ``selection`` loaded; translated fields are read
+            as loaded
+        selection: Fields and relations to emit (all by default)
+    """
+    selection = selection or FULL_PROJECT_SELECTION
+    payload = {name: getattr(project, name) for name in selection.fields}
+
+    if "technologies" in selection.include:
+        payload["technologies"] = [
+            {
+                "id": tech.id,
+                "name": tech.name,
+                "slug": tech.slug,
+                "icon": tech.icon,
+                "color": tech.color,
+                "category": tech.category,
+            }
+            for tech in project.technologies
+        ]
+    if "translations" in selection.include:
+        payload["translations"] = [
+            {
+                "id": trans.id,
+                "language": trans.language,
+                "title": trans.title,
+                "short_description": trans.short_description,
+                "description": trans.description,
+            }
+            for trans in project.translations
+        ]
+    if "images" in selection.include:
+        payload["images"] = [
+            {
+                "id": img.id,
+                "image_url": img.image_url,
+                "caption": img.caption,
+                "display_order": img.display_order,
+            }
+            for img in project.images
+        ]
+    if "tags" in selection.include:
+        payload["tags"] = [{"slug": tag.slug, "name": tag.name} for tag in project.tags]
+    return payload
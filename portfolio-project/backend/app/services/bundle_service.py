@@ -0,0 +1,123 @@
+"""
+Home Bundle Cache
+Builds the home page bundle and keeps a pre-serialized copy per language in Redis
+"""
+from typing import Dict, List, Optional
+
+from loguru import logger
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.crud import experience as experience_crud
+from app.crud import github as github_crud
+from app.crud import project as project_crud
+from app.crud import site as site_crud
+from app.crud import skill as skill_crud
+from app.database import SessionLocal
+from app.schemas.experience import ExperienceResponse
+from app.schemas.github import GitHubRepo
+from app.schemas.skill import SkillResponse
+from app.serializers.encoders import dumps
+from app.serializers.project import serialize_project
+from app.services.cache_service import get_cache_service
+
+BUNDLE_LANGUAGES = ("tr", "en")
+BUNDLE_TTL_SECONDS = 24 * 3600
+
+# Surrogate keys whose content is embedded in the home bundle
+HOME_BUNDLE_DEPENDENCIES = frozenset(
+    {"projects", "skills", "experiences", "technologies", "translations", "site-config", "github"}
+)
+
+_skills_adapter = TypeAdapter(List[SkillResponse])
+_experiences_adapter = TypeAdapter(Dict[str, List[ExperienceResponse]])
+_repos_adapter = TypeAdapter(List[GitHubRepo])
+
+
+def home_bundle_key(language: str) -> str:
+    return f"bundle:home:{language}"
+
+
+def build_home_bundle(db: Session, language: str) -> dict:
+    """
+    Assemble everything the home and about pages render
+
+    Mirrors ``/projects?featured_only=true``, ``/skills``, ``/experiences/by-type``,
+    ``/translations/{language}``, ``/translations/config/all`` and ``/github/repos``.
+    """
+    projects = project_crud.get_projects(db, skip=0, limit=100, featured_only=True, language=language)
+    skills = skill_crud.get_skills(db, language=language)
+
+    experiences: Dict[str, list] = {}
+    for experience in experience_crud.get_experiences(db, skip=0, limit=10000, language=language):
+        experiences.setdefault(experience.experience_type, []).append(experience)
+
+    return {
+        "language": language,
+        "projects": [serialize_project(project) for project in projects],
+        "skills": _skills_adapter.dump_python(_skills_adapter.validate_python(skills), mode="json"),
+        "experiences": _experiences_adapter.dump_python(
+            _experiences_adapter.validate_python(experiences), mode="json"
+        ),
+        "translations": site_crud.get_translations(db, language=language),
+        "config": site_crud.get_all_site_config(db),
+        "github_repos": _repos_adapter.dump_python(
+            _repos_adapter.validate_python(github_crud.get_github_repos(db, limit=20)), mode="json"
+        ),
+    }
+
+
+def render_home_bundle(db: Session, language: str) -> str:
+    """Serialize the bundle for a language to its compact JSON document"""
+    return dumps(build_home_bundle(db, language)).decode()
+
+
+async def get_home_bundle(language: str) -> Optional[str]:
+    """Return the cached JSON document for a language, if materialized"""
+    return await get_cache_service().get_raw(home_bundle_key(language))
+
+
+async def store_home_bundle(language: str, payload: str) -> None:
+    """
+    Store a bundle built on a cache miss
+
+    Only fills an empty slot: a request that read the database before a
+    content change must not overwrite the copy rebuilt after it.
+    """
+    await get_cache_service().set_raw(
+        home_bundle_key(language), payload, ttl=BUNDLE_TTL_SECONDS, only_if_absent=True
+    )
+
+
+async def invalidate_home_bundles() -> None:
+    """Drop every materialized bundle so the next request rebuilds it"""
+    cache = get_cache_service()
+    for language in BUNDLE_LANGUAGES:
+        await cache.delete(home_bundle_key(language))
+    logger.debug("Home bundles invalidated")
+
+
+async def rebuild_home_bundles() -> None:
+    """
+    Precompute and store every language's bundle after a content change
+
+    Runs after the admin write committed, with its own session. Stored copies
+    are overwritten in place; if the rebuild fails they are dropped instead so
+    the next request rebuilds them.
+    """
+    cache = get_cache_service()
+    if not cache.redis_client:
+        return
+
+    db = SessionLocal()
+    try:
+        for language in BUNDLE_LANGUAGES:
+            await cache.set_raw(
+                home_bundle_key(language), render_home_bundle(db, language), ttl=BUNDLE_TTL_SECONDS
+            )
+        logger.debug("Home bundles rebuilt")
+    except Exception as exc:
+        logger.error(f"Home bundle rebuild failed: {exc}")
+        await invalidate_home_bundles()
+    finally:
+        db.close()
@@ -84,6 +84,46 @@ class CacheService:
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {e}")
     
+    async def get_raw(self, key: str) -> Optional[str]:
+        """
+        Get a pre-serialized value from cache without decoding it
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Stored string or None
+        """
+        if not self.redis_client:
+            return None
+        
+        try:
+            return await self.redis_client.get(key)
+        
+        except Exception as e:
+            logger.error(f"Error getting cache key {key}: {e}")
+            return None
+    
+    async def set_raw(self, key: str, value: str, ttl: int = 3600, only_if_absent: bool = False):
+        """
+        Store a pre-serialized value in cache as-is
+        
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds (default: 1 hour)
+            only_if_absent: Leave an existing value untouched (SET NX)
+        """
+        if not self.redis_client:
+            return
+        
+        try:
+            await self.redis_client.set(key, value, ex=ttl, nx=only_if_absent)
+            logger.debug(f"Cached key {key} with TTL {ttl}s")
+        
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {e}")
+    
     async def delete(self, key: str):
         """
         Delete value from cache
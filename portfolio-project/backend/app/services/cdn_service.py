@@ -0,0 +1,117 @@
+"""
+CDN Purge Service
+Invalidates edge-cached responses by surrogate key
+"""
+from typing import Iterable, List, Optional, Set
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+
+
+class PurgeBackend:
+    """Interface for surrogate-key purge backends"""
+
+    async def purge(self, keys: Set[str]) -> bool:
+        raise NotImplementedError
+
+
+class NullPurgeBackend(PurgeBackend):
+    """Backend used when no CDN is configured"""
+
+    async def purge(self, keys: Set[str]) -> bool:
+        return True
+
+
+class InMemoryPurgeBackend(PurgeBackend):
+    """In-process stub that records purged keys (tests and local development)"""
+
+    def __init__(self):
+        self.purged: List[Set[str]] = []
+
+    async def purge(self, keys: Set[str]) -> bool:
+        self.purged.append(set(keys))
+        return True
+
+    @property
+    def purged_keys(self) -> Set[str]:
+        return set().union(*self.purged) if self.purged else set()
+
+
+class VarnishPurgeBackend(PurgeBackend):
+    """
+    Varnish-compatible HTTP purge backend
+
+    Sends ``PURGE`` to the configured endpoint with the keys in the
+    ``Surrogate-Key`` request header, e.g. for VCL using
+    ``xkey.purge(req.http.Surrogate-Key)``.
+    """
+
+    def __init__(self, purge_url: str, timeout: float = 5.0):
+        self.purge_url = purge_url
+        self.timeout = timeout
+
+    async def purge(self, keys: Set[str]) -> bool:
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.request(
+                    "PURGE",
+                    self.purge_url,
+                    headers={"Surrogate-Key": " ".join(sorted(keys))},
+                )
+            if response.status_code >= 400:
+                logger.warning("CDN purge failed with status {}", response.status_code)
+                return False
+            return True
+        except httpx.HTTPError as exc:
+            logger.error("CDN purge request failed: {}", exc)
+            return False
+
+
+class CDNService:
+    """Service for purging CDN caches"""
+
+    def __init__(self, backend: Optional[PurgeBackend] = None):
+        self.backend = backend or _build_backend()
+
+    async def purge(self, keys: Iterable[str]) -> bool:
+        """
+        Purge all edge objects tagged with any of the given keys
+
+        Args:
+            keys: Surrogate keys to purge
+
+        Returns:
+            True if the purge was accepted
+        """
+        unique_keys = {key for key in keys if key}
+        if not unique_keys:
+            return True
+
+        logger.debug(f"Purging CDN surrogate keys: {sorted(unique_keys)}")
+        return await self.backend.purge(unique_keys)
+
+
+def _build_backend() -> PurgeBackend:
+    backend = settings.CDN_PURGE_BACKEND.strip().lower()
+    if backend == "varnish":
+        if not settings.CDN_PURGE_URL:
+            logger.error("CDN_PURGE_BACKEND is varnish but CDN_PURGE_URL is not configured")
+            return NullPurgeBackend()
+        return VarnishPurgeBackend(settings.CDN_PURGE_URL, timeout=settings.CDN_PURGE_TIMEOUT_SECONDS)
+    if backend == "memory":
+        return InMemoryPurgeBackend()
+    return NullPurgeBackend()
+
+
+# Singleton instance
+_cdn_service: Optional[CDNService] = None
+
+
+def get_cdn_service() -> CDNService:
+    """Get or create CDN service instance"""
+    global _cdn_service
+    if _cdn_service is None:
+        _cdn_service = CDNService()
+    return _cdn_service
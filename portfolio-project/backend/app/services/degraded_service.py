@@ -0,0 +1,177 @@
+"""
+Degraded Read-Only Mode
+Serves public reads from the last good API snapshot while the database is down
+
+A circuit breaker counts database connectivity errors raised while handling
+requests. Once it opens, requests skip the database entirely: public GETs are
+answered from the snapshot written by ``build_snapshot`` (kept fresh by
+``refresh_snapshot_forever``) with ``Warning`` and ``Age`` headers, and
+everything else gets a 503 until a trial request succeeds again.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from sqlalchemy import exc as sa_exc
+
+from app.config import settings
+from app.core.cache_policy import NO_STORE
+from app.database import SessionLocal
+from app.services.snapshot_service import SnapshotStore, build_snapshot, canonical_url
+
+SAFE_METHODS = ("GET", "HEAD")
+STALE_WARNING = '110 - "Response is Stale"'
+
+# Preferred first; the snapshot stores ``.br`` only when brotli is installed
+SNAPSHOT_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def is_database_unavailable(exc: BaseException) -> bool:
+    """True for errors meaning the database cannot be reached, not a bad query"""
+    if isinstance(exc, (sa_exc.OperationalError, sa_exc.InterfaceError, sa_exc.TimeoutError)):
+        return True
+    return isinstance(exc, sa_exc.DBAPIError) and exc.connection_invalidated
+
+
+class DatabaseCircuit:
+    """
+    Consecutive-failure circuit breaker for the database
+
+    Opens after ``failure_threshold`` connectivity errors in a row and stays
+    open for ``reset_seconds``. Requests after that are trials: one success
+    closes the circuit, one failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and self.clock() - self.opened_at < self.reset_seconds
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.error("Database circuit opened after {} failures", self.failures)
+            self.opened_at = self.clock()
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("Database circuit closed")
+        self.failures = 0
+        self.opened_at = None
+
+
+class DegradedMode:
+    """The database circuit and the snapshot answering for it"""
+
+    def __init__(self, snapshot_dir: Path, circuit: DatabaseCircuit):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.circuit = circuit
+        self.store = SnapshotStore(self.snapshot_dir)
+
+    def reload_snapshot(self) -> None:
+        self.store = SnapshotStore(self.snapshot_dir)
+
+    def fallback_response(self, request: Request) -> Response:
+        """Answer a request without the database"""
+        if request.method not in SAFE_METHODS:
+            return self.unavailable("The site is temporarily read-only")
+        return self.snapshot_response(request) or self.unavailable("Service temporarily unavailable")
+
+    def snapshot_response(self, request: Request) -> Optional[Response]:
+        found = self.store.lookup(canonical_url(request.url.path, dict(request.query_params)))
+        if found is None:
+            return None
+        path, entry = found
+
+        headers = {
+            "Cache-Control": NO_STORE,
+            "ETag": entry["etag"],
+            "Warning": STALE_WARNING,
+            "Vary": "Accept-Encoding",
+        }
+        generated_at = self.store.manifest.get("generated_at")
+        if generated_at:
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(generated_at)
+            headers["Age"] = str(max(int(age.total_seconds()), 0))
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding, suffix in SNAPSHOT_ENCODINGS:
+            if encoding in accepted and encoding in entry["encodings"]:
+                headers["Content-Encoding"] = encoding
+                path = path.with_name(path.name + suffix)
+                break
+        try:
+            body = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def unavailable(self, detail: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": detail},
+            headers={"Retry-After": str(int(self.circuit.reset_seconds)), "Cache-Control": NO_STORE},
+        )
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for token in header.split(","):
+        name, _, params = token.partition(";")
+        weight = params.strip()
+        if weight.startswith("q="):
+            try:
+                if float(weight[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if name.strip():
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+async def refresh_snapshot_forever(app, mode: DegradedMode, interval: float) -> None:
+    """
+    Keep the fallback snapshot current with an incremental run every ``interval``
+
+    Runs are skipped while the circuit is open, and a failed run keeps the
+    previous snapshot, so the last good copy is never replaced by errors.
+    """
+    while True:
+        if not mode.circuit.is_open:
+            try:
+                with SessionLocal() as db:
+                    result = await build_snapshot(db, app, mode.snapshot_dir, incremental=True)
+                mode.reload_snapshot()
+                logger.info("Snapshot refreshed: {} written, {} removed", result.written, result.removed)
+            except Exception as exc:
+                if is_database_unavailable(exc):
+                    mode.circuit.record_failure()
+                logger.warning("Snapshot refresh failed, keeping the previous one: {}", exc)
+        await asyncio.sleep(interval)
+
+
+_degraded_mode: Optional[DegradedMode] = None
+
+
+def get_degraded_mode() -> DegradedMode:
+    """Get or create the degraded mode instance"""
+    global _degraded_mode
+    if _degraded_mode is None:
+        _degraded_mode = DegradedMode(
+            Path(settings.SNAPSHOT_DIR),
+            DatabaseCircuit(settings.DB_CIRCUIT_FAILURE_THRESHOLD, settings.DB_CIRCUIT_RESET_SECONDS),
+        )
+    return _degraded_mode
@@ -0,0 +1,19 @@
+"""
+Content Invalidation
+Single entry point that admin writes call after public content changes
+"""
+from app.services.bundle_service import HOME_BUNDLE_DEPENDENCIES, rebuild_home_bundles
+from app.services.cdn_service import get_cdn_service
+
+
+async def invalidate_content(*keys: str) -> None:
+    """
+    Invalidate cached copies of public content
+
+    Args:
+        keys: Surrogate keys of the changed collections and entities,
+            e.g. ``"projects"`` and ``"project:<id>"``
+    """
+    if HOME_BUNDLE_DEPENDENCIES.intersection(keys):
+        await rebuild_home_bundles()
+    await get_cdn_service().purge(keys)
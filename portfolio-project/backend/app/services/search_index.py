@@ -0,0 +1,431 @@
+"""
+Blog Search Index
+In-process BM25 ranking of published blog posts, without a database round trip
+
+Each read-model language has its own index of the text a reader sees in it:
+the translation's title, excerpt and content, or the English post when it is
+untranslated, tokenized by ``app.utils.tokenizer``. Every term maps to a
+posting list of document numbers and frequencies held in flat ``uint32``
+arrays, and matches are ranked with BM25.
+
+An index is saved as an immutable segment file that is memory-mapped when
+loaded, so posting lists are zero-copy views into the page cache and the
+stored result documents are sliced from it. Writes go to a small in-memory
+segment plus a set of deleted document numbers, and are folded into a new
+segment file when the index is saved. Other workers notice the replaced file
+on their next search and map it instead of their own copy.
+"""
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import blog_search
+from app.crud.read_model import READ_MODEL_LANGUAGES
+from app.database import SessionLocal
+from app.utils.tokenizer import term_frequencies, tokenize
+
+# BM25 saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+SEGMENT_MAGIC = b"BM25SEG1"
+SEGMENT_VERSION = 1
+_PREFIX = struct.Struct("<8sI")  # magic, header size
+
+# (segment number, document number); the mapped segment is 0, the in-memory one 1
+DocRef = Tuple[int, int]
+SearchDocument = Tuple[str, Sequence[str], bytes]  # key, (title, excerpt, content), stored document
+
+
+class SegmentError(Exception):
+    """A segment file that cannot be used by this process"""
+
+
+class MemorySegment:
+    """Mutable segment receiving the documents written since the last save"""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.lengths: List[int] = []
+        self._documents: List[bytes] = []
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+    def add(self, key: str, counts: Counter, length: int, document: bytes) -> int:
+        number = len(self.keys)
+        self.keys.append(key)
+        self.lengths.append(length)
+        self._documents.append(document)
+        for term, frequency in counts.items():
+            numbers, frequencies = self._postings.setdefault(term, (array("I"), array("I")))
+            numbers.append(number)
+            frequencies.append(frequency)
+        return number
+
+    def terms(self) -> Iterable[str]:
+        return self._postings.keys()
+
+    def postings(self, term: str) -> Tuple[Sequence[int], Sequence[int]]:
+        return self._postings.get(term, ((), ()))
+
+    def document(self, number: int) -> bytes:
+        return self._documents[number]
+
+
+class MappedSegment:
+    """
+    Read-only segment backed by a memory-mapped file
+
+    Layout: magic and header size, a JSON header (document keys, lengths and
+    stored-document offsets, and each term's ``[offset, count]`` into the
+    posting arrays), then every posting list's document numbers, then their
+    frequencies, as native ``uint32``, then the stored documents.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = _PREFIX.unpack_from(self._map)
+        if magic != SEGMENT_MAGIC:
+            raise SegmentError(f"{path} is not a search segment")
+        header = json.loads(self._map[_PREFIX.size:_PREFIX.size + header_size])
+        if header["version"] != SEGMENT_VERSION or header["byteorder"] != sys.byteorder:
+            raise SegmentError(f"{path} was written by an incompatible version or platform")
+
+        self.language: str = header["language"]
+        self.watermark: str = header["watermark"]
+        self.keys: List[str] = header["keys"]
+        self.lengths: List[int] = header["lengths"]
+        self._offsets: List[int] = header["stored"]
+        self._terms: Dict[str, List[int]] = header["terms"]
+        total = header["postings"]
+        start = _aligned(_PREFIX.size + header_size)
+        postings = memoryview(self._map)[start:start + 8 * total].cast("I")
+        self._numbers = postings[:total]
+        self._frequencies = postings[total:]
+        self._stored = start + 8 * total
+
+    def terms(self) -> Iterable[str]:
+        return self._terms.keys()
+
+    def postings(self, term: str) -> Tuple[Sequence[int], Sequence[int]]:
+        entry = self._terms.get(term)
+        if entry is None:
+            return (), ()
+        offset, count = entry
+        return self._numbers[offset:offset + count], self._frequencies[offset:offset + count]
+
+    def document(self, number: int) -> bytes:
+        return self._map[self._stored + self._offsets[number]:self._stored + self._offsets[number + 1]]
+
+
+def _aligned(position: int) -> int:
+    return (position + 3) & ~3
+
+
+def write_segment(
+    path: Path,
+    language: str,
+    watermark: str,
+    keys: Sequence[str],
+    lengths: Sequence[int],
+    documents: Iterable[bytes],
+    postings: Dict[str, Tuple[array, array]],
+) -> None:
+    """Write a segment next to ``path`` and atomically move it into place"""
+    numbers, frequencies, terms = array("I"), array("I"), {}
+    for term in sorted(postings):
+        term_numbers, term_counts = postings[term]
+        terms[term] = [len(numbers), len(term_numbers)]
+        numbers.extend(term_numbers)
+        frequencies.extend(term_counts)
+
+    stored, offsets = bytearray(), [0]
+    for document in documents:
+        stored += document
+        offsets.append(len(stored))
+
+    header = json.dumps({
+        "version": SEGMENT_VERSION,
+        "byteorder": sys.byteorder,
+        "language": language,
+        "watermark": watermark,
+        "keys": list(keys),
+        "lengths": list(lengths),
+        "stored": offsets,
+        "terms": terms,
+        "postings": len(numbers),
+    }, ensure_ascii=False, separators=(",", ":")).encode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "wb") as file:
+        file.write(_PREFIX.pack(SEGMENT_MAGIC, len(header)))
+        file.write(header)
+        file.write(b"\0" * (_aligned(_PREFIX.size + len(header)) - _PREFIX.size - len(header)))
+        file.write(numbers.tobytes())
+        file.write(frequencies.tobytes())
+        file.write(stored)
+    os.replace(temporary, path)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class LanguageIndex:
+    """BM25 index of one language: a mapped segment, an in-memory segment and deletions"""
+
+    def __init__(self, language: str, path: Path):
+        self.language = language
+        self.path = path
+        self.watermark: Optional[str] = None
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._reset(MemorySegment(), None)
+
+    def _reset(self, base, stamp: Optional[Tuple[int, int]]) -> None:
+        self._segments = (base, MemorySegment())
+        self._deleted: Set[DocRef] = set()
+        self._locations: Dict[str, DocRef] = {key: (0, number) for number, key in enumerate(base.keys)}
+        self._total_length = sum(base.lengths)
+        self._stamp = stamp
+
+    @property
+    def document_count(self) -> int:
+        return len(self._locations)
+
+    def load(self) -> bool:
+        """Map the saved segment; False when there is none or it is unusable"""
+        stamp = _file_stamp(self.path)
+        if stamp is None:
+            return False
+        try:
+            segment = MappedSegment(self.path)
+        except (SegmentError, ValueError, KeyError, struct.error) as exc:
+            logger.warning("Ignoring search segment {}: {}", self.path, exc)
+            return False
+        with self._lock:
+            self._reset(segment, stamp)
+            self.watermark = segment.watermark
+            self.dirty = False
+        return True
+
+    def replace(self, documents: Iterable[SearchDocument], watermark: str) -> None:
+        """Index exactly ``documents``, dropping everything indexed before"""
+        with self._lock:
+            self._reset(MemorySegment(), None)
+            self.watermark = watermark
+            self.dirty = True
+            for key, fields, stored in documents:
+                self._add(key, fields, stored)
+
+    def upsert(self, key: str, fields: Sequence[str], stored: bytes) -> None:
+        with self._lock:
+            self._remove(key)
+            self._add(key, fields, stored)
+            self.dirty = True
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if self._remove(key):
+                self.dirty = True
+
+    def _add(self, key: str, fields: Sequence[str], stored: bytes) -> None:
+        counts, length = term_frequencies(fields, self.language)
+        self._locations[key] = (1, self._segments[1].add(key, counts, length, stored))
+        self._total_length += length
+
+    def _remove(self, key: str) -> bool:
+        location = self._locations.pop(key, None)
+        if location is None:
+            return False
+        self._deleted.add(location)
+        segment, number = location
+        self._total_length -= self._segments[segment].lengths[number]
+        return True
+
+    def search(self, text: str, limit: int, offset: int = 0) -> List[Tuple[str, bytes]]:
+        """``(key, stored document)`` of the best BM25 matches of any word of ``text``"""
+        self._follow_saved_segment()
+        terms = set(tokenize(text, self.language))
+        with self._lock:
+            count = len(self._locations)
+            if not terms or not count:
+                return []
+            average = self._total_length / count
+            scores: Dict[DocRef, float] = {}
+            for term in terms:
+                matches = [
+                    (segment, number, frequency)
+                    for segment, postings in enumerate(self._segments)
+                    for number, frequency in zip(*postings.postings(term))
+                    if (segment, number) not in self._deleted
+                ]
+                if not matches:
+                    continue
+                idf = math.log(1 + (count - len(matches) + 0.5) / (len(matches) + 0.5))
+                for segment, number, frequency in matches:
+                    norm = K1 * (1 - B + B * self._segments[segment].lengths[number] / average)
+                    reference = (segment, number)
+                    scores[reference] = scores.get(reference, 0.0) + idf * frequency * (K1 + 1) / (frequency + norm)
+
+            best = heapq.nsmallest(
+                offset + limit,
+                scores.items(),
+                key=lambda item: (-item[1], self._segments[item[0][0]].keys[item[0][1]]),
+            )
+            return [
+                (self._segments[segment].keys[number], self._segments[segment].document(number))
+                for (segment, number), _ in best[offset:]
+            ]
+
+    def save(self) -> None:
+        """Fold the in-memory segment and deletions into a new segment file and map it"""
+        with self._lock:
+            if not self.dirty:
+                return
+            live = sorted(self._locations.values())
+            renumbered = {reference: number for number, reference in enumerate(live)}
+            postings: Dict[str, Tuple[array, array]] = {}
+            for segment, source in enumerate(self._segments):
+                for term in source.terms():
+                    numbers, frequencies = source.postings(term)
+                    for number, frequency in zip(numbers, frequencies):
+                        target = renumbered.get((segment, number))
+                        if target is None:
+                            continue
+                        entry = postings.setdefault(term, (array("I"), array("I")))
+                        entry[0].append(target)
+                        entry[1].append(frequency)
+
+            write_segment(
+                self.path,
+                self.language,
+                self.watermark or "",
+                [self._segments[segment].keys[number] for segment, number in live],
+                [self._segments[segment].lengths[number] for segment, number in live],
+                (self._segments[segment].document(number) for segment, number in live),
+                postings,
+            )
+            self._reset(MappedSegment(self.path), _file_stamp(self.path))
+            self.dirty = False
+
+    def _follow_saved_segment(self) -> None:
+        """Map the segment another worker saved since ours, unless ours has unsaved writes"""
+        if self.dirty or self._stamp is None:
+            return
+        stamp = _file_stamp(self.path)
+        if stamp is not None and stamp != self._stamp:
+            self.load()
+
+
+class SearchIndex:
+    """The per-language indexes of the blog, saved under one directory"""
+
+    def __init__(self, directory: Path, languages: Sequence[str] = READ_MODEL_LANGUAGES):
+        self.directory = directory
+        self.ready = False
+        self.languages = {
+            language: LanguageIndex(language, directory / f"blog-{language}.seg") for language in languages
+        }
+
+    def index(self, language: Optional[str]) -> LanguageIndex:
+        return self.languages.get(language or "en") or self.languages["en"]
+
+    def load(self, watermark: str) -> bool:
+        """Map the saved segments when all of them were built at ``watermark``"""
+        loaded = all([index.load() and index.watermark == watermark for index in self.languages.values()])
+        self.ready = loaded
+        return loaded
+
+    def rebuild(self, documents: Dict[str, Iterator[SearchDocument]], watermark: str) -> None:
+        """Index the documents of every language from scratch and save them"""
+        for language, index in self.languages.items():
+            index.replace(documents[language], watermark)
+            index.save()
+        self.ready = True
+
+    def search(self, text: str, language: Optional[str], limit: int, offset: int = 0) -> List[Tuple[str, bytes]]:
+        return self.index(language).search(text, limit, offset)
+
+    def save(self) -> None:
+        for index in self.languages.values():
+            index.save()
+
+
+_search_index: Optional[SearchIndex] = None
+
+
+def get_search_index() -> SearchIndex:
+    """Get or create the search index instance"""
+    global _search_index
+    if _search_index is None:
+        _search_index = SearchIndex(Path(settings.SEARCH_INDEX_DIR))
+    return _search_index
+
+
+def rebuild_search_index(db: Session, index: SearchIndex, watermark: Optional[str] = None) -> None:
+    """Index every published post from the blog tables"""
+    watermark = watermark or blog_search.index_watermark(db)
+    index.rebuild(
+        {language: blog_search.index_documents(db, language) for language in index.languages},
+        watermark,
+    )
+
+
+def open_search_index(index: SearchIndex) -> None:
+    """
+    Map the saved index at startup, rebuilding it when the blog changed since
+
+    PostgreSQL deployments rank with the database's full-text search, so the
+    index stays unready there and is never built.
+    """
+    with SessionLocal() as db:
+        if blog_search.uses_fulltext(db):
+            return
+        watermark = blog_search.index_watermark(db)
+        if index.load(watermark):
+            logger.info("Mapped blog search index from {}", index.directory)
+            return
+        rebuild_search_index(db, index, watermark)
+        logger.info("Rebuilt blog search index in {}", index.directory)
+
+
+def reindex_blog_posts(db: Session, *post_ids) -> None:
+    """
+    Refresh the indexed copies of posts after a committed write
+
+    Posts that were deleted or unpublished leave the index. Changes stay in
+    memory until ``SearchIndex.save``, which admin routes run as a
+    background task.
+    """
+    index = get_search_index()
+    if not index.ready:
+        return
+    keys = {str(post_id) for post_id in post_ids}
+    watermark = blog_search.index_watermark(db)
+    for language, language_index in index.languages.items():
+        indexed = set()
+        for key, fields, stored in blog_search.index_documents(db, language, post_ids):
+            language_index.upsert(key, fields, stored)
+            indexed.add(key)
+        for key in keys - indexed:
+            language_index.remove(key)
+        language_index.watermark = watermark
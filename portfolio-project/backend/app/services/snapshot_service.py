@@ -0,0 +1,330 @@
+"""
+Public API Snapshot
+Renders every public GET response to pre-compressed JSON files with a manifest
+
+The snapshot is a directory that object storage or a CDN can serve without an
+app server: each response is stored as ``<file>.json`` plus ``.json.gz`` and,
+when the ``brotli`` package is installed, ``.json.br``. ``manifest.json`` maps
+each canonical URL (see ``canonical_url``) to its file, digest and encodings.
+"""
+import gzip
+import json
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+import httpx
+from loguru import logger
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import blog as blog_crud
+from app.crud import github as github_crud
+from app.crud import project as project_crud
+from app.crud import read_model
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.read_model import ContentReadModel
+from app.serializers.encoders import merge_fields
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment
+    brotli = None
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+SNAPSHOT_LANGUAGES = read_model.READ_MODEL_LANGUAGES
+
+# Default page size of the public list routes
+LIST_PAGE_SIZE = 20
+
+# Query parameters left out of canonical URLs when they hold the route default
+DEFAULT_PARAMS = {"language": "en", "skip": "0"}
+
+# Documents written within this long before the previous run's watermark are
+# rendered again; absorbs timestamp precision differences between databases
+WATERMARK_OVERLAP = timedelta(seconds=1)
+
+
+def canonical_url(path: str, params: Optional[Mapping[str, str]] = None) -> str:
+    """
+    The snapshot key of a request: its path and sorted non-default parameters
+
+    ``/api/v1/projects/?skip=0&language=en`` and ``/api/v1/projects/`` share
+    one key; the edge must apply the same rule when mapping requests to files.
+    """
+    kept = sorted((name, value) for name, value in (params or {}).items() if DEFAULT_PARAMS.get(name) != value)
+    return f"{path}?{urlencode(kept)}" if kept else path
+
+
+def snapshot_file(url: str) -> str:
+    """Relative file of a canonical URL, without the encoding extension"""
+    path, _, query = url.partition("?")
+    base = path.strip("/") or "index"
+    if path.endswith("/"):
+        base = f"{base}/index"
+    return f"{base}.{query}.json" if query else f"{base}.json"
+
+
+@dataclass
+class SnapshotResult:
+    """What a snapshot run changed"""
+    written: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+class SnapshotStore:
+    """A snapshot directory and its manifest"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.manifest = self._load_manifest()
+
+    @property
+    def entries(self) -> Dict[str, dict]:
+        return self.manifest["entries"]
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        value = self.manifest.get("watermark")
+        return datetime.fromisoformat(value) if value else None
+
+    def _load_manifest(self) -> dict:
+        try:
+            manifest = json.loads((self.root / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {"version": MANIFEST_VERSION, "generated_at": None, "watermark": None, "entries": {}}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {"version": MANIFEST_VERSION, "generated_at": None, "watermark": None, "entries": {}}
+        return manifest
+
+    def write(self, url: str, body: bytes, entity: Optional[str] = None) -> bool:
+        """Store a response unless the stored copy is identical; True when written"""
+        digest = sha256(body).hexdigest()
+        existing = self.entries.get(url)
+        if existing and existing["sha256"] == digest and (self.root / existing["file"]).exists():
+            return False
+
+        relative = snapshot_file(url)
+        encodings = {"": body, ".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encodings[".br"] = brotli.compress(body, quality=11)
+        for suffix, content in encodings.items():
+            _write_atomic(self.root / f"{relative}{suffix}", content)
+
+        self.entries[url] = {
+            "file": relative,
+            "sha256": digest,
+            "etag": f'"{digest[:32]}"',
+            "bytes": len(body),
+            "encodings": [{".gz": "gzip", ".br": "br"}[suffix] for suffix in encodings if suffix],
+            "entity": entity,
+        }
+        return True
+
+    def remove(self, url: str) -> None:
+        entry = self.entries.pop(url)
+        for suffix in ("", ".gz", ".br"):
+            (self.root / f"{entry['file']}{suffix}").unlink(missing_ok=True)
+
+    def lookup(self, url: str) -> Optional[Tuple[Path, dict]]:
+        """The stored file and manifest entry of a canonical URL"""
+        entry = self.entries.get(url)
+        return (self.root / entry["file"], entry) if entry else None
+
+    def save(self, watermark: Optional[datetime]) -> None:
+        self.manifest["generated_at"] = datetime.now(timezone.utc).isoformat()
+        self.manifest["watermark"] = watermark.isoformat() if watermark else None
+        body = json.dumps(self.manifest, indent=2, sort_keys=True).encode()
+        _write_atomic(self.root / MANIFEST_NAME, body)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_bytes(content)
+    os.replace(temporary, path)
+
+
+def collection_urls(db: Session) -> List[str]:
+    """
+    Canonical URLs of every public list and lookup response
+
+    GitHub repositories are only included while their cache is fresh, so a
+    snapshot never makes the route call the GitHub API.
+    """
+    prefix = settings.API_V1_PREFIX
+    project_pages = _pages(db.query(func.count(Project.id)).scalar())
+    blog_pages = _pages(blog_crud.get_blog_count(db))
+
+    urls = [
+        canonical_url(f"{prefix}/translations/"),
+        canonical_url(f"{prefix}/translations/languages/available"),
+        canonical_url(f"{prefix}/translations/config/all"),
+        canonical_url(f"{prefix}/technologies/"),
+    ]
+    if github_crud.is_cache_valid(db, cache_hours=settings.GITHUB_CACHE_HOURS):
+        urls.append(canonical_url(f"{prefix}/github/repos"))
+    for language in SNAPSHOT_LANGUAGES:
+        params = {"language": language}
+        urls.extend(
+            canonical_url(f"{prefix}/projects/", {**params, "skip": str(page * LIST_PAGE_SIZE)})
+            for page in range(project_pages)
+        )
+        urls.extend(
+            canonical_url(f"{prefix}/blog/", {**params, "skip": str(page * LIST_PAGE_SIZE)})
+            for page in range(blog_pages)
+        )
+        urls.extend([
+            canonical_url(f"{prefix}/projects/", {**params, "featured_only": "true"}),
+            canonical_url(f"{prefix}/skills/", params),
+            canonical_url(f"{prefix}/skills/by-category", params),
+            canonical_url(f"{prefix}/experiences/", params),
+            canonical_url(f"{prefix}/experiences/by-type", params),
+            canonical_url(f"{prefix}/translations/{language}"),
+            canonical_url(f"{prefix}/bundle/home", params),
+        ])
+    return urls
+
+
+def _pages(total: int) -> int:
+    return max(math.ceil(total / LIST_PAGE_SIZE), 1)
+
+
+async def render_urls(app, urls: Iterable[str]) -> List[Tuple[str, bytes]]:
+    """
+    Render URLs through the application in-process
+
+    Returns ``(url, body)`` for every URL answered with a 200 JSON response;
+    others (e.g. a language without translations) are left out.
+    """
+    transport = httpx.ASGITransport(app=app)
+    rendered = []
+    # Identity bodies: the store writes its own compressed variants
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://snapshot", headers={"Accept-Encoding": "identity"}
+    ) as client:
+        for url in urls:
+            response = await client.get(url)
+            if response.status_code != 200 or not response.headers.get("content-type", "").startswith("application/json"):
+                logger.info("Snapshot skipped {} ({})", url, response.status_code)
+                continue
+            rendered.append((url, response.content))
+    return rendered
+
+
+def ensure_documents(db: Session) -> None:
+    """Materialize read-model documents of projects and blog posts that have none"""
+    # Blog summaries were added after blog documents; probing them covers both
+    for entity_type, model, refresh in (
+        (read_model.PROJECT, Project, project_crud.refresh_project_documents),
+        (read_model.BLOG_SUMMARY, BlogPost, blog_crud.refresh_blog_documents),
+    ):
+        missing = [
+            entity_id for (entity_id,) in db.query(model.id).outerjoin(
+                ContentReadModel, read_model.document_join(entity_type, model.id, "en")
+            ).filter(ContentReadModel.entity_id.is_(None))
+        ]
+        if missing:
+            refresh(db, *missing)
+            db.commit()
+
+
+def _published_documents(db: Session, *columns):
+    """Detail documents of every project and of published blog posts"""
+    return db.query(*columns).outerjoin(
+        BlogPost,
+        and_(ContentReadModel.entity_type == read_model.BLOG, BlogPost.id == ContentReadModel.entity_id),
+    ).filter(
+        ContentReadModel.entity_type.in_((read_model.PROJECT, read_model.BLOG)),
+        or_(ContentReadModel.entity_type != read_model.BLOG, BlogPost.published == True),
+    )
+
+
+def published_entities(db: Session) -> Set[str]:
+    """Entity keys (``type:id``) of everything the snapshot publishes"""
+    return {
+        f"{entity_type}:{entity_id}"
+        for entity_type, entity_id in _published_documents(
+            db, ContentReadModel.entity_type, ContentReadModel.entity_id
+        ).distinct()
+    }
+
+
+def detail_responses(db: Session, since: Optional[datetime] = None) -> Iterator[Tuple[str, bytes, str]]:
+    """
+    Yield ``(url, body, entity)`` of project and published blog post details
+
+    Bodies come straight from the read model: project documents are the
+    responses as stored, blog documents get the current view count (without
+    counting a view). ``since`` limits the output to documents rewritten after
+    that time.
+    """
+    prefix = settings.API_V1_PREFIX
+    query = _published_documents(db, ContentReadModel, BlogPost.views)
+    if since is not None:
+        query = query.filter(ContentReadModel.updated_at >= since - WATERMARK_OVERLAP)
+
+    routes = {read_model.PROJECT: "projects", read_model.BLOG: "blog"}
+    for row, views in query.yield_per(500):
+        url = canonical_url(f"{prefix}/{routes[row.entity_type]}/{row.slug}", {"language": row.language})
+        body = row.document.encode()
+        if row.entity_type == read_model.BLOG:
+            body = merge_fields(body, views=views or 0)
+        yield url, body, f"{row.entity_type}:{row.entity_id}"
+
+
+async def build_snapshot(db: Session, app, root: Path, incremental: bool = False) -> SnapshotResult:
+    """
+    Write the public API snapshot under ``root``
+
+    A full run renders everything and drops files of responses that no longer
+    exist. An incremental run re-renders the lists (cheap, and affected by
+    any change) but only the detail pages whose documents changed since the
+    previous run, and drops those of deleted entities. Unchanged responses
+    are never rewritten, so a sync to object storage uploads only what changed.
+    """
+    store = SnapshotStore(root)
+    since = store.watermark if incremental else None
+    result = SnapshotResult()
+
+    ensure_documents(db)
+    watermark = db.query(func.max(ContentReadModel.updated_at)).scalar()
+
+    produced, rendered = set(), set()
+    for url, body, entity in detail_responses(db, since):
+        produced.add(url)
+        rendered.add(entity)
+        _count(result, store.write(url, body, entity))
+    for url, body in await render_urls(app, collection_urls(db)):
+        produced.add(url)
+        _count(result, store.write(url, body))
+
+    # Lists are always rendered; detail pages go when their entity is gone or
+    # was rendered under other URLs (a renamed slug)
+    live = published_entities(db) if incremental else rendered
+    stale = [
+        url for url, entry in store.entries.items()
+        if url not in produced and (not entry["entity"] or entry["entity"] in rendered or entry["entity"] not in live)
+    ]
+    for url in stale:
+        store.remove(url)
+    result.removed = len(stale)
+
+    store.save(watermark)
+    return result
+
+
+def _count(result: SnapshotResult, written: bool) -> None:
+    if written:
+        result.written += 1
+    else:
+        result.unchanged += 1
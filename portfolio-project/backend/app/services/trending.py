@@ -0,0 +1,350 @@
+"""
+Trending Blog Posts
+Time-decayed view leaderboards per language, kept in sorted sets
+
+Every counted view adds to the post's score in one sorted set per language
+and window. Scores decay exponentially with the window as time constant: a
+view weighs 1 when it happens and 1/e one window later, so a steady stream
+of views scores about the number seen in the last window.
+
+The decay is applied forward: a view at time ``t`` adds
+``exp((t - epoch) / window)`` and readers divide by the same factor at the
+current time, so nothing is rewritten as time passes. A view is one
+ZINCRBY per window (O(log n)) and the top k one ZREVRANGE (O(log n + k)).
+Once the factors grow large every set is rescaled to a new epoch, and
+posts whose score decayed to nothing are dropped.
+
+The sets live in Redis when it is connected, shared by every worker, and in
+process memory otherwise. Every ``TRENDING_PERSIST_SECONDS`` the top of each
+leaderboard is copied to ``blog_trending_scores``; an empty leaderboard is
+restored from that copy at startup.
+"""
+import asyncio
+import heapq
+import math
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import redis.asyncio as redis
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.crud import trending as trending_crud
+from app.crud.read_model import READ_MODEL_LANGUAGES
+from app.database import SessionLocal
+from app.services.cache_service import get_cache_service
+
+# Window name to time constant in seconds
+WINDOWS = {"1d": 24 * 3600, "7d": 7 * 24 * 3600, "30d": 30 * 24 * 3600}
+# Rescale once the factor of the shortest window passes e**REBASE_EXPONENT,
+# far below the largest double (about e**709)
+REBASE_EXPONENT = 100
+# Posts below this decayed score are dropped from a leaderboard
+MIN_SCORE = 0.01
+# Posts per leaderboard copied to the database
+SNAPSHOT_SIZE = 1000
+
+EPOCH_KEY = "blog:trending:epoch"
+
+Scores = List[Tuple[str, float]]
+
+# Add one view to the post in every window's set of a language
+_ADD_SCRIPT = """
+local now = tonumber(ARGV[1])
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+    epoch = now
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+for i = 2, #KEYS do
+    redis.call('ZINCRBY', KEYS[i], math.exp((now - epoch) / tonumber(ARGV[i + 1])), ARGV[2])
+end
+"""
+
+# Drop decayed posts, and rescale every set to the current time when the
+# factors grew past the limit
+_COMPACT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+    return 0
+end
+local rebase = false
+for i = 2, #KEYS do
+    if (now - epoch) / tonumber(ARGV[i + 2]) > tonumber(ARGV[2]) then
+        rebase = true
+    end
+end
+for i = 2, #KEYS do
+    local factor = math.exp((now - epoch) / tonumber(ARGV[i + 2]))
+    if rebase then
+        redis.call('ZUNIONSTORE', KEYS[i], 1, KEYS[i], 'WEIGHTS', 1 / factor)
+        factor = 1
+    end
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', '(' .. (tonumber(ARGV[3]) * factor))
+end
+if rebase then
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return rebase and 1 or 0
+"""
+
+
+def leaderboard_key(language: str, window: str) -> str:
+    return f"blog:trending:{language}:{window}"
+
+
+def _leaderboards() -> List[Tuple[str, str]]:
+    return [(language, window) for language in READ_MODEL_LANGUAGES for window in WINDOWS]
+
+
+class Leaderboard:
+    """Interface for decayed score stores; times are Unix seconds"""
+
+    async def add(self, post_id: str, language: str, now: float) -> None:
+        """Add one view to the post in every window"""
+        raise NotImplementedError
+
+    async def top(self, language: str, window: str, limit: int, now: float) -> Scores:
+        """The ``limit`` highest ``(post_id, score)``, scores decayed to ``now``"""
+        raise NotImplementedError
+
+    async def load(self, language: str, window: str, scores: Mapping[str, float], now: float) -> None:
+        """Set scores decayed to ``now``"""
+        raise NotImplementedError
+
+    async def remove(self, post_id: str) -> None:
+        """Drop a post from every leaderboard"""
+        raise NotImplementedError
+
+    async def compact(self, now: float) -> None:
+        """Drop decayed posts and rescale to a new epoch when needed"""
+        raise NotImplementedError
+
+    async def is_empty(self) -> bool:
+        raise NotImplementedError
+
+
+class InMemoryLeaderboard(Leaderboard):
+    """Per-process leaderboards used when Redis is not connected; reads scan the set"""
+
+    def __init__(self):
+        self.epoch: Optional[float] = None
+        self.sets: Dict[str, Dict[str, float]] = {}
+
+    def _factor(self, window: str, now: float) -> float:
+        return math.exp((now - self.epoch) / WINDOWS[window])
+
+    async def add(self, post_id: str, language: str, now: float) -> None:
+        if self.epoch is None:
+            self.epoch = now
+        for window in WINDOWS:
+            scores = self.sets.setdefault(leaderboard_key(language, window), {})
+            scores[post_id] = scores.get(post_id, 0.0) + self._factor(window, now)
+
+    async def top(self, language: str, window: str, limit: int, now: float) -> Scores:
+        scores = self.sets.get(leaderboard_key(language, window), {})
+        if not scores:
+            return []
+        factor = self._factor(window, now)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(post_id, score / factor) for post_id, score in best]
+
+    async def load(self, language: str, window: str, scores: Mapping[str, float], now: float) -> None:
+        if self.epoch is None:
+            self.epoch = now
+        factor = self._factor(window, now)
+        stored = self.sets.setdefault(leaderboard_key(language, window), {})
+        stored.update((post_id, score * factor) for post_id, score in scores.items())
+
+    async def remove(self, post_id: str) -> None:
+        for scores in self.sets.values():
+            scores.pop(post_id, None)
+
+    async def compact(self, now: float) -> None:
+        if self.epoch is None:
+            return
+        rebase = max((now - self.epoch) / seconds for seconds in WINDOWS.values()) > REBASE_EXPONENT
+        for language, window in _leaderboards():
+            key = leaderboard_key(language, window)
+            factor = self._factor(window, now)
+            scale = 1 / factor if rebase else 1.0
+            self.sets[key] = {
+                post_id: score * scale
+                for post_id, score in self.sets.get(key, {}).items()
+                if score / factor >= MIN_SCORE
+            }
+        if rebase:
+            self.epoch = now
+
+    async def is_empty(self) -> bool:
+        return not any(self.sets.values())
+
+
+class RedisLeaderboard(Leaderboard):
+    """Leaderboards shared by every worker through Redis sorted sets"""
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._add = client.register_script(_ADD_SCRIPT)
+        self._compact = client.register_script(_COMPACT_SCRIPT)
+
+    async def add(self, post_id: str, language: str, now: float) -> None:
+        await self._add(
+            keys=[EPOCH_KEY, *(leaderboard_key(language, window) for window in WINDOWS)],
+            args=[now, post_id, *WINDOWS.values()],
+        )
+
+    async def top(self, language: str, window: str, limit: int, now: float) -> Scores:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.get(EPOCH_KEY)
+            pipe.zrevrange(leaderboard_key(language, window), 0, limit - 1, withscores=True)
+            epoch, scores = await pipe.execute()
+        if epoch is None:
+            return []
+        factor = math.exp((now - float(epoch)) / WINDOWS[window])
+        return [(post_id, score / factor) for post_id, score in scores]
+
+    async def load(self, language: str, window: str, scores: Mapping[str, float], now: float) -> None:
+        await self.client.set(EPOCH_KEY, now, nx=True)
+        epoch = float(await self.client.get(EPOCH_KEY))
+        factor = math.exp((now - epoch) / WINDOWS[window])
+        if scores:
+            await self.client.zadd(
+                leaderboard_key(language, window),
+                {post_id: score * factor for post_id, score in scores.items()},
+            )
+
+    async def remove(self, post_id: str) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for language, window in _leaderboards():
+                pipe.zrem(leaderboard_key(language, window), post_id)
+            await pipe.execute()
+
+    async def compact(self, now: float) -> None:
+        leaderboards = _leaderboards()
+        await self._compact(
+            keys=[EPOCH_KEY, *(leaderboard_key(language, window) for language, window in leaderboards)],
+            args=[now, REBASE_EXPONENT, MIN_SCORE, *(WINDOWS[window] for _, window in leaderboards)],
+        )
+
+    async def is_empty(self) -> bool:
+        return not await self.client.exists(
+            *(leaderboard_key(language, window) for language, window in _leaderboards())
+        )
+
+
+class Trending:
+    """Trending blog posts from time-decayed view scores"""
+
+    def __init__(self, leaderboard: Optional[Leaderboard] = None, clock: Callable[[], float] = time.time):
+        self._leaderboard = leaderboard
+        self.clock = clock
+
+    @property
+    def leaderboard(self) -> Leaderboard:
+        # Chosen on first use: Redis connects during application startup
+        if self._leaderboard is None:
+            client = get_cache_service().redis_client
+            self._leaderboard = RedisLeaderboard(client) if client is not None else InMemoryLeaderboard()
+        return self._leaderboard
+
+    async def record(self, post_id: uuid.UUID, language: str) -> None:
+        """Add a counted view of a post read in ``language``"""
+        try:
+            await self.leaderboard.add(str(post_id), language, self.clock())
+        except redis.RedisError as exc:
+            logger.error("Failed to record trending view: {}", exc)
+
+    async def top(self, language: str, window: str, limit: int) -> List[Tuple[uuid.UUID, float]]:
+        """The ``limit`` highest scoring posts of a leaderboard, best first"""
+        try:
+            scores = await self.leaderboard.top(language, window, limit, self.clock())
+        except redis.RedisError as exc:
+            logger.error("Failed to read trending posts: {}", exc)
+            return []
+        return [(uuid.UUID(post_id), score) for post_id, score in scores]
+
+    async def remove(self, post_id: uuid.UUID) -> None:
+        """Drop a deleted or unpublished post"""
+        try:
+            await self.leaderboard.remove(str(post_id))
+        except redis.RedisError as exc:
+            logger.error("Failed to remove trending post: {}", exc)
+
+    async def persist(self, session_factory: Callable[[], Session] = SessionLocal) -> int:
+        """
+        Compact the leaderboards and copy their top posts to the database
+
+        Returns:
+            Number of scores stored
+        """
+        now = self.clock()
+        await self.leaderboard.compact(now)
+        leaderboards = {
+            (language, window): [
+                (uuid.UUID(post_id), score)
+                for post_id, score in await self.leaderboard.top(language, window, SNAPSHOT_SIZE, now)
+            ]
+            for language, window in _leaderboards()
+        }
+        scored_at = datetime.fromtimestamp(now, timezone.utc)
+        return await run_in_threadpool(_store_scores, session_factory, leaderboards, scored_at)
+
+    async def restore(self, session_factory: Callable[[], Session] = SessionLocal) -> int:
+        """
+        Load the stored scores into empty leaderboards, decayed to now
+
+        Returns:
+            Number of scores loaded
+        """
+        if not await self.leaderboard.is_empty():
+            return 0
+        now = self.clock()
+        leaderboards: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for language, window, post_id, score, scored_at in await run_in_threadpool(_load_scores, session_factory):
+            if window not in WINDOWS:
+                continue
+            if scored_at.tzinfo is None:
+                scored_at = scored_at.replace(tzinfo=timezone.utc)
+            elapsed = max(now - scored_at.timestamp(), 0.0)
+            leaderboards.setdefault((language, window), {})[str(post_id)] = score * math.exp(
+                -elapsed / WINDOWS[window]
+            )
+        for (language, window), scores in leaderboards.items():
+            await self.leaderboard.load(language, window, scores, now)
+        return sum(len(scores) for scores in leaderboards.values())
+
+
+def _store_scores(session_factory: Callable[[], Session], leaderboards, scored_at: datetime) -> int:
+    with session_factory() as db:
+        return trending_crud.replace_trending_scores(db, leaderboards, scored_at)
+
+
+def _load_scores(session_factory: Callable[[], Session]):
+    with session_factory() as db:
+        return trending_crud.get_trending_scores(db)
+
+
+async def persist_trending_forever(trending: Trending, interval: float) -> None:
+    """Persist the leaderboards every ``interval`` seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await trending.persist()
+        except Exception as exc:  # keep persisting; the next copy replaces this one
+            logger.error("Trending leaderboard persist failed: {}", exc)
+
+
+_trending: Optional[Trending] = None
+
+
+def get_trending() -> Trending:
+    """Get or create the trending leaderboard instance"""
+    global _trending
+    if _trending is None:
+        _trending = Trending()
+    return _trending
@@ -0,0 +1,234 @@
+"""
+Blog View Counter
+Write-behind view counts: buffered per visitor window, flushed to the database in batches
+
+Reading a post records a view in a buffer instead of updating its row. A
+visitor (client address and user agent, hashed) counts once per post per
+``VIEW_DEDUP_SECONDS``. A background task moves the buffered counts into
+``blog_posts.views`` with one UPDATE every ``VIEW_FLUSH_SECONDS``, so page
+views never open a write transaction on the hot post rows.
+
+The buffer is a Redis hash when Redis is connected, shared by every worker,
+and an in-process dictionary otherwise (development and tests). Counts being
+flushed are set aside first and only dropped once the UPDATE has committed,
+so a failed flush is retried by the next one.
+
+Counted views of a post also feed the trending leaderboards of the language
+it was read in (app.services.trending).
+"""
+import asyncio
+import hashlib
+import time
+import uuid
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import redis.asyncio as redis
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger
+from slowapi.util import get_remote_address
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud import blog as blog_crud
+from app.database import SessionLocal
+from app.services.cache_service import get_cache_service
+from app.services.trending import Trending, get_trending
+
+PENDING_KEY = "blog:views:pending"
+FLUSHING_KEY = "blog:views:flushing"
+FLUSH_LOCK_KEY = "blog:views:flush-lock"
+FLUSH_LOCK_SECONDS = 60
+
+# Count the view unless the visitor was seen in the window; return whether
+# it was counted and the post's buffered count, including the batch being
+# flushed
+_RECORD_SCRIPT = """
+local counted = 0
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[2]) then
+    redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+    counted = 1
+end
+return {counted, tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+    + tonumber(redis.call('HGET', KEYS[3], ARGV[1]) or '0')}
+"""
+
+
+def visitor_id(request: Request) -> str:
+    """Anonymous visitor identity: a digest of the client address and user agent"""
+    identity = f"{get_remote_address(request)}|{request.headers.get('user-agent', '')}"
+    return hashlib.blake2b(identity.encode(), digest_size=12).hexdigest()
+
+
+class ViewBuffer:
+    """Interface for view count buffers"""
+
+    async def record(self, post_id: str, visitor: str, window: int) -> Tuple[bool, int]:
+        """Count a view once per visitor and window; return ``(counted, the post's buffered views)``"""
+        raise NotImplementedError
+
+    async def claim(self) -> Dict[str, int]:
+        """Set the buffered counts aside for a flush; empty while another flush runs"""
+        raise NotImplementedError
+
+    async def release(self, flushed: bool) -> None:
+        """End a flush, dropping the claimed counts when they were written"""
+        raise NotImplementedError
+
+
+class InMemoryViewBuffer(ViewBuffer):
+    """Per-process buffer used when Redis is not connected"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.pending: Dict[str, int] = {}
+        self.flushing: Dict[str, int] = {}
+        self._seen: Dict[Tuple[str, str], float] = {}
+        self._claimed = False
+
+    async def record(self, post_id: str, visitor: str, window: int) -> Tuple[bool, int]:
+        now = self.clock()
+        if len(self._seen) > 10000:
+            self._seen = {key: expiry for key, expiry in self._seen.items() if expiry > now}
+        counted = self._seen.get((post_id, visitor), 0.0) <= now
+        if counted:
+            self._seen[(post_id, visitor)] = now + window
+            self.pending[post_id] = self.pending.get(post_id, 0) + 1
+        return counted, self.pending.get(post_id, 0) + self.flushing.get(post_id, 0)
+
+    async def claim(self) -> Dict[str, int]:
+        if self._claimed:
+            return {}
+        self._claimed = True
+        if not self.flushing:
+            self.flushing, self.pending = self.pending, {}
+        return dict(self.flushing)
+
+    async def release(self, flushed: bool) -> None:
+        if flushed:
+            self.flushing = {}
+        self._claimed = False
+
+
+class RedisViewBuffer(ViewBuffer):
+    """Buffer shared by every worker through Redis"""
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._record = client.register_script(_RECORD_SCRIPT)
+        self._token = uuid.uuid4().hex
+
+    async def record(self, post_id: str, visitor: str, window: int) -> Tuple[bool, int]:
+        counted, buffered = await self._record(
+            keys=[f"blog:viewed:{post_id}:{visitor}", PENDING_KEY, FLUSHING_KEY],
+            args=[post_id, window],
+        )
+        return bool(counted), buffered
+
+    async def claim(self) -> Dict[str, int]:
+        if not await self.client.set(FLUSH_LOCK_KEY, self._token, nx=True, ex=FLUSH_LOCK_SECONDS):
+            return {}
+        # A batch left by a failed flush goes first; new views keep landing in
+        # the pending hash meanwhile
+        if not await self.client.exists(FLUSHING_KEY):
+            try:
+                await self.client.renamenx(PENDING_KEY, FLUSHING_KEY)
+            except redis.ResponseError:  # nothing pending
+                pass
+        counts = await self.client.hgetall(FLUSHING_KEY)
+        return {post_id: int(count) for post_id, count in counts.items()}
+
+    async def release(self, flushed: bool) -> None:
+        if flushed:
+            await self.client.delete(FLUSHING_KEY)
+        if await self.client.get(FLUSH_LOCK_KEY) == self._token:
+            await self.client.delete(FLUSH_LOCK_KEY)
+
+
+class ViewCounter:
+    """Records blog views and writes them back in batches"""
+
+    def __init__(
+        self,
+        buffer: Optional[ViewBuffer] = None,
+        window_seconds: Optional[int] = None,
+        trending: Optional[Trending] = None,
+    ):
+        self._buffer = buffer
+        self.window_seconds = window_seconds or settings.VIEW_DEDUP_SECONDS
+        self._trending = trending
+
+    @property
+    def buffer(self) -> ViewBuffer:
+        # Chosen on first use: Redis connects during application startup
+        if self._buffer is None:
+            client = get_cache_service().redis_client
+            self._buffer = RedisViewBuffer(client) if client is not None else InMemoryViewBuffer()
+        return self._buffer
+
+    @property
+    def trending(self) -> Trending:
+        if self._trending is None:
+            self._trending = get_trending()
+        return self._trending
+
+    async def record(self, post_id: uuid.UUID, visitor: str, language: str = "en") -> int:
+        """
+        Record a view of a post read in ``language``
+
+        Returns:
+            Views buffered for the post and not yet in ``blog_posts.views``
+        """
+        try:
+            counted, buffered = await self.buffer.record(str(post_id), visitor, self.window_seconds)
+        except redis.RedisError as exc:
+            logger.error("Failed to record blog view: {}", exc)
+            return 0
+        if counted:
+            await self.trending.record(post_id, language)
+        return buffered
+
+    async def flush(self, session_factory: Callable[[], Session] = SessionLocal) -> int:
+        """
+        Add the buffered views to ``blog_posts.views`` in one UPDATE
+
+        Returns:
+            Number of posts whose count changed
+        """
+        counts = await self.buffer.claim()
+        if not counts:
+            return 0
+        flushed = False
+        try:
+            await run_in_threadpool(_write_views, session_factory, counts.items())
+            flushed = True
+        finally:
+            await self.buffer.release(flushed)
+        logger.debug("Flushed views of {} blog posts", len(counts))
+        return len(counts)
+
+
+def _write_views(session_factory: Callable[[], Session], counts: Iterable[Tuple[str, int]]) -> None:
+    with session_factory() as db:
+        blog_crud.add_blog_views(db, {uuid.UUID(post_id): count for post_id, count in counts})
+
+
+async def flush_views_forever(counter: ViewCounter, interval: float) -> None:
+    """Flush buffered views every ``interval`` seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await counter.flush()
+        except Exception as exc:  # keep flushing; the batch is retried
+            logger.error("Blog view flush failed: {}", exc)
+
+
+_view_counter: Optional[ViewCounter] = None
+
+
+def get_view_counter() -> ViewCounter:
+    """Get or create the view counter instance"""
+    global _view_counter
+    if _view_counter is None:
+        _view_counter = ViewCounter()
+    return _view_counter
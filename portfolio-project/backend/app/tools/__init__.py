@@ -0,0 +1,4 @@
+"""
+Maintenance Tools
+Command-line jobs run against the application database with ``python -m app.tools.<name>``
+"""
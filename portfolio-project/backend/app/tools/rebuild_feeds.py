@@ -0,0 +1,30 @@
+"""
+Feeds Rebuild
+Re-renders the blog feeds and the sitemap from the published posts and projects
+
+Run from the backend directory with the application's environment set:
+
+    python -m app.tools.rebuild_feeds
+
+Needed after applying migration 008 to existing content, and after changing
+FRONTEND_URL, FEED_TITLE or FEED_AUTHOR. Writes keep the documents current
+incrementally; a rebuild also renumbers the sitemap pages that deleted
+posts left partly empty. Runs in one transaction.
+"""
+import argparse
+
+from app.crud import feeds as feeds_crud
+from app.database import SessionLocal
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__.splitlines()[1]).parse_args()
+
+    with SessionLocal() as db:
+        rebuilt = feeds_crud.rebuild_feeds(db)
+        db.commit()
+    print(f"Feeds of {rebuilt['posts']} posts, {rebuilt['sitemap pages']} sitemap pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Read Model Rebuild
+Rematerializes the public project and blog documents from the relational tables
+
+Run from the backend directory with the application's environment set:
+
+    python -m app.tools.rebuild_read_model --entity project --entity blog
+
+Needed after applying migration 003 to existing data, and safe to rerun at
+any time: documents are rewritten in one transaction per entity type.
+"""
+import argparse
+from typing import Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.crud import blog as blog_crud
+from app.crud import project as project_crud
+from app.crud import read_model
+from app.database import SessionLocal
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.read_model import ContentReadModel
+
+# Entity type to (model, refresh function)
+REBUILDERS = {
+    read_model.PROJECT: (Project, project_crud.refresh_project_documents),
+    read_model.BLOG: (BlogPost, blog_crud.refresh_blog_documents),
+}
+
+
+def rebuild_read_model(db: Session, entity_types: Iterable[str] = tuple(REBUILDERS)) -> Dict[str, int]:
+    """
+    Drop and rebuild every document of the given entity types
+
+    Returns:
+        Number of entities materialized per entity type
+    """
+    rebuilt = {}
+    for entity_type in entity_types:
+        model, refresh = REBUILDERS[entity_type]
+        db.query(ContentReadModel).filter(
+            ContentReadModel.entity_type.in_(read_model.DOCUMENT_TYPES[entity_type])
+        ).delete(synchronize_session=False)
+        entity_ids = [entity_id for (entity_id,) in db.query(model.id)]
+        refresh(db, *entity_ids)
+        db.commit()
+        rebuilt[entity_type] = len(entity_ids)
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--entity",
+        action="append",
+        choices=sorted(REBUILDERS),
+        help="Entity type to rebuild; repeat for several (default: all)",
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        rebuilt = rebuild_read_model(db, args.entity or tuple(REBUILDERS))
+    for entity_type, count in rebuilt.items():
+        print(f"{entity_type}: rebuilt documents of {count} entities")
+
+
+if __name__ == "__main__":
+    main()
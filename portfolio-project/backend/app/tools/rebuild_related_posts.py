@@ -0,0 +1,31 @@
+"""
+Related Posts Rebuild
+Recomputes the TF-IDF terms and neighbour lists of every published blog post
+
+Run from the backend directory with the application's environment set:
+
+    python -m app.tools.rebuild_related_posts
+
+Needed after applying migration 006 to existing posts. Writes keep the lists
+current incrementally, but lists they do not touch keep the document
+frequencies of when they were computed, so an occasional rebuild (e.g.
+nightly) brings every list to the same model. Runs in one transaction.
+"""
+import argparse
+
+from app.crud import related as related_crud
+from app.database import SessionLocal
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__.splitlines()[1]).parse_args()
+
+    with SessionLocal() as db:
+        rebuilt = related_crud.rebuild_related_posts(db)
+        db.commit()
+    for language, count in rebuilt.items():
+        print(f"{language}: related posts of {count} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Blog Re-render
+Renders the Markdown of blog posts and translations whose stored HTML or derived fields are out of date
+
+Run from the backend directory with the application's environment set:
+
+    python -m app.tools.render_blog [--force]
+
+Needed after applying migrations 005 and 009 to existing posts and after
+changing the renderer (bump ``RENDERER_VERSION``). Bodies whose
+``content_hash`` still matches are skipped unless ``--force`` is given;
+posts are committed in batches together with their rewritten read-model
+documents and feed entries. Excerpts feed the related-posts terms, so run
+``python -m app.tools.rebuild_related_posts`` afterwards.
+"""
+import argparse
+from typing import Dict, Set
+
+from sqlalchemy.orm import Session
+
+from app.crud import blog as blog_crud
+from app.crud import feeds as feeds_crud
+from app.database import SessionLocal
+from app.models.blog import BlogPost, BlogTranslation
+from app.utils.markdown_renderer import render_content
+
+BATCH_SIZE = 100
+
+
+def render_blog(db: Session, force: bool = False, batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """
+    Re-render stale blog bodies and refresh the documents of their posts
+
+    Returns:
+        Number of posts and translations rendered
+    """
+    rendered = {"posts": 0, "translations": 0}
+    post_ids = [post_id for (post_id,) in db.query(BlogPost.id).order_by(BlogPost.id)]
+    for start in range(0, len(post_ids), batch_size):
+        batch = post_ids[start:start + batch_size]
+        changed: Set = set()
+        for post in db.query(BlogPost).filter(BlogPost.id.in_(batch)):
+            if force:
+                post.content_hash = None
+            if render_content(post):
+                changed.add(post.id)
+                rendered["posts"] += 1
+        for translation in db.query(BlogTranslation).filter(BlogTranslation.blog_post_id.in_(batch)):
+            if force:
+                translation.content_hash = None
+            if render_content(translation):
+                changed.add(translation.blog_post_id)
+                rendered["translations"] += 1
+        if changed:
+            blog_crud.refresh_blog_documents(db, *sorted(changed))
+            feeds_crud.refresh_blog_feeds(db, *sorted(changed))
+        db.commit()
+        db.expunge_all()
+    return rendered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--force", action="store_true", help="Re-render every body, even when unchanged")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        rendered = render_blog(db, force=args.force)
+    print(f"Rendered {rendered['posts']} posts and {rendered['translations']} translations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Public API Snapshot
+Renders every public GET response to pre-compressed files for CDN hosting
+
+Run from the backend directory with the application's environment set:
+
+    python -m app.tools.snapshot --output snapshots
+    python -m app.tools.snapshot --incremental
+
+Upload the directory to object storage and have the edge map each request to
+the file listed for its canonical URL in ``manifest.json``, serving the
+``.gz``/``.br`` variant the client accepts. Incremental runs only rewrite
+responses that changed, so the sync uploads just those.
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+from app.config import settings
+from app.database import SessionLocal
+from app.main import app
+from app.services.snapshot_service import build_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", type=Path, default=Path(settings.SNAPSHOT_DIR))
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-render detail pages changed since the previous snapshot in --output",
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = asyncio.run(build_snapshot(db, app, args.output, incremental=args.incremental))
+    print(
+        f"{args.output}: {result.written} written, {result.unchanged} unchanged, "
+        f"{result.removed} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
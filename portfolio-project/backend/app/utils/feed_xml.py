@@ -0,0 +1,100 @@
+"""
+Feed and Sitemap XML
+RSS 2.0, Atom and sitemap documents assembled from per-entry fragments
+
+Each entry (a feed item, a sitemap URL) is rendered once into an XML
+fragment; documents are the fragments concatenated inside a header, so a
+document can be reassembled after one entry changes without rendering the
+others again. Datetimes without a timezone are taken as UTC.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Iterable, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+
+
+def utc(value: datetime) -> datetime:
+    """``value`` in UTC, naive datetimes being UTC already"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def http_date(value: datetime) -> str:
+    """RFC 1123 date, as in RSS dates and ``Last-Modified``"""
+    return format_datetime(utc(value), usegmt=True)
+
+
+def w3c_date(value: datetime) -> str:
+    """RFC 3339 date, as in Atom dates and sitemap ``lastmod``"""
+    return utc(value).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _element(name: str, text: Optional[str]) -> str:
+    return f"<{name}>{escape(text)}</{name}>" if text else ""
+
+
+def rss_item(title: str, link: str, published: datetime, summary: Optional[str]) -> str:
+    return (
+        f"<item>{_element('title', title)}{_element('link', link)}"
+        f'<guid isPermaLink="true">{escape(link)}</guid>'
+        f"<pubDate>{http_date(published)}</pubDate>{_element('description', summary)}</item>"
+    )
+
+
+def atom_entry(
+    entry_id: str, title: str, link: str, published: datetime, updated: datetime, summary: Optional[str]
+) -> str:
+    return (
+        f"<entry>{_element('id', entry_id)}{_element('title', title)}"
+        f'<link rel="alternate" href={quoteattr(link)}/>'
+        f"<published>{w3c_date(published)}</published><updated>{w3c_date(updated)}</updated>"
+        f"{_element('summary', summary)}</entry>"
+    )
+
+
+def sitemap_url(loc: str, lastmod: Optional[datetime]) -> str:
+    return f"<url>{_element('loc', loc)}{_element('lastmod', lastmod and w3c_date(lastmod))}</url>"
+
+
+def rss_document(
+    title: str, link: str, self_link: str, language: str, built: datetime, items: Iterable[str]
+) -> str:
+    return (
+        f'{XML_DECLARATION}<rss version="2.0" xmlns:atom="{ATOM_NAMESPACE}"><channel>'
+        f"{_element('title', title)}{_element('link', link)}{_element('description', title)}"
+        f'<atom:link href={quoteattr(self_link)} rel="self" type="application/rss+xml"/>'
+        f"<language>{escape(language)}</language><lastBuildDate>{http_date(built)}</lastBuildDate>"
+        f"{''.join(items)}</channel></rss>"
+    )
+
+
+def atom_document(
+    title: str, link: str, self_link: str, author: str, updated: datetime, entries: Iterable[str]
+) -> str:
+    return (
+        f'{XML_DECLARATION}<feed xmlns="{ATOM_NAMESPACE}">'
+        f"{_element('id', self_link)}{_element('title', title)}<updated>{w3c_date(updated)}</updated>"
+        f"<author>{_element('name', author)}</author>"
+        f'<link rel="alternate" href={quoteattr(link)}/><link rel="self" href={quoteattr(self_link)}/>'
+        f"{''.join(entries)}</feed>"
+    )
+
+
+def urlset_document(urls: Iterable[str]) -> str:
+    return f'{XML_DECLARATION}<urlset xmlns="{SITEMAP_NAMESPACE}">{"".join(urls)}</urlset>'
+
+
+def sitemap_index_document(sitemaps: Iterable[Tuple[str, datetime]]) -> str:
+    return (
+        f'{XML_DECLARATION}<sitemapindex xmlns="{SITEMAP_NAMESPACE}">'
+        + "".join(
+            f"<sitemap>{_element('loc', loc)}<lastmod>{w3c_date(lastmod)}</lastmod></sitemap>"
+            for loc, lastmod in sitemaps
+        )
+        + "</sitemapindex>"
+    )
@@ -0,0 +1,205 @@
+"""
+Markdown Rendering
+Blog bodies to sanitized HTML with highlighted code, heading anchors and a table of contents
+
+Raw HTML in the source is not passed through: the block and inline HTML
+processors of Python-Markdown are removed, so tags come out escaped, and
+links or images whose URL has a scheme other than http, https or mailto
+lose it. Fenced code blocks are highlighted by Pygments into
+``<div class="highlight">`` with the short token classes of its
+stylesheets.
+
+The prose of the rendered HTML, without code blocks and heading anchors,
+gives the word count, the reading time at ``WORDS_PER_MINUTE`` and an
+auto-excerpt of the opening paragraphs.
+
+Rendering happens when a post or translation is saved. The output is stored
+next to the source with ``content_hash``, a digest of the source and
+``RENDERER_VERSION``; bump the version whenever the output would change and
+run ``python -m app.tools.render_blog`` to re-render stored bodies.
+"""
+import hashlib
+import math
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import markdown
+from markdown.extensions import Extension
+from markdown.extensions.toc import slugify_unicode
+from markdown.treeprocessors import Treeprocessor
+
+RENDERER_VERSION = "2"
+
+WORDS_PER_MINUTE = 200
+# Longest auto-excerpt in characters, cut at a word boundary
+EXCERPT_LENGTH = 280
+
+_WORD = re.compile(r"\w+(?:['’]\w+)*")
+
+SAFE_URL_SCHEMES = frozenset({"", "http", "https", "mailto"})
+
+EXTENSIONS_CONFIG = {
+    "codehilite": {"css_class": "highlight", "guess_lang": False},
+    "toc": {
+        "slugify": slugify_unicode,
+        "permalink": True,
+        "permalink_class": "heading-anchor",
+        "toc_depth": "2-4",
+    },
+}
+
+
+class _SafeUrls(Treeprocessor):
+    """Drop link and image URLs with scripting or other unexpected schemes"""
+
+    def run(self, root):
+        for element in root.iter():
+            for attribute in ("href", "src"):
+                url = element.get(attribute)
+                if url is not None and not _is_safe_url(url):
+                    element.set(attribute, "")
+
+
+class _SanitizeExtension(Extension):
+    def extendMarkdown(self, md):
+        md.preprocessors.deregister("html_block")
+        md.inlinePatterns.deregister("html")
+        md.treeprocessors.register(_SafeUrls(md), "safe_urls", 0)
+
+
+def _is_safe_url(url: str) -> bool:
+    # Browsers ignore whitespace and control characters inside the scheme
+    cleaned = "".join(char for char in url if char.isprintable() and not char.isspace())
+    try:
+        return urlsplit(cleaned).scheme.lower() in SAFE_URL_SCHEMES
+    except ValueError:
+        return False
+
+
+class _ProseExtractor(HTMLParser):
+    """Text of rendered HTML outside code blocks and heading anchors, and of each paragraph"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text: List[str] = []
+        self.paragraphs: List[str] = []
+        self._skipping: Optional[str] = None
+        self._paragraph: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._skipping:
+            return
+        if tag == "pre" or (tag == "a" and "heading-anchor" in (dict(attrs).get("class") or "")):
+            self._skipping = tag
+        elif tag == "p":
+            self._paragraph = []
+
+    def handle_endtag(self, tag):
+        if self._skipping:
+            if tag == self._skipping:
+                self._skipping = None
+        elif tag == "p" and self._paragraph is not None:
+            self.paragraphs.append(" ".join("".join(self._paragraph).split()))
+            self._paragraph = None
+
+    def handle_data(self, data):
+        if self._skipping:
+            return
+        self.text.append(data)
+        if self._paragraph is not None:
+            self._paragraph.append(data)
+
+
+def _excerpt(passages: List[str]) -> str:
+    text = ""
+    for passage in filter(None, passages):
+        text = f"{text} {passage}".strip()
+        if len(text) >= EXCERPT_LENGTH:
+            break
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+    cut = text[:EXCERPT_LENGTH + 1]
+    cut = cut.rsplit(" ", 1)[0] if " " in cut else cut[:EXCERPT_LENGTH]
+    return cut.rstrip(" ,;:-") + "…"
+
+
+def reading_time(word_count: int) -> int:
+    """Minutes to read ``word_count`` words, at least one"""
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+@dataclass(frozen=True)
+class RenderedContent:
+    html: str
+    toc: List[Dict[str, Any]]
+    content_hash: str
+    word_count: int
+    excerpt: str  # opening paragraphs, or the whole prose without paragraphs
+
+
+def content_hash(source: str) -> str:
+    """Digest identifying ``source`` as rendered by this renderer version"""
+    return hashlib.sha256(f"{RENDERER_VERSION}\0{source}".encode()).hexdigest()
+
+
+def _toc_entries(tokens: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": token["id"],
+            "name": token["name"],
+            "level": token["level"],
+            "children": _toc_entries(token["children"]),
+        }
+        for token in tokens
+    ]
+
+
+def render_markdown(source: str) -> RenderedContent:
+    """Render a Markdown body"""
+    renderer = markdown.Markdown(
+        extensions=["fenced_code", "codehilite", "tables", "sane_lists", "toc", _SanitizeExtension()],
+        extension_configs=EXTENSIONS_CONFIG,
+        output_format="html",
+    )
+    html = renderer.convert(source)
+    prose = _ProseExtractor()
+    prose.feed(html)
+    prose.close()
+    text = " ".join(" ".join(prose.text).split())
+    return RenderedContent(
+        html,
+        _toc_entries(renderer.toc_tokens),
+        content_hash(source),
+        len(_WORD.findall(text)),
+        _excerpt(prose.paragraphs or [text]),
+    )
+
+
+def render_content(entity: Any) -> bool:
+    """
+    Store the rendering of ``entity.content`` and the fields derived from it on a post or translation
+
+    Sets the HTML, table of contents, word count, reading time and
+    ``auto_excerpt``. The excerpt follows ``auto_excerpt`` while the author
+    leaves it empty or as the previous auto-excerpt; a typed one is kept.
+
+    Returns:
+        False when the stored rendering already matches the content
+    """
+    previous_excerpt = entity.auto_excerpt
+    digest: Optional[str] = content_hash(entity.content) if entity.content is not None else None
+    changed = digest is None or digest != entity.content_hash
+    if changed:
+        rendered = render_markdown(entity.content or "")
+        entity.content_html = rendered.html
+        entity.content_toc = rendered.toc
+        entity.content_hash = digest
+        entity.word_count = rendered.word_count
+        entity.reading_time = reading_time(rendered.word_count)
+        entity.auto_excerpt = rendered.excerpt or None
+    if not (entity.excerpt or "").strip() or entity.excerpt == previous_excerpt:
+        entity.excerpt = entity.auto_excerpt
+    return changed
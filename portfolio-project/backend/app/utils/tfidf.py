@@ -0,0 +1,79 @@
+"""
+TF-IDF Similarity
+Sparse TF-IDF vectors and their cosine nearest neighbours
+
+Vectors are dictionaries from term to weight: sublinear term frequency
+(``1 + log tf``) times the smoothed ``1 + log((1 + N) / (1 + df))``, keeping
+the ``max_terms`` heaviest terms of each document and normalized to unit
+length. Terms found in every document weigh least but still count, so a
+vector weighed while the corpus was small is not left empty.
+``tfidf_vector`` weighs one document against stored document frequencies;
+``TfidfModel`` weighs a whole corpus and scores the neighbours of a document
+through an inverted index, so only documents sharing a kept term are visited.
+"""
+import heapq
+import math
+from collections import Counter
+from typing import Dict, Hashable, List, Mapping, Tuple
+
+MAX_TERMS = 64
+
+
+def tfidf_vector(
+    counts: Mapping[str, int], frequencies: Mapping[str, int], size: int, max_terms: int = MAX_TERMS
+) -> Dict[str, float]:
+    """
+    Unit TF-IDF vector of one document
+
+    Args:
+        counts: Term counts of the document
+        frequencies: Number of documents containing each of its terms
+        size: Number of documents, this one included
+    """
+    weights = {}
+    for term, count in counts.items():
+        if count > 0:
+            weights[term] = (1 + math.log(count)) * (1 + math.log((1 + size) / (1 + frequencies[term])))
+    if len(weights) > max_terms:
+        weights = dict(heapq.nlargest(max_terms, weights.items(), key=lambda item: (item[1], item[0])))
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+
+class TfidfModel:
+    """TF-IDF vectors of a fixed set of documents, keyed by comparable keys"""
+
+    def __init__(self, counts: Mapping[Hashable, Mapping[str, int]], max_terms: int = MAX_TERMS):
+        self.frequencies = Counter(term for terms in counts.values() for term in terms)
+
+        self.vectors: Dict[Hashable, Dict[str, float]] = {}
+        # Postings hold positions in _keys: integers hash and compare faster
+        self._keys: List[Hashable] = list(counts)
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        for position, key in enumerate(self._keys):
+            vector = tfidf_vector(counts[key], self.frequencies, len(counts), max_terms)
+            self.vectors[key] = vector
+            for term, weight in vector.items():
+                self._postings.setdefault(term, []).append((position, weight))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.vectors
+
+    def _scores(self, key: Hashable) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for term, weight in self.vectors.get(key, {}).items():
+            for other, other_weight in self._postings[term]:
+                scores[other] = scores.get(other, 0.0) + weight * other_weight
+        scores.pop(self._positions.get(key), None)
+        return scores
+
+    def similarities(self, key: Hashable) -> Dict[Hashable, float]:
+        """Cosine similarity of ``key`` to every other document sharing a term"""
+        return {self._keys[position]: score for position, score in self._scores(key).items()}
+
+    def neighbors(self, key: Hashable, limit: int) -> List[Tuple[Hashable, float]]:
+        """The ``limit`` most similar documents, best first and the greater key first on ties"""
+        keys = self._keys
+        best = heapq.nlargest(limit, self._scores(key).items(), key=lambda item: (item[1], keys[item[0]]))
+        return [(keys[position], score) for position, score in best]
@@ -0,0 +1,46 @@
+"""
+Text Tokenizer
+Word tokens of blog text for the search index and related-post similarity
+
+Tokens are case-folded the way the text's language writes capitals, then
+stripped of diacritics, so ``İSTANBUL``, ``istanbul`` and ``Istanbul`` are
+one term, as are ``gömülü`` and ``gomulu``.
+"""
+import re
+import unicodedata
+from collections import Counter
+from typing import List, Sequence, Tuple
+
+# A title word counts three times, an excerpt word twice
+FIELD_WEIGHTS = (3, 2, 1)  # title, excerpt, content
+
+_TOKEN = re.compile(r"[^\W_]+")
+# Turkish dotted and dotless capitals; str.casefold maps both to plain i
+_TURKISH_CAPITALS = str.maketrans({"I": "ı", "İ": "i"})
+# Letters NFKD does not decompose into a base letter and a combining mark
+_LETTER_FOLDS = str.maketrans({"ı": "i", "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ł": "l"})
+
+
+def fold(text: str, language: str = "en") -> str:
+    """Case-fold ``text`` the way ``language`` writes capitals, then strip diacritics"""
+    if language == "tr":
+        text = text.translate(_TURKISH_CAPITALS)
+    text = text.casefold()
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFKD", text).translate(_LETTER_FOLDS)
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def tokenize(text: str, language: str = "en") -> List[str]:
+    """Folded word tokens of ``text``"""
+    return _TOKEN.findall(fold(text, language))
+
+
+def term_frequencies(fields: Sequence[str], language: str) -> Tuple[Counter, int]:
+    """Weighted term frequencies of a document's fields and its weighted length"""
+    counts: Counter = Counter()
+    for weight, text in zip(FIELD_WEIGHTS, fields):
+        for token in tokenize(text or "", language):
+            counts[token] += weight
+    return counts, sum(counts.values())
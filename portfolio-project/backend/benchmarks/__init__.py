@@ -0,0 +1,4 @@
+"""
+Benchmarks
+Standalone scripts measuring query and serialization paths; run with ``python -m benchmarks.<name>``
+"""
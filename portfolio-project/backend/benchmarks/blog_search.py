@@ -0,0 +1,103 @@
+"""
+Blog Search Benchmark
+The in-process BM25 index versus the ILIKE scan used on SQLite
+
+Run from the backend directory with the application's environment set:
+
+    python -m benchmarks.blog_search --posts 500 --words 1500
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.crud import blog as blog_crud
+from app.database import Base
+from app.models.blog import BlogPost, BlogTranslation
+from app.models.user import User
+from app.services.search_index import SearchIndex, rebuild_search_index
+
+VOCABULARY = [f"term{index}" for index in range(20000)]
+
+
+def _text(generator: random.Random, words: int) -> str:
+    return " ".join(generator.choices(VOCABULARY, k=words))
+
+
+def seed(db: Session, posts: int, words: int) -> None:
+    generator = random.Random(42)
+    author = User(username="bench", email="bench@example.com", password_hash="x")
+    db.add(author)
+    db.flush()
+    for index in range(posts):
+        post = BlogPost(
+            slug=f"post-{index}",
+            title=_text(generator, 8),
+            excerpt=_text(generator, 30),
+            content=_text(generator, words),
+            author_id=author.id,
+            published=True,
+        )
+        db.add(post)
+        db.flush()
+        db.add(BlogTranslation(
+            blog_post_id=post.id, language="tr", title=_text(generator, 8), content=_text(generator, words)
+        ))
+    db.commit()
+
+
+def median_ms(search: Callable[[str], List], queries: List[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        for query in queries:
+            started = time.perf_counter()
+            search(query)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--words", type=int, default=1500)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    queries = random.Random(7).sample(VOCABULARY, 20)
+
+    with factory() as db, tempfile.TemporaryDirectory() as directory:
+        seed(db, args.posts, args.words)
+        index = SearchIndex(Path(directory))
+        started = time.perf_counter()
+        rebuild_search_index(db, index)
+        built = (time.perf_counter() - started) * 1000
+
+        mapped = SearchIndex(Path(directory))
+        started = time.perf_counter()
+        mapped.load(index.languages["en"].watermark)
+        loaded = (time.perf_counter() - started) * 1000
+
+        print(f"{args.posts} posts of {args.words} words in en and tr, {len(queries)} queries")
+        print(f"index build {built:.0f} ms, segment map {loaded:.2f} ms")
+        print(f"{'search':<8} {'median ms':>10}")
+        for name, search in (
+            ("ilike", lambda query: blog_crud.search_blog_posts(db, query, language="tr", limit=args.limit)),
+            ("bm25", lambda query: mapped.search(query, "tr", args.limit)),
+        ):
+            print(f"{name:<8} {median_ms(search, queries, args.repeat):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
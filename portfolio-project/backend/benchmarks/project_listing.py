@@ -0,0 +1,135 @@
+"""
+Project Listing Benchmark
+Joined eager loading versus the selectin loader layer for a page of projects
+
+Run from the backend directory with the application's environment set:
+
+    python -m benchmarks.project_listing --projects 100 --limit 20
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, joinedload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.crud import project as project_crud
+from app.crud.pagination import order_by_keys
+from app.database import Base
+from app.models.project import Project, ProjectImage, ProjectTechnology, ProjectTranslation
+from app.models.technology import Technology
+
+
+def seed(db: Session, projects: int, images: int, technologies: int) -> None:
+    techs = [
+        Technology(name=f"Tech {index}", slug=f"tech-{index}", category="backend")
+        for index in range(technologies * 2)
+    ]
+    db.add_all(techs)
+    db.flush()
+
+    for index in range(projects):
+        project = Project(
+            slug=f"project-{index}",
+            title=f"Project {index}",
+            short_description="Short description",
+            description="Description " * 50,
+            display_order=index,
+        )
+        db.add(project)
+        db.flush()
+        for language in ("en", "tr"):
+            db.add(ProjectTranslation(
+                project_id=project.id,
+                language=language,
+                title=f"Project {index} ({language})",
+                short_description="Short description",
+                description="Description " * 50,
+            ))
+        for position in range(images):
+            db.add(ProjectImage(
+                project_id=project.id,
+                image_url=f"https://cdn.example.com/{index}/{position}.png",
+                display_order=images - position,
+            ))
+        for offset in range(technologies):
+            db.add(ProjectTechnology(project_id=project.id, technology_id=techs[(index + offset) % len(techs)].id))
+    db.commit()
+
+
+def joined_page(db: Session, limit: int) -> List[Project]:
+    """The previous loader: every collection joined onto the paged query"""
+    query = db.query(Project).options(
+        joinedload(Project.translations),
+        joinedload(Project.technologies),
+        joinedload(Project.images),
+    )
+    return order_by_keys(query, project_crud.SORT_KEYS).offset(0).limit(limit).all()
+
+
+def selectin_page(db: Session, limit: int) -> List[Project]:
+    return project_crud.get_projects_page(db, skip=0, limit=limit, language="tr").items
+
+
+def measure(
+    factory: sessionmaker, engine, loader: Callable[[Session, int], List[Project]], limit: int, repeat: int
+) -> Tuple[int, int, float]:
+    """Return (statements, rows fetched, median milliseconds) for one page load"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    with factory() as db:
+        loaded = loader(db, limit)
+        assert all(len(project.images) and len(project.technologies) for project in loaded)
+    event.remove(engine, "before_cursor_execute", record)
+
+    with engine.connect() as conn:
+        rows = sum(
+            conn.exec_driver_sql(f"SELECT count(*) FROM ({statement})", parameters).scalar()
+            for statement, parameters in statements
+        )
+
+    timings = []
+    for _ in range(repeat):
+        with factory() as db:
+            started = time.perf_counter()
+            loader(db, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+    return len(statements), rows, statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--images", type=int, default=10)
+    parser.add_argument("--technologies", type=int, default=15)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        seed(db, args.projects, args.images, args.technologies)
+    with engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+
+    print(
+        f"{args.projects} projects, {args.images} images and {args.technologies} technologies each, "
+        f"page of {args.limit}"
+    )
+    print(f"{'loader':<10} {'queries':>8} {'rows':>8} {'median ms':>10}")
+    for name, loader in (("joined", joined_page), ("selectin", selectin_page)):
+        queries, rows, median = measure(factory, engine, loader, args.limit, args.repeat)
+        print(f"{name:<10} {queries:>8} {rows:>8} {median:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Related Posts Benchmark
+Full TF-IDF neighbour rebuild versus the incremental refresh of one written post
+
+Run from the backend directory with the application's environment set:
+
+    python -m benchmarks.related_posts --posts 10000 --words 300
+"""
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.crud import related as related_crud
+from app.database import Base
+from app.models.blog import BlogPost
+from app.models.user import User
+
+# Zipf-like draws, so posts share common words and differ in rare ones
+VOCABULARY = [f"term{index}" for index in range(20000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def _text(generator: random.Random, words: int) -> str:
+    return " ".join(generator.choices(VOCABULARY, WEIGHTS, k=words))
+
+
+def seed(db: Session, posts: int, words: int) -> None:
+    generator = random.Random(42)
+    author = User(username="bench", email="bench@example.com", password_hash="x")
+    db.add(author)
+    db.flush()
+    db.add_all(
+        BlogPost(
+            slug=f"post-{index}",
+            title=_text(generator, 8),
+            excerpt=_text(generator, 30),
+            content=_text(generator, words),
+            author_id=author.id,
+            published=True,
+        )
+        for index in range(posts)
+    )
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    generator = random.Random(7)
+
+    with factory() as db:
+        seed(db, args.posts, args.words)
+        started = time.perf_counter()
+        rebuilt = related_crud.rebuild_related_posts(db)
+        db.commit()
+        built = time.perf_counter() - started
+
+        refreshes = []
+        posts = db.query(BlogPost).order_by(BlogPost.slug).limit(args.updates).all()
+        for post in posts:
+            post.content = _text(generator, args.words)
+            started = time.perf_counter()
+            related_crud.refresh_related_posts(db, post.id)
+            db.commit()
+            refreshes.append((time.perf_counter() - started) * 1000)
+
+        lookups = []
+        for post in posts:
+            started = time.perf_counter()
+            related_crud.get_related_documents(db, post.slug, "en", args.limit)
+            lookups.append((time.perf_counter() - started) * 1000)
+
+        print(f"{args.posts} posts of {args.words} words, en and tr")
+        print(f"full rebuild {built:.1f} s ({rebuilt['en']} en lists)")
+        print(f"{'operation':<20} {'median ms':>10}")
+        print(f"{'incremental write':<20} {statistics.median(refreshes):>10.1f}")
+        print(f"{'related lookup':<20} {statistics.median(lookups):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Serialization Benchmark
+Response encoding paths for the projects, blog and experiences list payloads
+
+Compares, per payload, the previous encoding of each route with the
+precompiled-adapter/orjson layer in ``app.serializers.encoders``:
+
+- projects: hand-built dicts through ``jsonable_encoder`` + ``json.dumps``,
+  versus the same dicts through orjson and read-model documents spliced as is
+- blog and experiences: ``Schema.model_validate`` returned to FastAPI
+  (``jsonable_encoder`` + ``json.dumps``), versus one ``TypeAdapter.dump_json``
+
+Data is loaded once; only encoding is timed. Run from the backend directory
+with the application's environment set:
+
+    python -m benchmarks.serialization --items 50 --repeat 200
+"""
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.crud import blog as blog_crud
+from app.crud import experience as experience_crud
+from app.crud import project as project_crud
+from app.database import Base
+from app.models.blog import BlogPost, BlogTranslation
+from app.models.experience import Experience, ExperienceTranslation
+from app.schemas.blog import BlogPostListResponse
+from app.schemas.experience import ExperienceListResponse
+from app.serializers.encoders import dump_json, dumps, list_envelope
+from app.serializers.project import serialize_project
+from benchmarks.project_listing import seed as seed_projects
+
+
+def seed(db, items: int) -> None:
+    seed_projects(db, items, images=5, technologies=8)
+    author_id = uuid.uuid4()
+    for index in range(items):
+        post = BlogPost(
+            slug=f"post-{index}",
+            title=f"Post {index}",
+            content="Paragraph of text. " * 300,
+            excerpt="Excerpt " * 10,
+            author_id=author_id,
+            published=True,
+            published_at=datetime(2024, 1, 1 + index % 28, tzinfo=timezone.utc),
+            reading_time=5,
+        )
+        experience = Experience(
+            title=f"Role {index}",
+            organization="Organization",
+            location="Istanbul",
+            experience_type="work",
+            start_date=date(2020, 1, 1),
+            description="Responsibilities " * 40,
+            display_order=index,
+        )
+        db.add_all([post, experience])
+        db.flush()
+        db.add(BlogTranslation(blog_post_id=post.id, language="tr", title=f"Yazi {index}", content="Metin " * 300))
+        db.add(ExperienceTranslation(
+            experience_id=experience.id, language="tr", title=f"Rol {index}", organization="Kurum",
+            description="Sorumluluklar " * 40,
+        ))
+    db.commit()
+    project_ids = [project.id for project in project_crud.get_projects(db, limit=items)]
+    project_crud.refresh_project_documents(db, *project_ids)
+    db.commit()
+
+
+def _stdlib(payload) -> bytes:
+    """What FastAPI does with a returned dict or model and no response_model"""
+    return json.dumps(jsonable_encoder(payload)).encode()
+
+
+def encoders(db, items: int) -> Dict[str, List[Tuple[str, Callable[[], bytes]]]]:
+    """Encoding strategies to compare per payload, the previous one first"""
+    projects = project_crud.get_projects(db, limit=items, language="tr")
+    project_items = [serialize_project(project) for project in projects]
+    documents = [
+        document for _, document in project_crud.get_project_documents_page(db, limit=items, language="tr").items
+    ]
+    posts = blog_crud.get_blog_posts(db, limit=items, language="tr")
+    experiences = experience_crud.get_experiences(db, limit=items, language="tr")
+
+    envelope = {"total": items, "page": 1, "size": items, "pages": 1, "next_cursor": None}
+    blog_payload = {"items": posts, **envelope}
+    experience_payload = {"experiences": experiences, "total": items, "skip": 0, "limit": items, "next_cursor": None}
+
+    return {
+        "projects": [
+            ("jsonable_encoder", lambda: _stdlib({"items": project_items, **envelope})),
+            ("orjson", lambda: dumps({"items": project_items, **envelope})),
+            ("read model", lambda: list_envelope(documents, **envelope)),
+        ],
+        "blog": [
+            ("model_validate", lambda: _stdlib(BlogPostListResponse.model_validate(blog_payload))),
+            ("dump_json", lambda: dump_json(BlogPostListResponse, blog_payload)),
+        ],
+        "experiences": [
+            ("model_validate", lambda: _stdlib(ExperienceListResponse.model_validate(experience_payload))),
+            ("dump_json", lambda: dump_json(ExperienceListResponse, experience_payload)),
+        ],
+    }
+
+
+def measure(encode: Callable[[], bytes], repeat: int) -> Tuple[int, float]:
+    """Return (body bytes, median milliseconds) of one encoding"""
+    size = len(encode())
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode()
+        timings.append((time.perf_counter() - started) * 1000)
+    return size, statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        seed(db, args.items)
+        strategies = encoders(db, args.items)
+
+        print(f"{args.items} items per payload, median of {args.repeat} runs")
+        print(f"{'payload':<12} {'encoder':<17} {'bytes':>8} {'median ms':>10} {'speedup':>8}")
+        for payload, candidates in strategies.items():
+            baseline = None
+            for name, encode in candidates:
+                size, median = measure(encode, args.repeat)
+                baseline = baseline or median
+                print(f"{payload:<12} {name:<17} {size:>8} {median:>10.3f} {baseline / median:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,13 @@ from app.models.site import Translation
 from app.models.skill import Skill
 from app.models.technology import Technology
 from app.schemas.user import UserCreate
+from app.services import search_index as search_index_module
+from app.services.degraded_service import DatabaseCircuit, DegradedMode
+from app.services import trending as trending_module
+from app.services import view_counter as view_counter_module
+from app.services.search_index import SearchIndex
+from app.services.trending import InMemoryLeaderboard, Trending
+from app.services.view_counter import InMemoryViewBuffer, ViewCounter
 from app.utils.security import create_access_token
 
 SQLALCHEMY_DATABASE_URL = "sqlite://"
@@ -77,8 +84,29 @@ def db_session(engine, SessionLocal):
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def degraded_mode(tmp_path):
+    return DegradedMode(tmp_path / "degraded-snapshot", DatabaseCircuit(failure_threshold=2, reset_seconds=30))
+
+
+@pytest.fixture
+def search_index(tmp_path):
+    """Unloaded search index; tests that search through it build it"""
+    return SearchIndex(tmp_path / "search-index")
+
+
+@pytest.fixture
+def trending():
+    return Trending(InMemoryLeaderboard())
+
+
+@pytest.fixture
+def view_counter(trending):
+    return ViewCounter(InMemoryViewBuffer(), trending=trending)
+
+
 @pytest.fixture(scope="function")
-def client(db_session: Session, monkeypatch):
+def client(db_session: Session, monkeypatch, degraded_mode, search_index, view_counter, trending):
     def override_get_db():
         try:
             yield db_session
@@ -96,6 +124,14 @@ def client(db_session: Session, monkeypatch):
 
     monkeypatch.setattr(main_module, "get_cache_service", lambda: DummyCache())
     monkeypatch.setattr(main_module, "check_db_connection", lambda: True)
+    monkeypatch.setattr(main_module, "get_degraded_mode", lambda: degraded_mode)
+    monkeypatch.setattr(main_module, "open_search_index", lambda index: None)
+    monkeypatch.setattr(search_index_module, "_search_index", search_index)
+    monkeypatch.setattr(view_counter_module, "_view_counter", view_counter)
+    monkeypatch.setattr(trending_module, "_trending", trending)
+    monkeypatch.setattr(settings, "VIEW_FLUSH_SECONDS", 0)
+    monkeypatch.setattr(settings, "TRENDING_PERSIST_SECONDS", 0)
+    monkeypatch.setattr(settings, "SNAPSHOT_REFRESH_SECONDS", 0)
     app.dependency_overrides[get_db] = override_get_db
 
     with TestClient(app) as test_client:
@@ -0,0 +1,131 @@
+"""Batch endpoint tests."""
+
+from app.config import settings
+
+
+def test_batch_returns_results_in_order_with_item_status(client, create_project, create_skill):
+    create_project(slug="batched-project")
+    create_skill(name="Batched Skill")
+
+    response = client.post(
+        "/api/v1/batch/",
+        json={
+            "requests": [
+                {"path": "/api/v1/skills/"},
+                {"path": "/api/v1/projects/batched-project"},
+                {"path": "/api/v1/projects/missing-project"},
+                {"path": "/api/v1/projects/?featured_only=true&limit=5"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    items = response.json()["responses"]
+    assert [item["path"] for item in items] == [
+        "/api/v1/skills/",
+        "/api/v1/projects/batched-project",
+        "/api/v1/projects/missing-project",
+        "/api/v1/projects/?featured_only=true&limit=5",
+    ]
+    assert [item["status"] for item in items] == [200, 200, 404, 200]
+    assert items[0]["body"]["skills"][0]["name"] == "Batched Skill"
+    assert items[1]["body"]["slug"] == "batched-project"
+    assert items[2]["body"]["detail"] == "Project not found"
+    assert items[3]["body"]["items"] == []
+
+
+def test_batch_forwards_caller_authentication(client, admin_headers):
+    authenticated = client.post(
+        "/api/v1/batch/",
+        headers=admin_headers,
+        json={"requests": [{"path": "/api/v1/admin/stats"}]},
+    )
+    anonymous = client.post("/api/v1/batch/", json={"requests": [{"path": "/api/v1/admin/stats"}]})
+
+    assert authenticated.json()["responses"][0]["status"] == 200
+    assert anonymous.json()["responses"][0]["status"] in (401, 403)
+
+
+def test_batch_rejects_invalid_item_paths(client):
+    response = client.post(
+        "/api/v1/batch/",
+        json={
+            "requests": [
+                {"path": "/health"},
+                {"path": "/api/v1/batch/"},
+                {"path": "/api/v1/../health"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["responses"]] == [400, 400, 400]
+
+
+def test_batch_size_is_capped(client):
+    requests = [{"path": "/api/v1/skills/"}] * (settings.BATCH_MAX_REQUESTS + 1)
+
+    response = client.post("/api/v1/batch/", json={"requests": requests})
+
+    assert response.status_code == 400
+
+
+def test_batch_only_accepts_get_items(client):
+    response = client.post(
+        "/api/v1/batch/",
+        json={"requests": [{"method": "DELETE", "path": "/api/v1/skills/"}]},
+    )
+
+    assert response.status_code == 422
+
+
+def test_batch_items_share_one_session_from_real_get_db(client, create_project, monkeypatch, SessionLocal):
+    from app.api.deps import get_db
+    from app.main import app
+
+    create_project(slug="shared-session")
+    opened = []
+
+    def counting_session():
+        session = SessionLocal()
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr("app.database.SessionLocal", counting_session)
+    app.dependency_overrides.pop(get_db)
+
+    response = client.post(
+        "/api/v1/batch/",
+        json={
+            "requests": [
+                {"path": "/api/v1/projects/shared-session"},
+                {"path": "/api/v1/skills/"},
+                {"path": "/api/v1/projects/?limit=5"},
+            ]
+        },
+    )
+
+    assert [item["status"] for item in response.json()["responses"]] == [200, 200, 200]
+    assert len(opened) == 1
+
+
+def test_failed_item_does_not_poison_later_items(client, create_project, monkeypatch):
+    from app.crud import skill as skill_crud
+    from app.models.skill import Skill
+
+    create_project(slug="after-failure")
+
+    def failing_get_skills(db, **kwargs):
+        db.add(Skill(name=None, category="broken"))
+        db.flush()
+
+    monkeypatch.setattr(skill_crud, "get_skills", failing_get_skills)
+
+    response = client.post(
+        "/api/v1/batch/",
+        json={"requests": [{"path": "/api/v1/skills/"}, {"path": "/api/v1/projects/after-failure"}]},
+    )
+
+    items = response.json()["responses"]
+    assert [item["status"] for item in items] == [500, 200]
+    assert items[1]["body"]["slug"] == "after-failure"
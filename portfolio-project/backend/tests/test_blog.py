@@ -15,15 +15,16 @@ def test_get_blog_posts_and_search(client, create_blog_post):
     assert len(search.json()) == 1
 
 
-def test_get_blog_post_increments_views(client, create_blog_post):
+def test_get_blog_post_counts_one_view_per_visitor(client, create_blog_post):
     create_blog_post(slug="viewed-post", views=0)
 
     first = client.get("/api/v1/blog/viewed-post")
-    second = client.get("/api/v1/blog/viewed-post")
+    repeat = client.get("/api/v1/blog/viewed-post")
+    other = client.get("/api/v1/blog/viewed-post", headers={"User-Agent": "another-browser"})
 
     assert first.status_code == 200
-    assert second.status_code == 200
-    assert second.json()["views"] == 2
+    assert repeat.json()["views"] == 1
+    assert other.json()["views"] == 2
 
 
 def test_get_blog_post_not_found(client):
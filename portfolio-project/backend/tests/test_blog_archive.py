@@ -0,0 +1,98 @@
+"""Blog archive tests."""
+
+from datetime import datetime, timezone
+
+from app.crud import blog as blog_crud
+from app.crud import blog_archive
+from app.models.blog import BlogPost
+
+
+def _publish_at(monkeypatch, year, month):
+    class Frozen(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(year, month, 15, 12, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(blog_crud, "datetime", Frozen)
+
+
+def _post(client, admin_headers, slug, published=True):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": slug.title(), "content": "Body", "published": published},
+    ).json()["id"]
+
+
+def _buckets(client, language="en"):
+    archive = client.get("/api/v1/blog/archive", params={"language": language}).json()
+    return archive["total"], [
+        (year["year"], year["count"], [(month["month"], month["name"], month["count"]) for month in year["months"]])
+        for year in archive["years"]
+    ]
+
+
+def _slugs(client, **params):
+    return sorted(item["slug"] for item in client.get("/api/v1/blog/", params=params).json()["items"])
+
+
+def test_archive_counts_published_posts_per_month(client, admin_headers, monkeypatch):
+    assert _buckets(client) == (0, [])
+
+    _publish_at(monkeypatch, 2025, 12)
+    old = _post(client, admin_headers, "old")
+    _publish_at(monkeypatch, 2026, 3)
+    _post(client, admin_headers, "march")
+    spring = _post(client, admin_headers, "spring")
+    draft = _post(client, admin_headers, "draft", published=False)
+
+    assert _buckets(client) == (3, [
+        (2026, 2, [(3, "March", 2)]),
+        (2025, 1, [(12, "December", 1)]),
+    ])
+    assert _buckets(client, "tr")[1][0] == (2026, 2, [(3, "Mart", 2)])
+    assert _slugs(client, year=2026, month=3) == ["march", "spring"]
+    assert _slugs(client, year=2025) == ["old"]
+    assert client.get("/api/v1/blog/?year=2026&month=3&fields=slug").json()["total"] == 2
+
+    _publish_at(monkeypatch, 2026, 4)
+    client.put(f"/api/v1/blog/{spring}", headers=admin_headers, json={"published": False})
+    client.put(f"/api/v1/blog/{draft}", headers=admin_headers, json={"published": True})
+    client.put(f"/api/v1/blog/{draft}", headers=admin_headers, json={"title": "Edited"})
+    client.delete(f"/api/v1/blog/{old}", headers=admin_headers)
+
+    assert _buckets(client) == (2, [(2026, 2, [(4, "April", 1), (3, "March", 1)])])
+
+
+def test_archive_is_served_with_validators(client, admin_headers):
+    _post(client, admin_headers, "first")
+    first = client.get("/api/v1/blog/archive")
+    # Weak once the compression middleware has encoded the body
+    etag = first.headers["ETag"].removeprefix("W/")
+
+    assert first.headers["Cache-Control"].startswith("public")
+    assert "blog" in first.headers["Surrogate-Key"].split()
+    assert client.get("/api/v1/blog/archive", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/blog/archive", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+    _post(client, admin_headers, "second")
+    changed = client.get("/api/v1/blog/archive", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 2
+
+
+def test_aggregate_matches_a_recount_of_the_posts(client, admin_headers, db_session, monkeypatch):
+    for year, month, slug in ((2024, 1, "a"), (2024, 1, "b"), (2024, 2, "c"), (2025, 7, "d")):
+        _publish_at(monkeypatch, year, month)
+        _post(client, admin_headers, slug)
+    posts = {post.slug: post.id for post in db_session.query(BlogPost)}
+    client.put(f"/api/v1/blog/{posts['b']}", headers=admin_headers, json={"published": False})
+    client.delete(f"/api/v1/blog/{posts['c']}", headers=admin_headers)
+
+    db_session.expire_all()
+    recount = {}
+    for post in db_session.query(BlogPost).filter(BlogPost.published == True):
+        month = blog_archive.archive_month(post)
+        recount[month] = recount.get(month, 0) + 1
+    stored = {(row.year, row.month): row.post_count for row in blog_archive.get_archive_months(db_session)}
+    assert stored == recount == {(2024, 1): 1, (2025, 7): 1}
@@ -0,0 +1,79 @@
+"""Blog derived fields tests."""
+
+from app.utils import markdown_renderer
+from app.utils.markdown_renderer import EXCERPT_LENGTH, render_markdown
+
+LONG_PARAGRAPH = " ".join(["word"] * 450)
+
+
+def _create(client, admin_headers, slug, content, **fields):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": slug.title(), "content": content, "published": True, **fields},
+    ).json()
+
+
+def test_words_and_excerpt_come_from_the_prose_only():
+    rendered = render_markdown(
+        "# Heading here\n\nIt's the *first* paragraph &amp; more.\n\n"
+        "```python\nnot = counted + here\n```\n\n- one item\n\nSecond paragraph."
+    )
+    long = render_markdown(f"## Intro\n\n{LONG_PARAGRAPH}")
+
+    assert rendered.word_count == 11
+    assert rendered.excerpt == "It's the first paragraph & more. Second paragraph."
+    assert render_markdown("- only a list\n- of items").excerpt == "only a list of items"
+    assert long.word_count == 451
+    assert long.excerpt.endswith("word…") and len(long.excerpt) <= EXCERPT_LENGTH + 1
+    assert markdown_renderer.reading_time(long.word_count) == 3
+    assert markdown_renderer.reading_time(0) == 1
+
+
+def test_fields_are_derived_per_language_on_every_save(client, admin_headers):
+    created = _create(client, admin_headers, "derived", "Short English body.")
+    client.post(
+        f"/api/v1/blog/{created['id']}/translations",
+        headers=admin_headers,
+        json={"language": "tr", "title": "Türetilmiş", "content": LONG_PARAGRAPH},
+    )
+    updated = client.put(
+        f"/api/v1/blog/{created['id']}", headers=admin_headers, json={"content": f"{LONG_PARAGRAPH} {LONG_PARAGRAPH}"}
+    ).json()
+    turkish = client.get("/api/v1/blog/?language=tr").json()["items"][0]
+    english = client.get("/api/v1/blog/derived").json()
+
+    assert (created["word_count"], created["reading_time"], created["excerpt"]) == (3, 1, "Short English body.")
+    assert (updated["word_count"], updated["reading_time"]) == (900, 5)
+    assert updated["excerpt"].startswith("word word") and updated["excerpt"].endswith("…")
+    assert (turkish["word_count"], turkish["reading_time"]) == (450, 3)
+    assert english["word_count"] == 900
+
+
+def test_typed_excerpts_are_kept_until_cleared(client, admin_headers):
+    typed = _create(client, admin_headers, "typed", "First body.", excerpt="Hand written")["id"]
+    auto = _create(client, admin_headers, "auto", "First body.")
+    # Sent back unchanged by an edit form, the auto-excerpt keeps following the content
+    client.put(f"/api/v1/blog/{auto['id']}", headers=admin_headers, json={"excerpt": auto["excerpt"]})
+
+    kept = client.put(f"/api/v1/blog/{typed}", headers=admin_headers, json={"content": "Second body."}).json()
+    followed = client.put(f"/api/v1/blog/{auto['id']}", headers=admin_headers, json={"content": "Second body."}).json()
+    cleared = client.put(f"/api/v1/blog/{typed}", headers=admin_headers, json={"excerpt": ""}).json()
+
+    assert kept["excerpt"] == "Hand written"
+    assert followed["excerpt"] == "Second body."
+    assert cleared["excerpt"] == "Second body."
+
+
+def test_read_endpoints_do_not_derive_anything(client, admin_headers, monkeypatch):
+    _create(client, admin_headers, "stored", "Stored body.")
+
+    def no_rendering(source):
+        raise AssertionError("body rendered at request time")
+
+    monkeypatch.setattr(markdown_renderer, "render_markdown", no_rendering)
+
+    detail = client.get("/api/v1/blog/stored").json()
+    listed = client.get("/api/v1/blog/").json()["items"][0]
+    assert detail["word_count"] == listed["word_count"] == 2
+    assert listed["excerpt"] == "Stored body." and "content" not in listed
@@ -0,0 +1,99 @@
+"""Blog Markdown rendering tests."""
+
+from app.crud import read_model
+from app.models.blog import BlogTranslation
+from app.tools.render_blog import render_blog
+from app.utils import markdown_renderer
+from app.utils.markdown_renderer import render_markdown
+
+SOURCE = """# Title
+
+## Kurulum <b>now</b>
+
+<script>alert(1)</script>
+
+[bad](javascript:alert(1)) [good](https://example.com)
+
+```python
+def answer():
+    return 42
+```
+
+### Ayrıntılar
+"""
+
+
+def test_markdown_is_sanitized_highlighted_and_anchored():
+    rendered = render_markdown(SOURCE)
+
+    assert "<script>" not in rendered.html and "&lt;script&gt;" in rendered.html
+    assert "&lt;b&gt;now&lt;/b&gt;" in rendered.html
+    assert '<a href="">bad</a>' in rendered.html and 'href="https://example.com"' in rendered.html
+    assert '<div class="highlight">' in rendered.html and '<span class="k">def</span>' in rendered.html
+    assert 'class="heading-anchor" href="#ayrıntılar"' in rendered.html
+    assert rendered.toc == [{
+        "id": "kurulum-bnowb",
+        "name": "Kurulum &lt;b&gt;now&lt;/b&gt;",
+        "level": 2,
+        "children": [{"id": "ayrıntılar", "name": "Ayrıntılar", "level": 3, "children": []}],
+    }]
+
+
+def test_posts_and_translations_are_rendered_when_saved(client, admin_headers):
+    created = client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": "rendered", "title": "Rendered", "content": "## Setup\n\nText", "published": True},
+    ).json()
+    client.post(
+        f"/api/v1/blog/{created['id']}/translations",
+        headers=admin_headers,
+        json={"language": "tr", "title": "İşlenmiş", "content": "## Kurulum\n\nMetin"},
+    )
+
+    english = client.get("/api/v1/blog/rendered").json()
+    turkish = client.get("/api/v1/blog/rendered?language=tr").json()
+    listed = client.get("/api/v1/blog/").json()["items"][0]
+
+    assert created["content_html"].startswith('<h2 id="setup">Setup')
+    assert [entry["id"] for entry in english["content_toc"]] == ["setup"]
+    assert turkish["content_html"].startswith('<h2 id="kurulum">Kurulum')
+    assert turkish["content_toc"][0]["name"] == "Kurulum"
+    assert "content_html" not in listed and "content_toc" not in listed
+
+
+def test_unchanged_bodies_are_not_rendered_again(client, admin_headers, monkeypatch):
+    created = client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": "render-once", "title": "Once", "content": "Body"},
+    ).json()
+    calls = []
+    original = markdown_renderer.render_markdown
+
+    def counting(source):
+        calls.append(source)
+        return original(source)
+
+    monkeypatch.setattr(markdown_renderer, "render_markdown", counting)
+
+    client.put(f"/api/v1/blog/{created['id']}", headers=admin_headers, json={"title": "Renamed"})
+    updated = client.put(f"/api/v1/blog/{created['id']}", headers=admin_headers, json={"content": "New *body*"})
+
+    assert calls == ["New *body*"]
+    assert updated.json()["content_html"] == "<p>New <em>body</em></p>"
+
+
+def test_render_command_renders_stale_bodies(db_session, create_blog_post):
+    post = create_blog_post(slug="legacy-render", content="## Legacy")
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Eski", content="## Eski"))
+    db_session.commit()
+
+    first = render_blog(db_session, batch_size=1)
+    second = render_blog(db_session)
+    forced = render_blog(db_session, force=True)
+
+    document = read_model.get_document(db_session, read_model.BLOG, "legacy-render", "tr")
+    assert first == forced == {"posts": 1, "translations": 1}
+    assert second == {"posts": 0, "translations": 0}
+    assert '"content_html":"<h2 id=\\"eski\\">Eski' in document
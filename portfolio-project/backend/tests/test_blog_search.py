@@ -0,0 +1,71 @@
+"""Blog full-text search tests."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud import blog_search
+from app.crud.pagination import InvalidCursor, decode_offset_cursor, encode_offset_cursor
+
+
+def _sql(query):
+    return str(query.statement.compile(dialect=postgresql.dialect()))
+
+
+def test_turkish_search_matches_translations_through_the_vectors(db_session):
+    query, translated = blog_search.fulltext_query(db_session, "gömülü sistemler", "tr")
+    sql = _sql(query)
+
+    assert translated == ("title", "excerpt", "word_count", "reading_time")
+    assert "websearch_to_tsquery(%(param" in sql and "::REGCONFIG, %(websearch_to_tsquery" in sql
+    assert "blog_translations.search_vector @@ websearch_to_tsquery" in sql
+    assert "blog_posts.search_vector @@ websearch_to_tsquery" in sql
+    assert "UNION ALL" in sql and "NOT (EXISTS" in sql
+    assert "ts_headline(" in sql
+    assert "ORDER BY matches.rank DESC" in sql
+    assert "blog_posts.content AS" not in sql
+    params = query.statement.compile(dialect=postgresql.dialect()).params
+    assert {"turkish", "english"} <= set(params.values())
+
+
+def test_english_search_only_reads_post_vectors(db_session):
+    sql = _sql(blog_search.fulltext_query(db_session, '"read model" -cache', "en")[0])
+
+    assert "blog_translations" not in sql
+    assert "ts_rank_cd(blog_posts.search_vector" in sql
+
+
+def test_offset_cursors_reject_keyset_cursors():
+    assert decode_offset_cursor(encode_offset_cursor(20)) == 20
+    with pytest.raises(InvalidCursor):
+        decode_offset_cursor("WyIyMDI0Il0")  # ["2024"]
+    with pytest.raises(InvalidCursor):
+        decode_offset_cursor("not base64!")
+
+
+def test_other_databases_fall_back_to_substring_search(client, db_session, create_blog_post):
+    create_blog_post(slug="fallback-hit", title="Searchable Post")
+
+    response = client.get("/api/v1/blog/search?q=Searchable")
+
+    assert blog_search.uses_fulltext(db_session) is False
+    assert [(item["slug"], item["headline"]) for item in response.json()] == [("fallback-hit", None)]
+
+
+def test_ranked_search_pages_by_offset(client, db_session, create_blog_post, monkeypatch):
+    posts = [create_blog_post(slug=f"ranked-{index}") for index in range(3)]
+    calls = []
+
+    def ranked(db, text, language=None, limit=10, published_only=True, cursor=None):
+        calls.append(cursor)
+        offset = decode_offset_cursor(cursor) if cursor else 0
+        return posts[offset:offset + limit]
+
+    monkeypatch.setattr(blog_search, "uses_fulltext", lambda db: True)
+    monkeypatch.setattr(blog_search, "fulltext_search", ranked)
+
+    first = client.get("/api/v1/blog/search?q=ranked&limit=2")
+    rest = client.get(f"/api/v1/blog/search?q=ranked&limit=2&cursor={first.headers['X-Next-Cursor']}")
+
+    assert [item["slug"] for item in first.json() + rest.json()] == ["ranked-0", "ranked-1", "ranked-2"]
+    assert calls == [None, encode_offset_cursor(2)]
+    assert "X-Next-Cursor" not in rest.headers
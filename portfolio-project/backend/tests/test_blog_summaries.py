@@ -0,0 +1,43 @@
+"""Blog list summary projection tests."""
+
+from sqlalchemy import inspect
+
+from app.crud import blog as blog_crud
+from app.models.blog import BlogTranslation
+
+
+def test_list_and_search_leave_out_content(client, db_session, create_blog_post):
+    post = create_blog_post(slug="summarized", title="Summarized", content="Long body " * 500)
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Ozet", content="Uzun metin"))
+    db_session.commit()
+
+    listed = client.get("/api/v1/blog/?language=tr&include=translations").json()["items"]
+    found = client.get("/api/v1/blog/search?q=Summarized").json()
+    detail = client.get("/api/v1/blog/summarized").json()
+
+    assert listed[0]["title"] == "Ozet"
+    assert "content" not in listed[0]
+    assert listed[0]["translations"][0]["title"] == "Ozet"
+    assert "content" not in listed[0]["translations"][0]
+    assert [item["slug"] for item in found] == ["summarized"]
+    assert "content" not in found[0]
+    assert detail["content"].startswith("Long body")
+
+
+def test_list_queries_defer_post_and_translation_bodies(db_session, create_blog_post):
+    post = create_blog_post(slug="deferred-body")
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Baslik", content="Govde"))
+    db_session.commit()
+    db_session.expunge_all()
+
+    (listed,) = blog_crud.get_blog_posts(db_session, include=["translations"])
+    (found,) = blog_crud.search_blog_posts(db_session, search_query="Sample", language="tr")
+
+    assert "content" in inspect(listed).unloaded
+    assert "content" in inspect(listed.translations[0]).unloaded
+    assert found.title == "Baslik"
+    assert "content" in inspect(found._entity).unloaded
+
+
+def test_content_cannot_be_selected_on_lists(client):
+    assert client.get("/api/v1/blog/?fields=slug,content").status_code == 400
@@ -0,0 +1,95 @@
+"""Home bundle endpoint tests."""
+
+import pytest
+
+from app.services.cdn_service import CDNService, InMemoryPurgeBackend
+
+
+class DictCache:
+    redis_client = object()
+
+    def __init__(self):
+        self.store = {}
+
+    async def get_raw(self, key):
+        return self.store.get(key)
+
+    async def set_raw(self, key, value, ttl=3600, only_if_absent=False):
+        if only_if_absent and key in self.store:
+            return
+        self.store[key] = value
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def bundle_cache(monkeypatch, SessionLocal):
+    cache = DictCache()
+    monkeypatch.setattr("app.services.bundle_service.get_cache_service", lambda: cache)
+    monkeypatch.setattr("app.services.bundle_service.SessionLocal", SessionLocal)
+    monkeypatch.setattr(
+        "app.services.invalidation.get_cdn_service",
+        lambda: CDNService(backend=InMemoryPurgeBackend()),
+    )
+    return cache
+
+
+def test_home_bundle_contains_all_home_sections(
+    client, create_project, create_skill, create_experience, create_translation
+):
+    create_project(slug="featured-one", featured=True)
+    create_project(slug="not-featured", featured=False)
+    create_skill(name="Python")
+    create_experience(title="Engineer", experience_type="work")
+    create_translation(language="tr", key="hero.title", value="Merhaba")
+
+    response = client.get("/api/v1/bundle/home?language=tr")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["language"] == "tr"
+    assert [item["slug"] for item in payload["projects"]] == ["featured-one"]
+    assert payload["skills"][0]["name"] == "Python"
+    assert "work" in payload["experiences"]
+    assert payload["translations"] == {"hero.title": "Merhaba"}
+    assert payload["config"] == {}
+    assert payload["github_repos"] == []
+    assert "projects" in response.headers["Surrogate-Key"].split()
+
+
+def test_home_bundle_is_served_from_materialized_copy(client, create_project, bundle_cache):
+    create_project(slug="first", featured=True)
+    first = client.get("/api/v1/bundle/home?language=en")
+    assert "bundle:home:en" in bundle_cache.store
+
+    create_project(slug="second", featured=True)
+    cached = client.get("/api/v1/bundle/home?language=en")
+
+    assert cached.content == first.content
+
+
+def test_home_bundle_is_precomputed_after_content_change(client, admin_headers, bundle_cache):
+    client.get("/api/v1/bundle/home?language=en")
+    assert "bundle:home:en" in bundle_cache.store
+
+    client.post(
+        "/api/v1/projects/",
+        headers=admin_headers,
+        json={"title": "New", "slug": "new", "description": "Body", "featured": True},
+    )
+    assert set(bundle_cache.store) == {"bundle:home:en", "bundle:home:tr"}
+    assert '"slug":"new"' in bundle_cache.store["bundle:home:en"]
+
+    rebuilt = client.get("/api/v1/bundle/home?language=en")
+    assert [item["slug"] for item in rebuilt.json()["projects"]] == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_stale_miss_does_not_overwrite_rebuilt_bundle(bundle_cache):
+    from app.services import bundle_service
+
+    bundle_cache.store["bundle:home:en"] = "fresh"
+    await bundle_service.store_home_bundle("en", "stale")
+
+    assert bundle_cache.store["bundle:home:en"] == "fresh"
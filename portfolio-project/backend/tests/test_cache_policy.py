@@ -0,0 +1,91 @@
+"""CDN cache header and surrogate-key purge tests."""
+
+import pytest
+
+from app.services.cdn_service import CDNService, InMemoryPurgeBackend
+
+
+@pytest.fixture
+def purge_backend(monkeypatch):
+    backend = InMemoryPurgeBackend()
+    service = CDNService(backend=backend)
+    monkeypatch.setattr("app.services.invalidation.get_cdn_service", lambda: service)
+    return backend
+
+
+def test_public_list_carries_cache_policy_and_surrogate_keys(client, create_project):
+    project = create_project(slug="cached-project")
+
+    response = client.get("/api/v1/projects/")
+
+    assert response.status_code == 200
+    cache_control = response.headers["Cache-Control"]
+    assert "public" in cache_control
+    assert "s-maxage=300" in cache_control
+    assert "stale-while-revalidate=" in cache_control
+    assert "Accept-Language" in response.headers["Vary"]
+    keys = response.headers["Surrogate-Key"].split()
+    assert "projects" in keys
+    assert f"project:{project.id}" in keys
+
+
+def test_detail_response_is_tagged_with_entity_keys_only(client, create_project):
+    project = create_project(slug="tagged-project")
+
+    response = client.get("/api/v1/projects/tagged-project")
+
+    assert response.status_code == 200
+    assert response.headers["Surrogate-Key"].split() == [f"project:{project.id}"]
+
+
+def test_blog_detail_bypasses_edge_cache_so_views_are_counted(client, create_blog_post):
+    create_blog_post(slug="counted-post")
+
+    response = client.get("/api/v1/blog/counted-post")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-store"
+    assert "Surrogate-Key" not in response.headers
+
+
+def test_routes_without_entity_tags_fall_back_to_policy_key(client, create_skill):
+    create_skill()
+
+    response = client.get("/api/v1/skills/")
+
+    assert response.headers["Surrogate-Key"] == "skills"
+    assert "s-maxage=3600" in response.headers["Cache-Control"]
+
+
+def test_uncacheable_responses_are_marked_no_store(client, admin_headers):
+    not_found = client.get("/api/v1/projects/missing")
+    authenticated = client.get("/api/v1/projects/", headers=admin_headers)
+    admin_route = client.get("/api/v1/admin/stats", headers=admin_headers)
+    health = client.get("/health")
+
+    for response in (not_found, authenticated, admin_route, health):
+        assert response.headers["Cache-Control"] == "private, no-store"
+        assert "Surrogate-Key" not in response.headers
+
+
+def test_admin_writes_purge_affected_surrogate_keys(client, admin_headers, purge_backend):
+    created = client.post(
+        "/api/v1/projects/",
+        headers=admin_headers,
+        json={"title": "Purged", "slug": "purged", "description": "Body"},
+    )
+    project_id = created.json()["id"]
+    assert purge_backend.purged[-1] == {"projects"}
+
+    client.put(f"/api/v1/projects/{project_id}", headers=admin_headers, json={"featured": True})
+    assert purge_backend.purged[-1] == {"projects", f"project:{project_id}"}
+
+    client.put("/api/v1/translations/en", headers=admin_headers, json={"translations": {"a": "b"}})
+    assert purge_backend.purged[-1] == {"translations"}
+
+
+def test_failed_admin_write_does_not_purge(client, admin_headers, purge_backend, invalid_uuid):
+    response = client.delete(f"/api/v1/blog/{invalid_uuid}", headers=admin_headers)
+
+    assert response.status_code == 404
+    assert purge_backend.purged == []
@@ -0,0 +1,117 @@
+"""Response compression middleware tests."""
+
+import gzip
+import json
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.responses import content_etag
+
+BODY = json.dumps({"items": ["x" * 40] * 100}).encode()
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return Response(BODY, media_type="application/json")
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/image")
+    async def image():
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/cached")
+    async def cached():
+        return Response(BODY, media_type="application/json", headers={"ETag": content_etag(BODY)})
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for index in range(3):
+                yield f'{{"line":{index}}}\n'.encode()
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def test_encoding_negotiation_follows_q_values():
+    assert negotiate_encoding("gzip, deflate", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("br;q=0, *", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding("", ("gzip",)) is None
+
+
+def test_large_text_responses_are_compressed():
+    client = _client()
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+
+def test_small_binary_and_unaccepted_responses_pass_through():
+    client = _client()
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    image = client.get("/image", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    for response in (small, image, identity):
+        assert "content-encoding" not in response.headers
+    assert identity.content == BODY
+
+
+def test_streams_are_compressed_incrementally():
+    client = _client()
+
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode().splitlines() == ['{"line":0}', '{"line":1}', '{"line":2}']
+
+
+def test_cached_bodies_are_compressed_once(monkeypatch):
+    client = _client()
+    calls = []
+    original = compression.compress
+
+    def counting(body, encoding, cached=False):
+        calls.append(cached)
+        return original(body, encoding, cached)
+
+    monkeypatch.setattr(compression, "compress", counting)
+
+    first = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    client.get("/large", headers={"Accept-Encoding": "gzip"})
+    client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert first.content == second.content == BODY
+    assert first.headers["etag"] == f"W/{content_etag(BODY)}"
+    assert calls == [True, False, False]
+
+
+def test_api_lists_are_compressed(client, create_project):
+    for index in range(10):
+        create_project(slug=f"compressed-{index}", description="Description " * 20)
+
+    response = client.get("/api/v1/projects/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["items"]) == 10
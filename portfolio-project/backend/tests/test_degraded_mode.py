@@ -0,0 +1,91 @@
+"""Degraded read-only mode tests."""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.api.deps import get_db
+from app.main import app
+from app.services.degraded_service import STALE_WARNING, DatabaseCircuit
+from app.services.snapshot_service import build_snapshot
+
+PREFIX = "/api/v1"
+
+
+def _database_down():
+    raise OperationalError("SELECT 1", {}, ConnectionRefusedError("connection refused"))
+    yield  # pragma: no cover
+
+
+@pytest.fixture
+def outage():
+    previous = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = _database_down
+    yield
+    app.dependency_overrides[get_db] = previous
+
+
+def test_circuit_opens_after_consecutive_failures_and_closes_on_success():
+    now = [0.0]
+    circuit = DatabaseCircuit(failure_threshold=2, reset_seconds=30, clock=lambda: now[0])
+
+    circuit.record_failure()
+    assert not circuit.is_open
+    circuit.record_failure()
+    assert circuit.is_open
+
+    now[0] = 31.0
+    assert not circuit.is_open
+    circuit.record_failure()
+    assert circuit.is_open
+
+    now[0] = 62.0
+    circuit.record_success()
+    assert not circuit.is_open and circuit.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_public_reads_fall_back_to_the_snapshot(client, db_session, degraded_mode, create_project):
+    create_project(slug="kept-online", title="Kept Online")
+    await build_snapshot(db_session, app, degraded_mode.snapshot_dir)
+    degraded_mode.reload_snapshot()
+    app.dependency_overrides[get_db] = _database_down
+
+    listing = client.get(f"{PREFIX}/projects/?language=en")
+    detail = client.get(f"{PREFIX}/projects/kept-online", headers={"Accept-Encoding": "identity"})
+    missing = client.get(f"{PREFIX}/projects/never-snapshotted")
+
+    assert listing.status_code == 200
+    assert listing.headers["warning"] == STALE_WARNING
+    assert listing.headers["content-encoding"] == "gzip"
+    assert int(listing.headers["age"]) >= 0
+    assert listing.headers["cache-control"] == "private, no-store"
+    assert [item["slug"] for item in listing.json()["items"]] == ["kept-online"]
+    assert detail.json()["title"] == "Kept Online" and "content-encoding" not in detail.headers
+    assert missing.status_code == 503
+    assert degraded_mode.circuit.is_open
+
+
+def test_writes_are_rejected_while_the_circuit_is_open(client, admin_headers, degraded_mode, outage):
+    failed = client.post(f"{PREFIX}/projects/", headers=admin_headers, json={"title": "Nope"})
+    client.get(f"{PREFIX}/projects/")
+    health = client.get("/health").json()
+    rejected = client.delete(f"{PREFIX}/contact/{'0' * 32}", headers=admin_headers)
+
+    assert failed.status_code == 503
+    assert health["read_only"] is True
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "30"
+    assert rejected.json() == {"detail": "The site is temporarily read-only"}
+
+
+def test_successful_request_closes_a_half_open_circuit(client, degraded_mode, create_project):
+    create_project(slug="recovered")
+    degraded_mode.circuit.record_failure()
+    degraded_mode.circuit.record_failure()
+    degraded_mode.circuit.opened_at -= degraded_mode.circuit.reset_seconds
+
+    response = client.get(f"{PREFIX}/projects/recovered")
+
+    assert response.status_code == 200
+    assert "warning" not in response.headers
+    assert degraded_mode.circuit.failures == 0
@@ -0,0 +1,154 @@
+"""Blog feeds and sitemap tests."""
+
+import xml.etree.ElementTree as ET
+
+from app.crud import feeds as feeds_crud
+from app.models.feed import FeedDocument
+from app.utils import feed_xml
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+SITEMAP = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+def _publish(client, admin_headers, slug, published=True, **fields):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": slug.title(), "content": "Body", "published": published, **fields},
+    ).json()["id"]
+
+
+def _xml(client, path, **params):
+    response = client.get(path, params=params)
+    assert response.status_code == 200
+    return ET.fromstring(response.content)
+
+
+def _sitemap_locs(root):
+    return [loc.text for loc in root.iter(f"{SITEMAP}loc")]
+
+
+def _documents(db_session):
+    db_session.expire_all()
+    return {row.name: (row.etag, row.last_modified) for row in db_session.query(FeedDocument)}
+
+
+def test_feeds_list_published_posts_newest_first_per_language(client, admin_headers):
+    assert list(_xml(client, "/feeds/blog.atom").iter(f"{ATOM}entry")) == []
+    assert _sitemap_locs(_xml(client, "/sitemap.xml")) == []
+
+    first = _publish(client, admin_headers, "first", excerpt="Opening <post>")
+    _publish(client, admin_headers, "second")
+    _publish(client, admin_headers, "draft", published=False)
+    client.post(
+        f"/api/v1/blog/{first}/translations",
+        headers=admin_headers,
+        json={"language": "tr", "title": "Birinci", "content": "Gövde"},
+    )
+
+    rss = _xml(client, "/feeds/blog.rss")
+    atom = _xml(client, "/feeds/blog.atom", language="tr")
+
+    assert [item.findtext("title") for item in rss.iter("item")] == ["Second", "First"]
+    assert rss.find("channel/item[2]/description").text == "Opening <post>"
+    assert rss.find("channel/item[2]/link").text.endswith("/blog/first")
+    assert rss.findtext("channel/language") == "en"
+    assert [entry.findtext(f"{ATOM}title") for entry in atom.iter(f"{ATOM}entry")] == ["Second", "Birinci"]
+    assert atom.find(f"{ATOM}entry[2]/{ATOM}id").text == f"urn:uuid:{first}"
+    assert client.get("/feeds/blog.rss?language=de").status_code == 422
+
+
+def test_documents_are_served_stored_and_compressed_with_validators(client, admin_headers, monkeypatch):
+    _publish(client, admin_headers, "cached")
+
+    def no_rendering(*args, **kwargs):
+        raise AssertionError("feed rendered at request time")
+
+    monkeypatch.setattr(feeds_crud, "render_feed", no_rendering)
+    monkeypatch.setattr(feeds_crud, "render_sitemap", no_rendering)
+
+    gzipped = client.get("/feeds/blog.atom", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/feeds/blog.atom", headers={"Accept-Encoding": "identity"})
+    etag, last_modified = plain.headers["ETag"], plain.headers["Last-Modified"]
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.headers["ETag"] == f"W/{etag}"
+    assert gzipped.headers["Content-Type"] == "application/atom+xml"
+    assert gzipped.content == plain.content
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["Cache-Control"].startswith("public")
+    assert set(plain.headers["Surrogate-Key"].split()) == {"feeds", "blog"}
+
+    revalidated = client.get("/feeds/blog.atom", headers={"If-None-Match": gzipped.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["Cache-Control"].startswith("public")
+    assert client.get("/feeds/blog.atom", headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert client.get("/feeds/blog.atom", headers={"If-None-Match": '"stale"'}).status_code == 200
+    assert client.get("/sitemap.xml", headers={"If-None-Match": "*"}).status_code == 304
+
+
+def test_writes_rerender_only_the_changed_entries(client, admin_headers, db_session, monkeypatch):
+    ids = {slug: _publish(client, admin_headers, slug) for slug in ("one", "two", "three")}
+    draft = _publish(client, admin_headers, "draft", published=False)
+    before = _documents(db_session)
+
+    rendered = []
+    render_item = feed_xml.rss_item
+
+    def counting_item(title, *args):
+        rendered.append(title)
+        return render_item(title, *args)
+
+    monkeypatch.setattr(feed_xml, "rss_item", counting_item)
+
+    client.put(f"/api/v1/blog/{draft}", headers=admin_headers, json={"title": "Still a draft"})
+    assert _documents(db_session) == before
+
+    client.put(f"/api/v1/blog/{ids['two']}", headers=admin_headers, json={"title": "Two, edited"})
+    assert rendered == ["Two, edited", "Two, edited"]
+    assert _documents(db_session)["blog.rss:en"] != before["blog.rss:en"]
+
+    client.put(f"/api/v1/blog/{ids['one']}", headers=admin_headers, json={"published": False})
+    client.delete(f"/api/v1/blog/{ids['three']}", headers=admin_headers)
+
+    rss = _xml(client, "/feeds/blog.rss")
+    assert [item.findtext("title") for item in rss.iter("item")] == ["Two, edited"]
+    locs = _sitemap_locs(_xml(client, "/sitemap.xml"))
+    assert [loc for loc in locs if "/blog/" in loc] == [rss.findtext("channel/item/link")]
+
+
+def test_sitemap_splits_into_an_index_of_stable_pages(client, admin_headers, db_session, monkeypatch):
+    monkeypatch.setattr(feeds_crud, "SITEMAP_PAGE_SIZE", 2)
+    client.post(
+        "/api/v1/projects/",
+        headers=admin_headers,
+        json={"title": "Tool", "slug": "tool", "description": "Description"},
+    )
+    ids = [_publish(client, admin_headers, slug) for slug in ("alpha", "beta", "gamma")]
+
+    index = _xml(client, "/sitemap.xml")
+    pages = [_xml(client, f"/sitemaps/{page}.xml") for page in (1, 2, 3)]
+    urls = {
+        loc: url.findtext(f"{SITEMAP}lastmod")
+        for page in pages for url in page.iter(f"{SITEMAP}url") for loc in [url.findtext(f"{SITEMAP}loc")]
+    }
+
+    assert index.tag == f"{SITEMAP}sitemapindex"
+    assert [loc.rsplit("/", 1)[1] for loc in _sitemap_locs(index)] == ["1.xml", "2.xml", "3.xml"]
+    assert [len(_sitemap_locs(page)) for page in pages] == [2, 2, 2]
+    assert {loc.split("3000", 1)[1] for loc in urls} == {
+        "/", "/projects", "/blog", "/blog/alpha", "/blog/beta", "/blog/gamma"
+    }
+    assert all(urls.values())
+    assert client.get("/sitemaps/4.xml").status_code == 404
+
+    # Removing a URL leaves the other pages as they were
+    before = _documents(db_session)
+    client.delete(f"/api/v1/blog/{ids[0]}", headers=admin_headers)
+    after = _documents(db_session)
+    assert after["sitemap-3"] == before["sitemap-3"]
+    assert after["sitemap-2"] != before["sitemap-2"]
+
+    assert feeds_crud.rebuild_feeds(db_session) == {"posts": 2, "sitemap pages": 3}
+    assert len(_sitemap_locs(_xml(client, "/sitemap.xml"))) == 3
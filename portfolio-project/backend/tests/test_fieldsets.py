@@ -0,0 +1,95 @@
+"""Sparse fieldset (fields= / include=) tests."""
+
+from sqlalchemy import inspect
+
+from app.crud import blog as blog_crud
+from app.crud import project as project_crud
+from app.models.blog import BlogTranslation
+from app.models.project import ProjectTechnology
+
+
+def test_project_list_returns_only_requested_fields_and_relations(
+    client, db_session, create_project, create_technology
+):
+    project = create_project(slug="sparse-project")
+    tech = create_technology(slug="fastapi")
+    db_session.add(ProjectTechnology(project_id=project.id, technology_id=tech.id))
+    db_session.commit()
+
+    response = client.get("/api/v1/projects/?fields=slug,title&include=technologies")
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert set(item) == {"id", "slug", "title", "technologies"}
+    assert item["technologies"][0]["slug"] == "fastapi"
+    assert f"project:{project.id}" in response.headers["Surrogate-Key"].split()
+
+
+def test_project_list_without_parameters_keeps_full_shape(client, create_project):
+    create_project()
+
+    item = client.get("/api/v1/projects/").json()["items"][0]
+
+    assert {"description", "technologies", "translations", "images"} <= set(item)
+
+
+def test_blog_list_can_drop_content(client, create_blog_post):
+    create_blog_post(slug="card-post", content="Very long body")
+
+    response = client.get("/api/v1/blog/?fields=slug,title,excerpt")
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item == {"id": item["id"], "slug": "card-post", "title": "Post 1", "excerpt": "Sample excerpt"}
+    assert response.json()["total"] == 1
+
+
+def test_skill_and_experience_lists_accept_empty_include(client, create_skill, create_experience):
+    create_skill(name="Python")
+    create_experience(title="Engineer")
+
+    skill = client.get("/api/v1/skills/?fields=name&include=").json()["skills"][0]
+    experience = client.get("/api/v1/experiences/?include=").json()["experiences"][0]
+
+    assert set(skill) == {"id", "name"}
+    assert experience["title"] == "Engineer"
+    assert "translations" not in experience
+
+
+def test_unknown_fields_are_rejected(client):
+    assert client.get("/api/v1/projects/?fields=slug,secret").status_code == 400
+    assert client.get("/api/v1/blog/?include=author").status_code == 400
+
+
+def test_sparse_queries_defer_unselected_columns_and_skip_eager_loads(
+    db_session, create_project, create_blog_post
+):
+    create_project(slug="deferred-project")
+    create_blog_post(slug="deferred-post")
+    db_session.expunge_all()
+
+    post = blog_crud.get_blog_posts(db_session, columns=("slug", "title"), include=(), language="en")[0]
+    project = project_crud.get_projects(db_session, columns=("slug", "cover_image"), include=())[0]
+
+    post_state = inspect(post)
+    project_state = inspect(project)
+    assert {"content", "excerpt", "translations"} <= post_state.unloaded
+    assert "slug" not in post_state.unloaded
+    assert {"description", "title", "translations", "technologies", "images"} <= project_state.unloaded
+
+
+def test_sparse_translated_queries_resolve_translations_in_sql(db_session, create_blog_post):
+    post = create_blog_post(slug="translated-post", content="English body")
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Baslik", content="Govde"))
+    db_session.commit()
+    db_session.expunge_all()
+
+    loaded = blog_crud.get_blog_posts(db_session, columns=("slug", "title"), include=(), language="tr")[0]
+
+    assert loaded.title == "Baslik"
+    loaded_objects = list(db_session.identity_map.values())
+    assert not any(isinstance(obj, BlogTranslation) for obj in loaded_objects)
+    (base,) = loaded_objects
+    assert {"content", "translations"} <= inspect(base).unloaded
+    assert base.title != "Baslik"
+    assert not db_session.dirty
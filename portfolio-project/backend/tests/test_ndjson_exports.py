@@ -0,0 +1,105 @@
+"""NDJSON export tests."""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from app.crud import blog as blog_crud
+from app.models.blog import BlogTranslation
+from app.models.github import GitHubRepo
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_blog_export_streams_every_matching_post(client, db_session, create_blog_post):
+    posts = [create_blog_post(slug=f"export-{index}") for index in range(3)]
+    create_blog_post(slug="draft", published=False)
+    db_session.add(BlogTranslation(blog_post_id=posts[0].id, language="tr", title="Baslik", content="Icerik"))
+    db_session.commit()
+
+    response = client.get("/api/v1/blog/?limit=1&language=tr", headers=NDJSON)
+    lines = _lines(response)
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "Accept" in response.headers["vary"]
+    assert sorted(line["slug"] for line in lines) == ["export-0", "export-1", "export-2"]
+    assert {line["slug"]: line["title"] for line in lines}["export-0"] == "Baslik"
+
+
+def test_blog_export_honours_sparse_fieldsets(client, create_blog_post):
+    create_blog_post(slug="sparse-export")
+
+    response = client.get(
+        "/api/v1/blog/?fields=slug&include=translations",
+        headers={"Accept": "application/json;q=0.5, application/x-ndjson"},
+    )
+
+    (line,) = _lines(response)
+    assert line == {"id": line["id"], "slug": "sparse-export", "translations": []}
+
+
+def test_json_lists_vary_on_accept(client, create_blog_post):
+    create_blog_post()
+
+    response = client.get("/api/v1/blog/")
+
+    assert response.headers["content-type"] == "application/json"
+    assert "Accept" in response.headers["vary"]
+
+
+def test_export_fetches_rows_in_batches(db_session, create_blog_post, statements):
+    for index in range(5):
+        create_blog_post(slug=f"batched-{index}")
+    statements.clear()
+
+    posts = list(blog_crud.iter_blog_posts(db_session, include=["translations"], batch_size=2))
+
+    assert len(posts) == 5
+    # One translations load per batch of parent rows
+    assert len([sql for sql in statements if "FROM blog_translations" in sql]) == 3
+
+
+def test_contact_export_requires_admin(client, admin_headers, create_contact_message):
+    create_contact_message(is_read=True)
+    create_contact_message()
+
+    unauth = client.get("/api/v1/contact/", headers=NDJSON)
+    everything = client.get("/api/v1/contact/?limit=1", headers={**NDJSON, **admin_headers})
+    unread = client.get("/api/v1/contact/?unread_only=true", headers={**NDJSON, **admin_headers})
+
+    assert unauth.status_code == 401
+    assert len(_lines(everything)) == 2
+    assert [line["is_read"] for line in _lines(unread)] == [False]
+
+
+def test_github_export_streams_cached_repos(client, db_session):
+    for index in range(3):
+        db_session.add(GitHubRepo(
+            repo_name=f"repo-{index}",
+            full_name=f"owner/repo-{index}",
+            url=f"https://github.com/owner/repo-{index}",
+            stars=index,
+            topics=[],
+        ))
+    db_session.commit()
+
+    response = client.get("/api/v1/github/repos?limit=1", headers=NDJSON)
+
+    assert [line["repo_name"] for line in _lines(response)] == ["repo-2", "repo-1", "repo-0"]
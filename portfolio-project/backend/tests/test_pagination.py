@@ -0,0 +1,80 @@
+"""Keyset (cursor) pagination tests."""
+
+from datetime import datetime, timedelta, timezone
+
+
+MAX_PAGES = 20
+
+
+def _walk(client, url, collection, headers=None):
+    seen, cursor = [], None
+    for _ in range(MAX_PAGES):
+        page_url = f"{url}&cursor={cursor}" if cursor else url
+        body = client.get(page_url, headers=headers).json()
+        seen.extend(item["id"] for item in body[collection])
+        cursor = body["next_cursor"]
+        if not cursor:
+            return seen
+    raise AssertionError(f"Cursor pagination did not finish within {MAX_PAGES} pages")
+
+
+def test_project_cursor_walk_matches_offset_order(client, create_project):
+    for index in range(5):
+        create_project(slug=f"paged-{index}", display_order=index % 2)
+
+    offset_ids = [item["id"] for item in client.get("/api/v1/projects/?limit=100").json()["items"]]
+    cursor_ids = _walk(client, "/api/v1/projects/?limit=2", "items")
+
+    assert len(offset_ids) == 5
+    assert cursor_ids == offset_ids
+
+
+def test_blog_cursor_pages_by_published_at(client, db_session, create_blog_post):
+    now = datetime.now(timezone.utc)
+    for index in range(3):
+        post = create_blog_post(slug=f"dated-{index}")
+        post.published_at = now - timedelta(days=index)
+    db_session.commit()
+
+    first = client.get("/api/v1/blog/?limit=2").json()
+    second = client.get(f"/api/v1/blog/?limit=2&cursor={first['next_cursor']}").json()
+
+    assert [item["slug"] for item in first["items"]] == ["dated-0", "dated-1"]
+    assert [item["slug"] for item in second["items"]] == ["dated-2"]
+    assert second["next_cursor"] is None
+    assert first["total"] == 3
+    assert second["total"] is None and second["page"] is None
+
+
+def test_search_returns_next_cursor_header(client, create_blog_post):
+    for index in range(3):
+        create_blog_post(slug=f"findable-{index}", title=f"Findable {index}")
+
+    first = client.get("/api/v1/blog/search?q=Findable&limit=2")
+    rest = client.get(f"/api/v1/blog/search?q=Findable&limit=2&cursor={first.headers['X-Next-Cursor']}")
+
+    slugs = [post["slug"] for post in first.json() + rest.json()]
+    assert sorted(slugs) == ["findable-0", "findable-1", "findable-2"]
+    assert "X-Next-Cursor" not in rest.headers
+
+
+def test_contact_and_experience_cursors(client, admin_headers, create_contact_message, create_experience):
+    for _ in range(3):
+        create_contact_message()
+        create_experience()
+
+    messages = _walk(client, "/api/v1/contact/?limit=2", "messages", headers=admin_headers)
+    experiences = _walk(client, "/api/v1/experiences/?limit=2", "experiences")
+
+    assert len(set(messages)) == 3
+    assert len(set(experiences)) == 3
+
+
+def test_invalid_cursor_is_rejected(client, create_project):
+    create_project()
+
+    assert client.get("/api/v1/projects/?cursor=not-a-cursor").status_code == 400
+    # A blog cursor has two components and does not fit the three project sort keys
+    assert client.get("/api/v1/projects/?cursor=WzEsMl0").status_code == 400
+    # Right length, wrong value types for (display_order, created_at, id)
+    assert client.get("/api/v1/projects/?cursor=WyJ4IiwieSIsInoiXQ").status_code == 400
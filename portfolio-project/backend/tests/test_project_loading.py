@@ -0,0 +1,35 @@
+"""Project collection loading tests."""
+
+from sqlalchemy import event
+
+from app.models.project import ProjectImage, ProjectTechnology
+
+
+def test_project_page_loads_collections_without_row_product(
+    client, db_session, engine, create_project, create_technology
+):
+    project = create_project(slug="gallery")
+    for position in (3, 1, 2):
+        db_session.add(ProjectImage(project_id=project.id, image_url=f"{position}.png", display_order=position))
+    for index in range(3):
+        tech = create_technology(slug=f"tech-{index}", name=f"Tech {index}")
+        db_session.add(ProjectTechnology(project_id=project.id, technology_id=tech.id))
+    db_session.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/projects/")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    item = response.json()["items"][0]
+    assert [image["display_order"] for image in item["images"]] == [1, 2, 3]
+    assert len(item["technologies"]) == 3
+    page_query = next(sql for sql in statements if "FROM projects" in sql)
+    assert "JOIN project_images" not in page_query
+    assert "JOIN project_technologies" not in page_query
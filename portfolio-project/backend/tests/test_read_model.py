@@ -0,0 +1,147 @@
+"""Content read model tests."""
+
+import json
+import uuid
+
+import pytest
+
+from app.crud import read_model
+from app.models.read_model import ContentReadModel
+from app.tools.rebuild_read_model import rebuild_read_model
+
+
+def _documents(db_session, entity_type):
+    db_session.expire_all()
+    return {
+        row.language: json.loads(row.document)
+        for row in db_session.query(ContentReadModel).filter(ContentReadModel.entity_type == entity_type)
+    }
+
+
+def _tamper(db_session, entity_type, language, **changes):
+    row = db_session.query(ContentReadModel).filter(
+        ContentReadModel.entity_type == entity_type, ContentReadModel.language == language
+    ).one()
+    row.document = json.dumps({**json.loads(row.document), **changes})
+    db_session.commit()
+
+
+def _create_project(client, admin_headers, **overrides):
+    payload = {
+        "title": "Read Model Project",
+        "slug": "read-model-project",
+        "description": "Description",
+        "short_description": "Short",
+        **overrides,
+    }
+    response = client.post("/api/v1/projects/", json=payload, headers=admin_headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_project_writes_materialize_documents_per_language(client, admin_headers, db_session):
+    project = _create_project(client, admin_headers)
+
+    client.post(
+        f"/api/v1/projects/{project['id']}/translations",
+        headers=admin_headers,
+        json={"language": "tr", "title": "Okuma Modeli", "description": "Aciklama"},
+    )
+    documents = _documents(db_session, read_model.PROJECT)
+
+    assert set(documents) == {"en", "tr"}
+    assert documents["en"]["title"] == "Read Model Project"
+    assert documents["tr"]["title"] == "Okuma Modeli"
+
+    client.put(f"/api/v1/projects/{project['id']}", headers=admin_headers, json={"title": "Renamed"})
+
+    assert _documents(db_session, read_model.PROJECT)["en"]["title"] == "Renamed"
+
+    client.delete(f"/api/v1/projects/{project['id']}", headers=admin_headers)
+
+    assert _documents(db_session, read_model.PROJECT) == {}
+
+
+def test_project_list_and_detail_are_served_from_documents(client, admin_headers, db_session):
+    _create_project(client, admin_headers)
+    _tamper(db_session, read_model.PROJECT, "en", title="From Document")
+
+    listed = client.get("/api/v1/projects/").json()
+    detail = client.get("/api/v1/projects/read-model-project").json()
+
+    assert listed["total"] == 1
+    assert listed["items"][0]["title"] == "From Document"
+    assert detail["title"] == "From Document"
+
+
+def test_technology_changes_rewrite_embedding_projects(client, admin_headers, db_session, create_technology):
+    technology = create_technology(name="Rust", slug="rust")
+    _create_project(client, admin_headers, technology_ids=[str(technology.id)])
+
+    client.put(f"/api/v1/technologies/{technology.id}", headers=admin_headers, json={"name": "Rust Lang"})
+
+    assert _documents(db_session, read_model.PROJECT)["en"]["technologies"][0]["name"] == "Rust Lang"
+
+    client.delete(f"/api/v1/technologies/{technology.id}", headers=admin_headers)
+
+    assert _documents(db_session, read_model.PROJECT)["en"]["technologies"] == []
+
+
+def test_projects_without_documents_fall_back_to_tables(client, create_project):
+    create_project(slug="legacy-project", title="Legacy")
+
+    listed = client.get("/api/v1/projects/").json()
+    detail = client.get("/api/v1/projects/legacy-project")
+
+    assert listed["items"][0]["title"] == "Legacy"
+    assert detail.status_code == 200
+    assert detail.json()["title"] == "Legacy"
+
+
+@pytest.mark.asyncio
+async def test_blog_documents_merge_the_live_view_count(
+    client, admin_headers, db_session, view_counter, SessionLocal
+):
+    created = client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": "documented-post", "title": "Documented", "content": "Body", "published": True},
+    ).json()
+    _tamper(db_session, read_model.BLOG, "en", title="From Document")
+    _tamper(db_session, read_model.BLOG_SUMMARY, "en", title="From Summary")
+
+    first = client.get("/api/v1/blog/documented-post").json()
+    second = client.get("/api/v1/blog/documented-post", headers={"User-Agent": "second-visitor"}).json()
+    await view_counter.flush(SessionLocal)
+    db_session.expire_all()
+    listed = client.get("/api/v1/blog/").json()
+
+    assert "views" not in _documents(db_session, read_model.BLOG)["en"]
+    assert first["title"] == "From Document"
+    assert (first["views"], second["views"]) == (1, 2)
+    assert listed["items"][0]["title"] == "From Summary"
+    assert listed["items"][0]["views"] == 2
+    assert "content" not in listed["items"][0]
+
+    client.delete(f"/api/v1/blog/{created['id']}", headers=admin_headers)
+
+    assert client.get("/api/v1/blog/documented-post").status_code == 404
+    assert _documents(db_session, read_model.BLOG_SUMMARY) == {}
+
+
+def test_rebuild_materializes_existing_rows(db_session, create_project, create_blog_post):
+    project = create_project(slug="existing-project")
+    create_blog_post(slug="existing-post")
+    db_session.add(ContentReadModel(
+        entity_type=read_model.PROJECT, entity_id=uuid.uuid4(), language="en", slug="stale", document="{}"
+    ))
+    db_session.commit()
+
+    rebuilt = rebuild_read_model(db_session)
+
+    assert rebuilt == {read_model.PROJECT: 1, read_model.BLOG: 1}
+    projects = db_session.query(ContentReadModel.entity_id, ContentReadModel.slug).filter(
+        ContentReadModel.entity_type == read_model.PROJECT
+    ).distinct().all()
+    assert projects == [(project.id, "existing-project")]
+    assert set(_documents(db_session, read_model.BLOG)) == {"en", "tr"}
@@ -0,0 +1,114 @@
+"""Related blog posts tests."""
+
+from app.crud import related as related_crud
+from app.models.blog import BlogPostVector, BlogRelatedPost, BlogTermFrequency
+from app.utils.tfidf import TfidfModel
+
+POSTS = {
+    "asyncio-basics": ("Asyncio basics", "Event loop coroutines and asyncio tasks in Python"),
+    "asyncio-patterns": ("Asyncio patterns", "Cancelling asyncio tasks and coroutines on the event loop"),
+    "sourdough": ("Sourdough bread", "Feeding a sourdough starter and baking bread at home"),
+    "rye-bread": ("Rye bread", "Baking dense rye bread with a sourdough starter"),
+}
+
+
+def _publish(client, admin_headers, slug, title, content):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": title, "content": content, "published": True},
+    ).json()
+
+
+def _publish_all(client, admin_headers):
+    return {slug: _publish(client, admin_headers, slug, *text)["id"] for slug, text in POSTS.items()}
+
+
+def _related(client, slug, **params):
+    response = client.get(f"/api/v1/blog/{slug}/related", params=params)
+    assert response.status_code == 200
+    return [item["slug"] for item in response.json()]
+
+
+def _frequencies(db_session):
+    return {
+        (row.language, row.term): row.documents
+        for row in db_session.query(BlogTermFrequency)
+    }
+
+
+def test_tfidf_neighbours_rank_shared_rare_terms_first():
+    model = TfidfModel({
+        "a": {"every": 1, "asyncio": 3, "loop": 1},
+        "b": {"every": 2, "asyncio": 1},
+        "c": {"every": 1, "loop": 1},
+        "d": {"every": 1, "bread": 2},
+        "e": {"bread": 1},
+    })
+
+    assert model.vectors["a"]["every"] < model.vectors["a"]["loop"] < model.vectors["a"]["asyncio"]
+    assert [key for key, _ in model.neighbors("a", 5)] == ["b", "c", "d"]
+    assert [key for key, _ in model.neighbors("a", 1)] == ["b"]
+    assert [key for key, _ in model.neighbors("e", 5)] == ["d"]
+
+
+def test_related_posts_are_served_per_language(client, admin_headers, monkeypatch):
+    ids = _publish_all(client, admin_headers)
+    client.post(
+        f"/api/v1/blog/{ids['sourdough']}/translations",
+        headers=admin_headers,
+        json={"language": "tr", "title": "Ekşi maya", "content": "Asyncio olay döngüsü ve eşyordamlar"},
+    )
+
+    # Served from the stored lists alone
+    def no_scoring(*args, **kwargs):
+        raise AssertionError("similarity computed at request time")
+
+    monkeypatch.setattr(related_crud, "_similar", no_scoring)
+
+    assert _related(client, "asyncio-basics")[0] == "asyncio-patterns"
+    assert _related(client, "rye-bread", limit=1) == ["sourdough"]
+    assert _related(client, "sourdough", language="tr")[0] in {"asyncio-basics", "asyncio-patterns"}
+    assert _related(client, "rye-bread", language="tr") == []
+    assert client.get("/api/v1/blog/missing/related").status_code == 404
+    assert client.get("/api/v1/blog/asyncio-basics/related?limit=11").status_code == 422
+
+
+def test_edits_touch_only_the_vectors_of_the_changed_post(client, admin_headers, db_session):
+    ids = _publish_all(client, admin_headers)
+    vectors = {
+        (str(row.blog_post_id), row.language, row.term): row.weight for row in db_session.query(BlogPostVector)
+    }
+
+    client.put(
+        f"/api/v1/blog/{ids['rye-bread']}",
+        headers=admin_headers,
+        json={"title": "Rye coroutines", "content": "Asyncio tasks for a bread oven timer on the event loop"},
+    )
+    db_session.expire_all()
+    edited = {
+        (str(row.blog_post_id), row.language, row.term): row.weight for row in db_session.query(BlogPostVector)
+    }
+
+    def others(weights):
+        return {key: weight for key, weight in weights.items() if key[0] != ids["rye-bread"]}
+
+    assert others(edited) == others(vectors)
+    assert edited != vectors
+    assert "rye-bread" in _related(client, "asyncio-basics")[:2]
+    assert _related(client, "sourdough")[0] == "rye-bread"
+
+
+def test_unpublished_and_deleted_posts_leave_every_list(client, admin_headers, db_session):
+    ids = _publish_all(client, admin_headers)
+
+    client.put(f"/api/v1/blog/{ids['sourdough']}", headers=admin_headers, json={"published": False})
+    client.delete(f"/api/v1/blog/{ids['asyncio-patterns']}", headers=admin_headers)
+    db_session.expire_all()
+    incremental = _frequencies(db_session)
+    listed = {str(post_id) for (post_id,) in db_session.query(BlogRelatedPost.related_post_id)}
+
+    assert _related(client, "rye-bread") == []
+    assert {ids["sourdough"], ids["asyncio-patterns"]}.isdisjoint(listed)
+    assert related_crud.rebuild_related_posts(db_session) == {"en": 2, "tr": 2}
+    assert incremental == _frequencies(db_session)
@@ -0,0 +1,127 @@
+"""In-process blog search index tests."""
+
+from sqlalchemy import event
+
+from app.crud import blog_search
+from app.models.blog import BlogTranslation
+from app.services.search_index import MappedSegment, SearchIndex, rebuild_search_index
+from app.utils.tokenizer import fold, tokenize
+
+
+def _document(key):
+    return f'{{"id":"{key}"}}'.encode()
+
+
+def _keys(hits):
+    return [key for key, _ in hits]
+
+
+def test_tokens_fold_turkish_case_and_diacritics():
+    assert fold("İSTANBUL", "tr") == fold("Istanbul", "en") == "istanbul"
+    assert fold("IŞIK", "tr") == "isik"
+    assert tokenize("Gömülü Sistemler; C++ & Rust_2024!", "tr") == ["gomulu", "sistemler", "c", "rust", "2024"]
+    assert tokenize("Crème brûlée", "en") == ["creme", "brulee"]
+
+
+def test_bm25_prefers_rare_terms_and_title_matches(tmp_path):
+    index = SearchIndex(tmp_path).index("en")
+    index.replace([
+        ("body", ("Notes", "", "rust rust " + "filler " * 50), _document("body")),
+        ("title", ("Rust in production", "", "filler " * 50), _document("title")),
+        ("other", ("Python", "", "filler " * 10), _document("other")),
+    ], "w1")
+
+    assert _keys(index.search("rust", 10)) == ["title", "body"]
+    assert sorted(_keys(index.search("RUST python", 10))) == ["body", "other", "title"]
+    assert index.search("RUST python", 1, offset=2) == index.search("RUST python", 3)[2:]
+    assert index.search("missing", 10) == []
+    assert index.search("production", 10)[0][1] == _document("title")
+
+
+def test_saved_segments_are_mapped_and_take_incremental_writes(tmp_path):
+    index = SearchIndex(tmp_path).index("tr")
+    index.replace([
+        ("a", ("Gömülü sistemler", "", "mikrodenetleyici"), _document("a")),
+        ("b", ("Web", "", "istanbul"), _document("b")),
+    ], "w1")
+    index.save()
+
+    reopened = SearchIndex(tmp_path)
+    assert reopened.load("w1") is False  # the English segment was never written
+    mapped = reopened.index("tr")
+    assert isinstance(mapped._segments[0], MappedSegment)
+    assert _keys(mapped.search("GOMULU", 10)) == ["a"]
+
+    mapped.upsert("b", ("Web", "", "gömülü"), _document("b2"))
+    mapped.remove("a")
+    mapped.upsert("c", ("İstanbul", "", ""), _document("c"))
+    assert mapped.search("gomulu istanbul", 10) == [("c", _document("c")), ("b", _document("b2"))]
+
+    mapped.save()
+    assert mapped.dirty is False and mapped.document_count == 2
+    assert _keys(mapped.search("gömülü", 10)) == ["b"]
+
+
+def test_workers_follow_a_segment_saved_elsewhere(tmp_path):
+    writer = SearchIndex(tmp_path).index("en")
+    writer.replace([("a", ("First", "", ""), _document("a"))], "w1")
+    writer.save()
+    reader = SearchIndex(tmp_path).index("en")
+    reader.load()
+
+    writer.upsert("b", ("Second", "", ""), _document("b"))
+    writer.save()
+
+    assert _keys(reader.search("second", 10)) == ["b"]
+
+
+def test_search_endpoint_answers_from_the_index(client, db_session, search_index, create_blog_post):
+    post = create_blog_post(slug="embedded", title="Embedded systems", content="Interrupt handlers")
+    create_blog_post(slug="draft", title="Embedded draft", published=False)
+    create_blog_post(slug="web", title="Web", content="Embedded widgets in a page " * 5)
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Gömülü sistemler", content="Kesme"))
+    db_session.commit()
+    rebuild_search_index(db_session, search_index)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", record)
+    try:
+        english = client.get("/api/v1/blog/search?q=embedded&limit=1")
+        rest = client.get(f"/api/v1/blog/search?q=embedded&limit=1&cursor={english.headers['X-Next-Cursor']}")
+        turkish = client.get("/api/v1/blog/search?q=GOMULU&language=tr")
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", record)
+
+    assert statements == []
+    assert [item["slug"] for item in english.json() + rest.json()] == ["embedded", "web"]
+    assert english.json()[0]["headline"] is None
+    assert f"blog:{post.id}" in english.headers["Surrogate-Key"]
+    assert [(item["slug"], item["title"]) for item in turkish.json()] == [("embedded", "Gömülü sistemler")]
+
+
+def test_admin_writes_update_and_save_the_index(client, db_session, search_index, admin_headers):
+    rebuild_search_index(db_session, search_index)
+    payload = {"slug": "indexed", "title": "Freshly indexed", "content": "Body", "published": True}
+
+    created = client.post("/api/v1/blog/", json=payload, headers=admin_headers).json()
+    found = client.get("/api/v1/blog/search?q=freshly").json()
+    client.post(
+        f"/api/v1/blog/{created['id']}/translations",
+        json={"language": "tr", "title": "Yeni yazı", "content": "Gövde"},
+        headers=admin_headers,
+    )
+    translated = client.get("/api/v1/blog/search?q=yazi&language=tr").json()
+
+    saved = SearchIndex(search_index.directory)
+    assert saved.load(blog_search.index_watermark(db_session))
+    assert _keys(saved.search("gövde", "tr", 10)) == [created["id"]]
+
+    client.delete(f"/api/v1/blog/{created['id']}", headers=admin_headers)
+
+    assert [item["slug"] for item in found] == ["indexed"]
+    assert [item["title"] for item in translated] == ["Yeni yazı"]
+    assert client.get("/api/v1/blog/search?q=freshly").json() == []
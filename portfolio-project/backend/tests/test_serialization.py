@@ -0,0 +1,67 @@
+"""Response serialization tests."""
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+
+from app.schemas.blog import BlogPostListResponse
+from app.serializers.encoders import dump_json, dumps, list_envelope, merge_fields
+
+
+def test_dumps_encodes_native_values():
+    identifier = uuid.uuid4()
+    payload = {"id": identifier, "at": datetime(2024, 5, 1, 12, tzinfo=timezone.utc), "on": date(2024, 5, 1)}
+
+    assert json.loads(dumps(payload)) == {
+        "id": str(identifier),
+        "at": "2024-05-01T12:00:00+00:00",
+        "on": "2024-05-01",
+    }
+
+
+def test_encoded_documents_are_spliced_without_parsing():
+    body = list_envelope(['{"id":1}', b'{"id":2}'], total=2, next_cursor=None)
+
+    assert json.loads(body) == {"items": [{"id": 1}, {"id": 2}], "total": 2, "next_cursor": None}
+    assert json.loads(list_envelope([])) == {"items": []}
+    assert json.loads(merge_fields('{"id":1}', views=3)) == {"id": 1, "views": 3}
+    assert json.loads(merge_fields("{}", views=3)) == {"views": 3}
+
+
+def test_dump_json_matches_model_validation(db_session, create_blog_post):
+    post = create_blog_post(slug="encoded-post")
+    payload = {"items": [post], "total": 1, "page": 1, "size": 20, "pages": 1}
+
+    encoded = json.loads(dump_json(BlogPostListResponse, payload))
+
+    assert encoded == BlogPostListResponse.model_validate(payload).model_dump(mode="json")
+
+
+def test_project_routes_return_the_stored_document(client, admin_headers):
+    created = client.post(
+        "/api/v1/projects/",
+        json={"title": "Encoded", "slug": "encoded", "description": "Description"},
+        headers=admin_headers,
+    ).json()
+
+    listed = client.get("/api/v1/projects/")
+    detail = client.get("/api/v1/projects/encoded")
+
+    assert listed.headers["content-type"] == "application/json"
+    assert listed.json()["items"] == [detail.json()]
+    assert detail.json()["id"] == created["id"]
+    assert f"project:{created['id']}" in detail.headers["surrogate-key"]
+
+
+def test_sparse_and_relational_lists_use_the_fast_encoders(client, create_blog_post, create_experience):
+    create_blog_post(slug="sparse-post")
+    create_experience()
+
+    sparse = client.get("/api/v1/blog/?fields=slug,published_at")
+    posts = client.get("/api/v1/blog/")
+    experiences = client.get("/api/v1/experiences/")
+
+    assert sparse.json()["items"][0]["slug"] == "sparse-post"
+    assert posts.json()["items"][0]["slug"] == "sparse-post"
+    assert "blog:" in posts.headers["surrogate-key"]
+    assert experiences.json()["total"] == 1
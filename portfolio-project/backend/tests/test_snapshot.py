@@ -0,0 +1,74 @@
+"""Public API snapshot tests."""
+
+import gzip
+import json
+
+import pytest
+
+from app.crud import blog as blog_crud
+from app.main import app
+from app.schemas.blog import BlogPostUpdate
+from app.services.snapshot_service import SnapshotStore, build_snapshot, canonical_url
+
+PREFIX = "/api/v1"
+
+
+def _read(store, url):
+    path, entry = store.lookup(url)
+    body = path.read_bytes()
+    assert gzip.decompress(path.with_name(path.name + ".gz").read_bytes()) == body
+    return json.loads(body), entry
+
+
+def test_canonical_urls_drop_default_parameters():
+    assert canonical_url(f"{PREFIX}/projects/", {"language": "en", "skip": "0"}) == f"{PREFIX}/projects/"
+    assert canonical_url(f"{PREFIX}/blog/", {"skip": "20", "language": "tr"}) == f"{PREFIX}/blog/?language=tr&skip=20"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_renders_public_responses(client, db_session, tmp_path, create_project, create_blog_post):
+    create_project(slug="snap-project", title="Snapshot Project")
+    post = create_blog_post(slug="snap-post", views=7)
+    create_blog_post(slug="snap-draft", published=False)
+
+    result = await build_snapshot(db_session, app, tmp_path)
+    store = SnapshotStore(tmp_path)
+
+    project, _ = _read(store, f"{PREFIX}/projects/snap-project")
+    translated, _ = _read(store, f"{PREFIX}/projects/snap-project?language=tr")
+    blog, entry = _read(store, f"{PREFIX}/blog/snap-post")
+    listing, _ = _read(store, f"{PREFIX}/projects/?language=tr")
+
+    assert result.written == len(store.entries) and result.removed == 0
+    assert project["title"] == translated["title"] == "Snapshot Project"
+    assert blog["views"] == 7 and entry["entity"] == f"blog:{post.id}"
+    assert [item["slug"] for item in listing["items"]] == ["snap-project"]
+    assert f"{PREFIX}/skills/?language=tr" in store.entries
+    assert f"{PREFIX}/blog/snap-draft" not in store.entries
+    assert client.get(f"{PREFIX}/blog/snap-post").json()["views"] == 8
+
+
+@pytest.mark.asyncio
+async def test_incremental_snapshot_rewrites_only_changed_entities(
+    client, db_session, tmp_path, create_project, create_blog_post
+):
+    create_project(slug="steady-project")
+    post = create_blog_post(slug="renamed-post")
+    await build_snapshot(db_session, app, tmp_path)
+
+    blog_crud.update_blog_post(db_session, post.id, BlogPostUpdate(title="Renamed"))
+    result = await build_snapshot(db_session, app, tmp_path, incremental=True)
+    store = SnapshotStore(tmp_path)
+
+    assert _read(store, f"{PREFIX}/blog/renamed-post")[0]["title"] == "Renamed"
+    assert f"{PREFIX}/projects/steady-project" in store.entries
+    # The post in both languages and the blog list page of each language
+    assert result.written == 4
+
+    blog_crud.delete_blog_post(db_session, post.id)
+    result = await build_snapshot(db_session, app, tmp_path, incremental=True)
+    store = SnapshotStore(tmp_path)
+
+    assert f"{PREFIX}/blog/renamed-post" not in store.entries
+    assert not (tmp_path / "api/v1/blog/renamed-post.json").exists()
+    assert result.removed == 2
@@ -0,0 +1,119 @@
+"""Tag taxonomy tests."""
+
+from sqlalchemy import func
+
+from app.models.blog import BlogPost
+from app.models.tag import BlogPostTag, ProjectTag, Tag
+
+
+def _post(client, admin_headers, slug, tags, published=True):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": slug.title(), "content": "Body", "published": published, "tags": tags},
+    ).json()
+
+
+def _project(client, admin_headers, slug, tags):
+    return client.post(
+        "/api/v1/projects/",
+        headers=admin_headers,
+        json={"title": slug.title(), "slug": slug, "description": "Description", "tags": tags},
+    ).json()
+
+
+def _slugs(response):
+    return [item["slug"] for item in response.json()["items"]]
+
+
+def _counts(client, **params):
+    return {tag["slug"]: (tag["blog_post_count"], tag["project_count"]) for tag in client.get(
+        "/api/v1/tags/", params=params
+    ).json()}
+
+
+def test_tags_are_shared_by_slug_and_returned_with_items(client, admin_headers):
+    post = _post(client, admin_headers, "intro", ["Machine Learning", "python", "machine-learning"])
+    project = _project(client, admin_headers, "tool", ["Python"])
+
+    assert post["tags"] == [
+        {"slug": "machine-learning", "name": "Machine Learning"},
+        {"slug": "python", "name": "python"},
+    ]
+    assert project["tags"] == [{"slug": "python", "name": "python"}]
+    assert client.get("/api/v1/blog/intro").json()["tags"] == post["tags"]
+    assert client.get("/api/v1/blog/").json()["items"][0]["tags"] == post["tags"]
+    assert client.get("/api/v1/projects/tool").json()["tags"] == project["tags"]
+    assert client.get("/api/v1/blog/?fields=slug").json()["items"] == [{"id": post["id"], "slug": "intro"}]
+    assert client.get("/api/v1/blog/?fields=slug&include=tags").json()["items"][0]["tags"] == post["tags"]
+
+
+def test_lists_filter_by_any_and_all_tags(client, admin_headers):
+    _post(client, admin_headers, "both", ["python", "fastapi"])
+    _post(client, admin_headers, "python-only", ["python"])
+    _post(client, admin_headers, "rust-only", ["rust"])
+    _post(client, admin_headers, "draft", ["python", "fastapi"], published=False)
+    _project(client, admin_headers, "api", ["python", "fastapi"])
+    _project(client, admin_headers, "cli", ["rust"])
+
+    assert sorted(_slugs(client.get("/api/v1/blog/?tag=python"))) == ["both", "python-only"]
+    assert sorted(_slugs(client.get("/api/v1/blog/?tag=fastapi,rust"))) == ["both", "rust-only"]
+    assert _slugs(client.get("/api/v1/blog/?tags_all=python,fastapi")) == ["both"]
+    assert _slugs(client.get("/api/v1/blog/?tags_all=python,unknown")) == []
+    assert _slugs(client.get("/api/v1/blog/?tag=unknown")) == []
+    assert _slugs(client.get("/api/v1/blog/?tag=rust&tags_all=python")) == []
+    assert client.get("/api/v1/blog/?tags_all=python,fastapi").json()["total"] == 1
+    assert _slugs(client.get("/api/v1/blog/?tags_all=python,fastapi&fields=slug")) == ["both"]
+    assert sorted(_slugs(client.get(
+        "/api/v1/blog/?tags_all=fastapi&published_only=false", headers=admin_headers
+    ))) == ["both", "draft"]
+
+    assert _slugs(client.get("/api/v1/projects/?tags_all=fastapi,python")) == ["api"]
+    assert _slugs(client.get("/api/v1/projects/?tag=rust&fields=slug")) == ["cli"]
+
+
+def test_counts_follow_every_write(client, admin_headers, db_session):
+    first = _post(client, admin_headers, "first", ["python", "fastapi"])
+    draft = _post(client, admin_headers, "draft", ["python"], published=False)
+    project = _project(client, admin_headers, "api", ["python"])
+
+    assert _counts(client) == {"python": (1, 1), "fastapi": (1, 0)}
+
+    client.put(f"/api/v1/blog/{draft['id']}", headers=admin_headers, json={"published": True})
+    client.put(f"/api/v1/blog/{first['id']}", headers=admin_headers, json={"tags": ["python", "sql"]})
+    client.put(f"/api/v1/projects/{project['id']}", headers=admin_headers, json={"tags": ["sql", "docker"]})
+    assert _counts(client) == {"python": (2, 0), "sql": (1, 1), "docker": (0, 1)}
+
+    client.put(f"/api/v1/blog/{first['id']}", headers=admin_headers, json={"published": False})
+    client.delete(f"/api/v1/blog/{draft['id']}", headers=admin_headers)
+    client.delete(f"/api/v1/projects/{project['id']}", headers=admin_headers)
+    assert _counts(client) == {}
+
+    # The maintained counts match a recount of the association tables
+    db_session.expire_all()
+    published = dict(
+        db_session.query(BlogPostTag.tag_id, func.count())
+        .join(BlogPost, BlogPost.id == BlogPostTag.blog_post_id)
+        .filter(BlogPost.published == True)
+        .group_by(BlogPostTag.tag_id)
+    )
+    projects = dict(db_session.query(ProjectTag.tag_id, func.count()).group_by(ProjectTag.tag_id))
+    for tag in db_session.query(Tag):
+        assert (tag.blog_post_count, tag.project_count) == (published.get(tag.id, 0), projects.get(tag.id, 0))
+
+
+def test_tag_list_facets_and_caching(client, admin_headers):
+    _post(client, admin_headers, "one", ["python", "sql"])
+    _post(client, admin_headers, "two", ["python"])
+    _project(client, admin_headers, "api", ["docker", "sql"])
+
+    listed = client.get("/api/v1/tags/")
+    blog = client.get("/api/v1/tags/?type=blog").json()
+    projects = client.get("/api/v1/tags/?type=projects").json()
+
+    assert [tag["slug"] for tag in listed.json()] == ["python", "sql", "docker"]
+    assert [(tag["slug"], tag["blog_post_count"]) for tag in blog] == [("python", 2), ("sql", 1)]
+    assert [tag["slug"] for tag in projects] == ["docker", "sql"]
+    assert client.get("/api/v1/tags/?type=skills").status_code == 422
+    assert listed.headers["Cache-Control"].startswith("public")
+    assert {"tags", "blog", "projects"} <= set(listed.headers["Surrogate-Key"].split())
@@ -0,0 +1,51 @@
+"""Translation projection tests."""
+
+import pytest
+
+from app.crud import project as project_crud
+from app.models.blog import BlogPost, BlogTranslation
+from app.models.project import ProjectTranslation
+
+
+def test_translated_blog_detail_does_not_overwrite_base_row(client, db_session, create_blog_post):
+    post = create_blog_post(slug="bilingual", title="Original title")
+    db_session.add(BlogTranslation(blog_post_id=post.id, language="tr", title="Turkce baslik", content="Govde"))
+    db_session.commit()
+
+    turkish = client.get("/api/v1/blog/bilingual?language=tr").json()
+    english = client.get("/api/v1/blog/bilingual?language=en").json()
+
+    assert turkish["title"] == "Turkce baslik"
+    assert english["title"] == "Original title"
+    assert english["views"] == 1  # one visitor
+    db_session.expire_all()
+    assert db_session.get(BlogPost, post.id).title == "Original title"
+
+
+def test_missing_translation_falls_back_to_english_then_base(db_session, create_project):
+    with_english = create_project(slug="with-english", title="Base")
+    create_project(slug="base-only", title="Base only")
+    db_session.add(ProjectTranslation(
+        project_id=with_english.id, language="en", title="English", description="English body"
+    ))
+    db_session.commit()
+
+    titles = {
+        project.slug: project.title
+        for project in project_crud.get_projects(db_session, language="tr", include=())
+    }
+
+    assert titles == {"with-english": "English", "base-only": "Base only"}
+
+
+def test_translated_views_are_read_only(db_session, create_project):
+    project = create_project(slug="read-only")
+    db_session.add(ProjectTranslation(project_id=project.id, language="tr", title="Salt okunur", description="Govde"))
+    db_session.commit()
+
+    view = project_crud.get_project_by_slug(db_session, slug="read-only", language="tr")
+
+    assert view.title == "Salt okunur"
+    with pytest.raises(AttributeError):
+        view.title = "Changed"
+    assert not db_session.dirty
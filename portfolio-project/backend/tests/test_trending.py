@@ -0,0 +1,119 @@
+"""Trending blog posts tests."""
+
+import math
+import uuid
+
+import pytest
+
+from app.models.blog import BlogTrendingScore
+from app.services.trending import REBASE_EXPONENT, InMemoryLeaderboard, Trending
+
+DAY = 24 * 3600
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _publish(client, admin_headers, slug):
+    return client.post(
+        "/api/v1/blog/",
+        headers=admin_headers,
+        json={"slug": slug, "title": slug.title(), "content": "Body", "published": True},
+    ).json()["id"]
+
+
+def _read(client, slug, visitor, language="en"):
+    client.get(f"/api/v1/blog/{slug}", params={"language": language}, headers={"User-Agent": visitor})
+
+
+def _trending(client, **params):
+    response = client.get("/api/v1/blog/trending", params=params)
+    assert response.status_code == 200
+    return [(item["slug"], item["trending_score"]) for item in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_scores_decay_with_the_window_length():
+    clock = Clock()
+    trending = Trending(InMemoryLeaderboard(), clock)
+    old, new = uuid.uuid4(), uuid.uuid4()
+    await trending.record(old, "en")
+    await trending.record(old, "en")
+    clock.now += 7 * DAY
+    await trending.record(new, "en")
+
+    assert await trending.top("en", "7d", 10) == [
+        (new, pytest.approx(1.0)),
+        (old, pytest.approx(2 / math.e)),
+    ]
+    assert await trending.top("en", "30d", 1) == [(old, pytest.approx(2 * math.exp(-7 / 30)))]
+    assert await trending.top("tr", "7d", 10) == []
+
+
+@pytest.mark.asyncio
+async def test_rescaling_keeps_scores_and_drops_decayed_posts():
+    clock = Clock()
+    leaderboard = InMemoryLeaderboard()
+    await leaderboard.add("steady", "en", clock.now)
+    await leaderboard.add("faded", "tr", clock.now)
+    clock.now += (REBASE_EXPONENT + 1) * DAY
+    await leaderboard.add("steady", "en", clock.now)
+
+    await leaderboard.compact(clock.now)
+
+    assert leaderboard.epoch == clock.now
+    assert await leaderboard.top("en", "1d", 5, clock.now) == [("steady", pytest.approx(1.0))]
+    assert await leaderboard.top("en", "30d", 5, clock.now) == [
+        ("steady", pytest.approx(1 + math.exp(-(REBASE_EXPONENT + 1) / 30)))
+    ]
+    assert await leaderboard.top("tr", "1d", 5, clock.now) == []
+
+
+def test_trending_endpoint_ranks_counted_views_per_language(client, admin_headers):
+    _publish(client, admin_headers, "popular")
+    _publish(client, admin_headers, "quiet")
+    hidden = _publish(client, admin_headers, "hidden")
+    for visitor in ("a", "b", "c"):
+        _read(client, "popular", visitor)
+    _read(client, "popular", "a")  # the same visitor again
+    _read(client, "quiet", "a")
+    _read(client, "quiet", "b", language="tr")
+    _read(client, "hidden", "a")
+    client.put(f"/api/v1/blog/{hidden}", headers=admin_headers, json={"published": False})
+
+    weekly = client.get("/api/v1/blog/trending?window=7d").json()
+
+    assert [(slug, round(score)) for slug, score in _trending(client)] == [("popular", 3), ("quiet", 1)]
+    # Stored views; buffered ones arrive with the next flush
+    assert weekly[0]["views"] == 0 and "content" not in weekly[0]
+    assert [slug for slug, _ in _trending(client, language="tr", window="1d")] == ["quiet"]
+    assert _trending(client, limit=1)[0][0] == "popular"
+    assert client.get("/api/v1/blog/trending?window=1w").status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_leaderboards_are_persisted_and_restored_decayed(db_session, SessionLocal, create_blog_post):
+    kept = create_blog_post(slug="kept")
+    deleted = create_blog_post(slug="deleted")
+    clock = Clock()
+    trending = Trending(InMemoryLeaderboard(), clock)
+    await trending.record(kept.id, "en")
+    await trending.record(deleted.id, "en")
+    db_session.delete(deleted)
+    db_session.commit()
+
+    stored = await trending.persist(SessionLocal)
+    clock.now += DAY
+    restored = Trending(InMemoryLeaderboard(), clock)
+    loaded = await restored.restore(SessionLocal)
+
+    assert stored == 3 == db_session.query(BlogTrendingScore).count()
+    assert loaded == 3
+    assert await restored.top("en", "1d", 5) == [(kept.id, pytest.approx(1 / math.e))]
+    assert await restored.top("en", "7d", 5) == [(kept.id, pytest.approx(math.exp(-1 / 7)))]
+    assert await restored.restore(SessionLocal) == 0
@@ -0,0 +1,102 @@
+"""Write-behind blog view counter tests."""
+
+import pytest
+from sqlalchemy import event
+
+from app.models.blog import BlogPost
+from app.services.view_counter import InMemoryViewBuffer, ViewCounter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _recorder():
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    return statements, record
+
+
+def test_reading_a_post_does_not_write(client, db_session, create_blog_post):
+    create_blog_post(slug="read-only-view", views=5)
+    statements, record = _recorder()
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", record)
+    try:
+        response = client.get("/api/v1/blog/read-only-view")
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", record)
+
+    assert response.json()["views"] == 6
+    assert [statement for statement in statements if not statement.lstrip().startswith("SELECT")] == []
+
+
+@pytest.mark.asyncio
+async def test_views_are_deduplicated_per_window():
+    clock = Clock()
+    counter = ViewCounter(InMemoryViewBuffer(clock), window_seconds=60)
+
+    counts = [
+        await counter.record("post", "visitor"),
+        await counter.record("post", "visitor"),
+        await counter.record("post", "another"),
+    ]
+    clock.now += 61
+    counts.append(await counter.record("post", "visitor"))
+
+    assert counts == [1, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_flush_adds_buffered_views_in_one_update(db_session, SessionLocal, create_blog_post):
+    first = create_blog_post(slug="flush-one", views=10)
+    second = create_blog_post(slug="flush-two", views=0)
+    edited_at = first.updated_at
+    counter = ViewCounter(InMemoryViewBuffer(), window_seconds=60)
+    for visitor in ("a", "b", "c"):
+        await counter.record(first.id, visitor)
+    await counter.record(second.id, "a")
+    statements, record = _recorder()
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", record)
+    try:
+        flushed = await counter.flush(SessionLocal)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", record)
+
+    db_session.expire_all()
+    assert flushed == 2
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+    assert db_session.get(BlogPost, first.id).views == 13
+    assert db_session.get(BlogPost, second.id).views == 1
+    assert db_session.get(BlogPost, first.id).updated_at == edited_at
+    assert await counter.flush(SessionLocal) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_the_batch_for_the_next_one(db_session, SessionLocal, create_blog_post):
+    post = create_blog_post(slug="flush-retry", views=0)
+    buffer = InMemoryViewBuffer()
+    counter = ViewCounter(buffer, window_seconds=60)
+    await counter.record(post.id, "a")
+
+    def unavailable():
+        raise ConnectionError("database down")
+
+    with pytest.raises(ConnectionError):
+        await counter.flush(unavailable)
+    shown = await counter.record(post.id, "b")
+    await counter.flush(SessionLocal)
+    await counter.flush(SessionLocal)
+
+    db_session.expire_all()
+    assert shown == 2
+    assert db_session.get(BlogPost, post.id).views == 2
+    assert buffer.pending == buffer.flushing == {}
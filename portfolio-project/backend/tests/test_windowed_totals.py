@@ -0,0 +1,76 @@
+"""Windowed list total tests."""
+
+import pytest
+from sqlalchemy import event
+
+from app.crud.project import refresh_project_documents
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _selecting(statements, table):
+    return [sql for sql in statements if sql.lstrip().startswith("SELECT") and f"FROM {table}" in sql]
+
+
+def test_project_list_counts_in_the_page_query(client, db_session, create_project, statements):
+    projects = [create_project() for _ in range(5)]
+    refresh_project_documents(db_session, *(project.id for project in projects))
+    db_session.commit()
+    statements.clear()
+
+    response = client.get("/api/v1/projects/?skip=2&limit=2")
+
+    body = response.json()
+    assert body["total"] == 5
+    assert body["pages"] == 3
+    assert len(body["items"]) == 2
+    assert len(_selecting(statements, "projects")) == 1
+
+
+def test_total_is_reported_past_the_last_page(client, create_blog_post):
+    create_blog_post()
+    create_blog_post()
+
+    body = client.get("/api/v1/blog/?skip=20&limit=10").json()
+
+    assert body["items"] == []
+    assert body["total"] == 2
+
+
+def test_contact_list_counts_total_and_unread_together(
+    client, admin_headers, create_contact_message, statements
+):
+    create_contact_message(is_read=True)
+    create_contact_message()
+    create_contact_message()
+    statements.clear()
+
+    body = client.get("/api/v1/contact/?limit=1", headers=admin_headers).json()
+
+    assert body["total"] == 3
+    assert body["unread_count"] == 2
+    assert len(_selecting(statements, "contact_messages")) == 1
+
+
+def test_contact_cursor_page_still_reports_unread(client, admin_headers, create_contact_message):
+    for _ in range(3):
+        create_contact_message()
+
+    first = client.get("/api/v1/contact/?limit=2", headers=admin_headers).json()
+    second = client.get(
+        f"/api/v1/contact/?limit=2&cursor={first['next_cursor']}", headers=admin_headers
+    ).json()
+
+    assert second["total"] is None
+    assert second["unread_count"] == 3
+    assert len(second["messages"]) == 1
@@ -0,0 +1,19 @@
+-- ============================================
+-- Migration 003 - Content read model
+-- Ready-to-serve JSON documents of public projects and blog posts,
+-- one row per entity and language. Rows are rewritten by the admin write
+-- paths; populate or repair with: python -m app.tools.rebuild_read_model
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS content_read_model (
+    entity_type VARCHAR(20) NOT NULL,
+    entity_id UUID NOT NULL,
+    language VARCHAR(5) NOT NULL,
+    slug VARCHAR(255) NOT NULL,
+    document TEXT NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_content_read_model PRIMARY KEY (entity_type, entity_id, language)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_content_read_model_slug
+    ON content_read_model(entity_type, language, slug);
@@ -0,0 +1,40 @@
+-- ============================================
+-- Migration 004 - Blog full-text search
+-- Stored tsvectors per post and per translation, built with the text search
+-- configuration of their language and weighted title (A), excerpt (B),
+-- content (C). Queried by app/crud/blog_search.py with websearch_to_tsquery,
+-- ts_rank_cd and ts_headline.
+-- ============================================
+
+-- Replaced by the stored vector below; no query could use this expression
+DROP INDEX IF EXISTS idx_blog_posts_search;
+
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(content, '')), 'C')
+    ) STORED;
+
+-- Configuration of a translation language; keep in sync with SEARCH_CONFIGS
+CREATE OR REPLACE FUNCTION blog_search_config(lang VARCHAR) RETURNS regconfig
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE lang
+        WHEN 'tr' THEN 'turkish'::regconfig
+        WHEN 'de' THEN 'german'::regconfig
+        WHEN 'fr' THEN 'french'::regconfig
+        ELSE 'english'::regconfig
+    END
+$$;
+
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector(blog_search_config(language), coalesce(title, '')), 'A') ||
+        setweight(to_tsvector(blog_search_config(language), coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector(blog_search_config(language), coalesce(content, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_blog_posts_search_vector
+    ON blog_posts USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS idx_blog_translations_search_vector
+    ON blog_translations USING gin(search_vector);
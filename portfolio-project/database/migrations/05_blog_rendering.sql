@@ -0,0 +1,15 @@
+-- ============================================
+-- Migration 005 - Rendered blog bodies
+-- Sanitized HTML and table of contents of each post and translation body,
+-- rendered from Markdown when it is saved. content_hash identifies the
+-- source and renderer version the stored rendering came from; render
+-- existing rows with: python -m app.tools.render_blog
+-- ============================================
+
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS content_html TEXT;
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS content_toc JSON;
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS content_html TEXT;
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS content_toc JSON;
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
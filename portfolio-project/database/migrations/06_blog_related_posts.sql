@@ -0,0 +1,46 @@
+-- ============================================
+-- Migration 006 - Related blog posts
+-- Term counts, document frequencies and TF-IDF vectors of published posts
+-- per language, and the nearest neighbours of each post by cosine
+-- similarity, maintained by the blog write paths (app/crud/related.py). Populate existing posts with:
+-- python -m app.tools.rebuild_related_posts
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS blog_post_terms (
+    blog_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    language VARCHAR(5) NOT NULL,
+    terms JSON NOT NULL,
+    CONSTRAINT pk_blog_post_terms PRIMARY KEY (blog_post_id, language)
+);
+
+CREATE TABLE IF NOT EXISTS blog_term_frequencies (
+    language VARCHAR(5) NOT NULL,
+    term VARCHAR(64) NOT NULL,
+    documents INTEGER NOT NULL,
+    CONSTRAINT pk_blog_term_frequencies PRIMARY KEY (language, term)
+);
+
+CREATE TABLE IF NOT EXISTS blog_post_vectors (
+    blog_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    language VARCHAR(5) NOT NULL,
+    term VARCHAR(64) NOT NULL,
+    weight REAL NOT NULL,
+    CONSTRAINT pk_blog_post_vectors PRIMARY KEY (blog_post_id, language, term)
+);
+
+-- Finds the posts sharing a term with a changed post
+CREATE INDEX IF NOT EXISTS idx_blog_post_vectors_term
+    ON blog_post_vectors(language, term);
+
+CREATE TABLE IF NOT EXISTS blog_related_posts (
+    blog_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    language VARCHAR(5) NOT NULL,
+    rank SMALLINT NOT NULL,
+    related_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    score REAL NOT NULL,
+    CONSTRAINT pk_blog_related_posts PRIMARY KEY (blog_post_id, language, rank)
+);
+
+-- Finds the lists that name a changed post
+CREATE INDEX IF NOT EXISTS idx_blog_related_posts_related
+    ON blog_related_posts(related_post_id);
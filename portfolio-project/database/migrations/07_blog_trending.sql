@@ -0,0 +1,14 @@
+-- ============================================
+-- Migration 007 - Trending blog posts
+-- Periodic copy of the time-decayed view leaderboards kept in Redis
+-- (app/services/trending.py), restored from when Redis loses them
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS blog_trending_scores (
+    language VARCHAR(5) NOT NULL,
+    period VARCHAR(8) NOT NULL,
+    blog_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    score REAL NOT NULL,
+    scored_at TIMESTAMPTZ NOT NULL,
+    CONSTRAINT pk_blog_trending_scores PRIMARY KEY (language, period, blog_post_id)
+);
@@ -0,0 +1,27 @@
+-- ============================================
+-- Migration 008 - Blog feeds and sitemap
+-- Rendered RSS/Atom/sitemap entries and the gzip-compressed documents
+-- assembled from them (app/crud/feeds.py); fill with
+-- python -m app.tools.rebuild_feeds after applying
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS feed_entries (
+    feed VARCHAR(16) NOT NULL,
+    entry_key VARCHAR(64) NOT NULL,
+    fragment TEXT NOT NULL,
+    lastmod TIMESTAMPTZ,
+    sort_at TIMESTAMPTZ,
+    page INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT pk_feed_entries PRIMARY KEY (feed, entry_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_feed_entries_sort ON feed_entries(feed, sort_at);
+CREATE INDEX IF NOT EXISTS idx_feed_entries_page ON feed_entries(feed, page);
+
+CREATE TABLE IF NOT EXISTS feed_documents (
+    name VARCHAR(32) PRIMARY KEY,
+    media_type VARCHAR(32) NOT NULL,
+    body BYTEA NOT NULL,
+    etag VARCHAR(40) NOT NULL,
+    last_modified TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,13 @@
+-- ============================================
+-- Migration 009 - Derived blog fields
+-- Word count, reading time and auto-excerpt of each post and translation
+-- body, derived when it is saved together with its rendering; derive them
+-- for existing rows with: python -m app.tools.render_blog
+-- ============================================
+
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS auto_excerpt TEXT;
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS word_count INTEGER;
+
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS auto_excerpt TEXT;
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS word_count INTEGER;
+ALTER TABLE blog_translations ADD COLUMN IF NOT EXISTS reading_time INTEGER;
@@ -0,0 +1,33 @@
+-- ============================================
+-- Migration 010 - Tags
+-- Topic tags of blog posts and projects; each tag row carries the counts
+-- of published posts and projects using it, maintained by the writes
+-- (app/crud/tag.py)
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS tags (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    slug VARCHAR(100) UNIQUE NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    blog_post_count INTEGER NOT NULL DEFAULT 0,
+    project_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+-- The primary keys serve the tags of an entity, the reverse indexes the
+-- entities of a tag for the tag= and tags_all= list filters
+CREATE TABLE IF NOT EXISTS blog_post_tags (
+    blog_post_id UUID NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+    CONSTRAINT pk_blog_post_tags PRIMARY KEY (blog_post_id, tag_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_blog_post_tags_tag ON blog_post_tags(tag_id, blog_post_id);
+
+CREATE TABLE IF NOT EXISTS project_tags (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    tag_id UUID NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+    CONSTRAINT pk_project_tags PRIMARY KEY (project_id, tag_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_tags_tag ON project_tags(tag_id, project_id);
@@ -0,0 +1,23 @@
+-- ============================================
+-- Migration 011 - Blog archive
+-- Published posts per UTC month of published_at, moved by the blog writes
+-- (app/crud/blog_archive.py) so the archive is never grouped at read time;
+-- filled from the existing posts here
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS blog_archive_months (
+    year SMALLINT NOT NULL,
+    month SMALLINT NOT NULL,
+    post_count INTEGER NOT NULL,
+    CONSTRAINT pk_blog_archive_months PRIMARY KEY (year, month)
+);
+
+INSERT INTO blog_archive_months (year, month, post_count)
+SELECT
+    EXTRACT(YEAR FROM published_at AT TIME ZONE 'UTC')::SMALLINT,
+    EXTRACT(MONTH FROM published_at AT TIME ZONE 'UTC')::SMALLINT,
+    COUNT(*)
+FROM blog_posts
+WHERE published AND published_at IS NOT NULL
+GROUP BY 1, 2
+ON CONFLICT (year, month) DO UPDATE SET post_count = EXCLUDED.post_count;
@@ -1,3 +1,77 @@
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 011 (Blog Archive)
+-- ============================================
+
+DROP TABLE IF EXISTS blog_archive_months CASCADE;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 010 (Tags)
+-- ============================================
+
+DROP TABLE IF EXISTS project_tags CASCADE;
+DROP TABLE IF EXISTS blog_post_tags CASCADE;
+DROP TABLE IF EXISTS tags CASCADE;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 009 (Derived Blog Fields)
+-- ============================================
+
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS reading_time;
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS word_count;
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS auto_excerpt;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS word_count;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS auto_excerpt;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 008 (Blog Feeds and Sitemap)
+-- ============================================
+
+DROP TABLE IF EXISTS feed_documents CASCADE;
+DROP TABLE IF EXISTS feed_entries CASCADE;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 007 (Trending Blog Posts)
+-- ============================================
+
+DROP TABLE IF EXISTS blog_trending_scores CASCADE;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 006 (Related Blog Posts)
+-- ============================================
+
+DROP TABLE IF EXISTS blog_related_posts CASCADE;
+DROP TABLE IF EXISTS blog_post_vectors CASCADE;
+DROP TABLE IF EXISTS blog_term_frequencies CASCADE;
+DROP TABLE IF EXISTS blog_post_terms CASCADE;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 005 (Rendered Blog Bodies)
+-- ============================================
+
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS content_hash;
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS content_toc;
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS content_html;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS content_hash;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS content_toc;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS content_html;
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 004 (Blog Full-Text Search)
+-- ============================================
+
+DROP INDEX IF EXISTS idx_blog_translations_search_vector;
+DROP INDEX IF EXISTS idx_blog_posts_search_vector;
+ALTER TABLE blog_translations DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE blog_posts DROP COLUMN IF EXISTS search_vector;
+DROP FUNCTION IF EXISTS blog_search_config(VARCHAR);
+CREATE INDEX IF NOT EXISTS idx_blog_posts_search ON blog_posts USING gin(to_tsvector('english', title || ' ' || content));
+
+-- ============================================
+-- ROLLBACK SCRIPT - Migration 003 (Content Read Model)
+-- ============================================
+
+DROP TABLE IF EXISTS content_read_model CASCADE;
+
 -- ============================================
 -- ROLLBACK SCRIPT - Migration 002 (Seed Data)
 -- File: rollback_002.sql
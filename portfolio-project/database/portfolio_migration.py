@@ -30,6 +30,15 @@ class Migration:
 MIGRATIONS = [
     Migration("001", "Initial schema creation", "migrations/01_portfolio_db_schema.sql"),
     Migration("002", "Seed initial data", "migrations/02_portfolio_seed_data.sql", optional=True),
+    Migration("003", "Content read model", "migrations/03_content_read_model.sql"),
+    Migration("004", "Blog full-text search", "migrations/04_blog_search.sql"),
+    Migration("005", "Rendered blog bodies", "migrations/05_blog_rendering.sql"),
+    Migration("006", "Related blog posts", "migrations/06_blog_related_posts.sql"),
+    Migration("007", "Trending blog posts", "migrations/07_blog_trending.sql"),
+    Migration("008", "Blog feeds and sitemap", "migrations/08_feeds.sql"),
+    Migration("009", "Derived blog fields", "migrations/09_blog_derived_fields.sql"),
+    Migration("010", "Tags", "migrations/10_tags.sql"),
+    Migration("011", "Blog archive", "migrations/11_blog_archive.sql"),
 ]
 
 